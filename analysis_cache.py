@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+시트 분석 결과 디스크 캐시
+xlsx 안의 각 xl/worksheets/sheetN.xml 내용의 SHA-256 을 키로
+시트 요약(사용 범위, 수식, 병합 셀, 유효성 검사, 조건부 서식)을 압축 바이너리로 저장합니다.
+시트 하나만 수정한 뒤 다시 실행하면 그 시트만 다시 파싱합니다.
+"""
+
+import argparse
+import hashlib
+import io
+import os
+import pickle
+import zlib
+from collections import OrderedDict
+
+from excel_stream import open_workbook_zip, read_sheet_map, read_shared_strings, resolve_labels, summarize_sheet
+
+# 요약 형식이 바뀌면 올려서 예전 캐시 항목을 무효화
+SUMMARY_VERSION = 1
+DEFAULT_CACHE_DIR = os.environ.get(
+    'GRK_ANALYSIS_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'grk_excel_analysis'))
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class AnalysisCache:
+    """SHA-256 키 기반 시트 요약 캐시 (전체 크기 초과 시 오래 안 쓴 항목부터 삭제)"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes_written = 0
+        self.evicted = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, digest):
+        return os.path.join(self.cache_dir, f'{digest}.bin')
+
+    @staticmethod
+    def key(data):
+        """시트 XML 바이트의 캐시 키"""
+        return f'v{SUMMARY_VERSION}-' + hashlib.sha256(data).hexdigest()
+
+    def get(self, digest):
+        path = self._path(digest)
+        try:
+            with open(path, 'rb') as f:
+                summary = pickle.loads(zlib.decompress(f.read()))
+        except (OSError, zlib.error, pickle.UnpicklingError, EOFError):
+            self.misses += 1
+            return None
+        # 최근 사용 시각 갱신 (삭제 순서 기준)
+        os.utime(path, None)
+        self.hits += 1
+        return summary
+
+    def put(self, digest, summary):
+        blob = zlib.compress(pickle.dumps(summary, protocol=pickle.HIGHEST_PROTOCOL), 6)
+        path = self._path(digest)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(blob)
+        os.replace(tmp_path, path)
+        self.bytes_written += len(blob)
+        self.evict()
+
+    def entries(self):
+        """(경로, 크기, 최근 사용 시각) 목록"""
+        result = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.bin'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            result.append((path, stat.st_size, stat.st_mtime))
+        return result
+
+    def total_bytes(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        """전체 크기가 한도를 넘으면 오래 안 쓴 항목부터 삭제"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        for path, size, _ in sorted(entries, key=lambda e: e[2]):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.evicted += 1
+
+    def clear(self):
+        for path, _, _ in self.entries():
+            os.remove(path)
+
+    def report(self):
+        """캐시 적중/실패 보고"""
+        total = self.hits + self.misses
+        ratio = (self.hits / total * 100) if total else 0.0
+        print(f"\n=== 분석 캐시 ({self.cache_dir}) ===")
+        print(f"적중: {self.hits}개, 실패(재파싱): {self.misses}개, 적중률: {ratio:.0f}%")
+        print(f"새로 저장: {self.bytes_written:,} bytes, 삭제: {self.evicted}개, "
+              f"현재 크기: {self.total_bytes():,} / {self.max_bytes:,} bytes")
+
+
+def analyze_sheet_member(zf, part, cache=None):
+    """시트 XML 하나의 요약 (캐시에 있으면 파싱하지 않음)"""
+    data = zf.read(part)
+    digest = AnalysisCache.key(data)
+    if cache is not None:
+        summary = cache.get(digest)
+        if summary is not None:
+            return summary
+    summary = summarize_sheet(io.BytesIO(data))
+    if cache is not None:
+        cache.put(digest, summary)
+    return summary
+
+
+def load_sheet_summaries(source, cache=None):
+    """워크북의 시트별 요약을 시트 순서대로 반환 (라벨은 현재 공유 문자열로 풀어 둠)"""
+    zf = open_workbook_zip(source)
+    try:
+        shared_strings = read_shared_strings(zf)
+        summaries = OrderedDict()
+        for sheet_name, part in read_sheet_map(zf).items():
+            summary = dict(analyze_sheet_member(zf, part, cache))
+            summary['labels'] = resolve_labels(summary, shared_strings)
+            summaries[sheet_name] = summary
+        return summaries
+    finally:
+        if zf is not source:
+            zf.close()
+
+
+def add_cache_arguments(parser):
+    """분석 스크립트 공통 캐시 옵션"""
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="시트 분석 캐시 디렉터리")
+    parser.add_argument("--cache-max-mb", type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024),
+                        help="캐시 최대 크기 (MB)")
+    parser.add_argument("--no-cache", action="store_true", help="캐시를 쓰지 않고 항상 다시 파싱")
+
+
+def cache_from_args(args):
+    if args.no_cache:
+        return None
+    return AnalysisCache(args.cache_dir, int(args.cache_max_mb * 1024 * 1024))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시트 분석 캐시 관리")
+    parser.add_argument("file_path", nargs="?",
+                        default="/Users/sung/user/workspace/GRK/GRK_workspace/2025_CF_management.xlsx")
+    parser.add_argument("--clear", action="store_true", help="캐시 비우기")
+    add_cache_arguments(parser)
+    args = parser.parse_args()
+
+    cache = AnalysisCache(args.cache_dir, int(args.cache_max_mb * 1024 * 1024))
+    if args.clear:
+        cache.clear()
+        print(f"캐시를 비웠습니다: {args.cache_dir}")
+        return
+
+    summaries = load_sheet_summaries(args.file_path, cache)
+    for sheet_name, summary in summaries.items():
+        dims = summary['dimensions'] or {}
+        print(f"{sheet_name}: 범위 {dims.get('used_range')}, 수식 {len(summary['formulas'])}개, "
+              f"병합 {len(summary['merged_cells'])}개, 유효성 검사 {len(summary['data_validation'])}개")
+    cache.report()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+분석 결과 SQL 저장소 (SQLite)
+워크북의 셀, 수식, 참조(다른 시트 참조 포함), 함수, 병합 셀, 유효성 검사를
+로컬 SQLite 파일에 시트 단위로 적재하고 (시트, 행, 열)과 참조 대상 시트로 색인합니다.
+"03.HR unit cost 를 가리키는 VLOOKUP 전부" 같은 질문이 스크립트 재실행 없이 SQL 한 번으로 끝납니다.
+시트마다 (시트 XML + 그 시트가 쓰는 공유 문자열) 의 SHA-256 을 기억해 두어 다시 적재할 때는 바뀐 시트만 지우고 다시 넣습니다.
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sqlite3
+import time
+
+from excel_stream import scan_sheet
+from formula_graph import formula_functions, formula_references
+from workbook_session import WorkbookSession
+
+# 스키마가 바뀌면 올려서 예전 적재분을 모두 다시 넣도록 함
+STORE_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sheets (
+    sheet_id INTEGER PRIMARY KEY,
+    workbook TEXT NOT NULL,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    cell_count INTEGER NOT NULL,
+    formula_count INTEGER NOT NULL,
+    max_row INTEGER,
+    max_col INTEGER,
+    loaded_at REAL NOT NULL,
+    UNIQUE (workbook, name)
+);
+CREATE TABLE IF NOT EXISTS cells (
+    sheet_id INTEGER NOT NULL,
+    row INTEGER NOT NULL,
+    col INTEGER NOT NULL,
+    address TEXT NOT NULL,
+    value,
+    data_type TEXT,
+    style_id INTEGER,
+    formula TEXT,
+    PRIMARY KEY (sheet_id, row, col)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS cells_by_col ON cells (sheet_id, col, row);
+CREATE TABLE IF NOT EXISTS refs (
+    sheet_id INTEGER NOT NULL,
+    row INTEGER NOT NULL,
+    col INTEGER NOT NULL,
+    ref_sheet TEXT NOT NULL,
+    min_row INTEGER,
+    min_col INTEGER,
+    max_row INTEGER,
+    max_col INTEGER
+);
+CREATE INDEX IF NOT EXISTS refs_by_cell ON refs (sheet_id, row, col);
+CREATE INDEX IF NOT EXISTS refs_by_target ON refs (ref_sheet, min_row, min_col);
+CREATE TABLE IF NOT EXISTS functions (
+    sheet_id INTEGER NOT NULL,
+    row INTEGER NOT NULL,
+    col INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (sheet_id, row, col, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS functions_by_name ON functions (name, sheet_id);
+CREATE TABLE IF NOT EXISTS merged_cells (
+    sheet_id INTEGER NOT NULL,
+    ref TEXT NOT NULL,
+    min_row INTEGER, min_col INTEGER, max_row INTEGER, max_col INTEGER
+);
+CREATE INDEX IF NOT EXISTS merged_by_sheet ON merged_cells (sheet_id, min_row, min_col);
+CREATE TABLE IF NOT EXISTS validations (
+    sheet_id INTEGER NOT NULL,
+    type TEXT,
+    formula1 TEXT,
+    formula2 TEXT,
+    ranges TEXT,
+    allow_blank INTEGER,
+    prompt TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS validations_by_sheet ON validations (sheet_id);
+CREATE VIEW IF NOT EXISTS formula_refs AS
+    SELECT s.workbook, s.name AS sheet, c.address, c.formula, r.ref_sheet,
+           r.min_row, r.min_col, r.max_row, r.max_col, r.sheet_id, r.row, r.col
+    FROM refs r
+    JOIN sheets s ON s.sheet_id = r.sheet_id
+    JOIN cells c ON c.sheet_id = r.sheet_id AND c.row = r.row AND c.col = r.col;
+"""
+# 시트 하나를 다시 넣기 전에 지울 표
+_SHEET_TABLES = ('cells', 'refs', 'functions', 'merged_cells', 'validations')
+
+
+# 공유 문자열 셀의 <v> 번호 (<c ... t="s" ...><v>12</v>, 시트 XML 에서 t="s" 는 셀 속성에만 나옴)
+_SHARED_CELL_RE = re.compile(rb' t="s"[^>]*>\s*<v>(\d+)</v>')
+
+
+def _range_bounds(ref):
+    """'A1:C3' 병합 범위를 (최소 행, 최소 열, 최대 행, 최대 열) 로"""
+    parsed = formula_references(ref, None)
+    if not parsed:
+        return None, None, None, None
+    return parsed[0].min_row, parsed[0].min_col, parsed[0].max_row, parsed[0].max_col
+
+
+def _db_value(value):
+    """SQLite 에 넣을 수 있는 값으로 (논리값은 0/1)"""
+    if isinstance(value, bool):
+        return int(value)
+    return value
+
+
+def sheet_digest(data, shared_strings):
+    """
+    시트 XML 바이트와 그 시트의 t="s" 셀이 가리키는 공유 문자열로 만든 적재 키.
+    다른 시트에서 문자열을 고쳐 sharedStrings.xml 이 바뀌어도 이 시트가 쓰는 문자열이 같으면 키도 같습니다.
+    """
+    digest = hashlib.sha256(data)
+    for index in sorted({int(raw) for raw in _SHARED_CELL_RE.findall(data)}):
+        text = shared_strings[index] if index < len(shared_strings) else ''
+        digest.update(f'{index}\0{len(text)}\0{text}'.encode())
+    return f'v{STORE_VERSION}-' + digest.hexdigest()
+
+
+class AnalysisStore:
+    """워크북 분석 결과를 담는 SQLite 저장소 (시트 단위 교체 적재)"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def sheet_digests(self, workbook):
+        """적재된 시트 이름 → (sheet_id, 적재 키)"""
+        rows = self.conn.execute('SELECT name, sheet_id, digest FROM sheets WHERE workbook = ?', (workbook,))
+        return {name: (sheet_id, digest) for name, sheet_id, digest in rows}
+
+    def load_workbook(self, session, force=False):
+        """
+        세션의 워크북을 적재하고 시트 이름 → 'loaded' / 'unchanged' / 'removed' 를 반환.
+        적재 키가 같은 시트는 건너뛰고, 워크북에서 사라진 시트는 지웁니다 (force 면 모두 다시 넣음).
+        """
+        workbook = os.path.abspath(session.file_path)
+        loaded = self.sheet_digests(workbook)
+        status = {}
+        for position, (sheet_name, part) in enumerate(session.sheet_map.items()):
+            digest = sheet_digest(session.zf.read(part), session.shared_strings)
+            sheet_id, old_digest = loaded.pop(sheet_name, (None, None))
+            if digest == old_digest and not force:
+                self.conn.execute('UPDATE sheets SET position = ? WHERE sheet_id = ?', (position, sheet_id))
+                status[sheet_name] = 'unchanged'
+                continue
+            with self.conn:
+                self._load_sheet(session, workbook, sheet_name, part, position, digest, sheet_id)
+            status[sheet_name] = 'loaded'
+        with self.conn:
+            for sheet_name, (sheet_id, _) in loaded.items():
+                self._delete_sheet(sheet_id)
+                self.conn.execute('DELETE FROM sheets WHERE sheet_id = ?', (sheet_id,))
+                status[sheet_name] = 'removed'
+        return status
+
+    def _delete_sheet(self, sheet_id):
+        for table in _SHEET_TABLES:
+            self.conn.execute(f'DELETE FROM {table} WHERE sheet_id = ?', (sheet_id,))
+
+    def _load_sheet(self, session, workbook, sheet_name, part, position, digest, sheet_id):
+        """시트 하나를 지우고 다시 넣기 (호출하는 쪽에서 트랜잭션으로 감쌈)"""
+        if sheet_id is None:
+            sheet_id = self.conn.execute(
+                'INSERT INTO sheets (workbook, name, position, digest, cell_count, formula_count, loaded_at) '
+                'VALUES (?, ?, ?, ?, 0, 0, 0)', (workbook, sheet_name, position, digest)).lastrowid
+        else:
+            self._delete_sheet(sheet_id)
+
+        cells, refs, functions, merged, validations = [], [], [], [], []
+        max_row = max_col = 0
+        for kind, item in scan_sheet(session.zf, part, session.shared_strings):
+            if kind == 'cell':
+                cells.append((sheet_id, item.row, item.col, item.address, _db_value(item.value),
+                              item.data_type, item.style_id, item.formula))
+                max_row, max_col = max(max_row, item.row), max(max_col, item.col)
+                if not item.formula:
+                    continue
+                try:
+                    references = formula_references(item.formula, sheet_name)
+                    names = formula_functions(item.formula)
+                except ValueError:
+                    # 토큰화할 수 없는 수식은 셀만 넣음
+                    continue
+                refs.extend((sheet_id, item.row, item.col, ref.sheet, ref.min_row, ref.min_col,
+                             ref.max_row, ref.max_col) for ref in dict.fromkeys(references))
+                functions.extend((sheet_id, item.row, item.col, name) for name in names)
+            elif kind == 'mergeCell':
+                merged.append((sheet_id, item, *_range_bounds(item)))
+            elif kind == 'dataValidation':
+                validations.append((sheet_id, item['type'], item['formula1'], item['formula2'],
+                                    ' '.join(item['ranges']), int(item['allow_blank']), item['prompt'],
+                                    item['error']))
+
+        self.conn.executemany('INSERT OR REPLACE INTO cells VALUES (?, ?, ?, ?, ?, ?, ?, ?)', cells)
+        self.conn.executemany('INSERT INTO refs VALUES (?, ?, ?, ?, ?, ?, ?, ?)', refs)
+        self.conn.executemany('INSERT OR IGNORE INTO functions VALUES (?, ?, ?, ?)', functions)
+        self.conn.executemany('INSERT INTO merged_cells VALUES (?, ?, ?, ?, ?, ?)', merged)
+        self.conn.executemany('INSERT INTO validations VALUES (?, ?, ?, ?, ?, ?, ?, ?)', validations)
+        self.conn.execute(
+            'UPDATE sheets SET position = ?, digest = ?, cell_count = ?, formula_count = ?, max_row = ?, '
+            'max_col = ?, loaded_at = ? WHERE sheet_id = ?',
+            (position, digest, len(cells), sum(1 for cell in cells if cell[-1]), max_row or None,
+             max_col or None, time.time(), sheet_id))
+
+    def query(self, sql, params=()):
+        """SQL 실행 결과를 (열 이름 목록, 행 목록) 으로"""
+        cursor = self.conn.execute(sql, params)
+        return [d[0] for d in cursor.description or ()], cursor.fetchall()
+
+    def lookups_into(self, target_sheet, functions=('VLOOKUP',)):
+        """target_sheet 를 참조하는 functions 수식 셀 (시트, 주소, 수식)"""
+        marks = ', '.join('?' * len(functions))
+        return self.query(
+            f'SELECT DISTINCT r.sheet, r.address, r.formula FROM formula_refs r '
+            f'JOIN functions f ON f.sheet_id = r.sheet_id AND f.row = r.row AND f.col = r.col '
+            f'WHERE r.ref_sheet = ? AND f.name IN ({marks}) ORDER BY r.sheet, r.row, r.col',
+            (target_sheet, *[name.upper() for name in functions]))
+
+    def cross_sheet_refs(self, sheet_name):
+        """sheet_name 의 수식 셀 중 다른 시트를 참조하는 셀 (주소, 참조 시트, 수식)"""
+        return self.query(
+            'SELECT DISTINCT address, ref_sheet, formula FROM formula_refs '
+            'WHERE sheet = ? AND ref_sheet <> sheet ORDER BY row, col, ref_sheet', (sheet_name,))
+
+
+def print_rows(columns, rows, elapsed):
+    print(' | '.join(columns))
+    for row in rows:
+        print(' | '.join('' if value is None else str(value) for value in row))
+    print(f"({len(rows)}행, {elapsed * 1000:.2f}ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분석 결과 SQL 저장소 적재/조회")
+    parser.add_argument("file_path", nargs="?",
+                        default="/Users/sung/user/workspace/GRK/GRK_workspace/2025_CF_management.xlsx")
+    parser.add_argument("--db", default="excel_analysis.sqlite", help="SQLite 파일 경로")
+    parser.add_argument("--force", action="store_true", help="바뀌지 않은 시트도 다시 적재")
+    parser.add_argument("--no-load", action="store_true", help="적재하지 않고 조회만")
+    parser.add_argument("--lookups-into", metavar="SHEET", help="이 시트를 참조하는 조회 함수 셀 조회")
+    parser.add_argument("--functions", nargs="+", default=["VLOOKUP"], help="--lookups-into 의 함수 (기본: VLOOKUP)")
+    parser.add_argument("--cross-sheet", metavar="SHEET", help="이 시트에서 다른 시트를 참조하는 셀 조회")
+    parser.add_argument("--sql", help="임의 SQL 조회 (표: sheets, cells, refs, functions, "
+                                      "merged_cells, validations, 뷰: formula_refs)")
+    args = parser.parse_args()
+
+    with AnalysisStore(args.db) as store:
+        if not args.no_load:
+            start = time.perf_counter()
+            with WorkbookSession(args.file_path) as session:
+                status = store.load_workbook(session, force=args.force)
+            elapsed = time.perf_counter() - start
+            print(f"=== {args.db} 적재 ({elapsed:.2f}초) ===")
+            for sheet_name, state in status.items():
+                mark = {'loaded': '🔄 다시 적재', 'unchanged': '✅ 변경 없음', 'removed': '🗑️ 삭제'}[state]
+                print(f"  {mark}: {sheet_name}")
+
+        queries = []
+        if args.lookups_into:
+            queries.append((f"{args.lookups_into} 를 참조하는 {', '.join(args.functions)}", store.lookups_into,
+                            (args.lookups_into, args.functions)))
+        if args.cross_sheet:
+            queries.append((f"{args.cross_sheet} 의 다른 시트 참조", store.cross_sheet_refs, (args.cross_sheet,)))
+        if args.sql:
+            queries.append(("SQL", store.query, (args.sql,)))
+        for title, func, params in queries:
+            start = time.perf_counter()
+            columns, rows = func(*params)
+            print(f"\n=== {title} ===")
+            print_rows(columns, rows, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
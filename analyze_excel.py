@@ -9,9 +9,30 @@ from openpyxl import load_workbook
 from openpyxl.utils import get_column_letter, column_index_from_string
 import json
 import sys
+import argparse
+import contextlib
+import io
+import os
+import sqlite3
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 
-def analyze_excel_file(file_path):
-    """Excel 파일을 상세히 분석합니다."""
+from excel_stream import (
+    open_workbook_zip,
+    read_shared_strings,
+    scan_sheet,
+    split_address,
+)
+from analysis_store import AnalysisStore
+from ndjson_writer import COMPRESSIONS, NdjsonWriter
+from workbook_session import WorkbookSession
+
+def analyze_excel_file(session, stream=False, workers=1, writer=None):
+    """Excel 파일을 상세히 분석합니다. (workers > 1 이거나 NDJSON 출력이면 스트리밍 경로 사용)"""
+    if stream or workers > 1 or writer is not None:
+        return analyze_excel_file_stream(session, workers=workers, writer=writer)
+
+    file_path = session.file_path
     try:
         # Excel 파일 로드 (수식 유지)
         wb = load_workbook(file_path, data_only=False)
@@ -23,7 +44,8 @@ def analyze_excel_file(file_path):
                 "sheet_names": wb.sheetnames,
                 "active_sheet": wb.active.title if wb.active else None,
                 "total_sheets": len(wb.worksheets)
-            }
+            },
+            "styles": []
         }
         
         print(f"=== Excel 파일 분석: {file_path} ===\n")
@@ -31,10 +53,11 @@ def analyze_excel_file(file_path):
         print(f"워크시트 목록: {wb.sheetnames}")
         print(f"활성 시트: {wb.active.title if wb.active else 'None'}\n")
         
-        # 각 워크시트 분석
+        # 각 워크시트 분석 (셀 스타일은 워크북 전체에서 한 번씩만 스타일 표에 등록)
+        style_index = {}
         for sheet_name in wb.sheetnames:
             ws = wb[sheet_name]
-            sheet_analysis = analyze_worksheet(ws, sheet_name)
+            sheet_analysis = analyze_worksheet(ws, sheet_name, analysis["styles"], style_index)
             analysis["worksheets"].append(sheet_analysis)
             
         return analysis
@@ -43,8 +66,245 @@ def analyze_excel_file(file_path):
         print(f"오류 발생: {str(e)}")
         return None
 
-def analyze_worksheet(ws, sheet_name):
-    """개별 워크시트를 분석합니다."""
+def analyze_excel_file_stream(session, workers=1, writer=None):
+    """
+    openpyxl 로 워크북 전체를 올리지 않고 시트 XML 을 스트리밍으로 분석합니다.
+    writer(NdjsonWriter) 가 있으면 셀 데이터는 모으지 않고 읽는 즉시 기록합니다.
+    """
+    file_path = session.file_path
+    try:
+        sheet_map = session.sheet_map
+        sheet_names = session.sheet_names
+
+        analysis = {
+            "file_path": file_path,
+            "worksheets": [],
+            "workbook_info": {
+                "sheet_names": sheet_names,
+                "active_sheet": session.active_sheet,
+                "total_sheets": len(sheet_names)
+            },
+            "styles": session.styles
+        }
+
+        print(f"=== Excel 파일 분석 (스트리밍): {file_path} ===\n")
+        print(f"총 워크시트 개수: {len(sheet_names)}")
+        print(f"워크시트 목록: {sheet_names}\n")
+
+        if writer is not None:
+            writer.write({"type": "workbook", "file_path": file_path, **analysis["workbook_info"]})
+            # 셀 레코드의 style_id 는 이 스타일 표의 번호
+            writer.write({"type": "styles", "styles": analysis["styles"]})
+
+        if workers > 1 and len(sheet_map) > 1:
+            # 시트별 출력은 각 작업자에서 모아 두었다가 시트 순서대로 출력 (직렬 실행과 같은 결과)
+            session.parse_counts.update(sheet_map.values())
+            per_cell = writer.per_cell if writer is not None else None
+            for sheet_analysis, output, part_path in analyze_sheets_parallel(file_path, sheet_map, workers,
+                                                                             per_cell=per_cell):
+                sys.stdout.write(output)
+                if part_path is not None:
+                    # 작업자가 남긴 시트별 NDJSON 을 시트 순서대로 이어 붙임
+                    with open(part_path, encoding='utf-8') as f:
+                        writer.write_lines(f)
+                    os.remove(part_path)
+                analysis["worksheets"].append(sheet_analysis)
+        else:
+            for sheet_name, part in sheet_map.items():
+                session.parse_counts[part] += 1
+                sheet_analysis = analyze_worksheet_stream(session.zf, sheet_name, part, session.shared_strings,
+                                                          writer=writer)
+                analysis["worksheets"].append(sheet_analysis)
+
+        return analysis
+
+    except Exception as e:
+        print(f"오류 발생: {str(e)}")
+        return None
+
+# 병렬 분석 작업자 프로세스마다 한 번 여는 zip 과 공유 문자열
+_worker_state = {}
+
+def _init_sheet_worker(file_path):
+    zf = open_workbook_zip(file_path)
+    _worker_state["zf"] = zf
+    _worker_state["shared_strings"] = read_shared_strings(zf)
+
+def _analyze_sheet_job(job):
+    """작업자에서 시트 하나를 분석해 (분석 결과, 출력 텍스트, NDJSON 임시 파일) 을 반환"""
+    sheet_name, part, part_path, per_cell = job
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        if part_path is None:
+            sheet_analysis = analyze_worksheet_stream(
+                _worker_state["zf"], sheet_name, part, _worker_state["shared_strings"])
+        else:
+            with NdjsonWriter(part_path, 'none', per_cell=per_cell) as writer:
+                sheet_analysis = analyze_worksheet_stream(
+                    _worker_state["zf"], sheet_name, part, _worker_state["shared_strings"], writer=writer)
+    return sheet_analysis, buffer.getvalue(), part_path
+
+def analyze_sheets_parallel(file_path, sheet_map, workers, per_cell=None):
+    """
+    시트들을 프로세스 풀에서 나눠 분석하고 시트 순서대로 (분석 결과, 출력 텍스트, NDJSON 임시 파일) 을 내보냅니다.
+    per_cell 이 None 이 아니면 작업자는 셀 데이터를 돌려보내지 않고 시트별 임시 NDJSON 파일에 기록합니다.
+    """
+    workers = min(workers, len(sheet_map))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        jobs = [(sheet_name, part,
+                 os.path.join(tmp_dir, f"sheet{i}.ndjson") if per_cell is not None else None, per_cell)
+                for i, (sheet_name, part) in enumerate(sheet_map.items())]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_sheet_worker,
+                                 initargs=(file_path,)) as pool:
+            yield from pool.map(_analyze_sheet_job, jobs)
+
+def analyze_worksheet_stream(zf, sheet_name, part, shared_strings, writer=None):
+    """
+    시트 XML 을 스트리밍으로 읽으며 셀/수식/병합 정보를 분석합니다.
+    writer 가 있으면 행이 끝날 때마다 NDJSON 으로 기록하고 sheet_data["data"] 에는 모으지 않습니다.
+    """
+    print(f"\n{'='*50}")
+    print(f"워크시트: {sheet_name}")
+    print(f"{'='*50}")
+
+    sheet_data = {
+        "name": sheet_name,
+        "dimensions": {},
+        "formulas": [],
+        "data": [],
+        "merged_cells": [],
+        "data_validation": [],
+        "conditional_formatting": [],
+        "charts": [],
+        "pivot_tables": []
+    }
+
+    min_row = None
+    current_row = None
+    row_data = []
+    printed_header = False
+
+    for kind, item in scan_sheet(zf, part, shared_strings):
+        if kind == 'dimension':
+            # <dimension> 은 셀 데이터보다 먼저 나오므로 범위를 바로 출력할 수 있음
+            start, _, end = item.partition(':')
+            end = end or start
+            min_row, min_col = split_address(start)
+            max_row, max_col = split_address(end)
+            sheet_data["dimensions"] = {
+                "min_row": min_row,
+                "max_row": max_row,
+                "min_col": min_col,
+                "max_col": max_col,
+                "used_range": f"{get_column_letter(min_col)}{min_row}:{get_column_letter(max_col)}{max_row}"
+            }
+            print(f"사용된 범위: {sheet_data['dimensions']['used_range']}")
+            print(f"행 범위: {min_row} ~ {max_row}")
+            print(f"열 범위: {get_column_letter(min_col)} ~ {get_column_letter(max_col)}")
+
+        elif kind == 'cell':
+            if not printed_header:
+                print(f"\n셀 데이터 및 수식 분석:")
+                printed_header = True
+            if min_row is None:
+                min_row = item.row
+            if item.row != current_row:
+                if row_data:
+                    if writer is not None:
+                        writer.write_row(sheet_name, current_row, row_data)
+                    else:
+                        sheet_data["data"].append(row_data)
+                row_data = []
+                current_row = item.row
+
+            cell_info = {
+                "address": item.address,
+                "value": item.formula if item.formula else item.value,
+                "data_type": item.data_type,
+                "formula": item.formula,
+                "style_id": item.style_id
+            }
+
+            if item.formula:
+                sheet_data["formulas"].append({
+                    "cell": item.address,
+                    "formula": item.formula
+                })
+                print(f"  {item.address}: {item.formula}")
+            elif item.value is not None and item.row <= min_row + 10:
+                print(f"  {item.address}: {item.value} ({type(item.value).__name__})")
+
+            row_data.append(cell_info)
+
+        elif kind == 'mergeCell':
+            if not sheet_data["merged_cells"]:
+                print(f"\n병합된 셀:")
+            print(f"  - {item}")
+            sheet_data["merged_cells"].append(item)
+
+        elif kind == 'dataValidation':
+            validation_info = {
+                "type": item["type"],
+                "formula1": item["formula1"],
+                "formula2": item["formula2"],
+                "ranges": item["ranges"]
+            }
+            sheet_data["data_validation"].append(validation_info)
+            print(f"  데이터 유효성 검사 - 타입: {item['type']}, 범위: {item['ranges']}")
+
+        elif kind == 'conditionalFormatting':
+            sheet_data["conditional_formatting"].append(item)
+            print(f"  조건부 서식: {item}")
+
+    if row_data:
+        if writer is not None:
+            writer.write_row(sheet_name, current_row, row_data)
+        else:
+            sheet_data["data"].append(row_data)
+
+    if sheet_data["formulas"]:
+        print(f"\n발견된 수식 총 {len(sheet_data['formulas'])}개")
+    else:
+        print(f"\n수식이 발견되지 않았습니다.")
+
+    if writer is not None:
+        # 시트의 행 레코드 뒤에 셀 데이터를 뺀 시트 정보 레코드
+        writer.write({"type": "sheet", **{k: v for k, v in sheet_data.items() if k != "data"}})
+
+    return sheet_data
+
+def _style_info(cell):
+    """openpyxl 셀의 서식 정보 (스타일 표 항목)"""
+    return {
+        "number_format": cell.number_format,
+        "font": {
+            "name": cell.font.name,
+            "size": cell.font.size,
+            "bold": cell.font.bold,
+            "italic": cell.font.italic
+        },
+        "fill": str(cell.fill.fgColor.rgb) if cell.fill.fgColor.rgb != '00000000' else None,
+        "alignment": {
+            "horizontal": cell.alignment.horizontal,
+            "vertical": cell.alignment.vertical
+        }
+    }
+
+def _intern_style(cell, styles, style_index):
+    """셀 스타일을 스타일 표에 한 번만 등록하고 표 번호를 반환"""
+    # openpyxl 은 같은 스타일 조합에 같은 style_id 를 주므로 그 번호로 중복을 거름
+    key = cell.style_id
+    index = style_index.get(key)
+    if index is None:
+        index = len(styles)
+        style_index[key] = index
+        styles.append(_style_info(cell))
+    return index
+
+def analyze_worksheet(ws, sheet_name, styles=None, style_index=None):
+    """개별 워크시트를 분석합니다. (셀 서식은 styles 표에 등록하고 셀에는 style_id 만 저장)"""
+    if styles is None:
+        styles, style_index = [], {}
     print(f"\n{'='*50}")
     print(f"워크시트: {sheet_name}")
     print(f"{'='*50}")
@@ -97,18 +357,7 @@ def analyze_worksheet(ws, sheet_name):
                 "value": cell.value,
                 "data_type": str(type(cell.value).__name__),
                 "formula": None,
-                "number_format": cell.number_format,
-                "font": {
-                    "name": cell.font.name,
-                    "size": cell.font.size,
-                    "bold": cell.font.bold,
-                    "italic": cell.font.italic
-                },
-                "fill": str(cell.fill.fgColor.rgb) if cell.fill.fgColor.rgb != '00000000' else None,
-                "alignment": {
-                    "horizontal": cell.alignment.horizontal,
-                    "vertical": cell.alignment.vertical
-                }
+                "style_id": _intern_style(cell, styles, style_index)
             }
             
             # 수식이 있는 셀 확인
@@ -186,25 +435,92 @@ def analyze_worksheet(ws, sheet_name):
     
     return sheet_data
 
+def save_analysis(analysis, output_file, compact=False):
+    """분석 결과를 JSON 으로 저장 (compact 면 들여쓰기 없이)"""
+    try:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            if compact:
+                json.dump(analysis, f, ensure_ascii=False, separators=(',', ':'), default=str)
+            else:
+                json.dump(analysis, f, ensure_ascii=False, indent=2, default=str)
+        print(f"\n분석 결과가 {output_file}에 저장되었습니다.")
+    except Exception as e:
+        print(f"JSON 저장 오류: {e}")
+
+def store_analysis(session, db_path):
+    """워크북을 SQLite 분석 저장소에 적재 (바뀌지 않은 시트는 건너뜀)"""
+    try:
+        with AnalysisStore(db_path) as store:
+            status = store.load_workbook(session)
+    except sqlite3.Error as e:
+        print(f"분석 저장소 적재 오류: {e}")
+        return
+    loaded = [name for name, state in status.items() if state == 'loaded']
+    print(f"\n분석 저장소 {db_path}: 시트 {len(loaded)}개 다시 적재, "
+          f"{sum(1 for state in status.values() if state == 'unchanged')}개 변경 없음")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Excel 파일 상세 분석")
+    parser.add_argument("file_path", nargs="?",
+                        default="/Users/sung/user/workspace/GRK/GRK_workspace/2025_CF_management.xlsx")
+    parser.add_argument("--output", default="/Users/sung/user/workspace/GRK/GRK_workspace/excel_analysis.json",
+                        help="분석 결과 JSON 경로")
+    parser.add_argument("--compact", action="store_true",
+                        help="--output JSON 을 들여쓰기 없이 저장")
+    parser.add_argument("--stream", action="store_true",
+                        help="openpyxl 대신 시트 XML 을 스트리밍으로 읽어 분석")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="시트별 병렬 분석 프로세스 수 (2 이상이면 스트리밍 경로 사용)")
+    parser.add_argument("--ndjson", metavar="PATH",
+                        help="셀 데이터를 읽는 즉시 NDJSON 으로 기록 (.gz/.zst 는 압축, '-' 는 표준 출력). "
+                             "지정하면 --output JSON 은 만들지 않음")
+    parser.add_argument("--compress", choices=COMPRESSIONS,
+                        help="NDJSON 압축 방식 (기본: 확장자로 판단)")
+    parser.add_argument("--ndjson-cells", action="store_true",
+                        help="NDJSON 을 행 단위 대신 셀 단위 레코드로 기록")
+    parser.add_argument("--store", metavar="DB",
+                        help="셀/수식/참조/병합 셀/유효성 검사를 SQLite 저장소에 적재 (바뀐 시트만 다시 적재)")
+    return parser.parse_args(argv)
+
 def main():
-    file_path = "/Users/sung/user/workspace/GRK/GRK_workspace/2025_CF_management.xlsx"
-    
-    print("Excel 파일 상세 분석을 시작합니다...\n")
-    
-    # Excel 파일 분석
-    analysis = analyze_excel_file(file_path)
+    args = parse_args()
+    file_path = args.file_path
     
-    if analysis:
-        # JSON 형태로도 저장
-        output_file = "/Users/sung/user/workspace/GRK/GRK_workspace/excel_analysis.json"
+    # NDJSON 스트리밍 출력: 셀 데이터를 메모리에 모으지 않음
+    writer = None
+    if args.ndjson:
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(analysis, f, ensure_ascii=False, indent=2, default=str)
-            print(f"\n분석 결과가 {output_file}에 저장되었습니다.")
-        except Exception as e:
-            print(f"JSON 저장 오류: {e}")
+            writer = NdjsonWriter(args.ndjson, args.compress, per_cell=args.ndjson_cells)
+        except (ValueError, RuntimeError) as e:
+            print(f"NDJSON 출력 오류: {e}")
+            return
+    # 표준 출력으로 NDJSON 을 내보낼 때는 진행 상황 출력을 표준 오류로 돌림
+    console = sys.stderr if args.ndjson == '-' else sys.stdout
     
-    print("\n분석 완료!")
+    with contextlib.redirect_stdout(console):
+        print("Excel 파일 상세 분석을 시작합니다...\n")
+        
+        if writer is not None:
+            with WorkbookSession(file_path) as session, writer:
+                analysis = analyze_excel_file(session, workers=args.workers, writer=writer)
+                if analysis and args.store:
+                    store_analysis(session, args.store)
+            if analysis:
+                print(f"\nNDJSON {writer.records}줄을 {args.ndjson}에 기록했습니다. ({writer.compression})")
+            print("\n분석 완료!")
+            return
+        
+        # Excel 파일 분석
+        with WorkbookSession(file_path) as session:
+            analysis = analyze_excel_file(session, stream=args.stream, workers=args.workers)
+            if analysis and args.store:
+                store_analysis(session, args.store)
+        
+        if analysis:
+            # JSON 형태로도 저장
+            save_analysis(analysis, args.output, compact=args.compact)
+        
+        print("\n분석 완료!")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
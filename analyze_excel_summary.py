@@ -4,73 +4,88 @@ Excel 파일 요약 분석 스크립트
 워크시트별 구조와 주요 수식을 요약하여 보고합니다.
 """
 
-import openpyxl
-from openpyxl import load_workbook
-import zipfile
-import xml.etree.ElementTree as ET
-import os
+import argparse
 
-def check_vba_macros(file_path):
+from analysis_cache import add_cache_arguments, cache_from_args
+from formula_graph import tokenize
+from workbook_session import WorkbookSession
+
+def check_vba_macros(session):
     """Excel 파일에서 VBA 매크로 확인"""
     print("\n=== VBA 매크로 검사 ===")
-    try:
-        # Excel 파일을 zip으로 열어서 vbaProject.bin 파일 확인
-        with zipfile.ZipFile(file_path, 'r') as zip_file:
-            file_list = zip_file.namelist()
-            vba_files = [f for f in file_list if 'vba' in f.lower() or 'macro' in f.lower()]
-            
-            if vba_files:
-                print(f"VBA 관련 파일 발견:")
-                for vba_file in vba_files:
-                    print(f"  - {vba_file}")
-            else:
-                print("VBA 매크로가 발견되지 않았습니다.")
-                
-    except Exception as e:
-        print(f"VBA 매크로 검사 중 오류: {e}")
+    # zip 안의 vbaProject.bin 등 매크로 파일 확인
+    vba_files = [f for f in session.namelist if 'vba' in f.lower() or 'macro' in f.lower()]
+    
+    if vba_files:
+        print(f"VBA 관련 파일 발견:")
+        for vba_file in vba_files:
+            print(f"  - {vba_file}")
+    else:
+        print("VBA 매크로가 발견되지 않았습니다.")
 
-def analyze_data_validation(ws):
+def analyze_data_validation(summary):
     """데이터 유효성 검사 규칙 분석"""
     validations = []
-    try:
-        if hasattr(ws, 'data_validations') and ws.data_validations:
-            for dv in ws.data_validations.dataValidation:
-                validation = {
-                    'type': dv.type,
-                    'formula1': dv.formula1,
-                    'formula2': dv.formula2,
-                    'ranges': [str(r) for r in dv.ranges]
-                }
-                validations.append(validation)
-    except Exception as e:
-        print(f"  데이터 유효성 검사 분석 오류: {e}")
+    for dv in summary['data_validation']:
+        validation = {
+            'type': dv['type'],
+            'formula1': dv['formula1'],
+            'formula2': dv['formula2'],
+            'ranges': dv['ranges']
+        }
+        validations.append(validation)
     return validations
 
-def get_formula_summary(ws):
-    """워크시트의 주요 수식 패턴 분석"""
+def classify_formula(formula):
+    """
+    수식 분류: 'vlookup' / 'sum' / 'reference'(다른 시트 참조) / 'calculation' / None.
+    문자열 리터럴/시트 이름 안의 글자에 속지 않도록 토큰 단위로 판단하고,
+    토큰화할 수 없는 수식(표 참조 Table1[Col] 등)은 예전처럼 문자열 포함 여부로 판단합니다.
+    """
+    try:
+        tokens = tokenize(formula)
+    except ValueError:
+        upper = formula.upper()
+        if 'VLOOKUP' in upper:
+            return 'vlookup'
+        if 'SUM(' in upper:
+            return 'sum'
+        if '!' in formula:
+            return 'reference'
+        if any(op in formula for op in ['+', '-', '*', '/', '%']):
+            return 'calculation'
+        return None
+    functions = {t.text.upper() for t in tokens if t.kind == 'func'}
+    if 'VLOOKUP' in functions:
+        return 'vlookup'
+    if 'SUM' in functions:
+        return 'sum'
+    if any(t.kind == 'ref' and '!' in t.text for t in tokens):
+        return 'reference'
+    if any(t.kind == 'op' and t.text in '+-*/%' for t in tokens):
+        return 'calculation'
+    return None
+
+def get_formula_summary(sheet_formulas):
+    """워크시트의 주요 수식 패턴 분석 (sheet_formulas: (셀 주소, 수식) 목록)"""
     formulas = []
     vlookup_formulas = []
     sum_formulas = []
     reference_formulas = []
     calculation_formulas = []
     
-    for row in ws.iter_rows():
-        for cell in row:
-            if cell.value and isinstance(cell.value, str) and cell.value.startswith('='):
-                formula = cell.value
-                cell_ref = f"{cell.column_letter}{cell.row}"
-                
-                formulas.append({'cell': cell_ref, 'formula': formula})
-                
-                # 수식 분류
-                if 'VLOOKUP' in formula.upper():
-                    vlookup_formulas.append({'cell': cell_ref, 'formula': formula})
-                elif 'SUM(' in formula.upper():
-                    sum_formulas.append({'cell': cell_ref, 'formula': formula})
-                elif '!' in formula:  # 다른 시트 참조
-                    reference_formulas.append({'cell': cell_ref, 'formula': formula})
-                elif any(op in formula for op in ['+', '-', '*', '/', '%']):
-                    calculation_formulas.append({'cell': cell_ref, 'formula': formula})
+    for cell_ref, formula in sheet_formulas:
+        entry = {'cell': cell_ref, 'formula': formula}
+        formulas.append(entry)
+        category = classify_formula(formula)
+        if category == 'vlookup':
+            vlookup_formulas.append(entry)
+        elif category == 'sum':
+            sum_formulas.append(entry)
+        elif category == 'reference':
+            reference_formulas.append(entry)
+        elif category == 'calculation':
+            calculation_formulas.append(entry)
     
     return {
         'total_formulas': len(formulas),
@@ -81,23 +96,24 @@ def get_formula_summary(ws):
         'calculation_formulas': calculation_formulas
     }
 
-def analyze_worksheet_summary(ws, sheet_name):
-    """워크시트 요약 분석"""
+def analyze_worksheet_summary(summary, sheet_name):
+    """워크시트 요약 분석 (summary: WorkbookSession.summary 의 시트 요약)"""
     print(f"\n{'='*60}")
     print(f"워크시트: {sheet_name}")
     print(f"{'='*60}")
     
     # 기본 정보
-    min_row, max_row = ws.min_row, ws.max_row
-    min_col, max_col = ws.min_column, ws.max_column
-    used_range = f"{ws.cell(min_row, min_col).coordinate}:{ws.cell(max_row, max_col).coordinate}"
+    dims = summary['dimensions']
+    min_row, max_row = dims['min_row'], dims['max_row']
+    min_col, max_col = dims['min_col'], dims['max_col']
+    used_range = dims['used_range']
     
     print(f"사용 범위: {used_range}")
     print(f"행 수: {max_row - min_row + 1}")
     print(f"열 수: {max_col - min_col + 1}")
     
     # 병합된 셀
-    merged_ranges = list(ws.merged_cells.ranges)
+    merged_ranges = summary['merged_cells']
     if merged_ranges:
         print(f"\n병합된 셀 ({len(merged_ranges)}개):")
         for i, merged_range in enumerate(merged_ranges[:10]):  # 처음 10개만 표시
@@ -106,7 +122,7 @@ def analyze_worksheet_summary(ws, sheet_name):
             print(f"  ... 및 {len(merged_ranges) - 10}개 더")
     
     # 수식 분석
-    formula_analysis = get_formula_summary(ws)
+    formula_analysis = get_formula_summary(summary['formulas'])
     print(f"\n수식 분석:")
     print(f"  총 수식 개수: {formula_analysis['total_formulas']}")
     print(f"  VLOOKUP 수식: {len(formula_analysis['vlookup_formulas'])}개")
@@ -130,7 +146,7 @@ def analyze_worksheet_summary(ws, sheet_name):
             print(f"  ... 및 {len(formula_analysis['reference_formulas']) - 5}개 더")
     
     # 데이터 유효성 검사
-    validations = analyze_data_validation(ws)
+    validations = analyze_data_validation(summary)
     if validations:
         print(f"\n데이터 유효성 검사 ({len(validations)}개):")
         for i, validation in enumerate(validations):
@@ -141,16 +157,8 @@ def analyze_worksheet_summary(ws, sheet_name):
     # 주요 데이터 영역 식별
     print(f"\n주요 데이터 영역:")
     
-    # 헤더 행 찾기 (첫 10행에서)
-    headers = []
-    for row in range(1, min(11, max_row + 1)):
-        row_data = []
-        for col in range(min_col, min_col + 10):  # 처음 10열만
-            cell = ws.cell(row=row, column=col)
-            if cell.value and isinstance(cell.value, str):
-                row_data.append(f"{cell.coordinate}: {cell.value}")
-        if row_data:
-            headers.extend(row_data)
+    # 헤더 행 찾기 (첫 10행, 처음 10열에서)
+    headers = [f"{address}: {text}" for address, text in summary['labels'] if text]
     
     if headers:
         print("  주요 헤더/라벨:")
@@ -161,31 +169,28 @@ def analyze_worksheet_summary(ws, sheet_name):
     
     return formula_analysis
 
-def main():
-    file_path = "/Users/sung/user/workspace/GRK/GRK_workspace/2025_CF_management.xlsx"
-    
+def summarize_workbook(session):
+    """워크북 전체 요약 리포트"""
     print("=== GRK Partners 2025 Cash Flow Management Excel 파일 상세 분석 ===")
-    print(f"파일: {file_path}")
+    print(f"파일: {session.file_path}")
     
     # VBA 매크로 검사
-    check_vba_macros(file_path)
+    check_vba_macros(session)
     
     try:
-        # Excel 파일 로드
-        wb = load_workbook(file_path, data_only=False)
+        summaries = session.summaries
         
         print(f"\n=== 워크북 전체 정보 ===")
-        print(f"총 워크시트 개수: {len(wb.worksheets)}")
+        print(f"총 워크시트 개수: {len(summaries)}")
         print(f"워크시트 목록:")
-        for i, sheet_name in enumerate(wb.sheetnames, 1):
+        for i, sheet_name in enumerate(summaries, 1):
             print(f"  {i}. {sheet_name}")
-        print(f"활성 시트: {wb.active.title}")
+        print(f"활성 시트: {session.active_sheet}")
         
         # 각 워크시트 분석
         all_formulas = {}
-        for sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
-            formula_analysis = analyze_worksheet_summary(ws, sheet_name)
+        for sheet_name, summary in summaries.items():
+            formula_analysis = analyze_worksheet_summary(summary, sheet_name)
             all_formulas[sheet_name] = formula_analysis
         
         # 전체 요약
@@ -226,5 +231,19 @@ def main():
     except Exception as e:
         print(f"오류 발생: {str(e)}")
 
+def main():
+    parser = argparse.ArgumentParser(description="Excel 파일 요약 분석")
+    parser.add_argument("file_path", nargs="?",
+                        default="/Users/sung/user/workspace/GRK/GRK_workspace/2025_CF_management.xlsx")
+    add_cache_arguments(parser)
+    args = parser.parse_args()
+    cache = cache_from_args(args)
+    
+    with WorkbookSession(args.file_path, cache) as session:
+        summarize_workbook(session)
+    
+    if cache is not None:
+        cache.report()
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
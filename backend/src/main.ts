@@ -13,6 +13,9 @@ async function bootstrap() {
   // Global prefix 설정
   app.setGlobalPrefix('api');
 
+  // JSON 본문 크기 제한 (직원 일괄 등록 요청은 기본 100kb 를 넘을 수 있음)
+  app.useBodyParser('json', { limit: '5mb' });
+
   // 정적 파일 서빙 설정
   app.useStaticAssets(join(__dirname, '..', 'uploads'), {
     prefix: '/uploads/',
@@ -38,6 +38,8 @@ import {
   CreateLeaveRequestDto,
   CreateResignationRequestDto,
   CreateEvaluationDto,
+  BulkCreateEmployeeDto,
+  BulkCreateEmployeeResultDto,
 } from '../dto';
 import { Response } from 'express';
 
@@ -63,6 +65,22 @@ export class EmployeeController {
     }
   }
 
+  @Post('bulk')
+  @ApiOperation({
+    summary: 'Create multiple employees in one request',
+    description:
+      'Each row is validated like POST /employees. Valid rows are saved in one transaction; results are returned per row in request order.',
+  })
+  @ApiResponse({
+    status: 201,
+    description: 'Per-row creation results.',
+    type: BulkCreateEmployeeResultDto,
+  })
+  @ApiResponse({ status: 400, description: 'Bad request.' })
+  bulkCreate(@Body() bulkCreateEmployeeDto: BulkCreateEmployeeDto) {
+    return this.employeeService.bulkCreate(bulkCreateEmployeeDto.employees);
+  }
+
   @Get()
   @ApiOperation({ summary: 'Get all employees' })
   @ApiQuery({
@@ -0,0 +1,52 @@
+import { IsArray, ArrayNotEmpty, ArrayMaxSize, IsObject } from 'class-validator';
+import { ApiProperty, ApiPropertyOptional } from '@nestjs/swagger';
+
+// 한 번의 일괄 등록 요청에 담을 수 있는 최대 직원 수
+export const BULK_CREATE_MAX_ROWS = 1000;
+
+export class BulkCreateEmployeeDto {
+  @ApiProperty({
+    description:
+      'Employees to create (each item is validated as CreateEmployeeDto; invalid rows are reported per row)',
+    type: [Object],
+    maxItems: BULK_CREATE_MAX_ROWS,
+  })
+  @IsArray({ message: '직원 목록은 배열이어야 합니다.' })
+  @ArrayNotEmpty({ message: '직원 목록이 비어 있습니다.' })
+  @ArrayMaxSize(BULK_CREATE_MAX_ROWS, {
+    message: `직원 목록은 한 번에 최대 ${BULK_CREATE_MAX_ROWS}명까지 보낼 수 있습니다.`,
+  })
+  @IsObject({ each: true, message: '직원 항목은 객체여야 합니다.' })
+  employees: Record<string, unknown>[];
+}
+
+export class BulkCreateEmployeeRowResult {
+  @ApiProperty({ description: 'Index of the row in the request array' })
+  index: number;
+
+  @ApiProperty({ enum: ['created', 'failed'] })
+  status: 'created' | 'failed';
+
+  @ApiPropertyOptional({ description: 'Created employee ID' })
+  id?: number;
+
+  @ApiPropertyOptional({ description: 'Employee number (given or auto-generated)' })
+  empNo?: string;
+
+  @ApiPropertyOptional({ description: 'Validation or database errors', type: [String] })
+  errors?: string[];
+}
+
+export class BulkCreateEmployeeResultDto {
+  @ApiProperty()
+  total: number;
+
+  @ApiProperty()
+  created: number;
+
+  @ApiProperty()
+  failed: number;
+
+  @ApiProperty({ type: [BulkCreateEmployeeRowResult] })
+  results: BulkCreateEmployeeRowResult[];
+}
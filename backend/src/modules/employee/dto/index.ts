@@ -5,3 +5,4 @@ export * from './hr-cost.dto';
 export * from './leave-request.dto';
 export * from './resignation-request.dto';
 export * from './create-evaluation.dto';
+export * from './bulk-create-employee.dto';
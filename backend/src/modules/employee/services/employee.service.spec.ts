@@ -0,0 +1,225 @@
+import { Test, TestingModule } from '@nestjs/testing';
+import { getRepositoryToken } from '@nestjs/typeorm';
+import { DataSource } from 'typeorm';
+import {
+  Employee,
+  Education,
+  Experience,
+  LeaveBalance,
+} from '../../../entities';
+import { EmployeeService } from './employee.service';
+
+// 통과하는 직원 행 (사번/입사일 등은 overrides 로 바꿈)
+function employeeRow(
+  index: number,
+  overrides: Record<string, unknown> = {},
+): Record<string, unknown> {
+  return {
+    name: '홍길동',
+    position: '사원',
+    department: '개발팀',
+    tel: '010-1234-5678',
+    email: `hong${index}@example.com`,
+    joinDate: '2024-03-02',
+    ...overrides,
+  };
+}
+
+describe('EmployeeService', () => {
+  let service: EmployeeService;
+  // 연도 → DB 에 있는 그 해 마지막 사번
+  let lastEmpNos: Record<number, string>;
+  // DB 에 이미 있는 사번 (삭제된 직원 포함)
+  let existingEmpNos: string[];
+  let nextId: number;
+  let savedById: Map<number, any>;
+  let employeeRepository: any;
+  let leaveBalanceRepository: any;
+  let manager: any;
+  let dataSource: any;
+
+  const assignId = (employee: any) => {
+    const saved = { ...employee, id: nextId++ };
+    savedById.set(saved.id, saved);
+    return saved;
+  };
+
+  beforeEach(async () => {
+    lastEmpNos = {};
+    existingEmpNos = [];
+    nextId = 1;
+    savedById = new Map();
+
+    employeeRepository = {
+      create: jest.fn((data) => ({ ...data })),
+      find: jest.fn(async () =>
+        existingEmpNos.map((empNo, i) => ({ id: 1000 + i, empNo })),
+      ),
+      findOne: jest.fn(async ({ where }) => savedById.get(where.id) ?? null),
+      save: jest.fn(async (employee) => assignId(employee)),
+      createQueryBuilder: jest.fn(() => {
+        let pattern = '';
+        const builder: any = {
+          where: jest.fn((_, params) => {
+            pattern = params.pattern;
+            return builder;
+          }),
+          withDeleted: jest.fn(() => builder),
+          orderBy: jest.fn(() => builder),
+          getOne: jest.fn(async () => {
+            const empNo = lastEmpNos[Number(pattern.slice(0, 4))];
+            return empNo ? { empNo } : null;
+          }),
+        };
+        return builder;
+      }),
+    };
+    leaveBalanceRepository = {
+      create: jest.fn((data) => ({ ...data })),
+      save: jest.fn(async (balance) => balance),
+    };
+    manager = {
+      save: jest.fn(async (entity, items) =>
+        entity === Employee ? items.map(assignId) : items,
+      ),
+    };
+    dataSource = {
+      transaction: jest.fn(async (work) => work(manager)),
+    };
+
+    const module: TestingModule = await Test.createTestingModule({
+      providers: [
+        EmployeeService,
+        {
+          provide: getRepositoryToken(Employee),
+          useValue: employeeRepository,
+        },
+        { provide: getRepositoryToken(Education), useValue: {} },
+        { provide: getRepositoryToken(Experience), useValue: {} },
+        {
+          provide: getRepositoryToken(LeaveBalance),
+          useValue: leaveBalanceRepository,
+        },
+        { provide: DataSource, useValue: dataSource },
+      ],
+    }).compile();
+
+    service = module.get<EmployeeService>(EmployeeService);
+  });
+
+  describe('bulkCreate', () => {
+    it('rejects a duplicate empNo within the same batch', async () => {
+      const result = await service.bulkCreate([
+        employeeRow(0, { empNo: '2024100' }),
+        employeeRow(1, { empNo: '2024100' }),
+      ]);
+
+      expect(result).toMatchObject({ total: 2, created: 1, failed: 1 });
+      expect(result.results[0]).toEqual({
+        index: 0,
+        status: 'created',
+        id: 1,
+        empNo: '2024100',
+      });
+      expect(result.results[1]).toEqual({
+        index: 1,
+        status: 'failed',
+        errors: ['사번 2024100이 이미 존재합니다.'],
+      });
+      expect(employeeRepository.find).toHaveBeenCalledTimes(1);
+    });
+
+    it('rejects an empNo that already exists in the database', async () => {
+      existingEmpNos = ['2024100'];
+
+      const result = await service.bulkCreate([
+        employeeRow(0, { empNo: '2024100' }),
+        employeeRow(1, { empNo: '2024101' }),
+      ]);
+
+      expect(employeeRepository.find).toHaveBeenCalledWith(
+        expect.objectContaining({ withDeleted: true }),
+      );
+      expect(result.results[0]).toEqual({
+        index: 0,
+        status: 'failed',
+        errors: ['사번 2024100이 이미 존재합니다.'],
+      });
+      expect(result.results[1]).toMatchObject({
+        status: 'created',
+        empNo: '2024101',
+      });
+    });
+
+    it('falls back to per-row create() when the batch save fails', async () => {
+      lastEmpNos = { 2024: '2024004' };
+      manager.save.mockRejectedValueOnce(new Error('batch insert failed'));
+      employeeRepository.save
+        .mockImplementationOnce(async (employee) => assignId(employee))
+        .mockRejectedValueOnce(new Error('duplicate key value'));
+
+      const result = await service.bulkCreate([
+        employeeRow(0),
+        employeeRow(1),
+        employeeRow(2, { email: 'not-an-email' }),
+      ]);
+
+      expect(result).toMatchObject({ total: 3, created: 1, failed: 2 });
+      // 재시도 행은 일괄 채번한 사번을 그대로 씀
+      expect(result.results[0]).toMatchObject({
+        status: 'created',
+        empNo: '2024005',
+      });
+      expect(result.results[1]).toEqual({
+        index: 1,
+        status: 'failed',
+        errors: ['duplicate key value'],
+      });
+      expect(result.results[2].status).toBe('failed');
+      expect(result.results[2].errors).toEqual([
+        expect.stringMatching(/^email: /),
+      ]);
+      expect(employeeRepository.save).toHaveBeenCalledTimes(2);
+      expect(
+        employeeRepository.save.mock.calls.map(([employee]) => employee.empNo),
+      ).toEqual(['2024005', '2024006']);
+      expect(employeeRepository.createQueryBuilder).toHaveBeenCalledTimes(1);
+    });
+
+    it('numbers empNos per join year across save chunks', async () => {
+      lastEmpNos = { 2024: '2024005' };
+      const rows = Array.from({ length: 201 }, (_, i) => employeeRow(i));
+      rows.splice(100, 0, employeeRow(201, { joinDate: '2023-07-01' }));
+      rows.splice(150, 0, employeeRow(202, { empNo: '2024010' }));
+      rows.push(employeeRow(203, { joinDate: '2023-11-15' }));
+
+      const result = await service.bulkCreate(rows);
+
+      expect(result).toMatchObject({ total: 204, created: 204, failed: 0 });
+      // id 는 manager.save 가 돌려준 (복사된) 엔티티에서 옴
+      expect(result.results.map((row) => row.id)).toEqual(
+        Array.from({ length: 204 }, (_, i) => i + 1),
+      );
+      const empNos = result.results.map((row) => row.empNo as string);
+      expect(new Set(empNos).size).toBe(204);
+      const auto2024 = empNos.filter(
+        (empNo) => empNo.startsWith('2024') && empNo !== '2024010',
+      );
+      const expected2024 = Array.from({ length: 202 }, (_, i) => 6 + i)
+        .filter((n) => n !== 10)
+        .map((n) => `2024${String(n).padStart(3, '0')}`);
+      expect(auto2024).toEqual(expected2024);
+      expect(empNos.filter((empNo) => empNo.startsWith('2023'))).toEqual([
+        '2023001',
+        '2023002',
+      ]);
+      // 연도마다 마지막 번호는 한 번만 조회하고, 저장은 한 트랜잭션에서 200개씩
+      expect(employeeRepository.createQueryBuilder).toHaveBeenCalledTimes(2);
+      expect(dataSource.transaction).toHaveBeenCalledTimes(1);
+      expect(manager.save).toHaveBeenCalledWith(Employee, expect.any(Array), {
+        chunk: 200,
+      });
+      expect(manager.save.mock.calls[0][1]).toHaveLength(204);
+    });
+  });
+});
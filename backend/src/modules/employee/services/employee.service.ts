@@ -1,6 +1,8 @@
 import { Injectable, NotFoundException } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
-import { Repository } from 'typeorm';
+import { Repository, DataSource, In } from 'typeorm';
+import { plainToInstance } from 'class-transformer';
+import { validate, ValidationError } from 'class-validator';
 import {
   Employee,
   Education,
@@ -8,7 +10,29 @@ import {
   LeaveBalance,
   EmployeeStatus,
 } from '../../../entities';
-import { CreateEmployeeDto, UpdateEmployeeDto, CreateLeaveRequestDto, CreateResignationRequestDto, CreateEvaluationDto } from '../dto';
+import {
+  CreateEmployeeDto,
+  UpdateEmployeeDto,
+  CreateLeaveRequestDto,
+  CreateResignationRequestDto,
+  CreateEvaluationDto,
+  BulkCreateEmployeeResultDto,
+  BulkCreateEmployeeRowResult,
+} from '../dto';
+
+// 검증 오류를 "필드: 메시지" 목록으로 (중첩된 학력/경력 항목 포함)
+function flattenValidationErrors(
+  errors: ValidationError[],
+  parent = '',
+): string[] {
+  return errors.flatMap((error) => {
+    const path = parent ? `${parent}.${error.property}` : error.property;
+    const messages = Object.values(error.constraints ?? {}).map(
+      (message) => `${path}: ${message}`,
+    );
+    return messages.concat(flattenValidationErrors(error.children ?? [], path));
+  });
+}
 
 @Injectable()
 export class EmployeeService {
@@ -21,6 +45,7 @@ export class EmployeeService {
     private experienceRepository: Repository<Experience>,
     @InjectRepository(LeaveBalance)
     private leaveBalanceRepository: Repository<LeaveBalance>,
+    private dataSource: DataSource,
   ) {}
 
   async create(createEmployeeDto: CreateEmployeeDto): Promise<Employee> {
@@ -40,40 +65,176 @@ export class EmployeeService {
       }
     }
 
+    const employee = this.buildEmployee(createEmployeeDto, empNo);
+    const savedEmployee = await this.employeeRepository.save(employee);
+
+    // 휴가 잔여 초기화
+    await this.leaveBalanceRepository.save(this.buildLeaveBalance(savedEmployee));
+
+    return this.findOne(savedEmployee.id);
+  }
+
+  /**
+   * 직원 일괄 등록
+   * 각 행을 CreateEmployeeDto 규칙으로 검증하고, 통과한 행은 사번을 연도별로 한 번에 채번한 뒤
+   * 하나의 트랜잭션으로 저장합니다. 결과는 요청 배열 순서대로 행마다 반환합니다.
+   * 일괄 저장이 실패하면 문제 행을 찾기 위해 행 단위 등록으로 다시 시도합니다.
+   */
+  async bulkCreate(
+    rows: Record<string, unknown>[],
+  ): Promise<BulkCreateEmployeeResultDto> {
+    const results: BulkCreateEmployeeRowResult[] = rows.map((_, index) => ({
+      index,
+      status: 'failed',
+    }));
+
+    // 1. 행별 검증 (전역 ValidationPipe 와 같은 옵션)
+    const validRows: { index: number; dto: CreateEmployeeDto }[] = [];
+    for (const [index, row] of rows.entries()) {
+      const dto = plainToInstance(CreateEmployeeDto, row);
+      const errors = await validate(dto, {
+        whitelist: true,
+        forbidNonWhitelisted: true,
+      });
+      if (errors.length > 0) {
+        results[index].errors = flattenValidationErrors(errors);
+      } else {
+        validRows.push({ index, dto });
+      }
+    }
+
+    // 2. 지정된 사번 중복 확인 (DB 는 한 번만 조회, 삭제된 직원 포함)
+    const givenEmpNos = validRows
+      .map(({ dto }) => dto.empNo)
+      .filter((empNo): empNo is string => !!empNo);
+    const takenEmpNos = new Set(
+      givenEmpNos.length > 0
+        ? (
+            await this.employeeRepository.find({
+              select: { id: true, empNo: true },
+              where: { empNo: In(givenEmpNos) },
+              withDeleted: true,
+            })
+          ).map((employee) => employee.empNo)
+        : [],
+    );
+    const acceptedRows: typeof validRows = [];
+    for (const row of validRows) {
+      const empNo = row.dto.empNo;
+      if (empNo && takenEmpNos.has(empNo)) {
+        results[row.index].errors = [`사번 ${empNo}이 이미 존재합니다.`];
+        continue;
+      }
+      if (empNo) takenEmpNos.add(empNo);
+      acceptedRows.push(row);
+    }
+
+    // 3. 자동 사번 채번 (연도별 마지막 번호를 한 번씩만 조회)
+    const nextNumbers = new Map<number, number>();
+    const pending: { index: number; dto: CreateEmployeeDto; employee: Employee }[] = [];
+    for (const { index, dto } of acceptedRows) {
+      let empNo = dto.empNo;
+      if (!empNo) {
+        const year = new Date(dto.joinDate).getFullYear();
+        let nextNumber =
+          nextNumbers.get(year) ?? (await this.findLastEmpNumber(year)) + 1;
+        while (takenEmpNos.has(`${year}${String(nextNumber).padStart(3, '0')}`)) {
+          nextNumber++;
+        }
+        if (nextNumber > 999) {
+          results[index].errors = [
+            `연도별 사번 한계(999)를 초과했습니다. 현재 연도: ${year}`,
+          ];
+          nextNumbers.set(year, nextNumber);
+          continue;
+        }
+        empNo = `${year}${String(nextNumber).padStart(3, '0')}`;
+        nextNumbers.set(year, nextNumber + 1);
+        takenEmpNos.add(empNo);
+      }
+      pending.push({ index, dto, employee: this.buildEmployee(dto, empNo) });
+    }
+
+    // 4. 하나의 트랜잭션으로 저장
+    if (pending.length > 0) {
+      try {
+        const saved = await this.dataSource.transaction(async (manager) => {
+          const employees = await manager.save(
+            Employee,
+            pending.map(({ employee }) => employee),
+            { chunk: 200 },
+          );
+          await manager.save(
+            LeaveBalance,
+            employees.map((employee) => this.buildLeaveBalance(employee)),
+            { chunk: 200 },
+          );
+          return employees;
+        });
+        // id 는 save 가 돌려준 엔티티에서 읽음 (pending 의 엔티티가 바뀐다고 가정하지 않음)
+        for (const [i, { index }] of pending.entries()) {
+          results[index] = {
+            index,
+            status: 'created',
+            id: saved[i].id,
+            empNo: saved[i].empNo,
+          };
+        }
+      } catch (error) {
+        for (const { index, dto, employee } of pending) {
+          try {
+            const saved = await this.create({ ...dto, empNo: employee.empNo });
+            results[index] = {
+              index,
+              status: 'created',
+              id: saved.id,
+              empNo: saved.empNo,
+            };
+          } catch (rowError) {
+            results[index].errors = [rowError.message];
+          }
+        }
+      }
+    }
+
+    const created = results.filter((row) => row.status === 'created').length;
+    return {
+      total: rows.length,
+      created,
+      failed: rows.length - created,
+      results,
+    };
+  }
+
+  private buildEmployee(dto: CreateEmployeeDto, empNo: string): Employee {
     const employee = this.employeeRepository.create({
-      ...createEmployeeDto,
+      ...dto,
       empNo, // 자동 생성된 사번 사용
-      status:
-        (createEmployeeDto.status as EmployeeStatus) || EmployeeStatus.ACTIVE,
-      joinDate: new Date(createEmployeeDto.joinDate),
-      endDate: createEmployeeDto.endDate
-        ? new Date(createEmployeeDto.endDate)
-        : undefined,
+      status: (dto.status as EmployeeStatus) || EmployeeStatus.ACTIVE,
+      joinDate: new Date(dto.joinDate),
+      endDate: dto.endDate ? new Date(dto.endDate) : undefined,
     });
 
     // 학력 정보 처리 (JSON으로 저장, 빈 배열도 허용)
-    if (createEmployeeDto.education !== undefined) {
-      employee.education = createEmployeeDto.education.length > 0 ? createEmployeeDto.education : null;
+    if (dto.education !== undefined) {
+      employee.education = dto.education.length > 0 ? dto.education : null;
     }
 
     // 경력 정보 처리 (JSON으로 저장, 빈 배열도 허용)
-    if (createEmployeeDto.experience !== undefined) {
-      employee.experience = createEmployeeDto.experience.length > 0 ? createEmployeeDto.experience : null;
+    if (dto.experience !== undefined) {
+      employee.experience = dto.experience.length > 0 ? dto.experience : null;
     }
+    return employee;
+  }
 
-    const savedEmployee = await this.employeeRepository.save(employee);
-
-    // 휴가 잔여 초기화
-    const leaveBalance = this.leaveBalanceRepository.create({
-      employee: savedEmployee,
+  private buildLeaveBalance(employee: Employee): LeaveBalance {
+    return this.leaveBalanceRepository.create({
+      employee,
       year: new Date().getFullYear(),
       total: 15, // 기본 연차 15일
       used: 0,
       remaining: 15,
     });
-    await this.leaveBalanceRepository.save(leaveBalance);
-
-    return this.findOne(savedEmployee.id);
   }
 
   async findAll(): Promise<Employee[]> {
@@ -200,8 +361,23 @@ export class EmployeeService {
    */
   private async generateEmpNo(joinDate: Date): Promise<string> {
     const year = joinDate.getFullYear();
+    const nextNumber = (await this.findLastEmpNumber(year)) + 1;
 
-    // 해당 연도의 마지막 사번 조회 (삭제된 직원 포함)
+    // 3자리로 패딩 (최대 999명/년)
+    if (nextNumber > 999) {
+      throw new Error(
+        `연도별 사번 한계(999)를 초과했습니다. 현재 연도: ${year}`,
+      );
+    }
+
+    return `${year}${String(nextNumber).padStart(3, '0')}`;
+  }
+
+  /**
+   * 해당 연도의 마지막 사번 번호 (뒤 3자리, 없으면 0)
+   * 삭제된 직원 포함
+   */
+  private async findLastEmpNumber(year: number): Promise<number> {
     const lastEmployee = await this.employeeRepository
       .createQueryBuilder('employee')
       .where('employee.empNo LIKE :pattern', { pattern: `${year}%` })
@@ -209,23 +385,14 @@ export class EmployeeService {
       .orderBy('employee.empNo', 'DESC')
       .getOne();
 
-    let nextNumber = 1;
     if (lastEmployee && lastEmployee.empNo) {
       // 마지막 3자리 숫자 추출
       const lastNumber = parseInt(lastEmployee.empNo.slice(4));
       if (!isNaN(lastNumber)) {
-        nextNumber = lastNumber + 1;
+        return lastNumber;
       }
     }
-
-    // 3자리로 패딩 (최대 999명/년)
-    if (nextNumber > 999) {
-      throw new Error(
-        `연도별 사번 한계(999)를 초과했습니다. 현재 연도: ${year}`,
-      );
-    }
-
-    return `${year}${String(nextNumber).padStart(3, '0')}`;
+    return 0;
   }
 
   async updateProfileImage(id: number, imageUrl: string): Promise<Employee> {
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+분석 결과 SQL 저장소 벤치마크
+- 적재: 처음 적재, 바뀐 것 없이 다시 적재, 시트 하나만 바뀐 워크북 다시 적재,
+  시트 하나의 문자열만 고친 워크북 다시 적재 (sharedStrings.xml 은 바뀌어도 그 시트만 다시 넣어야 함)
+- 조회: "03.HR unit cost 를 가리키는 VLOOKUP", "99.프로젝트 PPE 의 다른 시트 참조" 를
+  기존 방식(analyze_excel 스트리밍 분석을 다시 돌려 수식 목록에서 찾기)과 SQL 조회로 비교
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis_store import AnalysisStore
+from analyze_excel import analyze_excel_file_stream
+from formula_graph import formula_functions, formula_references
+from workbook_session import WorkbookSession
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "2025_CF_management.xlsx")
+
+
+def touch_sheet(source, target, sheet_name):
+    """sheet_name 의 시트 XML 끝에 주석만 붙인 워크북 사본 (값은 같고 해시만 바뀜)"""
+    with WorkbookSession(source) as session:
+        part = session.sheet_map[sheet_name]
+    with zipfile.ZipFile(source) as zin, zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as zout:
+        for info in zin.infolist():
+            data = zin.read(info.filename)
+            if info.filename == part:
+                data += b'<!-- edited -->'
+            zout.writestr(info, data)
+
+
+def edit_string(source, target, sheet_name):
+    """
+    Excel 처럼 sheet_name 의 첫 문자열 셀을 고친 워크북 사본:
+    sharedStrings.xml 끝에 새 문자열을 붙이고 그 셀이 새 번호를 가리키게 함
+    """
+    with WorkbookSession(source) as session:
+        part = session.sheet_map[sheet_name]
+        new_index = len(session.shared_strings)
+    with zipfile.ZipFile(source) as zin, zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as zout:
+        for info in zin.infolist():
+            data = zin.read(info.filename)
+            if info.filename == 'xl/sharedStrings.xml':
+                data = data.replace(b'</sst>', b'<si><t>edited</t></si></sst>')
+            elif info.filename == part:
+                data = re.sub(rb'(<c\b[^>]*?\st="s"[^>]*>\s*<v>)\d+(</v>)',
+                              rb'\g<1>%d\g<2>' % new_index, data, count=1)
+            zout.writestr(info, data)
+
+
+def rerun_lookups(path, target_sheet, cross_sheet):
+    """기존 방식: 분석을 다시 돌리고 수식 목록을 훑어서 찾기"""
+    with WorkbookSession(path) as session, contextlib.redirect_stdout(io.StringIO()):
+        analysis = analyze_excel_file_stream(session)
+    lookups, cross = set(), set()
+    for sheet in analysis["worksheets"]:
+        for info in sheet["formulas"]:
+            refs = formula_references(info["formula"], sheet["name"])
+            if 'VLOOKUP' in formula_functions(info["formula"]) and any(r.sheet == target_sheet for r in refs):
+                lookups.add((sheet["name"], info["cell"], info["formula"]))
+            if sheet["name"] == cross_sheet:
+                cross.update((info["cell"], r.sheet, info["formula"]) for r in refs if r.sheet != cross_sheet)
+    return lookups, cross
+
+
+def timed(func, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분석 결과 SQL 저장소 벤치마크")
+    parser.add_argument("file_path", nargs="?", default=DEFAULT_PATH)
+    parser.add_argument("--lookups-into", default="03.HR unit cost")
+    parser.add_argument("--cross-sheet", default="99.프로젝트 PPE")
+    parser.add_argument("--edit-sheet", default="02.Monthly Expense", help="바꿨다고 가정할 시트")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "workbook.xlsx")
+        shutil.copy(args.file_path, path)
+        db_path = os.path.join(tmp, "analysis.sqlite")
+
+        def load():
+            with AnalysisStore(db_path) as store, WorkbookSession(path) as session:
+                return store.load_workbook(session)
+
+        print("=== 적재 ===")
+        for label in ("처음 적재", "변경 없이 다시 적재"):
+            elapsed, status = timed(load)
+            loaded = sum(1 for state in status.values() if state == 'loaded')
+            print(f"  {label:<20} {elapsed:7.3f}초  다시 적재한 시트 {loaded}/{len(status)}")
+        reloaded = []
+        for label, edit in (("시트 하나 변경", touch_sheet), ("문자열 하나 변경", edit_string)):
+            edit(args.file_path, path, args.edit_sheet)
+            elapsed, status = timed(load)
+            loaded = [name for name, state in status.items() if state == 'loaded']
+            reloaded.append(loaded)
+            print(f"  {label:<20} {elapsed:7.3f}초  다시 적재한 시트 {loaded}")
+
+        print("\n=== 조회 ===")
+        old_time, (old_lookups, old_cross) = timed(lambda: rerun_lookups(path, args.lookups_into, args.cross_sheet))
+        with AnalysisStore(db_path) as store:
+            lookup_time, (_, lookups) = timed(lambda: store.lookups_into(args.lookups_into), 100)
+            cross_time, (_, cross) = timed(lambda: store.cross_sheet_refs(args.cross_sheet), 100)
+        same = (set(lookups) == old_lookups and set(cross) == old_cross
+                and all(loaded == [args.edit_sheet] for loaded in reloaded))
+        print(f"  분석 다시 실행 후 검색 (두 질문)   {old_time * 1000:9.1f}ms")
+        print(f"  SQL: {args.lookups_into} VLOOKUP {len(lookups):>4}개  {lookup_time * 1000:9.3f}ms")
+        print(f"  SQL: {args.cross_sheet} 다른 시트 참조 {len(cross):>4}개  {cross_time * 1000:9.3f}ms")
+        print(f"  결과 동일: {same}")
+        if not same:
+            sys.exit("❌ 결과가 다릅니다")
+
+
+if __name__ == "__main__":
+    main()
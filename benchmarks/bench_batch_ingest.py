@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+CF 워크북 일괄 수집 벤치마크
+2025_CF_management.xlsx 를 여러 개(기본 24개, 연도별 폴더) 복사해 scripts/batch_ingest 로
+프로세스 수를 바꿔 가며 수집하고, 전체 시간/처리량과 합친 데이터셋이 직렬 실행과 같은지 확인합니다.
+코어 수보다 많은 프로세스는 빨라지지 않으므로 결과는 실행한 기계의 코어 수와 함께 보세요.
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+from batch_ingest import expand_paths, ingest_paths, merge_results
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "2025_CF_management.xlsx")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CF 워크북 일괄 수집 벤치마크")
+    parser.add_argument("file_path", nargs="?", default=DEFAULT_PATH)
+    parser.add_argument("--files", type=int, default=24, help="복사할 워크북 수")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}), help="프로세스 수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(args.files):
+            folder = os.path.join(tmp, str(2023 + i // 12))
+            os.makedirs(folder, exist_ok=True)
+            shutil.copy(args.file_path, os.path.join(folder, f"CF_{i % 12 + 1:02d}.xlsx"))
+        paths = expand_paths([os.path.join(tmp, '**', '*.xlsx')])
+
+        print(f"=== 워크북 {len(paths)}개, 코어 {os.cpu_count()}개 ===")
+        baseline = None
+        for workers in args.workers:
+            start = time.perf_counter()
+            dataset = merge_results(ingest_paths(paths, workers, verbose=False))
+            elapsed = time.perf_counter() - start
+            dataset.pop('files')
+            if baseline is None:
+                baseline, serial = dataset, elapsed
+            print(f"  프로세스 {workers:>2}개  {elapsed:7.2f}초  {len(paths) / elapsed:6.1f}개/초  "
+                  f"({serial / elapsed:4.1f}배)  직원 {len(dataset['employees'])}명  CF {len(dataset['cashflow'])}행  "
+                  f"결과 동일: {dataset == baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+열 지향 셀 저장소 메모리 벤치마크
+시트 8개 각각에 대해 기존 sheet_data["data"] (셀마다 dict 인 리스트의 리스트) 와
+cell_store.SheetCellStore 의 메모리 사용량, 행/열/범위 조회 시간을 비교합니다.
+- openpyxl 경로: 사용 범위 전체 격자 (빈 셀 포함)
+- 스트리밍 경로: 시트 XML 에 있는 셀 (서식만 있는 빈 셀 포함)
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from openpyxl import load_workbook
+
+from analyze_excel import analyze_worksheet, analyze_worksheet_stream
+from cell_store import load_cell_stores
+from excel_stream import split_address
+from workbook_session import WorkbookSession
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "2025_CF_management.xlsx")
+
+
+def deep_sizeof(obj, seen=None):
+    """객체와 그 안의 리스트/dict/문자열 크기 합 (같은 객체는 한 번만)"""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    return size
+
+
+def pool_sizeof(pool):
+    return deep_sizeof(pool.strings) + sys.getsizeof(pool._index)
+
+
+def timed(func, repeat=200):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def scan_rows(data, predicate):
+    """리스트의 리스트 구조에서 (행, 열) 조건에 맞는 셀 찾기 (기존 방식 조회)"""
+    return [cell for row in data for cell in row if predicate(*split_address(cell["address"]))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="열 지향 셀 저장소 메모리 벤치마크")
+    parser.add_argument("file_path", nargs="?", default=DEFAULT_PATH)
+    parser.add_argument("--skip-openpyxl", action="store_true", help="openpyxl 경로 측정 생략")
+    args = parser.parse_args()
+
+    with WorkbookSession(args.file_path) as session:
+        start = time.perf_counter()
+        stores = load_cell_stores(session)
+        store_time = time.perf_counter() - start
+
+        stream_data = {}
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for sheet_name, part in session.sheet_map.items():
+                stream_data[sheet_name] = analyze_worksheet_stream(
+                    session.zf, sheet_name, part, session.shared_strings)["data"]
+        stream_time = time.perf_counter() - start
+
+    grid_data = {}
+    if not args.skip_openpyxl:
+        start = time.perf_counter()
+        wb = load_workbook(args.file_path, data_only=False)
+        styles, style_index = [], {}
+        with contextlib.redirect_stdout(io.StringIO()):
+            for sheet_name in wb.sheetnames:
+                grid_data[sheet_name] = analyze_worksheet(wb[sheet_name], sheet_name, styles, style_index)["data"]
+        grid_time = time.perf_counter() - start
+
+    print(f"=== 시트별 메모리 (bytes) ===")
+    header = f"{'시트':<28}{'셀(store)':>10}{'store':>12}"
+    header += f"{'스트리밍 dict':>16}{'배율':>8}"
+    if grid_data:
+        header += f"{'openpyxl 격자':>16}{'배율':>8}"
+    print(header)
+
+    totals = [0, 0, 0]
+    for sheet_name, store in stores.items():
+        store_bytes = store.nbytes
+        stream_bytes = deep_sizeof(stream_data[sheet_name])
+        line = f"{sheet_name:<28}{len(store):>10,}{store_bytes:>12,}{stream_bytes:>16,}{stream_bytes / store_bytes:>7.0f}x"
+        totals[0] += store_bytes
+        totals[1] += stream_bytes
+        if grid_data:
+            grid_bytes = deep_sizeof(grid_data[sheet_name])
+            totals[2] += grid_bytes
+            line += f"{grid_bytes:>16,}{grid_bytes / store_bytes:>7.0f}x"
+        print(line)
+
+    any_store = next(iter(stores.values()))
+    pools = pool_sizeof(any_store.strings) + pool_sizeof(any_store.formulas)
+    print(f"\n공용 문자열/수식 풀: {pools:,} bytes")
+    print(f"합계 store(풀 포함): {totals[0] + pools:,} bytes ({store_time:.2f}초)")
+    print(f"합계 스트리밍 dict: {totals[1]:,} bytes ({stream_time:.2f}초, "
+          f"{totals[1] / (totals[0] + pools):.0f}배)")
+    if grid_data:
+        print(f"합계 openpyxl 격자: {totals[2]:,} bytes ({grid_time:.2f}초, "
+              f"{totals[2] / (totals[0] + pools):.0f}배)")
+
+    # 조회 시간 비교 (CF 시트)
+    sheet_name = "01.Cash Flow Management"
+    store = stores[sheet_name]
+    data = stream_data[sheet_name]
+    print(f"\n=== 조회 시간 ({sheet_name}, 1회 평균 µs) ===")
+    print(f"  6행:       store {timed(lambda: store.row(6)):8.1f}  "
+          f"dict 스캔 {timed(lambda: scan_rows(data, lambda r, c: r == 6), 20):10.1f}")
+    print(f"  G열:       store {timed(lambda: store.column('G')):8.1f}  "
+          f"dict 스캔 {timed(lambda: scan_rows(data, lambda r, c: c == 7), 20):10.1f}")
+    print(f"  E6:P40:    store {timed(lambda: store.range('E6:P40')):8.1f}")
+    print(f"  G6 한 셀:  store {timed(lambda: store.get('G6')):8.1f}")
+    store.to_dataframe()    # pandas import 제외
+    start = time.perf_counter()
+    frame = store.to_dataframe()
+    print(f"  DataFrame: {(time.perf_counter() - start) * 1e6:8.1f}µs "
+          f"(number 열 메모리 공유: {np.shares_memory(frame['number'].to_numpy(), store.numbers)})")
+
+
+if __name__ == "__main__":
+    main()
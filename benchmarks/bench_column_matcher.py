@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+컬럼 매칭 벤치마크
+컬럼이 많은 가짜 직원 시트로 기존 방식(행마다 모든 필드 x 컬럼 x 키워드를 부분 문자열 비교)과
+scripts/column_matcher.ColumnMatcher(시트당 한 번 컴파일된 정규식으로 필드 → 열 위치 계산 후 행은 값만 꺼냄)를
+extract_employee_data / preview_employee_data 두 스크립트 흐름에서 비교하고, 결과가 같은지 확인합니다.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+import pandas as pd
+
+import extract_employee_data
+import preview_employee_data
+
+
+def legacy_extract(df):
+    """기존 extract_employee_data 의 시트 처리 (행마다 COLUMN_MAPPING 전체 검색)"""
+    employee_data = []
+    name_columns = [col for col in df.columns if any(keyword in col.lower() for keyword in ['이름', 'name', '성명', '직원명'])]
+    if name_columns:
+        for idx, row in df.iterrows():
+            if pd.notna(row[name_columns[0]]) and str(row[name_columns[0]]).strip():
+                employee = {}
+                for field, possible_columns in extract_employee_data.COLUMN_MAPPING.items():
+                    for col in df.columns:
+                        if any(keyword in col.lower() for keyword in possible_columns):
+                            value = row[col]
+                            if pd.notna(value) and str(value).strip():
+                                employee[field] = extract_employee_data.clean_value(str(value).strip(), field)
+                            break
+                if 'name' in employee and employee['name']:
+                    employee.setdefault('department', '미정')
+                    employee.setdefault('position', '직원')
+                    employee.setdefault('rank', '사원')
+                    employee.setdefault('tel', '010-0000-0000')
+                    employee.setdefault('email', f"{employee['name'].replace(' ', '').lower()}@grkcon.com")
+                    employee.setdefault('joinDate', '2025-01-01')
+                    employee_data.append(employee)
+    return employee_data
+
+
+def legacy_preview(df):
+    """기존 extract_employee_data_from_sheet (행마다 column_mapping 전체 검색)"""
+    employee_data = []
+    name_columns = [col for col in df.columns if any(keyword in str(col).lower() for keyword in ['이름', 'name', '성명', '직원명', '성함'])]
+    if not name_columns:
+        return []
+    for idx, row in df.iterrows():
+        name_value = row[name_columns[0]]
+        if pd.notna(name_value) and str(name_value).strip() and str(name_value).strip() != '':
+            employee = {}
+            for field, possible_columns in preview_employee_data.COLUMN_MAPPING.items():
+                found_value = None
+                for col in df.columns:
+                    col_lower = str(col).lower()
+                    if any(keyword in col_lower for keyword in possible_columns):
+                        value = row[col]
+                        if pd.notna(value) and str(value).strip():
+                            found_value = preview_employee_data.clean_and_format_value(str(value).strip(), field)
+                            break
+                if found_value is not None:
+                    employee[field] = found_value
+            if 'name' not in employee:
+                employee['name'] = str(name_value).strip()
+            preview_employee_data.set_default_values(employee)
+            employee_data.append(employee)
+    return employee_data
+
+
+def wide_employee_sheet(rows, width, seed=0):
+    """직원 컬럼 사이사이에 월별/기타 컬럼이 많은 가짜 시트 (빈 값, 겹치는 키워드 컬럼 포함)"""
+    rng = random.Random(seed)
+    named = ['성명', '직급', '직책', '소속 부서', '휴대폰 번호', '이메일', '입사일', '월급여(원)', '기본급', '계좌번호', '나이', '비상 연락처']
+    filler = [f'{2020 + i // 12}년 {i % 12 + 1}월 실적' for i in range(max(width - len(named), 0))]
+    columns = filler[:]
+    for i, name in enumerate(named):
+        columns.insert(min(i * (len(columns) // len(named) + 1), len(columns)), name)
+    data = {}
+    for column in columns:
+        if column == '성명':
+            data[column] = [rng.choice([f'직원{i}', f' Kim {i} ', None]) for i in range(rows)]
+        elif column in ('휴대폰 번호', '비상 연락처'):
+            data[column] = [rng.choice([f'010{rng.randrange(10**8):08d}', None, '']) for _ in range(rows)]
+        elif column == '이메일':
+            data[column] = [rng.choice([f'User{i}@GRKcon.com', 'none', None]) for i in range(rows)]
+        elif column == '입사일':
+            data[column] = [rng.choice(['2021/3/5', '2022-11-30 00:00:00', None]) for _ in range(rows)]
+        elif column in ('직급', '직책', '소속 부서'):
+            data[column] = [rng.choice(['EP', 'PR', 'BA', '컨설팅팀', None]) for _ in range(rows)]
+        elif column in ('월급여(원)', '기본급', '나이', '계좌번호'):
+            data[column] = [rng.choice([rng.randrange(20, 99) * 100_000, '3,500,000원', None]) for _ in range(rows)]
+        else:
+            data[column] = [rng.random() for _ in range(rows)]
+    return pd.DataFrame(data, columns=columns)
+
+
+def timed(func, df):
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = func(df)
+        elapsed = time.perf_counter() - start
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="컬럼 매칭 벤치마크")
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--width", type=int, nargs="+", default=[20, 100, 300], help="시트 컬럼 수")
+    args = parser.parse_args()
+
+    ok = True
+    for width in args.width:
+        df = wide_employee_sheet(args.rows, width)
+        print(f"=== 가짜 시트 {args.rows:,}행 x {df.shape[1]}열 ===")
+        for label, legacy, current in (
+                ("extract_employee_data", legacy_extract, extract_employee_data.extract_employee_data_from_frame),
+                ("preview_employee_data", legacy_preview,
+                 lambda df: preview_employee_data.extract_employee_data_from_sheet(df, '직원'))):
+            old, old_time = timed(legacy, df)
+            new, new_time = timed(current, df)
+            same = json.dumps(old, ensure_ascii=False) == json.dumps(new, ensure_ascii=False)
+            ok &= same
+            print(f"  {label:<24} 기존 {old_time:8.3f}초  매칭기 {new_time:7.3f}초  "
+                  f"({old_time / new_time:5.1f}배)  {len(new):,}명  결과 동일: {same}")
+    if not ok:
+        sys.exit("❌ 결과가 다릅니다")
+
+
+if __name__ == "__main__":
+    main()
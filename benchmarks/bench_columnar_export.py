@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+열 기반 내보내기 벤치마크
+저장소의 2025_CF_management.xlsx 를 batch_ingest 로 한 번 추출한 뒤 월별 스냅숏 파일이 많은 상황처럼
+데이터셋을 N배로 불려 JSON / Parquet / Arrow IPC 로 저장하고,
+'CF 표의 1월 금액 합계' 한 열만 필요할 때 각 방식으로 다시 읽는 시간과 파일 크기를 비교합니다.
+xlsx 는 워크북 하나를 다시 파싱하는 시간을 재서 N배 한 값을 추정치로 보여 줍니다.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+import pyarrow.compute as pc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+from batch_ingest import ingest_workbook, merge_results
+from columnar_export import export_dataset, read_table
+
+
+def scale_dataset(dataset, copies):
+    """표 행을 copies 배로 (source 만 바꿔 월별 스냅숏처럼)"""
+    scaled = {}
+    for key in ('cashflow', 'expenses', 'projects'):
+        scaled[key] = [{**row, 'source': f"{row['source']}#{i}"} for i in range(copies) for row in dataset[key]]
+    scaled['employees'] = dataset['employees'] * copies
+    return scaled
+
+
+def best_of(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = func()
+        times.append(time.perf_counter() - start)
+    return min(times), value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="열 기반 내보내기 벤치마크")
+    parser.add_argument("file_path", nargs="?", default=os.path.join(ROOT, "2025_CF_management.xlsx"))
+    parser.add_argument("--copies", type=int, nargs="+", default=[100, 2000], help="데이터셋을 불릴 배수")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    result = ingest_workbook(args.file_path)
+    if result['error']:
+        sys.exit(f"❌ {result['error']}")
+    base = merge_results([result])
+    xlsx_time, _ = best_of(lambda: ingest_workbook(args.file_path), args.repeat)
+
+    def month_total(rows):
+        return sum(row['months'][0] or 0 for row in rows)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for copies in args.copies:
+            dataset = scale_dataset(base, copies)
+            expected = month_total(dataset['cashflow'])
+            json_path = os.path.join(tmp, f'dataset_{copies}.json')
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(dataset, f, ensure_ascii=False, indent=2, default=str)
+            paths = {fmt: export_dataset(dataset, os.path.join(tmp, f'{fmt}_{copies}'), fmt)['cashflow']
+                     for fmt in ('parquet', 'arrow')}
+
+            def from_json():
+                with open(json_path, encoding='utf-8') as f:
+                    return month_total(json.load(f)['cashflow'])
+
+            def from_columnar(path):
+                return lambda: pc.sum(read_table(path, ['month_01']).column('month_01')).as_py()
+
+            print(f"=== CF 표 {len(dataset['cashflow']):,}행 (전체 표 {copies}배) ===")
+            print(f"  {'xlsx 다시 파싱 (추정)':<24} {xlsx_time * copies:9.3f}초")
+            rows = [('JSON 전체 로드', json_path, from_json)]
+            rows += [(f'{fmt} month_01 열만', path, from_columnar(path)) for fmt, path in paths.items()]
+            for label, path, func in rows:
+                elapsed, total = best_of(func, args.repeat)
+                same = abs(total - expected) < 1e-6 * max(1, abs(expected))
+                print(f"  {label:<24} {elapsed:9.3f}초  {os.path.getsize(path) / 1e6:8.2f}MB  결과 동일: {same}")
+                if not same:
+                    sys.exit("❌ 결과가 다릅니다")
+
+
+if __name__ == "__main__":
+    main()
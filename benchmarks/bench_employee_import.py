@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+직원 일괄 등록 벤치마크
+로컬 스텁 /api/employees 서버(scripts/stub_employee_server.py)를 띄우고
+기존 방식(직원마다 requests.post, 매번 새 연결)과 employee_importer(스레드별 연결 풀 + 동시 요청)를
+같은 가짜 직원 데이터로 비교하고, 묶음 모드(POST /api/employees/bulk)의 요청 수와 처리량도 잽니다.
+스텁의 일시 오류(503)는 재시도로 모두 등록되어야 합니다.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+import requests
+
+from employee_importer import EmployeeImporter, synthetic_employees
+from stub_employee_server import start_background_server
+
+
+def sequential_post(url, employee_data):
+    """기존 send_to_backend 방식: 직원마다 연결을 새로 여는 blocking POST"""
+    ok = 0
+    for employee in employee_data:
+        response = requests.post(url, json=employee, headers={'Content-Type': 'application/json'}, timeout=10)
+        ok += response.status_code == 201
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="직원 일괄 등록 벤치마크")
+    parser.add_argument("--rows", type=int, default=3000, help="등록할 가짜 직원 수")
+    parser.add_argument("--latency", type=float, default=5.0, help="스텁 서버 요청당 지연(밀리초)")
+    parser.add_argument("--fail-rate", type=float, default=0.02, help="스텁 서버 503 응답 확률")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--batch-size", type=int, nargs="+", default=[100, 500], help="묶음 모드 크기")
+    parser.add_argument("--baseline-rows", type=int, default=500,
+                        help="기존 방식으로 보낼 직원 수 (느리므로 일부만)")
+    args = parser.parse_args()
+
+    employees = synthetic_employees(args.rows)
+    print(f"=== 직원 {args.rows:,}명, 스텁 지연 {args.latency:g}ms, 오류율 {args.fail_rate:g} ===")
+
+    # 기존 방식은 재시도가 없으므로 오류 없는 서버에서 측정
+    server, url = start_background_server(port=0, latency=args.latency / 1000)
+    baseline = employees[:args.baseline_rows]
+    start = time.perf_counter()
+    ok = sequential_post(url, baseline)
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+    print(f"{'기존 (순차, 연결 매번 새로)':<30}{len(baseline) / elapsed:>10.1f}명/초  "
+          f"성공 {ok}/{len(baseline)}")
+
+    runs = [(concurrency, 0) for concurrency in args.concurrency]
+    runs += [(min(args.concurrency), batch_size) for batch_size in args.batch_size]
+    for concurrency, batch_size in runs:
+        server, url = start_background_server(port=0, latency=args.latency / 1000, fail_rate=args.fail_rate)
+        importer = EmployeeImporter(url, concurrency=concurrency, retries=5, backoff=0.01, batch_size=batch_size)
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = importer.run(employees)
+        stored = server.store.all()
+        server.shutdown()
+        assert len(stored) == args.rows and len({e['name'] for e in stored}) == args.rows, "등록 누락/중복"
+        label = f"묶음 {batch_size}명, 동시 {concurrency}개" if batch_size else f"풀 + 동시 {concurrency}개"
+        print(f"{label:<30}{result.throughput:>10.1f}명/초  "
+              f"성공 {len(result.successful)}/{result.total}  요청 {result.attempts}회(재시도 {result.retries})  "
+              f"p50 {result.percentile(50) * 1000:.1f}ms  p95 {result.percentile(95) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
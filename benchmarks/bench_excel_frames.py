@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+워크북 한 번 파싱 벤치마크
+직원 추출/미리보기 스크립트의 기존 읽기 방식(시트마다 pd.read_excel(file_path, ...) 로 워크북을 다시 열고,
+미리보기용으로 한 번 더 읽음)과 scripts/excel_frames.ExcelFrames(한 번 열고 시트마다 한 번 파싱)의
+시간을 스크립트 흐름별로 비교하고, 읽은 DataFrame 이 같은지 확인합니다.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+import pandas as pd
+
+from excel_frames import ExcelFrames
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "2025_CF_management.xlsx")
+
+
+def legacy_extract_flow(file_path):
+    """기존 extract_employee_data.py: read_excel_file(미리보기 nrows=5) + extract_employee_data(전체)"""
+    excel_file = pd.ExcelFile(file_path)
+    for sheet_name in excel_file.sheet_names:
+        pd.read_excel(file_path, sheet_name=sheet_name, nrows=5)
+    excel_file = pd.ExcelFile(file_path)
+    return {sheet_name: pd.read_excel(file_path, sheet_name=sheet_name) for sheet_name in excel_file.sheet_names}
+
+
+def legacy_preview_flow(file_path):
+    """기존 preview_employee_data.py: read_and_preview_excel"""
+    excel_file = pd.ExcelFile(file_path)
+    return {sheet_name: pd.read_excel(file_path, sheet_name=sheet_name) for sheet_name in excel_file.sheet_names}
+
+
+def frames_flow(file_path):
+    """두 스크립트 모두: 로더 하나로 미리보기 + 추출"""
+    with ExcelFrames(file_path) as frames:
+        for sheet_name in frames.sheet_names:
+            frames.preview(sheet_name)
+        return dict(frames.frames())
+
+
+def best_of(func, file_path, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(file_path)
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워크북 한 번 파싱 벤치마크")
+    parser.add_argument("file_path", nargs="?", default=DEFAULT_PATH)
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (가장 빠른 값 사용)")
+    args = parser.parse_args()
+
+    new, new_time = best_of(frames_flow, args.file_path, args.repeat)
+    print(f"=== {os.path.basename(args.file_path)} (시트 {len(new)}개) ===")
+    for label, legacy in (("extract_employee_data", legacy_extract_flow),
+                          ("preview_employee_data", legacy_preview_flow)):
+        old, old_time = best_of(legacy, args.file_path, args.repeat)
+        same = old.keys() == new.keys() and all(old[name].equals(new[name]) for name in old)
+        print(f"  {label:<24} 기존 {old_time:7.3f}초  한 번 파싱 {new_time:7.3f}초  "
+              f"({old_time / new_time:4.1f}배)  결과 동일: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+수식 컴파일러 벤치마크
+- 파싱: 셀마다 토큰 → AST 파싱 vs R1C1 모양 캐시 (parse_formula)
+- 평가: 재계산마다 수식을 다시 파싱/컴파일해 계산 vs 그룹에 캐시된 클로저로 바로 계산
+셀당 시간과 두 방식의 결과가 같은지 비교합니다.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from formula_eval import WorkbookModel, compile_area, compile_formula, formula_shape, parse_formula, parse_shape
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "2025_CF_management.xlsx")
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def same_vec(a, b):
+    return (np.array_equal(a.num, b.num) and np.array_equal(a.kind, b.kind)
+            and (a.text is None) == (b.text is None)
+            and (a.text is None or np.array_equal(a.text, b.text)))
+
+
+def reinterpret(model, formulas):
+    """캐시 없이 셀마다 수식을 파싱하고 그룹마다 새로 컴파일해 계산 (기존 방식)"""
+    compile_formula.cache_clear()
+    compile_area.cache_clear()
+    parse = parse_shape.__wrapped__
+    results = []
+    for group in model.groups:
+        for node_id in group.members:
+            ast = parse(formula_shape(*formulas[node_id]))
+        results.append(compile_formula(ast)(model, group))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수식 컴파일러 벤치마크")
+    parser.add_argument("file_path", nargs="?", default=DEFAULT_PATH)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    model = WorkbookModel.load(args.file_path)
+    model.recalculate()
+    graph = model.graph
+    by_node = {node_id: (formula, graph.keys[node_id][1], graph.keys[node_id][2])
+               for node_id, formula in graph.formulas.items() if node_id not in model.parse_errors}
+    formulas = list(by_node.values())
+    cells = len(formulas)
+    print(f"수식 {cells}개, 모양 {len(set(model.asts.values()))}개, 그룹 {len(model.groups)}개")
+
+    print("\n=== 파싱 ===")
+    uncached = parse_shape.__wrapped__
+    parse_time, _ = timed(lambda: [uncached(formula_shape(*item)) for item in formulas], args.repeat)
+    cached_time, _ = timed(lambda: [parse_formula(*item) for item in formulas], args.repeat)
+    print(f"  셀마다 파싱     {parse_time / cells * 1e6:8.2f}µs/셀")
+    print(f"  모양 캐시       {cached_time / cells * 1e6:8.2f}µs/셀 ({parse_time / cached_time:5.1f}배)")
+
+    print("\n=== 평가 (그룹 단위, 참조 바인딩은 미리 계산) ===")
+    groups = [group for group in model.groups if not any(i in model.parse_errors for i in group.members)]
+    model.groups = groups
+    interpreted_time, interpreted = timed(lambda: reinterpret(model, by_node), args.repeat)
+    compiled_time, compiled = timed(lambda: [g.compiled(model, g) for g in groups], args.repeat)
+    same = all(same_vec(a, b) for a, b in zip(interpreted, compiled))
+    print(f"  매번 파싱/컴파일 {interpreted_time / cells * 1e6:7.2f}µs/셀")
+    print(f"  컴파일된 클로저 {compiled_time / cells * 1e6:8.2f}µs/셀 ({interpreted_time / compiled_time:5.2f}배)")
+    print(f"  결과 동일: {same}")
+    if not same:
+        sys.exit("❌ 결과가 다릅니다")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+수식 계산 엔진 벤치마크
+openpyxl(data_only=True) 로 읽은 Excel 캐시 값과 formula_eval 재계산 결과를
+워크북 전체 수식 셀에 대해 비교하고 각 단계의 소요 시간을 측정합니다.
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl import load_workbook
+
+from excel_stream import column_letter
+from formula_eval import WorkbookModel
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "2025_CF_management.xlsx")
+
+
+def values_match(expected, actual, rel_tol=1e-9, abs_tol=1e-6):
+    if isinstance(expected, datetime):
+        # 날짜 서식 셀은 Excel 일련번호로 비교
+        delta = expected - datetime(1899, 12, 30)
+        expected = delta.days + delta.seconds / 86400
+    if isinstance(expected, bool) or isinstance(actual, bool):
+        return expected == actual
+    if isinstance(expected, (int, float)) and isinstance(actual, (int, float)):
+        return abs(expected - actual) <= max(abs_tol, rel_tol * max(abs(expected), abs(actual)))
+    if expected is None:
+        return actual in (None, 0, 0.0, '')
+    return expected == actual
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수식 계산 엔진 벤치마크")
+    parser.add_argument("file_path", nargs="?", default=DEFAULT_PATH)
+    parser.add_argument("--repeat", type=int, default=20, help="전체 재계산 반복 횟수")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    wb = load_workbook(args.file_path, data_only=True)
+    openpyxl_load = time.perf_counter() - start
+
+    start = time.perf_counter()
+    model = WorkbookModel.load(args.file_path)
+    model_load = time.perf_counter() - start
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        model.recalculate()
+        timings.append(time.perf_counter() - start)
+
+    matched = 0
+    mismatches = []
+    for node_id in model.graph.formulas:
+        sheet, row, col = model.graph.keys[node_id]
+        expected = wb[sheet].cell(row=row, column=col).value
+        actual = model.store.get(node_id)
+        if values_match(expected, actual):
+            matched += 1
+        else:
+            mismatches.append((f"{sheet}!{column_letter(col)}{row}", expected, actual))
+
+    total = len(model.graph.formulas)
+    print("=== 수식 계산 엔진 벤치마크 ===")
+    print(f"파일: {args.file_path}")
+    print(f"openpyxl 캐시 값 로드 (data_only=True): {openpyxl_load:.3f}초")
+    print(f"모델 로드 (스트리밍 스캔 + 그래프 + 계산 계획): {model_load:.3f}초")
+    print(f"전체 재계산 {args.repeat}회: 평균 {sum(timings) / len(timings) * 1000:.2f}ms, "
+          f"최소 {min(timings) * 1000:.2f}ms")
+    print(f"수식 {total}개, 배열 연산 그룹 {len(model.groups)}개 (셀당 평균 {total / len(model.groups):.1f}개)")
+    print(f"캐시 값 일치: {matched}/{total}")
+    if mismatches:
+        print(f"불일치 {len(mismatches)}개:")
+        for cell, expected, actual in mismatches[:20]:
+            print(f"  {cell}: Excel={expected!r} 계산={actual!r}")
+    if model.unsupported:
+        print(f"지원하지 않는 함수: {dict(model.unsupported)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+HR 명단 추출 벤치마크
+'03.HR unit cost' 형태의 가짜 시트(기본 10만 행)로 기존 행 단위 추출(df.iloc 반복)과
+열 단위 추출(scripts/hr_roster.py 사용)의 시간을 비교하고, 두 결과가 같은지 확인합니다.
+(add_employees_to_db.real_employees_from_frame, extract_hr_data.hr_employees_from_frame)
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import re
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+import pandas as pd
+
+from add_employees_to_db import generate_email, generate_phone_number, map_department, map_rank, real_employees_from_frame
+from extract_hr_data import hr_employees_from_frame, set_default_values
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "2025_CF_management.xlsx")
+
+
+def legacy_real_employees(df):
+    """기존 extract_real_employees 의 행 단위 루프"""
+    header_row = 2
+    headers = {'name': 1, 'position': 2, 'joinDate': 4, 'monthlySalary': 7}
+    real_employees = []
+    exclude_names = ['합계', '소계', 'Manager', 'Associate', 'SBA', 'BA', 'RA']
+
+    for idx in range(header_row + 1, len(df)):
+        row = df.iloc[idx]
+        name_value = row.iloc[headers['name']]
+        if (pd.notna(name_value) and
+                str(name_value).strip() and
+                str(name_value).strip() not in exclude_names):
+            employee = {}
+            employee['name'] = str(name_value).strip()
+            position_value = row.iloc[headers['position']]
+            if pd.notna(position_value):
+                employee['position'] = str(position_value).strip()
+            else:
+                employee['position'] = '직원'
+            joindate_value = row.iloc[headers['joinDate']]
+            if pd.notna(joindate_value):
+                if isinstance(joindate_value, (datetime, date)):
+                    employee['joinDate'] = joindate_value.strftime('%Y-%m-%d')
+                else:
+                    employee['joinDate'] = str(joindate_value)[:10]
+            else:
+                employee['joinDate'] = '2025-01-01'
+            salary_value = row.iloc[headers['monthlySalary']]
+            if pd.notna(salary_value):
+                try:
+                    if isinstance(salary_value, (int, float)):
+                        employee['monthlySalary'] = int(salary_value / 12)
+                    else:
+                        cleaned = re.sub(r'[^\d]', '', str(salary_value))
+                        if cleaned:
+                            annual_salary = int(cleaned)
+                            employee['monthlySalary'] = int(annual_salary / 12)
+                except:
+                    employee['monthlySalary'] = 3000000
+            else:
+                employee['monthlySalary'] = 3000000
+            employee['department'] = map_department(employee['position'])
+            employee['rank'] = map_rank(employee['position'])
+            employee['tel'] = generate_phone_number(employee['name'])
+            employee['email'] = generate_email(employee['name'])
+            real_employees.append(employee)
+            print(f"✅ 추가 대상: {employee['name']} ({employee['position']})")
+    return real_employees
+
+
+def legacy_hr_employees(df):
+    """기존 extract_hr_unit_cost_data 의 행 단위 루프"""
+    header_row = None
+    for idx, row in df.iterrows():
+        if '이름' in str(row.iloc[0]) or any('이름' in str(cell) for cell in row if pd.notna(cell)):
+            header_row = idx
+            break
+    if header_row is None:
+        return []
+    headers = {}
+    for col_idx, cell_value in enumerate(df.iloc[header_row]):
+        if pd.notna(cell_value):
+            cell_str = str(cell_value).strip()
+            if '이름' in cell_str:
+                headers['name'] = col_idx
+            elif '직급' in cell_str:
+                headers['position'] = col_idx
+            elif '입사일' in cell_str:
+                headers['joinDate'] = col_idx
+            elif '연봉' in cell_str:
+                headers['monthlySalary'] = col_idx
+
+    employee_data = []
+    for idx in range(header_row + 1, len(df)):
+        row = df.iloc[idx]
+        if 'name' in headers:
+            name_value = row.iloc[headers['name']]
+            if pd.notna(name_value) and str(name_value).strip() and str(name_value).strip() not in ['합계', '소계', '', 'NaN']:
+                employee = {}
+                employee['name'] = str(name_value).strip()
+                if 'position' in headers:
+                    position_value = row.iloc[headers['position']]
+                    if pd.notna(position_value):
+                        employee['position'] = str(position_value).strip()
+                if 'joinDate' in headers:
+                    joindate_value = row.iloc[headers['joinDate']]
+                    if pd.notna(joindate_value):
+                        if isinstance(joindate_value, (datetime, date)):
+                            employee['joinDate'] = joindate_value.strftime('%Y-%m-%d')
+                        else:
+                            employee['joinDate'] = str(joindate_value).strip()
+                if 'monthlySalary' in headers:
+                    salary_value = row.iloc[headers['monthlySalary']]
+                    if pd.notna(salary_value):
+                        try:
+                            if isinstance(salary_value, (int, float)):
+                                employee['monthlySalary'] = int(salary_value / 12)
+                            else:
+                                cleaned = re.sub(r'[^\d]', '', str(salary_value))
+                                if cleaned:
+                                    annual_salary = int(cleaned)
+                                    employee['monthlySalary'] = int(annual_salary / 12)
+                        except:
+                            pass
+                set_default_values(employee)
+                employee_data.append(employee)
+                print(f"✅ 직원 추출: {employee['name']}")
+    return employee_data
+
+
+def synthetic_hr_sheet(rows, seed=0):
+    """'03.HR unit cost' 와 같은 배치의 가짜 시트 (제목 2행 + 헤더 + 합계 + 직원, 템플릿/빈 행/문자열 값 섞음)"""
+    rng = random.Random(seed)
+    positions = ['EP', 'PR', 'Manager', 'SBA', 'BA', 'ACC', None]
+    templates = ['Manager', 'Associate', 'SBA', 'BA', 'RA', '소계']
+    width = 25
+    data = [
+        [None, '03.GRK Partners Human Resource unit Cost'] + [None] * (width - 2),
+        [None, '(단위 :   원)'] + [None] * (width - 2),
+        [None, '이름', '직급', '인력원가', '입사일\n(활동지원수)', '상여금\n기준일', '성과급\n기준일', '연봉',
+         '4대보험/퇴직금', '회사 부담금액'] + [f'{m}월' for m in range(1, width - 9)],
+        [None, '합계', None, 'Minimum 빌링', 11, None, None, 1291000000, 4.6e8, 1.75e9] + [None] * (width - 10),
+    ]
+    base = datetime(2015, 1, 1)
+    for i in range(rows):
+        kind = rng.random()
+        if kind < 0.03:
+            name = rng.choice(templates)
+        elif kind < 0.05:
+            name = rng.choice([None, '  '])
+        else:
+            name = f" 직원{i} " if rng.random() < 0.1 else f"직원{i}"
+        joined = base + timedelta(days=rng.randrange(3650))
+        join_value = rng.choice([joined, joined, joined, joined.strftime('%Y.%m.%d'), None])
+        salary = rng.randrange(30, 200) * 1_000_000
+        salary_value = rng.choice([salary, salary, float(salary), f"{salary:,}원", '미정', None])
+        row = [None, name, rng.choice(positions), salary // 4, join_value, datetime(2025, 6, 30),
+               datetime(2025, 12, 31), salary_value, salary / 3, salary * 4 / 3]
+        row += [rng.random() * 1e7 for _ in range(width - len(row))]
+        data.append(row)
+    return pd.DataFrame(data, columns=[f'Unnamed: {c}' for c in range(width)])
+
+
+def timed(func, df):
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = func(df)
+        elapsed = time.perf_counter() - start
+    return result, elapsed
+
+
+def compare(label, legacy, vectorized, df):
+    old, old_time = timed(legacy, df)
+    new, new_time = timed(vectorized, df)
+    same = json.dumps(old, ensure_ascii=False) == json.dumps(new, ensure_ascii=False)
+    print(f"  {label:<28} 기존 {old_time:8.3f}초  열 단위 {new_time:7.3f}초  "
+          f"({old_time / new_time:5.1f}배)  {len(new):,}명  결과 동일: {same}")
+    return same
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HR 명단 추출 벤치마크")
+    parser.add_argument("file_path", nargs="?", default=DEFAULT_PATH)
+    parser.add_argument("--rows", type=int, default=100_000, help="가짜 시트 직원 행 수")
+    args = parser.parse_args()
+
+    ok = True
+    if os.path.exists(args.file_path):
+        df = pd.read_excel(args.file_path, sheet_name='03.HR unit cost')
+        print(f"=== 실제 시트 ({len(df)}행) ===")
+        ok &= compare("add_employees_to_db", legacy_real_employees, real_employees_from_frame, df)
+        ok &= compare("extract_hr_data", legacy_hr_employees, hr_employees_from_frame, df)
+
+    df = synthetic_hr_sheet(args.rows)
+    print(f"=== 가짜 시트 ({len(df):,}행 x {df.shape[1]}열) ===")
+    ok &= compare("add_employees_to_db", legacy_real_employees, real_employees_from_frame, df)
+    ok &= compare("extract_hr_data", legacy_hr_employees, hr_employees_from_frame, df)
+    if not ok:
+        sys.exit("❌ 결과가 다릅니다")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+HR 시트 스트리밍 추출 벤치마크
+'03.HR unit cost' 형태의 큰 가짜 워크북(기본 직원 10만 행 x 25열)을 만들고
+기존 방식(pd.read_excel 로 시트 전체 DataFrame 생성 후 extract_hr_data.hr_employees_from_frame)과
+scripts/hr_stream.iter_hr_employees 를 각각 별도 프로세스로 실행해
+첫 직원까지 걸린 시간, 전체 시간, 최대 메모리(RSS)를 비교하고 결과가 같은지 확인합니다.
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+SCRIPTS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts")
+sys.path.insert(0, SCRIPTS)
+
+
+def write_hr_workbook(path, rows, width=25, seed=0):
+    """제목 2행 + 헤더 + 합계 + 직원 행으로 된 HR 시트 작성 (날짜 셀은 날짜 서식, 연봉은 숫자/문자열 섞음)"""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+
+    rng = random.Random(seed)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('03.HR unit cost')
+
+    def date_cell(value):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.number_format = 'yyyy-mm-dd'
+        return cell
+
+    ws.append([None, '03.GRK Partners Human Resource unit Cost'])
+    ws.append([None, '(단위 :   원)'])
+    ws.append([None, '이름', '직급', '인력원가', '입사일\n(활동지원수)', '상여금\n기준일', '성과급\n기준일', '연봉',
+               '4대보험/퇴직금', '회사 부담금액'] + [f'{m}월' for m in range(1, width - 9)])
+    ws.append([None, '합계', None, 'Minimum 빌링', 11, None, None, 1291000000])
+    base = datetime(2015, 1, 1)
+    for i in range(rows):
+        name = rng.choice(['Manager', 'SBA', '소계', None]) if rng.random() < 0.05 else f"직원{i}"
+        joined = base + timedelta(days=rng.randrange(3650))
+        salary = rng.randrange(30, 200) * 1_000_000
+        row = [None, name, rng.choice(['EP', 'PR', 'Manager', 'BA', None]), salary // 4,
+               rng.choice([date_cell(joined), date_cell(joined), joined.strftime('%Y.%m.%d')]),
+               date_cell(datetime(2025, 6, 30)), date_cell(datetime(2025, 12, 31)),
+               rng.choice([salary, salary, f"{salary:,}원", '미정']), salary / 3, salary * 4 / 3]
+        row += [rng.random() * 1e7 for _ in range(width - len(row))]
+        ws.append(row)
+    wb.save(path)
+
+
+def run_pandas(path):
+    import pandas as pd
+    from extract_hr_data import hr_employees_from_frame
+
+    df = pd.read_excel(path, sheet_name='03.HR unit cost')
+    with contextlib.redirect_stdout(io.StringIO()):
+        employees = hr_employees_from_frame(df)
+    yield from employees
+
+
+def run_stream(path):
+    from hr_stream import iter_hr_employees
+
+    yield from iter_hr_employees(path)
+
+
+def measure(mode, path):
+    """자식 프로세스에서 한 방식을 실행하고 결과 요약을 JSON 한 줄로 출력"""
+    start = time.perf_counter()
+    first = None
+    digest = hashlib.sha256()
+    count = 0
+    for employee in (run_pandas if mode == 'pandas' else run_stream)(path):
+        if first is None:
+            first = time.perf_counter() - start
+        digest.update(json.dumps(employee, ensure_ascii=False).encode())
+        count += 1
+    print(json.dumps({
+        'first': first,
+        'total': time.perf_counter() - start,
+        'count': count,
+        'digest': digest.hexdigest(),
+        'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HR 시트 스트리밍 추출 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000], help="가짜 시트 직원 행 수")
+    parser.add_argument("--measure", choices=['pandas', 'stream'], help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.measure, args.path)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            path = os.path.join(tmp, f'hr_{rows}.xlsx')
+            write_hr_workbook(path, rows)
+            print(f"=== 가짜 HR 시트 {rows:,}행 ({os.path.getsize(path) / 1e6:.1f}MB) ===")
+            results = {}
+            for mode, label in (('pandas', 'pd.read_excel + 열 단위'), ('stream', '스트리밍')):
+                output = subprocess.run([sys.executable, __file__, '--measure', mode, '--path', path],
+                                        capture_output=True, text=True, check=True).stdout
+                results[mode] = result = json.loads(output.strip().splitlines()[-1])
+                print(f"  {label:<24} 첫 직원 {result['first']:7.3f}초  전체 {result['total']:7.2f}초  "
+                      f"최대 메모리 {result['max_rss_mb']:7.1f}MB  {result['count']:,}명")
+            same = results['pandas']['digest'] == results['stream']['digest']
+            print(f"  결과 동일: {same}")
+            if not same:
+                sys.exit("❌ 결과가 다릅니다")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+시트별 병렬 분석 벤치마크
+analyze_excel 스트리밍 분석을 직렬(workers=1)과 프로세스 풀(workers=N)로 실행해
+소요 시간을 비교하고, 분석 결과와 출력 텍스트가 직렬 실행과 같은지 확인합니다.
+CF 워크북과 50개 시트짜리 합성 워크북 두 가지로 측정합니다.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analyze_excel import analyze_excel_file_stream
+from excel_stream import column_letter
+from workbook_session import WorkbookSession
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "2025_CF_management.xlsx")
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '{overrides}</Types>'
+)
+
+
+def write_synthetic_workbook(path, sheets=50, rows=2000, cols=10):
+    """숫자 열과 SUM/곱셈 수식 열로 이루어진 합성 워크북 작성 (openpyxl 없이 XML 직접 작성)"""
+    ns = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+    rel_ns = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+    last_col = column_letter(cols + 2)
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        overrides = ''.join(
+            f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+            f'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            for i in range(1, sheets + 1))
+        zf.writestr('[Content_Types].xml', _CONTENT_TYPES.format(overrides=overrides))
+        zf.writestr('_rels/.rels',
+                    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+                    'relationships/officeDocument" Target="xl/workbook.xml"/></Relationships>')
+        zf.writestr('xl/workbook.xml',
+                    f'<workbook xmlns="{ns}" xmlns:r="{rel_ns}"><sheets>'
+                    + ''.join(f'<sheet name="Sheet{i}" sheetId="{i}" r:id="rId{i}"/>'
+                              for i in range(1, sheets + 1))
+                    + '</sheets></workbook>')
+        zf.writestr('xl/_rels/workbook.xml.rels',
+                    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                    + ''.join(f'<Relationship Id="rId{i}" Type="{rel_ns}/worksheet" '
+                              f'Target="worksheets/sheet{i}.xml"/>' for i in range(1, sheets + 1))
+                    + '</Relationships>')
+        for i in range(1, sheets + 1):
+            parts = [f'<worksheet xmlns="{ns}"><dimension ref="A1:{last_col}{rows}"/><sheetData>']
+            for r in range(1, rows + 1):
+                cells = ''.join(f'<c r="{column_letter(c)}{r}"><v>{(r * c + i) % 997}</v></c>'
+                                for c in range(1, cols + 1))
+                sum_col = column_letter(cols + 1)
+                cells += f'<c r="{sum_col}{r}"><f>SUM(A{r}:{column_letter(cols)}{r})</f><v>0</v></c>'
+                cells += f'<c r="{last_col}{r}"><f>{sum_col}{r}*1.1</f><v>0</v></c>'
+                parts.append(f'<row r="{r}">{cells}</row>')
+            parts.append(f'</sheetData><mergeCells count="1"><mergeCell ref="A1:B1"/></mergeCells></worksheet>')
+            zf.writestr(f'xl/worksheets/sheet{i}.xml', ''.join(parts))
+
+
+def run(file_path, workers):
+    """분석 한 번 실행: (소요 시간, 분석 결과 JSON, 출력 텍스트)"""
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(buffer), WorkbookSession(file_path) as session:
+        analysis = analyze_excel_file_stream(session, workers=workers)
+    elapsed = time.perf_counter() - start
+    return elapsed, json.dumps(analysis, ensure_ascii=False, default=str), buffer.getvalue()
+
+
+def compare(label, file_path, worker_counts, repeat):
+    print(f"\n=== {label} ===")
+    baseline = None
+    for workers in worker_counts:
+        timings = []
+        for _ in range(repeat):
+            elapsed, result, output = run(file_path, workers)
+            timings.append(elapsed)
+        best = min(timings)
+        if baseline is None:
+            baseline = (best, result, output)
+            print(f"  workers={workers}: {best:.3f}초")
+            continue
+        same = result == baseline[1] and output == baseline[2]
+        print(f"  workers={workers}: {best:.3f}초 (직렬 대비 {baseline[0] / best:.2f}배, "
+              f"결과 {'일치' if same else '불일치'})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시트별 병렬 분석 벤치마크")
+    parser.add_argument("file_path", nargs="?", default=DEFAULT_PATH)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, os.cpu_count() or 1],
+                        help="비교할 작업자 수 목록")
+    parser.add_argument("--sheets", type=int, default=50, help="합성 워크북 시트 수")
+    parser.add_argument("--rows", type=int, default=2000, help="합성 워크북 시트당 행 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    worker_counts = [1] + sorted(set(w for w in args.workers if w > 1))
+    print(f"CPU {os.cpu_count()}개")
+
+    compare(f"CF 워크북: {args.file_path}", args.file_path, worker_counts, args.repeat)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic.xlsx")
+        start = time.perf_counter()
+        write_synthetic_workbook(path, sheets=args.sheets, rows=args.rows)
+        print(f"\n합성 워크북 생성: {args.sheets}개 시트 x {args.rows}행 "
+              f"({os.path.getsize(path):,} bytes, {time.perf_counter() - start:.2f}초)")
+        compare(f"합성 워크북 ({args.sheets}개 시트)", path, worker_counts, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
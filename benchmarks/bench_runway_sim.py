@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo 런웨이 시뮬레이션 벤치마크
+- 기존 방식: 경로마다 뽑은 입력을 모델에 넣고 recalculate_cells 로 영향받는 셀만 재계산 (일부 경로만)
+  (매출 행 일부는 수식 셀이라 update 대신 값 저장소에 직접 고정)
+- runway_sim.simulate: 경로 청크를 시나리오 축으로 한 번에 계산 (프로세스 수별, 작업자 모델 로드 포함)
+경로당 시간, 같은 입력에서 기존 방식과 결과가 같은지, 프로세스 수가 달라도 결과가 같은지 확인합니다.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from formula_eval import NUMBER, WorkbookModel
+from runway_sim import RunwaySimulator, simulate
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "2025_CF_management.xlsx")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo 런웨이 시뮬레이션 벤치마크")
+    parser.add_argument("file_path", nargs="?", default=DEFAULT_PATH)
+    parser.add_argument("--loop", type=int, default=200, help="기존 방식으로 계산할 경로 수")
+    parser.add_argument("--paths", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    model = WorkbookModel.load(args.file_path)
+    model.recalculate()
+    simulator = RunwaySimulator(model)
+    evaluator = simulator.evaluator
+    values = simulator.sample(np.random.default_rng(0), args.loop)
+
+    store = model.store
+    kinds = store.kind[evaluator.input_ids].copy()
+    store.kind[evaluator.input_ids] = NUMBER
+    start = time.perf_counter()
+    expected = []
+    for row in values:
+        store.num[evaluator.input_ids] = row
+        model.recalculate_cells(evaluator.dirty)
+        expected.append([model.value(cell) for cell in evaluator.outputs])
+    loop_time = (time.perf_counter() - start) / args.loop
+    store.num[evaluator.input_ids] = simulator.base
+    store.kind[evaluator.input_ids] = kinds
+    model.recalculate_cells(evaluator.dirty)
+    same = np.allclose(evaluator.run(values), np.array(expected, dtype=np.float64), rtol=1e-12, atol=1e-6)
+    print(f"입력 {len(evaluator.inputs)}셀, dirty 수식 {len(evaluator.dirty)}개, {len(simulator.months)}개월")
+    print(f"경로마다 재계산: {loop_time * 1e3:8.3f}ms/경로 ({args.loop}경로), 결과 동일: {same}")
+    if not same:
+        sys.exit("❌ 결과가 다릅니다")
+
+    results = {}
+    for workers in dict.fromkeys(args.workers):
+        start = time.perf_counter()
+        cash, _ = simulate(args.file_path, args.paths, seed=0, workers=workers, simulator=simulator)
+        elapsed = time.perf_counter() - start
+        results[workers] = cash
+        print(f"시나리오 축, 프로세스 {workers}개: {args.paths:,}경로 {elapsed:6.2f}초 "
+              f"({elapsed / args.paths * 1e6:6.1f}µs/경로, 기존 대비 {loop_time * args.paths / elapsed:5.0f}배)")
+    reference = next(iter(results.values()))
+    same = all(np.array_equal(reference, cash) for cash in results.values())
+    print(f"프로세스 수와 무관하게 결과 동일: {same}")
+    if not same:
+        sys.exit("❌ 결과가 다릅니다")
+
+
+if __name__ == "__main__":
+    main()
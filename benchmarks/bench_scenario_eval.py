@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+What-if 시나리오 일괄 계산 벤치마크
+'03.HR unit cost' 연봉 열(H6:H27)에 무작위 배율을 곱한 시나리오들을
+- 기존 방식: WorkbookModel.update 로 시나리오마다 입력을 바꾸고 영향받는 셀만 재계산
+- scenario_eval.ScenarioEvaluator: 시나리오 축을 붙여 dirty 부분 그래프를 한 번에 계산
+으로 계산해 시나리오당 시간과 기말현금(CF 6행) 결과가 같은지 비교합니다.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from formula_eval import WorkbookModel
+from formula_graph import parse_cell_key
+from scenario_eval import DEFAULT_OUTPUTS, ScenarioEvaluator, expand_cells, scale_scenarios
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "2025_CF_management.xlsx")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="What-if 시나리오 일괄 계산 벤치마크")
+    parser.add_argument("file_path", nargs="?", default=DEFAULT_PATH)
+    parser.add_argument("--range", default="'03.HR unit cost'!H6:H27", help="배율을 곱할 입력 범위")
+    parser.add_argument("--loop", type=int, default=50, help="기존 방식으로 계산할 시나리오 수")
+    parser.add_argument("--scenarios", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    model = WorkbookModel.load(args.file_path)
+    model.recalculate()
+    inputs = [cell for cell in expand_cells(args.range) if model.graph.index.get(parse_cell_key(cell)) is not None]
+    evaluator = ScenarioEvaluator(model, inputs)
+    base = evaluator.base_inputs()
+    rng = np.random.default_rng(args.seed)
+    print(f"입력 {len(inputs)}셀, dirty 수식 {len(evaluator.dirty)}개, 출력 {len(DEFAULT_OUTPUTS)}셀")
+
+    # 기존 방식: 시나리오마다 update 후 출력 읽기
+    factors = rng.uniform(0.9, 1.1, size=(args.loop, 1))
+    values = scale_scenarios(base, [list(range(len(inputs)))], factors)
+    start = time.perf_counter()
+    expected = []
+    for row in values:
+        model.update(dict(zip(inputs, row)))
+        expected.append([model.value(cell) for cell in DEFAULT_OUTPUTS])
+    loop_time = (time.perf_counter() - start) / args.loop
+    model.update(dict(zip(inputs, base)))
+    expected = np.array(expected, dtype=np.float64)
+    batched = evaluator.run(values)
+    same = np.allclose(batched, expected, rtol=1e-12, atol=1e-6)
+    print(f"\n기존 update 반복: {loop_time * 1e3:8.3f}ms/시나리오 ({args.loop}개), 결과 동일: {same}")
+    if not same:
+        sys.exit("❌ 결과가 다릅니다")
+
+    for count in args.scenarios:
+        values = scale_scenarios(base, [list(range(len(inputs)))], rng.uniform(0.9, 1.1, size=(count, 1)))
+        start = time.perf_counter()
+        evaluator.run(values)
+        elapsed = time.perf_counter() - start
+        print(f"시나리오 축 {count:>7,}개: {elapsed:7.3f}초 ({elapsed / count * 1e6:7.1f}µs/시나리오, "
+              f"기존 대비 {loop_time * count / elapsed:6.0f}배)")
+
+
+if __name__ == "__main__":
+    main()
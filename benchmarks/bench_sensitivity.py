@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+역방향 민감도 벤치마크
+목표 셀(기본: 연말 기말현금 P6)의 선행 셀 중 숫자 입력 셀 전부에 대해
+- 기존 방식: 입력을 하나씩 조금 바꿔 update 로 재계산한 차분 미분 (입력 수 x 재계산)
+- sensitivity.reverse_gradient: 역전파 한 번
+의 시간과 두 결과가 같은지(상대 오차 1e-4) 비교합니다.
+앞/뒤 한쪽 차분이 서로 다른 입력(DATEDIF 날짜처럼 계단/꺾인 점에 있는 입력)은 미분이 정의되지 않으므로 따로 셉니다.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from formula_eval import NUMBER, WorkbookModel
+from formula_graph import format_cell_key
+from sensitivity import DEFAULT_TARGET, reverse_gradient
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "2025_CF_management.xlsx")
+
+
+def one_sided(model, target, cell, relative_step=1e-6, min_step=1e-3):
+    """앞쪽/뒤쪽 한쪽 차분 미분"""
+    original = model.value(cell)
+    base = model.value(target)
+    step = max(abs(original) * relative_step, min_step)
+    model.update({cell: original + step})
+    upper = model.value(target)
+    model.update({cell: original - step})
+    lower = model.value(target)
+    model.update({cell: original})
+    return (upper - base) / step, (base - lower) / step
+
+
+def main():
+    parser = argparse.ArgumentParser(description="역방향 민감도 벤치마크")
+    parser.add_argument("file_path", nargs="?", default=DEFAULT_PATH)
+    parser.add_argument("--target", default=DEFAULT_TARGET)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    model = WorkbookModel.load(args.file_path)
+    model.recalculate()
+    graph = model.graph
+    target_id = model.node_id(args.target)
+    inputs = [graph.keys[i] for i in graph.precedent_ids(target_id, transitive=True)
+              if i not in model.asts and model.store.kind[i] == NUMBER]
+    print(f"목표 {args.target}, 선행 숫자 입력 {len(inputs)}개")
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        gradient, _ = reverse_gradient(model, args.target)
+    reverse_time = (time.perf_counter() - start) / args.repeat
+
+    start = time.perf_counter()
+    numeric = {key: one_sided(model, args.target, key) for key in inputs}
+    perturb_time = time.perf_counter() - start
+
+    smooth = [key for key in inputs if np.isclose(*numeric[key], rtol=1e-4, atol=1e-6)]
+    mismatched = [key for key in smooth
+                  if not np.isclose(gradient.get(key, 0.0), sum(numeric[key]) / 2, rtol=1e-4, atol=1e-6)]
+    print(f"입력마다 차분 미분: {perturb_time:8.3f}초 ({perturb_time / len(inputs) * 1e3:.2f}ms/입력)")
+    print(f"역전파 한 번:       {reverse_time:8.3f}초 (기존 대비 {perturb_time / reverse_time:6.0f}배)")
+    print(f"계단/꺾인 점에 있어 비교에서 뺀 입력: "
+          f"{', '.join(format_cell_key(key) for key in inputs if key not in smooth) or '없음'}")
+    print(f"결과 동일: {not mismatched} (비교 {len(smooth)}개 중 다른 입력 {len(mismatched)}개)")
+    for key in mismatched[:10]:
+        print(f"  {format_cell_key(key)}: 역전파 {gradient.get(key, 0.0):.6g}, 차분 {sum(numeric[key]) / 2:.6g}")
+    if mismatched:
+        sys.exit("❌ 결과가 다릅니다")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+VLOOKUP 색인 벤치마크
+'03.HR unit cost' 같은 인력 단가표를 행 수만 늘린 가상 표(이름 열 + 정렬된 등급 점수 열)에서
+- 기존 방식: 첫 열을 앞에서부터 훑는 선형 탐색
+- formula_eval.LookupIndex: 정확히 일치는 해시, 근사 일치는 누적 최댓값 이진 탐색
+으로 같은 키들을 찾아 조회당 시간과 결과가 같은지 비교합니다 (색인 만드는 시간 포함).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from formula_eval import EMPTY, NUMBER, STRING, LookupIndex, ValueStore, _lookup_key
+
+
+def linear_match(first_column, wanted, approximate, store):
+    """기존 방식: 첫 열에서 키가 있는 행 번호 (없으면 -1) — 선형 탐색"""
+    if not approximate:
+        for row, node_id in enumerate(first_column):
+            kind = store.kind[node_id]
+            if kind == EMPTY:
+                continue
+            if _lookup_key(store.num[node_id], kind, store.text[node_id]) == wanted:
+                return row
+        return -1
+    found = -1
+    for row, node_id in enumerate(first_column):
+        kind = store.kind[node_id]
+        if kind == EMPTY:
+            continue
+        candidate = _lookup_key(store.num[node_id], kind, store.text[node_id])
+        if candidate[0] != wanted[0]:
+            continue
+        if candidate > wanted:
+            break
+        found = row
+    return found
+
+
+def build_table(rows, rng):
+    """이름 열(0..rows-1) 과 정렬된 점수 열(rows..2*rows-1) 을 담은 값 저장소"""
+    store = ValueStore(2 * rows)
+    for i in range(rows):
+        store.set(i, f"직원{i:06d}")
+    scores = np.sort(rng.uniform(0, 1000, size=rows))
+    for i, score in enumerate(scores):
+        store.set(rows + i, float(score))
+    return store, np.arange(rows), np.arange(rows, 2 * rows)
+
+
+def compare(label, store, column, keys, approximate, linear_keys):
+    start = time.perf_counter()
+    expected = [linear_match(column, key, approximate, store) for key in keys[:linear_keys]]
+    linear_time = (time.perf_counter() - start) / linear_keys
+
+    start = time.perf_counter()
+    index = LookupIndex(column, store)
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    found = [index.match(key, approximate) for key in keys]
+    index_time = (time.perf_counter() - start) / len(keys)
+    same = found[:linear_keys] == expected
+    print(f"  {label:<12} 선형 {linear_time * 1e6:10.1f}µs/조회   색인 {index_time * 1e6:6.2f}µs/조회 "
+          f"(색인 생성 {built * 1e3:6.1f}ms, {linear_time / index_time:8.0f}배)  결과 동일: {same}")
+    return same
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VLOOKUP 색인 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--lookups", type=int, default=20_000, help="색인으로 찾을 키 수")
+    parser.add_argument("--linear", type=int, default=200, help="선형 탐색으로 찾을 키 수 (앞쪽 일부)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    ok = True
+    for rows in args.rows:
+        store, names, scores = build_table(rows, rng)
+        print(f"=== 표 {rows:,}행 ===")
+        # 정확히 일치: 있는 이름 + 없는 이름 조금, 대소문자 무시
+        picks = rng.integers(0, rows + rows // 10, size=args.lookups)
+        exact = [_lookup_key(0.0, STRING, f"직원{i:06d}".upper()) for i in picks]
+        ok &= compare("정확히 일치", store, names, exact, False, args.linear)
+        approx = [_lookup_key(value, NUMBER, None) for value in rng.uniform(-10, 1010, size=args.lookups)]
+        ok &= compare("근사 일치", store, scores, approx, True, args.linear)
+    if not ok:
+        sys.exit("❌ 결과가 다릅니다")
+
+
+if __name__ == "__main__":
+    main()
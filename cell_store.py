@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+열 지향(columnar) 셀 저장소
+시트의 셀을 셀마다 dict 로 두지 않고 행/열 번호 배열, 값 배열과 종류(tag) 배열,
+수식 문자열 풀(정수 id) 로 보관합니다. 값도 수식도 없는 셀은 저장하지 않습니다.
+셀은 행 우선 순서로 정렬되어 있어 행 범위 조회는 복사 없는 배열 슬라이스이고,
+pandas DataFrame 으로도 가능한 한 복사 없이 내보낼 수 있습니다.
+"""
+
+import argparse
+import time
+from array import array
+
+import numpy as np
+
+from excel_stream import column_index, column_letter, scan_sheet, split_address
+from formula_eval import BOOL, EMPTY, ERROR_KIND, NUMBER, STRING
+from workbook_session import WorkbookSession
+
+
+class StringPool:
+    """워크북 공용 문자열 풀 (중복 없는 문자열 목록과 문자열 → id)"""
+
+    def __init__(self, shared_strings=()):
+        self.strings = []
+        self._index = {}
+        # 공유 문자열 번호 → 풀 id (sharedStrings.xml 에 같은 문자열이 여러 번 있을 수 있음)
+        self.shared_ids = [self.add(text) for text in shared_strings]
+
+    def add(self, text):
+        string_id = self._index.get(text)
+        if string_id is None:
+            string_id = len(self.strings)
+            self._index[text] = string_id
+            self.strings.append(text)
+        return string_id
+
+    def __getitem__(self, string_id):
+        return self.strings[string_id]
+
+    def __len__(self):
+        return len(self.strings)
+
+
+class SheetCellStore:
+    """한 시트의 셀을 행 우선으로 정렬해 담은 열 지향 저장소"""
+
+    def __init__(self, name, rows, cols, tags, numbers, text_ids, formula_ids, style_ids, strings, formulas):
+        self.name = name
+        self.rows = rows                # int32, 행 번호 (오름차순)
+        self.cols = cols                # int32, 열 번호 (같은 행 안에서 오름차순)
+        self.tags = tags                # int8, EMPTY/NUMBER/STRING/BOOL/오류 코드
+        self.numbers = numbers          # float64, 숫자/논리값 (그 밖에는 NaN)
+        self.text_ids = text_ids        # int32, 문자열/오류 값의 문자열 풀 id (없으면 -1)
+        self.formula_ids = formula_ids  # int32, 수식 풀 id (없으면 -1)
+        self.style_ids = style_ids      # int32, styles.xml cellXfs 번호
+        self.strings = strings          # StringPool (워크북 공용)
+        self.formulas = formulas        # StringPool (워크북 공용 수식 풀)
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def nbytes(self):
+        """셀 배열이 차지하는 바이트 (공용 풀 제외)"""
+        return sum(a.nbytes for a in (self.rows, self.cols, self.tags, self.numbers,
+                                      self.text_ids, self.formula_ids, self.style_ids))
+
+    def _take(self, index):
+        """슬라이스(복사 없음) 또는 인덱스 배열로 부분 저장소 만들기"""
+        return SheetCellStore(self.name, self.rows[index], self.cols[index], self.tags[index],
+                              self.numbers[index], self.text_ids[index], self.formula_ids[index],
+                              self.style_ids[index], self.strings, self.formulas)
+
+    def rows_between(self, min_row, max_row):
+        """min_row~max_row 행의 셀 (배열 뷰, 복사 없음)"""
+        start = np.searchsorted(self.rows, min_row, side='left')
+        stop = np.searchsorted(self.rows, max_row, side='right')
+        return self._take(slice(start, stop))
+
+    def row(self, row):
+        return self.rows_between(row, row)
+
+    def column(self, col):
+        """한 열의 셀 (열 문자 또는 번호)"""
+        col = column_index(col) if isinstance(col, str) else col
+        return self._take(np.flatnonzero(self.cols == col))
+
+    def range(self, ref):
+        """'B4:P40' 범위의 셀"""
+        start, _, end = ref.replace('$', '').partition(':')
+        min_row, min_col = split_address(start)
+        max_row, max_col = split_address(end or start)
+        part = self.rows_between(min_row, max_row)
+        return part._take(np.flatnonzero((part.cols >= min_col) & (part.cols <= max_col)))
+
+    def position(self, row, col):
+        """(행, 열) 셀의 배열 위치 (없으면 None)"""
+        start = np.searchsorted(self.rows, row, side='left')
+        stop = np.searchsorted(self.rows, row, side='right')
+        i = start + np.searchsorted(self.cols[start:stop], col)
+        if i < stop and self.cols[i] == col:
+            return int(i)
+        return None
+
+    def value_at(self, i):
+        """배열 위치의 파이썬 값"""
+        tag = self.tags[i]
+        if tag == NUMBER:
+            return float(self.numbers[i])
+        if tag == BOOL:
+            return bool(self.numbers[i])
+        if tag == EMPTY:
+            return None
+        return self.strings[self.text_ids[i]]
+
+    def get(self, address):
+        """'G6' 셀의 (값, 수식) (없으면 (None, None))"""
+        i = self.position(*split_address(address))
+        if i is None:
+            return None, None
+        formula_id = self.formula_ids[i]
+        return self.value_at(i), (self.formulas[formula_id] if formula_id >= 0 else None)
+
+    def addresses(self):
+        return [f"{column_letter(c)}{r}" for r, c in zip(self.rows.tolist(), self.cols.tolist())]
+
+    def to_dense(self, ref=None):
+        """숫자 값을 2차원 배열로 (빈 셀과 숫자가 아닌 셀은 NaN)"""
+        part = self.range(ref) if ref else self
+        if not len(part):
+            return np.empty((0, 0))
+        min_row, min_col = int(part.rows.min()), int(part.cols.min())
+        if ref:
+            start, _, end = ref.replace('$', '').partition(':')
+            min_row, min_col = split_address(start)
+            max_row, max_col = split_address(end or start)
+        else:
+            max_row, max_col = int(part.rows.max()), int(part.cols.max())
+        grid = np.full((max_row - min_row + 1, max_col - min_col + 1), np.nan)
+        numeric = (part.tags == NUMBER) | (part.tags == BOOL)
+        grid[part.rows[numeric] - min_row, part.cols[numeric] - min_col] = part.numbers[numeric]
+        return grid
+
+    def to_dataframe(self):
+        """
+        셀 목록을 pandas DataFrame 으로 (숫자 배열은 복사 없이 사용).
+        text/formula 열은 공용 풀을 범주(categories)로 하는 Categorical 이라 문자열을 복사하지 않습니다.
+        """
+        import pandas as pd
+
+        return pd.DataFrame({
+            'row': self.rows,
+            'col': self.cols,
+            'tag': self.tags,
+            'number': self.numbers,
+            'text': pd.Categorical.from_codes(self.text_ids, categories=_categories(self.strings)),
+            'formula': pd.Categorical.from_codes(self.formula_ids, categories=_categories(self.formulas)),
+            'style_id': self.style_ids,
+        }, copy=False)
+
+
+def _categories(pool):
+    import pandas as pd
+
+    return pd.Index(pool.strings, dtype=object)
+
+
+def build_sheet_store(name, events, strings, formulas):
+    """scan_sheet 결과(공유 문자열은 번호 그대로)로 시트 저장소 만들기"""
+    rows, cols = array('i'), array('i')
+    tags = array('b')
+    numbers = array('d')
+    text_ids, formula_ids, style_ids = array('i'), array('i'), array('i')
+    nan = float('nan')
+
+    for kind, record in events:
+        if kind != 'cell':
+            continue
+        value, data_type = record.value, record.data_type
+        if value is None and not record.formula:
+            continue    # 빈 셀은 저장하지 않음
+
+        number, text_id = nan, -1
+        if value is None:
+            tag = EMPTY
+        elif data_type == 's':
+            tag, text_id = STRING, strings.shared_ids[int(value)]
+        elif data_type == 'b':
+            tag, number = BOOL, 1.0 if value else 0.0
+        elif data_type == 'e':
+            tag, text_id = ERROR_KIND.get(value, ERROR_KIND['#VALUE!']), strings.add(value)
+        elif isinstance(value, (int, float)):
+            tag, number = NUMBER, float(value)
+        else:
+            tag, text_id = STRING, strings.add(str(value))
+
+        rows.append(record.row)
+        cols.append(record.col)
+        tags.append(tag)
+        numbers.append(number)
+        text_ids.append(text_id)
+        formula_ids.append(formulas.add(record.formula) if record.formula else -1)
+        style_ids.append(record.style_id)
+
+    # array 버퍼를 그대로 쓰는 NumPy 배열 (복사 없음)
+    store = SheetCellStore(
+        name,
+        np.frombuffer(rows, dtype=np.int32), np.frombuffer(cols, dtype=np.int32),
+        np.frombuffer(tags, dtype=np.int8), np.frombuffer(numbers, dtype=np.float64),
+        np.frombuffer(text_ids, dtype=np.int32), np.frombuffer(formula_ids, dtype=np.int32),
+        np.frombuffer(style_ids, dtype=np.int32), strings, formulas)
+    row_step, col_step = np.diff(store.rows), np.diff(store.cols)
+    if np.any((row_step < 0) | ((row_step == 0) & (col_step < 0))):
+        # 시트 XML 은 보통 행 우선 순서지만, 아니면 정렬
+        store = store._take(np.lexsort((store.cols, store.rows)))
+    return store
+
+
+def load_cell_stores(session):
+    """워크북 전체를 시트별 SheetCellStore 로 (문자열/수식 풀은 시트끼리 공유)"""
+    strings = StringPool(session.shared_strings)
+    formulas = StringPool()
+    stores = {}
+    for sheet_name, part in session.sheet_map.items():
+        stores[sheet_name] = build_sheet_store(sheet_name, scan_sheet(session.zf, part), strings, formulas)
+    return stores
+
+
+def main():
+    parser = argparse.ArgumentParser(description="열 지향 셀 저장소")
+    parser.add_argument("file_path", nargs="?",
+                        default="/Users/sung/user/workspace/GRK/GRK_workspace/2025_CF_management.xlsx")
+    parser.add_argument("--sheet", default="01.Cash Flow Management", help="조회할 시트")
+    parser.add_argument("--range", default="E6:P8", help="조회할 범위")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with WorkbookSession(args.file_path) as session:
+        stores = load_cell_stores(session)
+    elapsed = time.perf_counter() - start
+
+    print(f"=== 열 지향 셀 저장소 ({elapsed:.2f}초) ===")
+    for sheet_name, store in stores.items():
+        print(f"{sheet_name}: 셀 {len(store):,}개, 수식 {int((store.formula_ids >= 0).sum()):,}개, "
+              f"{store.nbytes:,} bytes")
+
+    store = stores[args.sheet]
+    part = store.range(args.range)
+    print(f"\n{args.sheet}!{args.range} ({len(part)}개 셀):")
+    for address, i in zip(part.addresses(), range(len(part))):
+        formula_id = part.formula_ids[i]
+        formula = f"  {part.formulas[formula_id]}" if formula_id >= 0 else ""
+        print(f"  {address}: {part.value_at(i)}{formula}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Excel 통합 분석 리포트
+요약 분석, 주요 수식 리포트, 고급 기능 분석(선택적으로 전체 셀 분석까지)을
+하나의 WorkbookSession 으로 한 프로세스에서 실행합니다.
+워크북 파트는 리포트 수와 관계없이 한 번씩만 파싱됩니다.
+"""
+
+import argparse
+import contextlib
+import time
+
+from analysis_cache import add_cache_arguments, cache_from_args
+from analyze_excel import analyze_excel_file_stream, save_analysis
+from analyze_excel_summary import summarize_workbook
+from detailed_formula_report import analyze_key_formulas
+from excel_advanced_features import run_advanced_report
+from ndjson_writer import NdjsonWriter
+from workbook_session import WorkbookSession
+
+# 리포트 이름 → 실행 함수 (모두 WorkbookSession 하나를 받음)
+REPORTS = {
+    "summary": summarize_workbook,
+    "formulas": analyze_key_formulas,
+    "advanced": run_advanced_report,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Excel 통합 분석 리포트")
+    parser.add_argument("file_path", nargs="?",
+                        default="/Users/sung/user/workspace/GRK/GRK_workspace/2025_CF_management.xlsx")
+    parser.add_argument("--reports", nargs="+", choices=list(REPORTS), default=list(REPORTS),
+                        help="실행할 리포트 (기본: 전체)")
+    parser.add_argument("--full", action="store_true",
+                        help="전체 셀 스트리밍 분석도 실행하고 JSON 으로 저장")
+    parser.add_argument("--output", default="/Users/sung/user/workspace/GRK/GRK_workspace/excel_analysis.json",
+                        help="--full 분석 결과 JSON 경로")
+    parser.add_argument("--ndjson", metavar="PATH",
+                        help="--full 셀 데이터를 JSON 대신 NDJSON 으로 스트리밍 기록 (.gz/.zst 는 압축)")
+    parser.add_argument("--workers", type=int, default=1, help="--full 분석의 시트별 병렬 프로세스 수")
+    add_cache_arguments(parser)
+    args = parser.parse_args()
+    cache = cache_from_args(args)
+
+    timings = []
+    with WorkbookSession(args.file_path, cache) as session:
+        for name in args.reports:
+            print(f"\n{'#'*60}\n# {name}\n{'#'*60}\n")
+            start = time.perf_counter()
+            REPORTS[name](session)
+            timings.append((name, time.perf_counter() - start))
+
+        if args.full:
+            print(f"\n{'#'*60}\n# full\n{'#'*60}\n")
+            start = time.perf_counter()
+            with contextlib.ExitStack() as stack:
+                writer = stack.enter_context(NdjsonWriter(args.ndjson)) if args.ndjson else None
+                analysis = analyze_excel_file_stream(session, workers=args.workers, writer=writer)
+            if analysis and writer is not None:
+                print(f"\nNDJSON {writer.records}줄을 {args.ndjson}에 기록했습니다.")
+            elif analysis:
+                save_analysis(analysis, args.output)
+            timings.append(("full", time.perf_counter() - start))
+
+        print(f"\n=== 실행 시간 ===")
+        for name, elapsed in timings:
+            print(f"  {name}: {elapsed:.3f}초")
+        print(f"\n=== 파트별 파싱 횟수 ===")
+        for part, count in sorted(session.parse_counts.items()):
+            print(f"  {part}: {count}회")
+
+    if cache is not None:
+        cache.report()
+
+
+if __name__ == "__main__":
+    main()
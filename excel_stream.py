@@ -0,0 +1,530 @@
+#!/usr/bin/env python3
+"""
+Excel 워크시트 스트리밍 스캐너
+xlsx(zip) 안의 xl/worksheets/sheetN.xml 을 iterparse 로 직접 읽어
+셀 레코드(주소, 원시값, 수식, 스타일 id)를 파싱되는 즉시 내보냅니다.
+행 단위로 XML 요소를 비우므로 시트 크기와 무관하게 메모리 사용량이 일정합니다.
+"""
+
+import posixpath
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import OrderedDict, namedtuple
+from datetime import datetime, timedelta
+
+NS_MAIN = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+NS_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+NS_PKG_REL = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+# 스캐너가 내보내는 셀 한 개의 정보
+CellRecord = namedtuple('CellRecord', ['address', 'row', 'col', 'value', 'formula', 'style_id', 'data_type'])
+
+_ADDRESS_RE = re.compile(r'^\$?([A-Z]{1,3})\$?(\d+)$')
+# 수식 안의 셀 참조 (함수 이름 LOG10( 같은 경우와 시트/이름 일부는 제외, Sheet1!A1 은 A1 만 이동)
+_FORMULA_REF_RE = re.compile(r"(?<![A-Za-z0-9_.])(\$?)([A-Z]{1,3})(\$?)(\d+)(?![A-Za-z0-9_(!])")
+_FORMULA_SKIP_RE = re.compile(r'"(?:[^"]|"")*"|\'(?:[^\']|\'\')*\'!')
+# 날짜 서식 판별: 따옴표 문자열, 이스케이프, [Red]/[$-412] 같은 구간을 지운 뒤 날짜/시간 기호 검사
+_FORMAT_LITERAL_RE = re.compile(r'"[^"]*"|\\.|\[[^\]]*\]')
+_DATE_TOKEN_RE = re.compile(r'[dmyhs]', re.IGNORECASE)
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+
+
+def _tag(name):
+    return f'{{{NS_MAIN}}}{name}'
+
+
+def column_index(letters):
+    """열 문자(A, AB ...)를 1부터 시작하는 열 번호로 변환"""
+    index = 0
+    for ch in letters:
+        index = index * 26 + (ord(ch) - 64)
+    return index
+
+
+def column_letter(index):
+    """1부터 시작하는 열 번호를 열 문자로 변환"""
+    letters = ''
+    while index > 0:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def split_address(address):
+    """'$B$5' 형태의 셀 주소를 (행, 열) 번호로 분리"""
+    match = _ADDRESS_RE.match(address)
+    if not match:
+        raise ValueError(f"잘못된 셀 주소: {address}")
+    return int(match.group(2)), column_index(match.group(1))
+
+
+def translate_formula(formula, row_offset, col_offset):
+    """공유 수식의 상대 참조를 (행, 열) 오프셋만큼 이동"""
+    def shift(match):
+        col_abs, col, row_abs, row = match.groups()
+        if not col_abs:
+            col = column_letter(column_index(col) + col_offset)
+        if not row_abs:
+            row = str(int(row) + row_offset)
+        return f'{col_abs}{col}{row_abs}{row}'
+
+    # 문자열 리터럴과 따옴표로 감싼 시트 이름은 그대로 두고 나머지만 변환
+    result = []
+    pos = 0
+    for skip in _FORMULA_SKIP_RE.finditer(formula):
+        result.append(_FORMULA_REF_RE.sub(shift, formula[pos:skip.start()]))
+        result.append(skip.group(0))
+        pos = skip.end()
+    result.append(_FORMULA_REF_RE.sub(shift, formula[pos:]))
+    return ''.join(result)
+
+
+def open_workbook_zip(source):
+    """파일 경로 또는 이미 열린 ZipFile 을 받아 ZipFile 로 반환"""
+    if isinstance(source, zipfile.ZipFile):
+        return source
+    return zipfile.ZipFile(source, 'r')
+
+
+def read_sheet_map(zf):
+    """워크시트 이름 → zip 내부 XML 경로 (워크북 순서 유지)"""
+    return parse_sheet_map(ET.fromstring(zf.read('xl/workbook.xml')),
+                           ET.fromstring(zf.read('xl/_rels/workbook.xml.rels')))
+
+
+def parse_sheet_map(workbook_root, rels_root):
+    """파싱된 workbook.xml 과 workbook.xml.rels 로 시트 이름 → XML 경로 구하기"""
+    targets = {}
+    for rel in rels_root.iter(f'{{{NS_PKG_REL}}}Relationship'):
+        target = rel.get('Target')
+        if target.startswith('/'):
+            part = target.lstrip('/')
+        else:
+            part = posixpath.normpath(posixpath.join('xl', target))
+        targets[rel.get('Id')] = part
+
+    sheet_map = OrderedDict()
+    for sheet in workbook_root.iter(_tag('sheet')):
+        sheet_map[sheet.get('name')] = targets.get(sheet.get(f'{{{NS_REL}}}id'))
+    return sheet_map
+
+
+def read_active_sheet(zf):
+    """워크북에서 활성 시트 이름 (bookViews 의 activeTab)"""
+    return parse_active_sheet(ET.fromstring(zf.read('xl/workbook.xml')))
+
+
+def parse_active_sheet(workbook_root):
+    names = [sheet.get('name') for sheet in workbook_root.iter(_tag('sheet'))]
+    view = workbook_root.find(f"{_tag('bookViews')}/{_tag('workbookView')}")
+    active = int(view.get('activeTab', 0)) if view is not None else 0
+    return names[active] if active < len(names) else None
+
+
+# 내장 숫자 서식 (numFmts 에 정의되지 않는 번호)
+BUILTIN_NUMBER_FORMATS = {
+    0: 'General', 1: '0', 2: '0.00', 3: '#,##0', 4: '#,##0.00',
+    5: '"$"#,##0_);("$"#,##0)', 6: '"$"#,##0_);[Red]("$"#,##0)',
+    7: '"$"#,##0.00_);("$"#,##0.00)', 8: '"$"#,##0.00_);[Red]("$"#,##0.00)',
+    9: '0%', 10: '0.00%', 11: '0.00E+00', 12: '# ?/?', 13: '# ??/??',
+    14: 'mm-dd-yy', 15: 'd-mmm-yy', 16: 'd-mmm', 17: 'mmm-yy',
+    18: 'h:mm AM/PM', 19: 'h:mm:ss AM/PM', 20: 'h:mm', 21: 'h:mm:ss', 22: 'm/d/yy h:mm',
+    37: '#,##0 ;(#,##0)', 38: '#,##0 ;[Red](#,##0)',
+    39: '#,##0.00;(#,##0.00)', 40: '#,##0.00;[Red](#,##0.00)',
+    45: 'mm:ss', 46: '[h]:mm:ss', 47: 'mmss.0', 48: '##0.0E+0', 49: '@',
+}
+
+
+def read_style_table(zf):
+    """xl/styles.xml 의 cellXfs 를 스타일 표로 읽기 (셀의 s 속성 = 표 번호)"""
+    if 'xl/styles.xml' not in zf.namelist():
+        return []
+    return parse_style_table(ET.fromstring(zf.read('xl/styles.xml')))
+
+
+def _color(elem):
+    """<color>/<fgColor> 요소를 'FF112233', 'theme:1', 'indexed:64' 형태로"""
+    if elem is None:
+        return None
+    if elem.get('rgb'):
+        return elem.get('rgb')
+    for kind in ('theme', 'indexed'):
+        if elem.get(kind) is not None:
+            return f"{kind}:{elem.get(kind)}"
+    return None
+
+
+def _flag(elem, name):
+    """<b/>, <i/> 처럼 있으면 참인 글꼴 속성 (val="0" 이면 거짓)"""
+    child = elem.find(_tag(name))
+    return child is not None and child.get('val', '1') not in ('0', 'false')
+
+
+def parse_style_table(styles_root):
+    """
+    파싱된 styles.xml 로 스타일 표 만들기.
+    각 항목은 {number_format, font{name,size,bold,italic}, fill, alignment{horizontal,vertical}}
+    """
+    number_formats = dict(BUILTIN_NUMBER_FORMATS)
+    for fmt in styles_root.iter(_tag('numFmt')):
+        number_formats[int(fmt.get('numFmtId'))] = fmt.get('formatCode')
+
+    fonts = []
+    fonts_elem = styles_root.find(_tag('fonts'))
+    for font in (fonts_elem if fonts_elem is not None else []):
+        name = font.find(_tag('name'))
+        size = font.find(_tag('sz'))
+        fonts.append({
+            'name': name.get('val') if name is not None else None,
+            'size': float(size.get('val')) if size is not None else None,
+            'bold': _flag(font, 'b'),
+            'italic': _flag(font, 'i'),
+        })
+
+    fills = []
+    fills_elem = styles_root.find(_tag('fills'))
+    for fill in (fills_elem if fills_elem is not None else []):
+        pattern = fill.find(_tag('patternFill'))
+        color = _color(pattern.find(_tag('fgColor'))) if pattern is not None else None
+        fills.append(color if color != '00000000' else None)
+
+    table = []
+    xfs_elem = styles_root.find(_tag('cellXfs'))
+    for xf in (xfs_elem if xfs_elem is not None else []):
+        alignment = xf.find(_tag('alignment'))
+        font_id = int(xf.get('fontId', 0))
+        fill_id = int(xf.get('fillId', 0))
+        table.append({
+            'number_format': number_formats.get(int(xf.get('numFmtId', 0)), 'General'),
+            'font': fonts[font_id] if font_id < len(fonts) else None,
+            'fill': fills[fill_id] if fill_id < len(fills) else None,
+            'alignment': {
+                'horizontal': alignment.get('horizontal') if alignment is not None else None,
+                'vertical': alignment.get('vertical') if alignment is not None else None,
+            },
+        })
+    return table
+
+
+def is_date_format(number_format):
+    """숫자 서식이 날짜/시간 서식인지 ('yyyy-mm-dd', 'm/d/yy h:mm' 등)"""
+    if not number_format or number_format == 'General':
+        return False
+    return bool(_DATE_TOKEN_RE.search(_FORMAT_LITERAL_RE.sub('', number_format)))
+
+
+def date_style_ids(style_table):
+    """스타일 표에서 날짜/시간 서식인 스타일 번호 집합"""
+    return {i for i, style in enumerate(style_table) if is_date_format(style['number_format'])}
+
+
+def excel_serial_to_datetime(serial):
+    """Excel 날짜 일련번호(1900 체계)를 datetime 으로"""
+    return _EXCEL_EPOCH + timedelta(days=serial)
+
+
+def read_shared_strings(zf):
+    """공유 문자열 테이블 (sharedStrings.xml) 을 리스트로 읽기"""
+    if 'xl/sharedStrings.xml' not in zf.namelist():
+        return []
+
+    strings = []
+    with zf.open('xl/sharedStrings.xml') as f:
+        for event, elem in ET.iterparse(f, events=('end',)):
+            if elem.tag == _tag('si'):
+                strings.append(_inline_text(elem))
+                elem.clear()
+    return strings
+
+
+def _inline_text(elem):
+    """<si>/<is> 요소의 텍스트 (리치 텍스트 run 포함, 윗주 제외)"""
+    parts = []
+    for child in elem:
+        if child.tag == _tag('t'):
+            parts.append(child.text or '')
+        elif child.tag == _tag('r'):
+            t = child.find(_tag('t'))
+            if t is not None:
+                parts.append(t.text or '')
+    return ''.join(parts)
+
+
+def _convert_value(raw, data_type, shared_strings):
+    """<v> 원시 문자열을 셀 타입에 맞는 파이썬 값으로 변환"""
+    if raw is None:
+        return None
+    if data_type == 's':
+        return shared_strings[int(raw)] if shared_strings is not None else raw
+    if data_type == 'b':
+        return raw == '1'
+    if data_type in ('str', 'e', 'inlineStr'):
+        return raw
+    if data_type == 'd':
+        return raw
+    try:
+        if '.' in raw or 'E' in raw.upper():
+            return float(raw)
+        return int(raw)
+    except ValueError:
+        return raw
+
+
+def _split_sqref(sqref):
+    return sqref.split() if sqref else []
+
+
+def scan_sheet(zf, part, shared_strings=None):
+    """
+    시트 XML 을 한 번 훑으며 (종류, 데이터) 이벤트를 순서대로 내보냅니다.
+    종류: 'dimension', 'cell', 'mergeCell', 'dataValidation', 'conditionalFormatting'
+    """
+    with zf.open(part) as f:
+        yield from scan_sheet_file(f, shared_strings)
+
+
+def scan_sheet_file(f, shared_strings=None):
+    """이미 열린 시트 XML 파일 객체를 스캔 (scan_sheet 와 같은 이벤트)"""
+    shared_formulas = {}
+    sheet_data = None
+    current_row = 0
+    current_col = 0
+
+    for event, elem in ET.iterparse(f, events=('start', 'end')):
+        tag = elem.tag
+        if event == 'start':
+            if tag == _tag('sheetData'):
+                sheet_data = elem
+            elif tag == _tag('row'):
+                r = elem.get('r')
+                current_row = int(r) if r else current_row + 1
+                current_col = 0
+            continue
+
+        if tag == _tag('c'):
+            address = elem.get('r')
+            if address:
+                row, col = split_address(address)
+            else:
+                row, col = current_row, current_col + 1
+                address = f'{column_letter(col)}{row}'
+            current_col = col
+
+            data_type = elem.get('t', 'n')
+            style = elem.get('s')
+            raw = None
+            formula = None
+            for child in elem:
+                if child.tag == _tag('v'):
+                    raw = child.text
+                elif child.tag == _tag('f'):
+                    formula = _read_formula(child, row, col, shared_formulas)
+                elif child.tag == _tag('is'):
+                    raw = _inline_text(child)
+
+            yield 'cell', CellRecord(
+                address=address,
+                row=row,
+                col=col,
+                value=_convert_value(raw, data_type, shared_strings),
+                formula=formula,
+                style_id=int(style) if style else 0,
+                data_type=data_type,
+            )
+        elif tag == _tag('row'):
+            # 처리한 행은 즉시 버려서 메모리를 일정하게 유지
+            elem.clear()
+            if sheet_data is not None:
+                sheet_data.clear()
+        elif tag == _tag('dimension'):
+            yield 'dimension', elem.get('ref')
+        elif tag == _tag('mergeCell'):
+            yield 'mergeCell', elem.get('ref')
+        elif tag == _tag('dataValidation'):
+            formula1 = elem.find(_tag('formula1'))
+            formula2 = elem.find(_tag('formula2'))
+            yield 'dataValidation', {
+                'type': elem.get('type'),
+                'formula1': formula1.text if formula1 is not None else None,
+                'formula2': formula2.text if formula2 is not None else None,
+                'ranges': _split_sqref(elem.get('sqref')),
+                'allow_blank': elem.get('allowBlank') == '1',
+                'show_dropdown': elem.get('showDropDown') == '1',
+                'error_title': elem.get('errorTitle'),
+                'error': elem.get('error'),
+                'prompt_title': elem.get('promptTitle'),
+                'prompt': elem.get('prompt'),
+            }
+            elem.clear()
+        elif tag == _tag('conditionalFormatting'):
+            rules = []
+            for rule in elem.iter(_tag('cfRule')):
+                rules.append({
+                    'type': rule.get('type'),
+                    'priority': rule.get('priority'),
+                    'formula': [f.text for f in rule.iter(_tag('formula'))],
+                })
+            yield 'conditionalFormatting', {
+                'ranges': _split_sqref(elem.get('sqref')),
+                'rules': rules,
+            }
+            elem.clear()
+
+
+def _read_formula(elem, row, col, shared_formulas):
+    """<f> 요소에서 수식 문자열을 얻기 (공유 수식은 기준 셀에서 변환)"""
+    text = elem.text
+    if elem.get('t') == 'shared':
+        si = elem.get('si')
+        if text:
+            shared_formulas[si] = (text, row, col)
+        elif si in shared_formulas:
+            base_text, base_row, base_col = shared_formulas[si]
+            text = translate_formula(base_text, row - base_row, col - base_col)
+    if text is None:
+        return None
+    return '=' + text
+
+
+def summarize_sheet(f, label_rows=10, label_cols=10):
+    """
+    시트 XML 한 번 스캔으로 분석 요약 (사용 범위, 수식, 병합 셀, 유효성 검사, 조건부 서식) 을 만들기.
+    공유 문자열은 풀지 않고 번호로 남겨 두므로 sharedStrings.xml 이 바뀌어도 요약은 유효합니다.
+    """
+    summary = {
+        'dimensions': None,
+        'formulas': [],
+        'merged_cells': [],
+        'data_validation': [],
+        'conditional_formatting': [],
+        'labels': [],
+        'cell_count': 0,
+    }
+    declared = None
+    min_col = None
+    bounds = None   # 실제 셀 기준 [최소 행, 최대 행, 최소 열, 최대 열]
+    for kind, item in scan_sheet_file(f):
+        if kind == 'cell':
+            summary['cell_count'] += 1
+            if bounds is None:
+                bounds = [item.row, item.row, item.col, item.col]
+            else:
+                bounds[1] = item.row
+                bounds[2] = min(bounds[2], item.col)
+                bounds[3] = max(bounds[3], item.col)
+            if min_col is None:
+                min_col = item.col
+            if item.formula:
+                summary['formulas'].append((item.address, item.formula))
+            # 상단 라벨 (문자열/수식 셀): 공유 문자열은 (주소, 번호, True) 로 저장
+            if item.row <= label_rows and min_col <= item.col < min_col + label_cols:
+                if item.formula:
+                    summary['labels'].append((item.address, item.formula, False))
+                elif item.data_type == 's':
+                    summary['labels'].append((item.address, int(item.value), True))
+                elif isinstance(item.value, str) and item.data_type in ('str', 'inlineStr'):
+                    summary['labels'].append((item.address, item.value, False))
+        elif kind == 'dimension':
+            # <dimension> 은 선언된 범위일 뿐이므로 셀이 하나도 없을 때만 사용
+            start, _, end = item.partition(':')
+            first_row, first_col = split_address(start)
+            last_row, last_col = split_address(end or start)
+            declared = [first_row, last_row, first_col, last_col]
+            min_col = first_col
+        elif kind == 'mergeCell':
+            summary['merged_cells'].append(item)
+        elif kind == 'dataValidation':
+            summary['data_validation'].append(item)
+        elif kind == 'conditionalFormatting':
+            summary['conditional_formatting'].append(item)
+
+    bounds = bounds or declared
+    if bounds is not None:
+        first_row, last_row, first_col, last_col = bounds
+        summary['dimensions'] = {
+            'min_row': first_row,
+            'max_row': last_row,
+            'min_col': first_col,
+            'max_col': last_col,
+            'used_range': f'{column_letter(first_col)}{first_row}:{column_letter(last_col)}{last_row}',
+        }
+    return summary
+
+
+def resolve_labels(summary, shared_strings):
+    """요약의 라벨 목록을 (주소, 텍스트) 로 풀기"""
+    return [(address, shared_strings[value] if shared else value)
+            for address, value, shared in summary['labels']]
+
+
+def iter_sheet_cells(zf, part, shared_strings=None):
+    """시트의 셀 레코드만 순서대로 내보내기"""
+    for kind, data in scan_sheet(zf, part, shared_strings):
+        if kind == 'cell':
+            yield data
+
+
+def iter_sheet_rows(zf, part, shared_strings=None, columns=None, date_styles=()):
+    """
+    시트를 행 단위로 (행 번호, {열 번호: 값}) 으로 내보내기 (값이 없는 셀과 빈 행은 빠짐).
+    columns(집합)가 비어 있지 않으면 그 열의 셀만 값으로 변환하고 나머지는 건너뜁니다.
+    셀마다 검사하므로 빈 집합을 넘겼다가 헤더를 찾은 뒤 채워 넣는 식으로 실행 중에 바꿔도 됩니다.
+    date_styles 에 든 스타일의 숫자 셀은 datetime 으로 바꿉니다. 수식은 캐시된 결과값만 읽습니다.
+    """
+    sheet_data = None
+    current_row = 0
+    current_col = 0
+    values = {}
+    with zf.open(part) as f:
+        for event, elem in ET.iterparse(f, events=('start', 'end')):
+            tag = elem.tag
+            if event == 'start':
+                if tag == _tag('sheetData'):
+                    sheet_data = elem
+                elif tag == _tag('row'):
+                    r = elem.get('r')
+                    current_row = int(r) if r else current_row + 1
+                    current_col = 0
+                    values = {}
+                continue
+
+            if tag == _tag('c'):
+                address = elem.get('r')
+                current_col = split_address(address)[1] if address else current_col + 1
+                if columns and current_col not in columns:
+                    continue
+                data_type = elem.get('t', 'n')
+                raw = None
+                for child in elem:
+                    if child.tag == _tag('v'):
+                        raw = child.text
+                    elif child.tag == _tag('is'):
+                        raw = _inline_text(child)
+                value = _convert_value(raw, data_type, shared_strings)
+                if value is None or value == '':
+                    continue
+                if data_type == 'n' and date_styles and int(elem.get('s') or 0) in date_styles \
+                        and isinstance(value, (int, float)):
+                    value = excel_serial_to_datetime(value)
+                values[current_col] = value
+            elif tag == _tag('row'):
+                # 처리한 행은 즉시 버려서 메모리를 일정하게 유지
+                elem.clear()
+                if sheet_data is not None:
+                    sheet_data.clear()
+                if values:
+                    yield current_row, values
+
+
+def iter_workbook_cells(source):
+    """워크북 전체를 시트 순서대로 훑으며 (시트 이름, 셀 레코드) 를 내보내기"""
+    zf = open_workbook_zip(source)
+    try:
+        shared_strings = read_shared_strings(zf)
+        for sheet_name, part in read_sheet_map(zf).items():
+            for record in iter_sheet_cells(zf, part, shared_strings):
+                yield sheet_name, record
+    finally:
+        if zf is not source:
+            zf.close()
@@ -0,0 +1,1240 @@
+#!/usr/bin/env python3
+"""
+CF 워크북 수식 계산 엔진
+수식 의존성 그래프를 위상 순서로 훑으며 모든 수식 셀을 다시 계산합니다.
+같은 단계(level)에 있는 같은 모양(R1C1 기준)의 수식들은 하나로 묶어
+NumPy 배열 연산 한 번으로 계산합니다. (예: J10:P10 의 VLOOKUP 행)
+수식 모양마다 한 번만 파싱하고 AST 를 클로저로 컴파일해 캐시하므로
+재계산/시나리오 계산 때는 파싱과 AST 해석을 다시 하지 않습니다.
+지원 함수: SUM, AVERAGE, MIN, MAX, COUNT, COUNTA, IF, IFERROR, VLOOKUP,
+ROUND, ROUNDUP, ROUNDDOWN, DATEDIF, ABS, AND, OR, NOT 및 사칙연산/비교/문자열 연결
+"""
+
+import argparse
+import re
+import time
+from bisect import bisect_right
+from collections import defaultdict, namedtuple
+from functools import lru_cache
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from excel_stream import (
+    column_index,
+    column_letter,
+    open_workbook_zip,
+    read_sheet_map,
+    read_shared_strings,
+    scan_sheet,
+    split_address,
+)
+from formula_graph import FormulaGraph, Reference, Token, parse_cell_key, split_sheet, tokenize
+
+# 셀 값 종류 (4 이상은 오류 코드)
+EMPTY, NUMBER, STRING, BOOL = 0, 1, 2, 3
+ERROR_CODES = ['#NULL!', '#DIV/0!', '#VALUE!', '#REF!', '#NAME?', '#NUM!', '#N/A']
+ERROR_KIND = {code: 4 + i for i, code in enumerate(ERROR_CODES)}
+ERR_DIV0 = ERROR_KIND['#DIV/0!']
+ERR_VALUE = ERROR_KIND['#VALUE!']
+ERR_REF = ERROR_KIND['#REF!']
+ERR_NAME = ERROR_KIND['#NAME?']
+ERR_NUM = ERROR_KIND['#NUM!']
+ERR_NA = ERROR_KIND['#N/A']
+
+# 수식 셀 기준 상대 참조 (절대 참조는 *_abs=True 이고 값이 절대 행/열 번호)
+RelRef = namedtuple('RelRef', ['sheet', 'row1', 'col1', 'row2', 'col2',
+                               'row1_abs', 'col1_abs', 'row2_abs', 'col2_abs'])
+
+_REF_PART_RE = re.compile(r'^(\$?)([A-Z]{1,3})?(\$?)(\d+)?$')
+_EXCEL_EPOCH = date(1899, 12, 30)
+# 모양별 파싱/컴파일 결과 캐시 크기 (CF 워크북의 고유 모양은 수백 개 수준)
+SHAPE_CACHE_SIZE = 4096
+
+
+# ---------------------------------------------------------------------------
+# 수식 파서 (토큰 → 수식 셀 기준 상대 참조를 가진 AST)
+# ---------------------------------------------------------------------------
+
+def _rel_part(text, host_row, host_col):
+    match = _REF_PART_RE.match(text)
+    if not match:
+        raise ValueError(f"잘못된 참조: {text}")
+    col_abs, col, row_abs, row = match.groups()
+    col_value = None
+    if col:
+        col_value = column_index(col) if col_abs else column_index(col) - host_col
+    row_value = None
+    if row:
+        row_value = int(row) if row_abs else int(row) - host_row
+    return row_value, col_value, bool(row_abs), bool(col_abs)
+
+
+def relative_reference(text, host_row, host_col):
+    """참조 토큰을 수식 셀 기준 RelRef 로 변환 (시트가 없으면 sheet=None)"""
+    sheet, ref = split_sheet(text)
+    start, _, end = ref.partition(':')
+    row1, col1, row1_abs, col1_abs = _rel_part(start, host_row, host_col)
+    row2, col2, row2_abs, col2_abs = _rel_part(end or start, host_row, host_col)
+    return RelRef(sheet, row1, col1, row2, col2, row1_abs, col1_abs, row2_abs, col2_abs)
+
+
+def resolve_reference(ref, host_sheet, host_row, host_col):
+    """RelRef 를 특정 수식 셀 위치에서의 절대 Reference 로 변환"""
+    def absolute(value, is_abs, base):
+        if value is None:
+            return None
+        return value if is_abs else base + value
+
+    row1 = absolute(ref.row1, ref.row1_abs, host_row)
+    row2 = absolute(ref.row2, ref.row2_abs, host_row)
+    col1 = absolute(ref.col1, ref.col1_abs, host_col)
+    col2 = absolute(ref.col2, ref.col2_abs, host_col)
+    if row1 is not None and row2 is not None and row1 > row2:
+        row1, row2 = row2, row1
+    if col1 is not None and col2 is not None and col1 > col2:
+        col1, col2 = col2, col1
+    return Reference(ref.sheet or host_sheet, row1, col1, row2, col2)
+
+
+class _Parser:
+    """재귀 하강 파서 (Excel 연산자 우선순위)"""
+
+    COMPARE = ('=', '<>', '<', '>', '<=', '>=')
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self):
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def expect(self, kind):
+        token = self.take()
+        if token is None or token.kind != kind:
+            raise ValueError(f"'{kind}' 토큰이 필요합니다: {token}")
+        return token
+
+    def is_op(self, *ops):
+        token = self.peek()
+        return token is not None and token.kind == 'op' and token.text in ops
+
+    def parse(self):
+        node = self.comparison()
+        if self.peek() is not None:
+            raise ValueError(f"해석할 수 없는 토큰: {self.peek()}")
+        return node
+
+    def comparison(self):
+        node = self.concat()
+        while self.is_op(*self.COMPARE):
+            node = ('op', self.take().text, node, self.concat())
+        return node
+
+    def concat(self):
+        node = self.additive()
+        while self.is_op('&'):
+            self.take()
+            node = ('op', '&', node, self.additive())
+        return node
+
+    def additive(self):
+        node = self.term()
+        while self.is_op('+', '-'):
+            node = ('op', self.take().text, node, self.term())
+        return node
+
+    def term(self):
+        node = self.power()
+        while self.is_op('*', '/'):
+            node = ('op', self.take().text, node, self.power())
+        return node
+
+    def power(self):
+        node = self.unary()
+        while self.is_op('^'):
+            self.take()
+            node = ('op', '^', node, self.unary())
+        return node
+
+    def unary(self):
+        if self.is_op('-'):
+            self.take()
+            return ('neg', self.unary())
+        if self.is_op('+'):
+            self.take()
+            return self.unary()
+        return self.percent()
+
+    def percent(self):
+        node = self.primary()
+        while self.is_op('%'):
+            self.take()
+            node = ('pct', node)
+        return node
+
+    def primary(self):
+        token = self.take()
+        if token is None:
+            raise ValueError("수식이 예기치 않게 끝났습니다")
+        kind = token.kind
+        if kind == 'number':
+            return ('num', float(token.text))
+        if kind == 'string':
+            return ('str', token.text[1:-1].replace('""', '"'))
+        if kind == 'bool':
+            return ('bool', token.text == 'TRUE')
+        if kind == 'error':
+            return ('err', ERROR_KIND.get(token.text, ERR_VALUE))
+        if kind in ('ref', 'range'):
+            return (kind, token.text)
+        if kind == 'func':
+            name = token.text.upper()
+            self.expect('lparen')
+            args = []
+            if self.peek() is not None and self.peek().kind == 'rparen':
+                self.take()
+                return ('call', name, ())
+            while True:
+                if self.peek() is not None and self.peek().kind in ('sep', 'rparen'):
+                    args.append(('missing',))
+                else:
+                    args.append(self.comparison())
+                token = self.take()
+                if token is None:
+                    raise ValueError("함수 인자가 닫히지 않았습니다")
+                if token.kind == 'rparen':
+                    break
+                if token.kind != 'sep':
+                    raise ValueError(f"함수 인자 구분자가 필요합니다: {token}")
+            return ('call', name, tuple(args))
+        if kind == 'lparen':
+            node = self.comparison()
+            self.expect('rparen')
+            return node
+        if kind == 'name':
+            return ('name', token.text)
+        raise ValueError(f"예상하지 못한 토큰: {token}")
+
+
+def formula_shape(formula, host_row, host_col):
+    """
+    수식의 R1C1 모양: 참조 토큰을 수식 셀 기준 RelRef 로 바꾼 토큰 튜플.
+    '=G7+G35-G8'(G6) 과 '=H7+H35-H8'(H6) 은 같은 모양입니다.
+    """
+    shape = []
+    for token in tokenize(formula):
+        if token.kind == 'ref':
+            kind = 'range' if ':' in token.text else 'ref'
+            token = Token(kind, relative_reference(token.text, host_row, host_col))
+        shape.append(token)
+    return tuple(shape)
+
+
+@lru_cache(maxsize=SHAPE_CACHE_SIZE)
+def parse_shape(shape):
+    """R1C1 모양 → AST (모양마다 한 번만 파싱)"""
+    return _Parser(shape).parse()
+
+
+def parse_formula(formula, host_row, host_col):
+    """수식을 수식 셀 기준 상대 참조 AST 로 변환 (같은 R1C1 모양이면 같은 AST)"""
+    return parse_shape(formula_shape(formula, host_row, host_col))
+
+
+# ---------------------------------------------------------------------------
+# 벡터 값 (여러 셀 값을 한 번에 다루는 배열 묶음)
+# ---------------------------------------------------------------------------
+
+class Vec:
+    """같은 모양 수식 그룹의 값 배열 (num: 숫자, kind: 값 종류, text: 문자열)"""
+
+    __slots__ = ('num', 'kind', 'text')
+
+    def __init__(self, num, kind, text=None):
+        self.num = num
+        self.kind = kind
+        self.text = text
+
+    @classmethod
+    def constant(cls, value_kind, number=0.0, text=None, shape=()):
+        num = np.full(shape, number, dtype=np.float64)
+        kind = np.full(shape, value_kind, dtype=np.int8)
+        texts = None
+        if text is not None:
+            texts = np.empty(shape, dtype=object)
+            texts[...] = text
+        return cls(num, kind, texts)
+
+    @classmethod
+    def numbers(cls, num, kind=None):
+        if kind is None:
+            kind = np.full(np.shape(num), NUMBER, dtype=np.int8)
+        return cls(np.asarray(num, dtype=np.float64), kind)
+
+    def texts(self):
+        """text 배열 (없으면 kind 모양의 빈 배열)"""
+        if self.text is None:
+            return np.full(self.kind.shape, None, dtype=object)
+        return self.text
+
+    def is_error(self):
+        return self.kind >= 4
+
+
+def _where(cond, a, b):
+    """조건에 따라 두 Vec 중 하나를 고르기 (배열 모양은 브로드캐스팅)"""
+    num = np.where(cond, a.num, b.num)
+    kind = np.where(cond, a.kind, b.kind).astype(np.int8)
+    text = None
+    if a.text is not None or b.text is not None:
+        text = np.where(cond, a.texts(), b.texts())
+    return Vec(num, kind, text)
+
+
+def as_number(v):
+    """산술 연산용 숫자 배열과 오류 종류 배열 (문자열은 숫자로 바꿀 수 있을 때만 허용)"""
+    num = v.num
+    err = np.where(v.is_error(), v.kind, 0).astype(np.int8)
+    strings = v.kind == STRING
+    if strings.any():
+        num = num.copy()
+        for index in zip(*np.nonzero(strings)):
+            try:
+                num[index] = float(v.text[index])
+            except (TypeError, ValueError):
+                err[index] = ERR_VALUE
+    return num, err
+
+
+def _first_error(*errs):
+    result = np.zeros(np.broadcast(*errs).shape, dtype=np.int8)
+    for err in reversed(errs):
+        result = np.where(err > 0, err, result)
+    return result
+
+
+def _number_result(num, *errs):
+    """숫자 결과 + 오류 전파 (무한대/NaN 은 #NUM!)"""
+    err = _first_error(*errs)
+    bad = ~np.isfinite(num)
+    err = np.where((err == 0) & bad, ERR_NUM, err).astype(np.int8)
+    kind = np.where(err > 0, err, NUMBER).astype(np.int8)
+    return Vec(np.where(err > 0, 0.0, num), kind)
+
+
+def _arith(op, a, b):
+    num_a, err_a = as_number(a)
+    num_b, err_b = as_number(b)
+    with np.errstate(all='ignore'):
+        if op == '+':
+            result = num_a + num_b
+        elif op == '-':
+            result = num_a - num_b
+        elif op == '*':
+            result = num_a * num_b
+        elif op == '/':
+            result = num_a / np.where(num_b == 0, np.nan, num_b)
+            err_b = np.where((err_b == 0) & (num_b == 0), ERR_DIV0, err_b).astype(np.int8)
+        else:
+            result = np.power(num_a, num_b)
+    return _number_result(result, err_a, err_b)
+
+
+def _scalar_text(num, kind, text):
+    if kind == STRING:
+        return text
+    if kind == BOOL:
+        return 'TRUE' if num else 'FALSE'
+    if kind == EMPTY:
+        return ''
+    if float(num).is_integer():
+        return str(int(num))
+    return repr(float(num))
+
+
+def _concat(a, b):
+    shape = np.broadcast(a.kind, b.kind).shape
+    a_num, a_kind, a_text = (np.broadcast_to(x, shape) for x in (a.num, a.kind, a.texts()))
+    b_num, b_kind, b_text = (np.broadcast_to(x, shape) for x in (b.num, b.kind, b.texts()))
+    err = _first_error(np.where(a_kind >= 4, a_kind, 0), np.where(b_kind >= 4, b_kind, 0))
+    text = np.empty(shape, dtype=object)
+    for index in np.ndindex(shape):
+        text[index] = (_scalar_text(a_num[index], a_kind[index], a_text[index])
+                       + _scalar_text(b_num[index], b_kind[index], b_text[index]))
+    kind = np.where(err > 0, err, STRING).astype(np.int8)
+    return Vec(np.zeros(shape), kind, text)
+
+
+def _compare_key(num, kind, text, other_kind=NUMBER):
+    # Excel 비교 순서: 숫자 < 문자열 < 논리값, 문자열은 대소문자 무시
+    if kind == EMPTY:
+        # 빈 셀은 상대 값 종류의 빈 값("", FALSE, 0)으로 비교
+        kind, num, text = other_kind, 0.0, ''
+    if kind == STRING:
+        return (1, text.lower())
+    if kind == BOOL:
+        return (2, num)
+    return (0, num)
+
+
+def _compare(op, a, b):
+    err = _first_error(np.where(a.is_error(), a.kind, 0), np.where(b.is_error(), b.kind, 0))
+    if a.text is None and b.text is None and not (a.kind == BOOL).any() and not (b.kind == BOOL).any():
+        x, y = a.num, b.num
+        result = {'=': np.equal, '<>': np.not_equal, '<': np.less, '>': np.greater,
+                  '<=': np.less_equal, '>=': np.greater_equal}[op](x, y)
+    else:
+        shape = np.broadcast(a.kind, b.kind).shape
+        arrays = [np.broadcast_to(x, shape) for x in (a.num, a.kind, a.texts(), b.num, b.kind, b.texts())]
+        result = np.zeros(shape, dtype=bool)
+        for index in np.ndindex(shape):
+            left = _compare_key(arrays[0][index], arrays[1][index], arrays[2][index], arrays[4][index])
+            right = _compare_key(arrays[3][index], arrays[4][index], arrays[5][index], arrays[1][index])
+            result[index] = {'=': left == right, '<>': left != right, '<': left < right,
+                             '>': left > right, '<=': left <= right, '>=': left >= right}[op]
+    kind = np.where(err > 0, err, BOOL).astype(np.int8)
+    return Vec(np.where(err > 0, 0.0, result.astype(np.float64)), kind)
+
+
+def truthy(v):
+    """IF 조건 해석: (참 여부 배열, 오류 배열)"""
+    err = np.where(v.is_error(), v.kind, 0).astype(np.int8)
+    err = np.where(v.kind == STRING, ERR_VALUE, err).astype(np.int8)
+    return v.num != 0, err
+
+
+# ---------------------------------------------------------------------------
+# 값 저장소
+# ---------------------------------------------------------------------------
+
+class ValueStore:
+    """노드 번호별 셀 값 배열 (마지막 칸은 #REF! 용 예비 칸)"""
+
+    # 그룹 결과 앞에 붙는 축 (시나리오 저장소는 (시나리오 수,))
+    batch_shape = ()
+
+    def __init__(self, size):
+        self.num = np.zeros(size + 1, dtype=np.float64)
+        self.kind = np.zeros(size + 1, dtype=np.int8)
+        self.text = np.full(size + 1, None, dtype=object)
+        self.kind[size] = ERR_REF
+        self.ref_error = size
+
+    def set(self, node_id, value, data_type='n'):
+        """파이썬 값을 저장"""
+        self.text[node_id] = None
+        self.num[node_id] = 0.0
+        if value is None:
+            self.kind[node_id] = EMPTY
+        elif data_type == 'e':
+            # 오류는 셀 형식이 'e' 일 때만 ("#N/A" 라는 문자열 값은 문자열 그대로)
+            self.kind[node_id] = ERROR_KIND.get(value, ERR_VALUE)
+        elif isinstance(value, bool):
+            self.kind[node_id] = BOOL
+            self.num[node_id] = float(value)
+        elif isinstance(value, (int, float)):
+            self.kind[node_id] = NUMBER
+            self.num[node_id] = float(value)
+        elif isinstance(value, datetime):
+            delta = value - datetime(1899, 12, 30)
+            self.kind[node_id] = NUMBER
+            self.num[node_id] = delta.days + delta.seconds / 86400
+        elif isinstance(value, date):
+            self.kind[node_id] = NUMBER
+            self.num[node_id] = float((value - _EXCEL_EPOCH).days)
+        else:
+            self.kind[node_id] = STRING
+            self.text[node_id] = str(value)
+
+    def get(self, node_id):
+        """저장된 값을 파이썬 값으로 반환"""
+        kind = self.kind[node_id]
+        if kind == EMPTY:
+            return None
+        if kind == NUMBER:
+            return float(self.num[node_id])
+        if kind == BOOL:
+            return bool(self.num[node_id])
+        if kind == STRING:
+            return self.text[node_id]
+        return ERROR_CODES[kind - 4]
+
+    def gather(self, ids):
+        return Vec(self.num[ids], self.kind[ids], self.text[ids])
+
+    def varies(self, ids):
+        """ids 중 배치 축을 따라 값이 달라지는 셀이 있는지 (기본 저장소는 항상 False)"""
+        return False
+
+    def assign(self, ids, v):
+        """그룹 계산 결과를 저장 (빈 값 참조 결과는 0 으로 저장)"""
+        kind = np.where(v.kind == EMPTY, NUMBER, v.kind).astype(np.int8)
+        self.num[ids] = np.where(v.kind == EMPTY, 0.0, v.num)
+        self.kind[ids] = kind
+        self.text[ids] = v.text if v.text is not None else None
+
+
+# ---------------------------------------------------------------------------
+# 수식 컴파일러 (AST → 그룹 전체를 계산하는 클로저)
+# ---------------------------------------------------------------------------
+
+_CONSTANT_NODES = {
+    'num': lambda node: Vec.constant(NUMBER, node[1]),
+    'str': lambda node: Vec.constant(STRING, text=node[1]),
+    'bool': lambda node: Vec.constant(BOOL, float(node[1])),
+    'err': lambda node: Vec.constant(node[1]),
+    'missing': lambda node: Vec.constant(EMPTY),
+}
+
+
+# 컴파일된 함수 인자: AST, 값 클로저, 범위 클로저 (참조/범위가 아니면 None 을 돌려줌)
+FormulaArg = namedtuple('FormulaArg', ['node', 'value', 'area'])
+
+
+def _no_area(model, group):
+    return None
+
+
+@lru_cache(maxsize=SHAPE_CACHE_SIZE)
+def compile_area(node):
+    """인자를 범위 의미로 평가하는 클로저 (마지막 축이 범위 안의 셀, 참조/범위가 아니면 None)"""
+    if node[0] == 'ref':
+        def run(model, group):
+            ids, _ = model.bind(group, node)
+            return model.store.gather(ids[:, None])
+        return run
+    if node[0] == 'range':
+        def run(model, group):
+            ids, _ = model.bind(group, node)
+            return model.store.gather(ids)
+        return run
+    return _no_area
+
+
+def compile_arguments(args):
+    """함수 인자 AST 들을 FormulaArg 튜플로 (처리기는 값/범위 중 필요한 의미로 평가)"""
+    return tuple(FormulaArg(arg, compile_formula(arg), compile_area(arg)) for arg in args)
+
+
+@lru_cache(maxsize=SHAPE_CACHE_SIZE)
+def compile_formula(node):
+    """
+    AST 를 (model, group) → Vec 클로저로 변환.
+    노드 종류/연산자/함수 처리기는 컴파일할 때 한 번만 고르고, 같은 모양(같은 AST)은 캐시에서 재사용합니다.
+    함수 인자도 FormulaArg 로 미리 컴파일해 넘기므로 계산 중에는 AST 를 다시 훑지 않습니다.
+    """
+    kind = node[0]
+    if kind in _CONSTANT_NODES:
+        value = _CONSTANT_NODES[kind](node)
+        return lambda model, group: value
+    if kind == 'ref':
+        def run(model, group):
+            ids, _ = model.bind(group, node)
+            return model.store.gather(ids)
+        return run
+    if kind == 'range':
+        # 범위를 단일 값 자리에 쓰면 첫 셀 값 (암시적 교차는 지원하지 않음)
+        def run(model, group):
+            ids, _ = model.bind(group, node)
+            return model.store.gather(ids[:, 0])
+        return run
+    if kind == 'neg':
+        operand = compile_formula(node[1])
+        zero = Vec.constant(NUMBER, 0.0)
+        return lambda model, group: _arith('-', zero, operand(model, group))
+    if kind == 'pct':
+        operand = compile_formula(node[1])
+        hundred = Vec.constant(NUMBER, 100.0)
+        return lambda model, group: _arith('/', operand(model, group), hundred)
+    if kind == 'op':
+        op = node[1]
+        left = compile_formula(node[2])
+        right = compile_formula(node[3])
+        if op in ('+', '-', '*', '/', '^'):
+            return lambda model, group: _arith(op, left(model, group), right(model, group))
+        if op == '&':
+            return lambda model, group: _concat(left(model, group), right(model, group))
+        return lambda model, group: _compare(op, left(model, group), right(model, group))
+    if kind in ('call', 'name'):
+        name = node[1]
+        handler = _FUNCTIONS.get(name) if kind == 'call' else None
+        if handler is None:
+            def run(model, group):
+                model.unsupported[name] += 1
+                return Vec.constant(ERR_NAME)
+            return run
+        args = compile_arguments(node[2])
+        return lambda model, group: handler(model, group, args)
+    raise ValueError(f"알 수 없는 AST 노드: {node}")
+
+
+# ---------------------------------------------------------------------------
+# 워크북 모델 + 계산기
+# ---------------------------------------------------------------------------
+
+class Group:
+    """같은 단계, 같은 모양의 수식 셀 묶음"""
+
+    __slots__ = ('level', 'ast', 'compiled', 'members', 'targets', 'bindings')
+
+    def __init__(self, level, ast, members, compiled=None):
+        self.level = level
+        self.ast = ast
+        self.compiled = compiled or compile_formula(ast)
+        self.members = members
+        self.targets = np.asarray(members, dtype=np.intp)
+        self.bindings = {}
+
+    def subset(self, positions):
+        """일부 구성원만 담은 그룹 (이미 계산한 참조 바인딩은 잘라서 재사용)"""
+        sub = Group(self.level, self.ast, [self.members[i] for i in positions], self.compiled)
+        index = np.asarray(positions, dtype=np.intp)
+        for leaf, (ids, shape) in self.bindings.items():
+            sub.bindings[leaf] = (ids[index], shape)
+        return sub
+
+
+class WorkbookModel:
+    """수식 그래프와 셀 값 저장소를 묶은 워크북 계산 모델"""
+
+    def __init__(self, graph, cells):
+        self.graph = graph
+        self.cells = cells
+        self.store = ValueStore(len(graph))
+        self.cached = {}
+        for node_id, key in enumerate(graph.keys):
+            value, data_type = cells.get(key, (None, 'n'))
+            self.store.set(node_id, value, data_type)
+            if node_id in graph.formulas:
+                self.cached[node_id] = value
+        self.asts = {}
+        self.parse_errors = {}
+        for node_id, formula in graph.formulas.items():
+            _, row, col = graph.keys[node_id]
+            try:
+                self.asts[node_id] = parse_formula(formula, row, col)
+            except ValueError as e:
+                self.parse_errors[node_id] = str(e)
+                self.asts[node_id] = ('err', ERR_NAME)
+        self.levels = self._compute_levels()
+        self.groups = self._build_groups()
+        self.unsupported = defaultdict(int)
+        # VLOOKUP 색인: (시트, 시작 행, 끝 행, 첫 열) → LookupIndex, 색인에 든 셀 표시
+        self.lookup_indexes = {}
+        self.lookup_cells = np.zeros(len(self.store.num), dtype=bool)
+
+    @classmethod
+    def load(cls, source):
+        """워크북을 한 번 스캔해 값과 수식을 모두 읽어 모델 생성"""
+        cells = {}
+        formula_cells = []
+        dimensions = {}
+        zf = open_workbook_zip(source)
+        try:
+            shared_strings = read_shared_strings(zf)
+            for sheet_name, part in read_sheet_map(zf).items():
+                for kind, item in scan_sheet(zf, part, shared_strings):
+                    if kind == 'dimension':
+                        _, _, end = item.partition(':')
+                        dimensions[sheet_name] = split_address(end or item)
+                    elif kind == 'cell':
+                        key = (sheet_name, item.row, item.col)
+                        if item.value is not None:
+                            cells[key] = (item.value, item.data_type)
+                        if item.formula:
+                            formula_cells.append((sheet_name, item.row, item.col, item.formula))
+        finally:
+            if zf is not source:
+                zf.close()
+        graph = FormulaGraph.from_formulas(formula_cells, dimensions)
+        return cls(graph, cells)
+
+    def _compute_levels(self):
+        """위상 정렬 단계: 수식 셀의 단계 = 선행 수식 셀 단계의 최댓값 + 1"""
+        graph = self.graph
+        formulas = graph.formulas
+        pending = {}
+        level = {}
+        ready = []
+        for node_id in formulas:
+            count = sum(1 for i in range(graph.prec_ptr[node_id], graph.prec_ptr[node_id + 1])
+                        if graph.prec_idx[i] in formulas)
+            pending[node_id] = count
+            level[node_id] = 1
+            if count == 0:
+                ready.append(node_id)
+
+        order = []
+        while ready:
+            node_id = ready.pop()
+            order.append(node_id)
+            for i in range(graph.dep_ptr[node_id], graph.dep_ptr[node_id + 1]):
+                dependent = graph.dep_idx[i]
+                level[dependent] = max(level[dependent], level[node_id] + 1)
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+
+        # 순환 참조 셀은 마지막 단계에 순서대로 배치
+        self.circular = [node_id for node_id in formulas if pending[node_id] > 0]
+        last = max(level.values(), default=0) + 1
+        for offset, node_id in enumerate(self.circular):
+            level[node_id] = last + offset
+        return level
+
+    def _build_groups(self):
+        buckets = defaultdict(list)
+        for node_id, ast in self.asts.items():
+            buckets[(self.levels[node_id], ast)].append(node_id)
+        groups = [Group(level, ast, members) for (level, ast), members in buckets.items()]
+        groups.sort(key=lambda g: g.level)
+        # 노드 번호 → (그룹 순번, 그룹 안 위치) : 부분 재계산 때 사용
+        self.group_of = {}
+        for group_index, group in enumerate(groups):
+            for position, node_id in enumerate(group.members):
+                self.group_of[node_id] = (group_index, position)
+        return groups
+
+    # -- 참조 바인딩 ---------------------------------------------------------
+
+    def _cell_id(self, key):
+        node_id = self.graph.index.get(key)
+        return self.store.ref_error if node_id is None else node_id
+
+    def bind(self, group, leaf):
+        """AST 참조 잎(leaf)을 그룹 구성원별 노드 번호 배열로 변환 (한 번만 계산)"""
+        binding = group.bindings.get(leaf)
+        if binding is not None:
+            return binding
+        kind, ref = leaf
+        ids = []
+        shape = (1, 1)
+        for node_id in group.members:
+            sheet, row, col = self.graph.keys[node_id]
+            absolute = resolve_reference(ref, sheet, row, col)
+            if kind == 'ref':
+                if absolute.min_row is None or absolute.min_row < 1 or absolute.min_col is None or absolute.min_col < 1:
+                    ids.append(self.store.ref_error)
+                else:
+                    ids.append(self._cell_id((absolute.sheet, absolute.min_row, absolute.min_col)))
+            else:
+                keys = list(self.graph.expand(absolute))
+                max_row, max_col = self.graph.dimensions.get(absolute.sheet, (0, 0))
+                height = (absolute.max_row if absolute.max_row is not None else max_row) - (absolute.min_row or 1) + 1
+                width = (absolute.max_col if absolute.max_col is not None else max_col) - (absolute.min_col or 1) + 1
+                shape = (height, width)
+                ids.append([self._cell_id(key) for key in keys])
+        binding = (np.asarray(ids, dtype=np.intp), shape)
+        group.bindings[leaf] = binding
+        return binding
+
+    # -- AST 평가 -----------------------------------------------------------
+
+    def evaluate(self, node, group):
+        """AST 노드 하나를 그룹 전체에 대해 평가 (compile_formula 캐시 사용)"""
+        return compile_formula(node)(self, group)
+
+    def evaluate_area(self, node, group):
+        """범위 의미로 인자를 평가 (마지막 축이 범위 안의 셀, 참조/범위가 아니면 None)"""
+        return compile_area(node)(self, group)
+
+    def _evaluate_group(self, group):
+        result = group.compiled(self, group)
+        shape = self.store.batch_shape + (len(group.members),)
+        result = Vec(np.broadcast_to(result.num, shape), np.broadcast_to(result.kind, shape),
+                     None if result.text is None else np.broadcast_to(result.text, shape))
+        self.store.assign(group.targets, result)
+        if not self.store.batch_shape:
+            # 시나리오 저장소는 바뀐 값을 따로 두고 색인은 기본 값만 보므로 (varies 로 걸러 냄) 버릴 필요 없음
+            self._invalidate_lookups(group.targets)
+
+    # -- VLOOKUP 색인 --------------------------------------------------------
+
+    def lookup_index(self, table, first_column):
+        """표 범위(table: 절대 Reference)의 첫 열 색인 (값이 바뀌기 전까지 재사용)"""
+        key = (table.sheet, table.min_row, table.max_row, table.min_col)
+        index = self.lookup_indexes.get(key)
+        if index is None:
+            index = LookupIndex(first_column, self.store)
+            self.lookup_indexes[key] = index
+            self.lookup_cells[index.ids] = True
+        return index
+
+    def _invalidate_lookups(self, ids):
+        """ids 중 색인된 첫 열 셀이 있으면 그 셀을 담은 색인만 버림"""
+        if not self.lookup_indexes:
+            return
+        hit = np.asarray(ids, dtype=np.intp)
+        hit = hit[self.lookup_cells[hit]]
+        if not len(hit):
+            return
+        for key, index in list(self.lookup_indexes.items()):
+            if np.isin(index.ids, hit).any():
+                del self.lookup_indexes[key]
+        self.lookup_cells[:] = False
+        for index in self.lookup_indexes.values():
+            self.lookup_cells[index.ids] = True
+
+    def recalculate(self):
+        """모든 수식 셀을 위상 순서대로 다시 계산하고 계산한 셀 수를 반환"""
+        for group in self.groups:
+            self._evaluate_group(group)
+        return len(self.asts)
+
+    def dirty_cells(self, node_ids):
+        """입력 노드들의 전이 종속 수식 셀 (다시 계산해야 하는 셀) 집합"""
+        dirty = set()
+        for node_id in node_ids:
+            if node_id in dirty:
+                continue
+            dirty.update(self.graph.dependent_ids(node_id, transitive=True))
+        return dirty
+
+    def recalculate_cells(self, dirty):
+        """주어진 수식 셀만 위상 순서대로 다시 계산하고 계산한 셀 수를 반환"""
+        positions = defaultdict(list)
+        for node_id in dirty:
+            group_index, position = self.group_of[node_id]
+            positions[group_index].append(position)
+
+        for group_index in sorted(positions):
+            group = self.groups[group_index]
+            selected = sorted(positions[group_index])
+            if len(selected) == len(group.members):
+                self._evaluate_group(group)
+            else:
+                self._evaluate_group(group.subset(selected))
+        return len(dirty)
+
+    def update(self, changes):
+        """
+        입력 셀 값을 바꾸고 영향을 받는 수식 셀만 다시 계산합니다.
+        changes: {'03.HR unit cost!H6': 200000000, ...} 형태의 dict
+        반환값: 다시 계산한 수식 셀 수
+        """
+        changed = []
+        for cell, value in changes.items():
+            key = parse_cell_key(cell) if isinstance(cell, str) else cell
+            node_id = self.graph.index.get(key)
+            if node_id is not None and node_id in self.asts:
+                raise ValueError(f"수식 셀은 입력 값으로 바꿀 수 없습니다: {cell}")
+            self.cells[key] = (value, 'n')
+            if node_id is not None:
+                self.store.set(node_id, value)
+                changed.append(node_id)
+        self._invalidate_lookups(changed)
+        return self.recalculate_cells(self.dirty_cells(changed))
+
+    # -- 조회 ---------------------------------------------------------------
+
+    def node_id(self, cell):
+        key = parse_cell_key(cell) if isinstance(cell, str) else cell
+        node_id = self.graph.index.get(key)
+        if node_id is None:
+            raise KeyError(f"모델에 없는 셀: {cell}")
+        return node_id
+
+    def value(self, cell):
+        """셀 값 조회 (예: '01.Cash Flow Management!G6')"""
+        key = parse_cell_key(cell) if isinstance(cell, str) else cell
+        node_id = self.graph.index.get(key)
+        if node_id is None:
+            # 어떤 수식과도 연결되지 않은 셀은 읽은 값 그대로
+            return self.cells.get(key, (None, 'n'))[0]
+        return self.store.get(node_id)
+
+
+# ---------------------------------------------------------------------------
+# 함수 구현 (그룹 전체를 배열로 계산)
+# ---------------------------------------------------------------------------
+
+def _aggregate_args(model, group, args, scalar_bools=True):
+    """SUM/AVERAGE 류 인자를 (숫자 배열 목록, 포함 마스크 목록, 오류 배열 목록) 으로 정리"""
+    parts = []
+    for arg in args:
+        area = arg.area(model, group)
+        if area is not None:
+            # 범위 안의 문자열/논리값은 무시
+            mask = area.kind == NUMBER
+            err = np.where(area.is_error(), area.kind, 0).astype(np.int8)
+            parts.append((area.num, mask, err, True))
+        else:
+            value = arg.value(model, group)
+            num, err = as_number(value)
+            mask = np.ones(np.shape(num), dtype=bool) if scalar_bools else value.kind == NUMBER
+            parts.append((num, mask, err, False))
+    return parts
+
+
+def _reduce_error(err, is_area):
+    if not is_area:
+        return err
+    # 범위 안 첫 번째 오류를 결과 오류로 사용
+    has = err > 0
+    first = np.argmax(has, axis=-1)
+    picked = np.take_along_axis(err, first[..., None], axis=-1)[..., 0]
+    return np.where(has.any(axis=-1), picked, 0).astype(np.int8)
+
+
+def _fn_sum(model, group, args):
+    total = 0.0
+    errs = []
+    for num, mask, err, is_area in _aggregate_args(model, group, args):
+        values = np.where(mask, num, 0.0)
+        total = total + (values.sum(axis=-1) if is_area else values)
+        errs.append(_reduce_error(err, is_area))
+    return _number_result(np.asarray(total, dtype=np.float64), *errs)
+
+
+def count_values(model, group, args):
+    """AVERAGE 용 구성원별 (숫자 개수, 합계, 인자별 오류 배열 목록)"""
+    count = 0
+    total = 0.0
+    errs = []
+    for num, mask, err, is_area in _aggregate_args(model, group, args):
+        values = np.where(mask, num, 0.0)
+        if is_area:
+            count = count + mask.sum(axis=-1)
+            total = total + values.sum(axis=-1)
+        else:
+            count = count + mask
+            total = total + values
+        errs.append(_reduce_error(err, is_area))
+    return np.asarray(count, dtype=np.float64), np.asarray(total, dtype=np.float64), errs
+
+
+def _fn_average(model, group, args):
+    count, total, errs = count_values(model, group, args)
+    with np.errstate(all='ignore'):
+        result = total / np.where(count == 0, np.nan, count)
+    errs.append(np.where(count == 0, ERR_DIV0, 0).astype(np.int8))
+    return _number_result(result, *errs)
+
+
+def _fn_extreme(reducer):
+    def handler(model, group, args):
+        result = None
+        errs = []
+        for num, mask, err, is_area in _aggregate_args(model, group, args):
+            fill = -np.inf if reducer is np.maximum else np.inf
+            values = np.where(mask, num, fill)
+            part = (np.maximum.reduce if reducer is np.maximum else np.minimum.reduce)(values, axis=-1) \
+                if is_area else values
+            result = part if result is None else reducer(result, part)
+            errs.append(_reduce_error(err, is_area))
+        result = np.where(np.isfinite(result), result, 0.0)
+        return _number_result(result, *errs)
+    return handler
+
+
+def _fn_count(model, group, args):
+    count = 0
+    for arg in args:
+        area = arg.area(model, group)
+        value = area if area is not None else arg.value(model, group)
+        mask = value.kind == NUMBER
+        count = count + (mask.sum(axis=-1) if area is not None else mask)
+    return Vec.numbers(np.asarray(count, dtype=np.float64))
+
+
+def _fn_counta(model, group, args):
+    count = 0
+    for arg in args:
+        area = arg.area(model, group)
+        value = area if area is not None else arg.value(model, group)
+        mask = value.kind != EMPTY
+        count = count + (mask.sum(axis=-1) if area is not None else mask)
+    return Vec.numbers(np.asarray(count, dtype=np.float64))
+
+
+def _fn_if(model, group, args):
+    condition = args[0].value(model, group)
+    truth, err = truthy(condition)
+    when_true = args[1].value(model, group) if len(args) > 1 else Vec.constant(BOOL, 1.0)
+    when_false = args[2].value(model, group) if len(args) > 2 else Vec.constant(BOOL, 0.0)
+    result = _where(truth, when_true, when_false)
+    return _where(err > 0, Vec(np.zeros(np.shape(err)), err), result)
+
+
+def _fn_iferror(model, group, args):
+    value = args[0].value(model, group)
+    fallback = args[1].value(model, group)
+    return _where(value.is_error(), fallback, value)
+
+
+def _bool_result(truth, *errs):
+    err = _first_error(*errs)
+    kind = np.where(err > 0, err, BOOL).astype(np.int8)
+    return Vec(np.where(err > 0, 0.0, np.asarray(truth, dtype=np.float64)), kind)
+
+
+def _fn_not(model, group, args):
+    truth, err = truthy(args[0].value(model, group))
+    return _bool_result(~truth, err)
+
+
+def _fn_logical(combine):
+    def handler(model, group, args):
+        result = None
+        errs = []
+        for arg in args:
+            area = arg.area(model, group)
+            if area is not None:
+                mask = (area.kind == NUMBER) | (area.kind == BOOL)
+                values = np.where(mask, area.num != 0, combine is np.logical_and)
+                part = values.all(axis=-1) if combine is np.logical_and else values.any(axis=-1)
+                errs.append(_reduce_error(np.where(area.is_error(), area.kind, 0).astype(np.int8), True))
+            else:
+                part, err = truthy(arg.value(model, group))
+                errs.append(err)
+            result = part if result is None else combine(result, part)
+        return _bool_result(result, *errs)
+    return handler
+
+
+def _round_with(fn):
+    def handler(model, group, args):
+        num, err = as_number(args[0].value(model, group))
+        digits, digits_err = as_number(args[1].value(model, group)) if len(args) > 1 else (0.0, np.int8(0))
+        factor = np.power(10.0, np.trunc(digits))
+        # 부동소수점 오차(0.30000000000000004 등)를 먼저 정리한 뒤 반올림
+        scaled = np.round(np.abs(num) * factor, 9)
+        result = np.sign(num) * fn(scaled) / factor
+        return _number_result(result, err, digits_err)
+    return handler
+
+
+def _fn_abs(model, group, args):
+    num, err = as_number(args[0].value(model, group))
+    return _number_result(np.abs(num), err)
+
+
+def _serial_to_date(serial):
+    return _EXCEL_EPOCH + timedelta(days=int(serial))
+
+
+def _datedif_scalar(start, end, unit):
+    if unit == 'D':
+        return float(int(end) - int(start))
+    d1 = _serial_to_date(start)
+    d2 = _serial_to_date(end)
+    months = (d2.year - d1.year) * 12 + (d2.month - d1.month) - (1 if d2.day < d1.day else 0)
+    if unit == 'M':
+        return float(months)
+    if unit == 'Y':
+        return float(months // 12)
+    if unit == 'YM':
+        return float(months % 12)
+    if unit == 'MD':
+        anchor_month = d2.month - (1 if d2.day < d1.day else 0)
+        anchor_year = d2.year + (anchor_month - 1) // 12 if anchor_month > 0 else d2.year - 1
+        anchor_month = (anchor_month - 1) % 12 + 1
+        day = min(d1.day, 28)
+        return float((d2 - date(anchor_year, anchor_month, day)).days)
+    if unit == 'YD':
+        try:
+            anchor = d1.replace(year=d2.year)
+        except ValueError:
+            anchor = d1.replace(year=d2.year, day=28)
+        if anchor > d2:
+            anchor = anchor.replace(year=d2.year - 1)
+        return float((d2 - anchor).days)
+    raise ValueError(unit)
+
+
+def _fn_datedif(model, group, args):
+    start, err_start = as_number(args[0].value(model, group))
+    end, err_end = as_number(args[1].value(model, group))
+    unit = args[2].value(model, group)
+    shape = np.broadcast(start, end, unit.kind).shape
+    start, end = np.broadcast_to(start, shape), np.broadcast_to(end, shape)
+    units = np.broadcast_to(unit.texts(), shape)
+    result = np.zeros(shape)
+    err = np.zeros(shape, dtype=np.int8)
+    for index in np.ndindex(shape):
+        code = str(units[index] or '').upper()
+        if start[index] > end[index]:
+            err[index] = ERR_NUM
+            continue
+        try:
+            result[index] = _datedif_scalar(start[index], end[index], code)
+        except (ValueError, OverflowError):
+            err[index] = ERR_NUM
+    return _number_result(result, err_start, err_end, err)
+
+
+def _lookup_key(num, kind, text):
+    if kind == STRING:
+        return (STRING, text.lower())
+    return (kind if kind != EMPTY else NUMBER, float(num))
+
+
+def _vlookup_rows(model, group, args):
+    """구성원별 (찾은 행 번호, 오류) 계산"""
+    key = args[0].value(model, group)
+    table_ids, (height, width) = model.bind(group, args[1].node)
+    column, col_err = as_number(args[2].value(model, group))
+    approximate, flag_err = True, 0
+    if len(args) > 3 and args[3].node[0] != 'missing':
+        approximate, flag_err = truthy(args[3].value(model, group))
+
+    count = len(group.members)
+    if (np.ndim(key.num) > 1 or np.ndim(column) > 1 or np.ndim(approximate) > 1
+            or model.store.varies(table_ids[:, ::width])):
+        # 찾는 행은 구성원마다 한 번만 정하므로 키/열 번호/일치 방식/첫 열이 시나리오마다 달라지면 계산할 수 없음
+        raise ValueError("시나리오마다 달라지는 VLOOKUP 키/일치 방식/첫 열은 지원하지 않습니다")
+    key_num = np.broadcast_to(key.num, (count,))
+    key_kind = np.broadcast_to(key.kind, (count,))
+    key_text = np.broadcast_to(key.texts(), (count,))
+    column = np.broadcast_to(column, (count,))
+    approximate = np.broadcast_to(approximate, (count,))
+    flag_err = np.broadcast_to(flag_err, (count,))
+
+    rows = np.zeros(count, dtype=np.intp)
+    err = np.zeros(count, dtype=np.int8)
+    keys = model.graph.keys
+    for i in range(count):
+        if key_kind[i] >= 4:
+            err[i] = key_kind[i]
+            continue
+        if flag_err[i]:
+            err[i] = flag_err[i]
+            continue
+        col = int(column[i])
+        if col < 1 or col > width:
+            err[i] = ERR_REF if col > width else ERR_VALUE
+            continue
+        table = resolve_reference(args[1].node[1], *keys[group.members[i]])
+        index = model.lookup_index(table, table_ids[i][::width])
+        wanted = _lookup_key(key_num[i], key_kind[i], key_text[i])
+        row = index.match(wanted, bool(approximate[i]))
+        if row < 0:
+            err[i] = ERR_NA
+        else:
+            rows[i] = row
+    return table_ids, height, width, rows, column, err, np.broadcast_to(col_err, (count,))
+
+
+class LookupIndex:
+    """
+    VLOOKUP 표 첫 열 색인.
+    정확히 일치: 값 → 첫 행 번호 해시 (O(1)).
+    근사 일치: 종류별로 행 순서의 누적 최댓값 배열을 이진 탐색 (O(log n)).
+    '처음으로 키보다 큰 값이 나오기 직전 행' 이라서 정렬되지 않은 열에서도 앞에서부터 훑는 것과 결과가 같습니다.
+    """
+
+    __slots__ = ('ids', 'exact', 'ordered')
+
+    def __init__(self, first_column, store):
+        self.ids = np.array(first_column, dtype=np.intp)
+        self.exact = {}
+        self.ordered = {}
+        kinds = store.kind[self.ids]
+        for row in np.nonzero(kinds != EMPTY)[0].tolist():
+            node_id = self.ids[row]
+            key = _lookup_key(store.num[node_id], kinds[row], store.text[node_id])
+            self.exact.setdefault(key, row)
+            peaks, rows = self.ordered.setdefault(key[0], ([], []))
+            peaks.append(key if not peaks or key > peaks[-1] else peaks[-1])
+            rows.append(row)
+
+    def match(self, wanted, approximate):
+        """키가 있는 행 번호 (없으면 -1)"""
+        if not approximate:
+            return self.exact.get(wanted, -1)
+        run = self.ordered.get(wanted[0])
+        if run is None:
+            return -1
+        peaks, rows = run
+        position = bisect_right(peaks, wanted)
+        return rows[position - 1] if position else -1
+
+
+def vlookup_cells(model, group, args):
+    """구성원별 VLOOKUP 이 찾아온 셀의 노드 번호와 오류 (오류인 구성원은 ref_error 칸)"""
+    table_ids, height, width, rows, column, err, col_err = _vlookup_rows(model, group, args)
+    ids = np.full(len(group.members), model.store.ref_error, dtype=np.intp)
+    for i in np.nonzero(err == 0)[0]:
+        ids[i] = table_ids[i][rows[i] * width + int(column[i]) - 1]
+    return ids, np.where(col_err > 0, col_err, err).astype(np.int8)
+
+
+def _fn_vlookup(model, group, args):
+    ids, err = vlookup_cells(model, group, args)
+    return _where(err > 0, Vec(np.zeros(len(group.members)), err), model.store.gather(ids))
+
+
+_FUNCTIONS = {
+    'SUM': _fn_sum,
+    'AVERAGE': _fn_average,
+    'MIN': _fn_extreme(np.minimum),
+    'MAX': _fn_extreme(np.maximum),
+    'COUNT': _fn_count,
+    'COUNTA': _fn_counta,
+    'IF': _fn_if,
+    'IFERROR': _fn_iferror,
+    'VLOOKUP': _fn_vlookup,
+    'ROUND': _round_with(lambda x: np.floor(x + 0.5)),
+    'ROUNDUP': _round_with(np.ceil),
+    'ROUNDDOWN': _round_with(np.floor),
+    'DATEDIF': _fn_datedif,
+    'ABS': _fn_abs,
+    'AND': _fn_logical(np.logical_and),
+    'OR': _fn_logical(np.logical_or),
+    'NOT': _fn_not,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CF 워크북 수식 재계산")
+    parser.add_argument("file_path", nargs="?",
+                        default="/Users/sung/user/workspace/GRK/GRK_workspace/2025_CF_management.xlsx")
+    parser.add_argument("--cell", action="append", default=[], help="값을 출력할 셀 (예: '01.Cash Flow Management!P6')")
+    parser.add_argument("--set", action="append", default=[], metavar="CELL=VALUE",
+                        help="입력 셀 값 변경 후 영향받는 셀만 재계산 (예: '03.HR unit cost!H6=200000000')")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    model = WorkbookModel.load(args.file_path)
+    loaded = time.perf_counter()
+    count = model.recalculate()
+    finished = time.perf_counter()
+
+    print(f"=== 수식 재계산 ===")
+    print(f"수식 {count}개, 계산 단계 {len(set(model.levels.values()))}개, 배열 연산 그룹 {len(model.groups)}개")
+    parsed = parse_shape.cache_info()
+    print(f"수식 모양 {parsed.currsize}개 (모양 캐시 적중 {parsed.hits}회), "
+          f"컴파일된 노드 {compile_formula.cache_info().currsize}개")
+    print(f"모델 로드: {loaded - start:.3f}초, 전체 재계산: {(finished - loaded) * 1000:.1f}ms")
+    if model.circular:
+        print(f"⚠️ 순환 참조 셀 {len(model.circular)}개")
+    if model.unsupported:
+        print(f"⚠️ 지원하지 않는 함수/이름: {dict(model.unsupported)}")
+
+    if args.set:
+        changes = {}
+        for item in args.set:
+            cell, _, raw = item.rpartition('=')
+            try:
+                changes[cell] = float(raw)
+            except ValueError:
+                changes[cell] = raw
+        start = time.perf_counter()
+        touched = model.update(changes)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"\n입력 변경 {len(changes)}개 → 다시 계산한 셀 {touched}개 ({elapsed:.2f}ms)")
+
+    cells = args.cell or [f"01.Cash Flow Management!{column_letter(c)}6" for c in range(column_index('E'), column_index('P') + 1)]
+    print(f"\n계산 결과:")
+    for cell in cells:
+        print(f"  {cell}: {model.value(cell)}")
+
+
+if __name__ == "__main__":
+    main()
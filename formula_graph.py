@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+워크북 전체 수식 의존성 그래프
+수식을 토큰 단위로 분해해 셀/범위 참조(다른 시트 참조 포함)를 찾아내고,
+선행 셀(precedents)과 종속 셀(dependents)을 CSR 인접 배열로 저장합니다.
+한 번 빌드한 뒤에는 "무엇이 이 셀을 계산하는가", "이 셀을 바꾸면 무엇이 바뀌는가"를
+즉시 조회할 수 있습니다.
+"""
+
+import argparse
+import re
+import time
+from array import array
+from collections import namedtuple
+
+from excel_stream import (
+    column_index,
+    column_letter,
+    open_workbook_zip,
+    read_sheet_map,
+    read_shared_strings,
+    scan_sheet,
+    split_address,
+)
+
+Token = namedtuple('Token', ['kind', 'text'])
+# 행/열 범위가 없는 전체 열(A:A), 전체 행(1:1) 참조는 None 으로 표시
+Reference = namedtuple('Reference', ['sheet', 'min_row', 'min_col', 'max_row', 'max_col'])
+
+_CELL = r'\$?[A-Z]{1,3}\$?\d+'
+_SHEET = r"(?:'(?:[^']|'')+'!|[A-Za-z_][\w.]*!)"
+_TOKEN_RE = re.compile(r'''
+    (?P<space>\s+)
+  | (?P<string>"(?:[^"]|"")*")
+  | (?P<array>\{{(?:"(?:[^"]|"")*"|[^{{}}"])*\}})
+  | (?P<error>{sheet}?\#(?:NULL!|DIV/0!|VALUE!|REF!|NAME\?|NUM!|N/A|GETTING_DATA))
+  | (?P<ref>{sheet}?
+        (?:{cell}(?::{cell})?|\$?[A-Z]{{1,3}}:\$?[A-Z]{{1,3}}|\$?\d+:\$?\d+)
+        (?![\w(]))
+  | (?P<func>[A-Za-z_][\w.]*(?=\())
+  | (?P<bool>(?:TRUE|FALSE)(?![\w(]))
+  | (?P<number>(?:\d+(?:\.\d*)?|\.\d+)(?:[Ee][+-]?\d+)?)
+  | (?P<name>[A-Za-z_\\][\w.]*)
+  | (?P<op><>|<=|>=|[-+*/^&=<>%])
+  | (?P<lparen>\()
+  | (?P<rparen>\))
+  | (?P<sep>[,;])
+'''.format(cell=_CELL, sheet=_SHEET), re.VERBOSE)
+
+
+def tokenize(formula):
+    """
+    수식 문자열을 Token 리스트로 분해 (선행 '=' 는 무시).
+    배열 상수 {1,2,3} 은 'array' 토큰 하나, 시트가 지워진 참조 Sheet1!#REF! 는 '#REF!' 오류 토큰이 됩니다.
+    """
+    text = formula[1:] if formula.startswith('=') else formula
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        match = _TOKEN_RE.match(text, pos)
+        if not match:
+            raise ValueError(f"수식 토큰화 실패 ({pos}번째 문자): {formula}")
+        kind = match.lastgroup
+        if kind == 'error':
+            # 'Sheet1!#REF!' 의 시트 부분은 버림 (오류 코드 안에는 끝 말고 '!' 가 없음)
+            code = match.group(kind)
+            tokens.append(Token(kind, code[code.rfind('!', 0, -1) + 1:]))
+        elif kind != 'space':
+            tokens.append(Token(kind, match.group(kind)))
+        pos = match.end()
+    return tokens
+
+
+def split_sheet(text):
+    """"'시트 이름'!A1" 을 (시트 이름, 'A1') 로 분리 (시트가 없으면 None)"""
+    if '!' not in text:
+        return None, text
+    sheet, _, ref = text.rpartition('!')
+    if sheet.startswith("'") and sheet.endswith("'"):
+        sheet = sheet[1:-1].replace("''", "'")
+    return sheet, ref
+
+
+def parse_reference(text, default_sheet):
+    """참조 토큰 텍스트를 Reference 로 변환"""
+    sheet, ref = split_sheet(text)
+    sheet = sheet or default_sheet
+    start, _, end = ref.replace('$', '').partition(':')
+    end = end or start
+
+    if start.isdigit():
+        # 전체 행 참조 (1:3)
+        return Reference(sheet, int(start), None, int(end), None)
+    if start.isalpha():
+        # 전체 열 참조 (A:C)
+        return Reference(sheet, None, column_index(start), None, column_index(end))
+
+    row1, col1 = split_address(start)
+    row2, col2 = split_address(end)
+    return Reference(sheet, min(row1, row2), min(col1, col2), max(row1, row2), max(col1, col2))
+
+
+def formula_references(formula, default_sheet):
+    """수식이 참조하는 모든 Reference 리스트"""
+    return [parse_reference(token.text, default_sheet)
+            for token in tokenize(formula) if token.kind == 'ref']
+
+
+def formula_functions(formula):
+    """수식에서 사용하는 함수 이름 집합 (대문자)"""
+    return {token.text.upper() for token in tokenize(formula) if token.kind == 'func'}
+
+
+def parse_cell_key(text, default_sheet=None):
+    """"01.Cash Flow Management!G6" 형태를 (시트, 행, 열) 로 변환"""
+    sheet, address = split_sheet(text.strip())
+    sheet = sheet or default_sheet
+    if sheet is None:
+        raise ValueError(f"시트 이름이 없는 셀 주소: {text}")
+    row, col = split_address(address)
+    return sheet, row, col
+
+
+def format_cell_key(key):
+    sheet, row, col = key
+    return f"{sheet}!{column_letter(col)}{row}"
+
+
+class FormulaGraph:
+    """셀 의존성 그래프 (CSR 인접 배열)"""
+
+    def __init__(self):
+        self.keys = []            # 노드 번호 → (시트, 행, 열)
+        self.index = {}           # (시트, 행, 열) → 노드 번호
+        self.formulas = {}        # 노드 번호 → 수식 문자열
+        self.unparsed = {}        # 노드 번호 → 토큰화 오류 (간선 없이 수식 노드만 둠)
+        self.dimensions = {}      # 시트 → (최대 행, 최대 열)
+        self.prec_ptr = array('i', [0])
+        self.prec_idx = array('i')
+        self.dep_ptr = array('i', [0])
+        self.dep_idx = array('i')
+
+    def node(self, key):
+        """(시트, 행, 열) 에 해당하는 노드 번호 (없으면 새로 추가)"""
+        node_id = self.index.get(key)
+        if node_id is None:
+            node_id = len(self.keys)
+            self.index[key] = node_id
+            self.keys.append(key)
+        return node_id
+
+    def expand(self, ref):
+        """Reference 를 개별 셀 키로 펼치기 (전체 행/열 참조는 시트 사용 범위로 제한)"""
+        max_row, max_col = self.dimensions.get(ref.sheet, (0, 0))
+        min_row = ref.min_row or 1
+        min_col = ref.min_col or 1
+        last_row = ref.max_row if ref.max_row is not None else max_row
+        last_col = ref.max_col if ref.max_col is not None else max_col
+        for row in range(min_row, last_row + 1):
+            for col in range(min_col, last_col + 1):
+                yield (ref.sheet, row, col)
+
+    @classmethod
+    def build(cls, source):
+        """워크북을 한 번 스캔해 그래프를 빌드"""
+        graph = cls()
+        formula_cells = []
+
+        zf = open_workbook_zip(source)
+        try:
+            shared_strings = read_shared_strings(zf)
+            for sheet_name, part in read_sheet_map(zf).items():
+                for kind, item in scan_sheet(zf, part, shared_strings):
+                    if kind == 'dimension':
+                        _, _, end = item.partition(':')
+                        graph.dimensions[sheet_name] = split_address(end or item)
+                    elif kind == 'cell' and item.formula:
+                        formula_cells.append((sheet_name, item.row, item.col, item.formula))
+        finally:
+            if zf is not source:
+                zf.close()
+
+        graph._link(formula_cells)
+        return graph
+
+    @classmethod
+    def from_formulas(cls, formula_cells, dimensions=None):
+        """(시트, 행, 열, 수식) 목록으로 그래프 빌드"""
+        graph = cls()
+        graph.dimensions.update(dimensions or {})
+        graph._link(formula_cells)
+        return graph
+
+    def _link(self, formula_cells):
+        """수식 셀 목록에서 간선을 만들어 CSR 배열로 정리"""
+        edges = []
+        for sheet_name, row, col, formula in formula_cells:
+            target = self.node((sheet_name, row, col))
+            self.formulas[target] = formula
+            try:
+                references = formula_references(formula, sheet_name)
+            except ValueError as e:
+                # 표 참조(Table1[Col]), 분산 범위(A1#) 처럼 토큰화할 수 없는 수식 하나 때문에 빌드를 멈추지 않음
+                self.unparsed[target] = str(e)
+                continue
+            sources = set()
+            for ref in references:
+                for key in self.expand(ref):
+                    sources.add(self.node(key))
+            edges.extend((source, target) for source in sorted(sources))
+
+        size = len(self.keys)
+        self.prec_ptr, self.prec_idx = _to_csr(size, ((t, s) for s, t in edges))
+        self.dep_ptr, self.dep_idx = _to_csr(size, edges)
+
+    def __len__(self):
+        return len(self.keys)
+
+    @property
+    def edge_count(self):
+        return len(self.dep_idx)
+
+    def _walk(self, start, ptr, idx, transitive):
+        visited = bytearray(len(self.keys))
+        result = []
+        stack = [start]
+        while stack:
+            node_id = stack.pop()
+            for i in range(ptr[node_id], ptr[node_id + 1]):
+                neighbor = idx[i]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    result.append(neighbor)
+                    if transitive:
+                        stack.append(neighbor)
+        return result
+
+    def precedent_ids(self, node_id, transitive=False):
+        return self._walk(node_id, self.prec_ptr, self.prec_idx, transitive)
+
+    def dependent_ids(self, node_id, transitive=True):
+        return self._walk(node_id, self.dep_ptr, self.dep_idx, transitive)
+
+    def _lookup(self, cell):
+        key = parse_cell_key(cell) if isinstance(cell, str) else cell
+        return self.index.get(key)
+
+    def precedents(self, cell, transitive=False):
+        """셀을 계산하는 데 쓰이는 셀 목록 ("무엇이 이 셀을 계산하는가")"""
+        node_id = self._lookup(cell)
+        if node_id is None:
+            return []
+        return [format_cell_key(self.keys[i]) for i in self.precedent_ids(node_id, transitive)]
+
+    def dependents(self, cell, transitive=True):
+        """셀이 바뀌면 다시 계산되는 셀 목록 ("이 셀을 바꾸면 무엇이 바뀌는가")"""
+        node_id = self._lookup(cell)
+        if node_id is None:
+            return []
+        return [format_cell_key(self.keys[i]) for i in self.dependent_ids(node_id, transitive)]
+
+
+def _to_csr(size, pairs):
+    """(출발, 도착) 쌍을 출발 노드 기준 CSR (ptr, idx) 배열로 변환"""
+    counts = [0] * (size + 1)
+    pairs = list(pairs)
+    for source, _ in pairs:
+        counts[source + 1] += 1
+    for i in range(size):
+        counts[i + 1] += counts[i]
+    ptr = array('i', counts)
+    idx = array('i', bytes(4 * len(pairs)))
+    fill = list(counts[:-1])
+    for source, target in pairs:
+        idx[fill[source]] = target
+        fill[source] += 1
+    return ptr, idx
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수식 의존성 그래프 조회")
+    parser.add_argument("file_path", nargs="?",
+                        default="/Users/sung/user/workspace/GRK/GRK_workspace/2025_CF_management.xlsx")
+    parser.add_argument("--precedents", action="append", default=[],
+                        help="선행 셀을 조회할 셀 (예: '01.Cash Flow Management!G6')")
+    parser.add_argument("--dependents", action="append", default=[],
+                        help="종속 셀을 조회할 셀 (예: '03.HR unit cost!H5')")
+    parser.add_argument("--direct", action="store_true", help="직접 연결된 셀만 조회")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    graph = FormulaGraph.build(args.file_path)
+    elapsed = time.perf_counter() - start
+    print(f"=== 수식 의존성 그래프 ===")
+    print(f"노드 {len(graph)}개, 간선 {graph.edge_count}개, 수식 {len(graph.formulas)}개 ({elapsed:.2f}초)")
+    if graph.unparsed:
+        print(f"⚠️ 토큰화하지 못한 수식 {len(graph.unparsed)}개 (참조 없이 둠)")
+
+    for cell in args.precedents:
+        start = time.perf_counter()
+        cells = graph.precedents(cell, transitive=not args.direct)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"\n{cell} 을(를) 계산하는 셀 {len(cells)}개 ({elapsed:.3f}ms):")
+        for c in cells:
+            print(f"  - {c}")
+
+    for cell in args.dependents:
+        start = time.perf_counter()
+        cells = graph.dependents(cell, transitive=not args.direct)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"\n{cell} 을(를) 바꾸면 다시 계산되는 셀 {len(cells)}개 ({elapsed:.3f}ms):")
+        for c in cells:
+            print(f"  - {c}")
+
+
+if __name__ == "__main__":
+    main()
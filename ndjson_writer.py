@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+NDJSON(줄 단위 JSON) 스트리밍 출력
+레코드를 받는 즉시 한 줄씩 기록하므로 전체 결과를 메모리에 모으지 않고,
+출력 중에도 grep/jq 로 읽을 수 있습니다.
+경로가 .gz 로 끝나면 gzip, .zst 로 끝나면 zstd(zstandard 패키지 필요)로 압축합니다.
+"""
+
+import gzip
+import io
+import json
+import sys
+
+try:
+    import zstandard
+except ImportError:  # zstd 출력은 선택 기능
+    zstandard = None
+
+COMPRESSIONS = ('none', 'gzip', 'zstd')
+
+
+def detect_compression(path):
+    """파일 확장자로 압축 방식 추정"""
+    if path.endswith('.gz'):
+        return 'gzip'
+    if path.endswith('.zst'):
+        return 'zstd'
+    return 'none'
+
+
+def open_text_output(path, compression=None):
+    """압축 방식에 맞는 텍스트 출력 스트림 열기 ('-' 는 표준 출력)"""
+    compression = compression or detect_compression(path)
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"지원하지 않는 압축 방식: {compression}")
+    if path == '-':
+        if compression != 'none':
+            raise ValueError("표준 출력에는 압축을 쓸 수 없습니다")
+        return sys.stdout
+    if compression == 'gzip':
+        # 기본값(9)보다 빠른 수준으로 압축 (셀 덤프는 반복이 많아 압축률 차이가 작음)
+        return gzip.open(path, 'wt', encoding='utf-8', compresslevel=6)
+    if compression == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("zstd 출력에는 zstandard 패키지가 필요합니다 (pip install zstandard)")
+        raw = open(path, 'wb')
+        stream = zstandard.ZstdCompressor(level=3).stream_writer(raw, closefd=True)
+        return io.TextIOWrapper(stream, encoding='utf-8')
+    return open(path, 'w', encoding='utf-8')
+
+
+class NdjsonWriter:
+    """레코드(dict)를 한 줄에 하나씩 기록하는 NDJSON 출력기"""
+
+    def __init__(self, path, compression=None, per_cell=False):
+        self.path = path
+        self.compression = compression or detect_compression(path)
+        self.per_cell = per_cell      # True 면 행 대신 셀마다 한 줄
+        self.stream = open_text_output(path, self.compression)
+        self.records = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, record):
+        self.stream.write(json.dumps(record, ensure_ascii=False, default=str, separators=(',', ':')))
+        self.stream.write('\n')
+        self.records += 1
+
+    def write_row(self, sheet_name, row, cells):
+        """시트의 한 행을 행 레코드 하나 또는 셀 레코드 여러 개로 기록"""
+        if self.per_cell:
+            for cell in cells:
+                self.write({"type": "cell", "sheet": sheet_name, **cell})
+        else:
+            self.write({"type": "row", "sheet": sheet_name, "row": row, "cells": cells})
+
+    def write_lines(self, source):
+        """다른 NDJSON 텍스트 파일의 줄을 그대로 이어 붙이기 (병렬 작업자 출력 병합용)"""
+        for line in source:
+            self.stream.write(line)
+            self.records += 1
+
+    def close(self):
+        if self.stream is not sys.stdout:
+            self.stream.close()
+        else:
+            self.stream.flush()
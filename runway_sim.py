@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo 현금 런웨이 시뮬레이션
+'01.Cash Flow Management' 의 월별 기말현금 사슬(=G7+G35-G8, 기초현금은 전월 기말현금)을 그대로 쓰고,
+경로마다 다음 두 가지를 무작위로 뽑아 scenario_eval.ScenarioEvaluator 로 한 번에 계산합니다.
+- 매출 시점: 프로젝트 시트('01.SCL LIS시스템 ISP' 등)에 해당하는 CF 매출 행의 입금이
+  기하분포 개월 수만큼 늦어짐 (12월을 넘기면 올해 현금에서 빠짐)
+- 지출 잡음: 지출합계(8행)를 이루는 지출 항목에 평균 1인 로그정규 배율
+경로는 청크로 나눠 프로세스 풀에서 계산하고, 청크마다 SeedSequence 로 시드를 나눠 주므로
+같은 시드면 프로세스 수와 상관없이 결과가 같습니다.
+"""
+
+import argparse
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from excel_stream import column_letter
+from formula_eval import WorkbookModel
+from formula_graph import format_cell_key
+from scenario_eval import CF_SHEET, ENDING_CASH_ROW, ScenarioEvaluator
+
+PROJECT_SHEETS = ('01.SCL LIS시스템 ISP', '02.SCL HIS시스템 PMO', '03.휴니버스PMI')
+EXPENSE_ROW = 8
+REVENUE_LABEL_COL = 3       # CF 시트 C열: 매출 항목 이름
+FIRST_MONTH_COL, LAST_MONTH_COL = 5, 16     # E~P: 1~12월
+PERCENTILES = (5, 25, 50, 75, 95)
+DEFAULT_CHUNK = 10_000
+_SHEET_PREFIX_RE = re.compile(r'^\d+\.')
+
+
+def _normalize(label):
+    """'02.SCL HIS시스템 PMO' / 'SCL HIS시스템  PMO컨설팅' 비교용: 번호 접두어와 공백 제거"""
+    return re.sub(r'\s+', '', _SHEET_PREFIX_RE.sub('', str(label))).lower()
+
+
+class RunwaySimulator:
+    """워크북 모델에서 시뮬레이션 입력(매출/지출 셀)과 출력(기말현금)을 정해 두고 경로 청크를 계산"""
+
+    def __init__(self, model, project_sheets=PROJECT_SHEETS, on_time=0.6, expense_noise=0.1):
+        self.model = model
+        self.on_time = on_time
+        self.expense_noise = expense_noise
+        graph = model.graph
+        # 기말현금이 수식인 달만 시뮬레이션 (실적이 입력된 달은 고정)
+        self.months = [col for col in range(FIRST_MONTH_COL, LAST_MONTH_COL + 1)
+                       if graph.index.get((CF_SHEET, ENDING_CASH_ROW, col)) in graph.formulas]
+        if not self.months:
+            raise ValueError(f"{CF_SHEET} {ENDING_CASH_ROW}행에 수식으로 계산되는 달이 없습니다")
+
+        self.project_rows = self._project_rows(project_sheets)
+        inputs = [(CF_SHEET, row, col) for row in self.project_rows.values() for col in self.months]
+        self.revenue = np.array([_value(model, key) for key in inputs]).reshape(len(self.project_rows), -1)
+        expense_cells = self._expense_cells()
+        self.expense_slice = slice(len(inputs), len(inputs) + len(expense_cells))
+        inputs += expense_cells
+        self.evaluator = ScenarioEvaluator(
+            model, [format_cell_key(key) for key in inputs],
+            [f"{CF_SHEET}!{column_letter(col)}{ENDING_CASH_ROW}" for col in self.months])
+        self.base = self.evaluator.base_inputs()
+
+    def _project_rows(self, project_sheets):
+        """프로젝트 시트 → CF 매출 행 (C열 항목 이름이 시트 이름으로 시작하는 행)"""
+        labels = {row: _normalize(value) for (sheet, row, col), (value, _) in self.model.cells.items()
+                  if sheet == CF_SHEET and col == REVENUE_LABEL_COL and isinstance(value, str)}
+        rows = {}
+        for sheet in project_sheets:
+            wanted = _normalize(sheet)
+            row = next((row for row, label in sorted(labels.items()) if label.startswith(wanted)), None)
+            if row is None:
+                raise ValueError(f"{CF_SHEET} 에서 프로젝트 매출 행을 찾을 수 없습니다: {sheet}")
+            rows[sheet] = row
+        return rows
+
+    def _expense_cells(self):
+        """달마다 지출합계 셀이 수식이면 그 직접 선행 셀들, 값이면 지출합계 셀 자체"""
+        graph = self.model.graph
+        cells = []
+        for col in self.months:
+            node_id = graph.index.get((CF_SHEET, EXPENSE_ROW, col))
+            if node_id in graph.formulas:
+                cells.extend(sorted(graph.keys[i] for i in graph.precedent_ids(node_id)))
+            elif node_id is not None:
+                cells.append((CF_SHEET, EXPENSE_ROW, col))
+        return cells
+
+    def sample(self, rng, paths):
+        """경로별 입력 배열 (경로 수, 입력 수)"""
+        values = np.repeat(self.base[None, :], paths, axis=0)
+        months = len(self.months)
+        target = np.arange(months)
+        offset = 0
+        for amounts in self.revenue:
+            shifted = np.zeros((paths, months))
+            delays = rng.geometric(self.on_time, size=(paths, months)) - 1
+            landing = target[None, :] + delays
+            for month in np.nonzero(amounts)[0]:
+                # 12월을 넘긴 입금은 올해 현금에서 빠짐
+                kept = landing[:, month] < months
+                np.add.at(shifted, (np.nonzero(kept)[0], landing[kept, month]), amounts[month])
+            values[:, offset:offset + months] = shifted
+            offset += months
+        if self.expense_noise > 0:
+            sigma = self.expense_noise
+            width = self.expense_slice.stop - self.expense_slice.start
+            values[:, self.expense_slice] *= rng.lognormal(-sigma * sigma / 2, sigma, size=(paths, width))
+        return values
+
+    def run_chunk(self, seed, paths):
+        """시드 하나로 paths 개 경로의 달별 기말현금 (경로 수, 달 수)"""
+        return self.evaluator.run(self.sample(np.random.default_rng(seed), paths), chunk_size=paths)
+
+
+def _value(model, key):
+    value = model.value(key)
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else 0.0
+
+
+def runway_months(cash, threshold=0.0):
+    """경로별 런웨이: 기말현금이 처음 threshold 아래로 내려가기 전까지의 달 수 (끝까지 버티면 전체 달 수)"""
+    below = cash < threshold
+    return np.where(below.any(axis=1), below.argmax(axis=1), cash.shape[1])
+
+
+def recovery_month(cash, threshold=0.0):
+    """경로별 회복 시점: 그 달부터 끝까지 기말현금이 threshold 이상인 첫 달 순번 (끝까지 회복 못 하면 전체 달 수)"""
+    below = cash < threshold
+    last_below = np.where(below.any(axis=1), cash.shape[1] - 1 - below[:, ::-1].argmax(axis=1), -1)
+    return last_below + 1
+
+
+# 작업자 프로세스마다 한 번 만드는 시뮬레이터
+_worker_state = {}
+
+
+def _init_worker(file_path, options):
+    model = WorkbookModel.load(file_path)
+    model.recalculate()
+    _worker_state['simulator'] = RunwaySimulator(model, **options)
+
+
+def _run_job(job):
+    seed, paths = job
+    return _worker_state['simulator'].run_chunk(seed, paths)
+
+
+def simulate(file_path, paths, seed=0, workers=1, chunk_size=DEFAULT_CHUNK, simulator=None, **options):
+    """
+    paths 개 경로의 달별 기말현금 (경로 수, 달 수) 과 시뮬레이터를 반환.
+    청크 i 는 SeedSequence(seed).spawn 의 i 번째 시드를 쓰므로 workers 와 무관하게 재현됩니다.
+    """
+    sizes = [min(chunk_size, paths - start) for start in range(0, paths, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = list(zip(seeds, sizes))
+    if simulator is None:
+        model = WorkbookModel.load(file_path)
+        model.recalculate()
+        simulator = RunwaySimulator(model, **options)
+    workers = min(workers, len(jobs))
+    if workers <= 1:
+        chunks = [simulator.run_chunk(seed, size) for seed, size in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(file_path, options)) as pool:
+            chunks = list(pool.map(_run_job, jobs))
+    return np.concatenate(chunks), simulator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo 현금 런웨이 시뮬레이션")
+    parser.add_argument("file_path", nargs="?",
+                        default="/Users/sung/user/workspace/GRK/GRK_workspace/2025_CF_management.xlsx")
+    parser.add_argument("--paths", type=int, default=100_000, help="경로 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="프로세스 수 (기본: 코어 수)")
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="청크당 경로 수")
+    parser.add_argument("--on-time", type=float, default=0.6, help="입금이 예정된 달에 들어올 확률 (지연은 기하분포)")
+    parser.add_argument("--expense-noise", type=float, default=0.1, help="지출 항목 로그정규 잡음 표준편차")
+    parser.add_argument("--threshold", type=float, default=0.0, help="런웨이 기준 현금 (이 값 아래로 내려가면 소진)")
+    args = parser.parse_args()
+
+    options = {'on_time': args.on_time, 'expense_noise': args.expense_noise}
+    start = time.perf_counter()
+    model = WorkbookModel.load(args.file_path)
+    model.recalculate()
+    simulator = RunwaySimulator(model, **options)
+    loaded = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cash, _ = simulate(args.file_path, args.paths, args.seed, args.workers, args.chunk, simulator, **options)
+    elapsed = time.perf_counter() - start
+
+    months = [column_letter(col) for col in simulator.months]
+    runway = runway_months(cash, args.threshold)
+    print(f"=== Monte Carlo 현금 런웨이 ({args.paths:,}경로 x {len(months)}개월, 시드 {args.seed}) ===")
+    print(f"프로젝트 매출 행: " + ", ".join(f"{sheet} → {row}행" for sheet, row in simulator.project_rows.items()))
+    print(f"입력 {len(simulator.evaluator.inputs)}셀, 다시 계산할 수식 {len(simulator.evaluator.dirty)}개")
+    print(f"모델 로드: {loaded:.2f}초, 시뮬레이션: {elapsed:.2f}초 (프로세스 {min(args.workers, -(-args.paths // args.chunk))}개, "
+          f"{args.paths / elapsed:,.0f}경로/초)")
+
+    print(f"\n런웨이 (기말현금 < {args.threshold:,.0f} 이 되기 전 개월 수, {months[0]}열부터):")
+    print("  " + ", ".join(f"p{p} {v:.0f}" for p, v in zip(PERCENTILES, np.percentile(runway, PERCENTILES))))
+    print(f"  끝까지 버틴 경로: {np.mean(runway == len(months)) * 100:.1f}%")
+    recovery = recovery_month(cash, args.threshold)
+    print(f"회복 시점 (그 달부터 연말까지 기준 이상인 첫 달):")
+    print("  " + ", ".join(f"p{p} {months[int(v)] if v < len(months) else '회복 못 함'}"
+                           for p, v in zip(PERCENTILES, np.percentile(recovery, PERCENTILES, method='lower'))))
+    print(f"최저 기말현금: " + ", ".join(f"p{p} {v:,.0f}"
+                                     for p, v in zip(PERCENTILES, np.percentile(cash.min(axis=1), PERCENTILES))))
+
+    print(f"\n월별 기말현금 분포:")
+    print(f"  {'월':<4}" + "".join(f"{'p' + str(p):>12}" for p in PERCENTILES) + f"{'소진 확률':>12}")
+    table = np.percentile(cash, PERCENTILES, axis=0)
+    for i, letter in enumerate(months):
+        print(f"  {letter + '6':<4}" + "".join(f"{v:>12,.0f}" for v in table[:, i])
+              + f"{np.mean(cash[:, i] < args.threshold) * 100:>11.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+What-if 시나리오 일괄 계산
+입력 셀(예: '03.HR unit cost' 연봉 열, '02.Monthly Expense' 환율 반영 금액 E21:E26)에
+시나리오 수만큼의 입력 벡터를 주면, 입력에 영향을 받는 수식 셀(dirty 부분 그래프)만
+맨 앞에 시나리오 축을 붙인 배열로 한 번에 계산합니다.
+수식 그룹 하나를 평가할 때 모든 시나리오가 같은 NumPy 연산을 타므로 시나리오를 하나씩 바꿔 가며
+재계산하는 것보다 훨씬 빠르고, 결과로 기말현금('01.Cash Flow Management' 6행) 같은 출력 셀을 돌려줍니다.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from excel_stream import column_index, column_letter
+from formula_eval import EMPTY, NUMBER, STRING, Vec, WorkbookModel
+from formula_graph import format_cell_key, parse_cell_key, parse_reference, split_sheet
+
+CF_SHEET = '01.Cash Flow Management'
+ENDING_CASH_ROW = 6
+DEFAULT_OUTPUTS = [f"{CF_SHEET}!{column_letter(col)}{ENDING_CASH_ROW}"
+                   for col in range(column_index('E'), column_index('P') + 1)]
+DEFAULT_CHUNK = 4096
+
+
+def expand_cells(text):
+    """"'03.HR unit cost'!H6:H27" 같은 범위를 셀 주소 목록으로 (행 우선)"""
+    sheet, _ = split_sheet(text)
+    if sheet is None:
+        raise ValueError(f"시트 이름이 없는 범위: {text}")
+    ref = parse_reference(text, sheet)
+    if ref.min_row is None or ref.min_col is None:
+        raise ValueError(f"전체 행/열 범위는 입력으로 쓸 수 없습니다: {text}")
+    return [format_cell_key((ref.sheet, row, col))
+            for row in range(ref.min_row, ref.max_row + 1) for col in range(ref.min_col, ref.max_col + 1)]
+
+
+def _number(value):
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else np.nan
+
+
+class ScenarioStore:
+    """
+    기본 ValueStore 위에 시나리오별 값을 얹은 저장소 (formula_eval 의 저장소 자리에 끼워 씀).
+    slot 이 0 이상인 노드(입력 + dirty 수식 셀)만 (시나리오 수, 칸 수) 배열에 값을 따로 두고,
+    나머지 노드는 기본 값을 그대로 읽어 시나리오 축으로 브로드캐스트합니다.
+    """
+
+    def __init__(self, base, slot, width, scenarios):
+        self.base = base
+        # VLOOKUP 색인처럼 배열을 직접 읽는 쪽은 기본 값을 봄 (varies 로 미리 걸러 냄)
+        self.num, self.kind, self.text = base.num, base.kind, base.text
+        self.ref_error = base.ref_error
+        self.slot = slot
+        self.batch_shape = (scenarios,)
+        self.batch_num = np.zeros((scenarios, width), dtype=np.float64)
+        self.batch_kind = np.full((scenarios, width), NUMBER, dtype=np.int8)
+        self.batch_text = None      # 문자열 결과가 처음 나올 때 만듦
+
+    def varies(self, ids):
+        return bool((self.slot[ids] >= 0).any())
+
+    def gather(self, ids):
+        ids = np.asarray(ids, dtype=np.intp)
+        slots = self.slot[ids]
+        varying = slots >= 0
+        if not varying.any():
+            return self.base.gather(ids)
+        picked = slots[varying]
+        shape = self.batch_shape + ids.shape
+        num = np.empty(shape, dtype=np.float64)
+        num[...] = self.num[ids]
+        num[:, varying] = self.batch_num[:, picked]
+        kind = np.empty(shape, dtype=np.int8)
+        kind[...] = self.kind[ids]
+        kind[:, varying] = self.batch_kind[:, picked]
+        text = None
+        if self.batch_text is not None or (self.kind[ids] == STRING).any():
+            text = np.empty(shape, dtype=object)
+            text[...] = self.text[ids]
+            text[:, varying] = self.batch_text[:, picked] if self.batch_text is not None else None
+        return Vec(num, kind, text)
+
+    def assign(self, ids, v):
+        slots = self.slot[ids]
+        shape = self.batch_shape + (len(ids),)
+        kind = np.broadcast_to(v.kind, shape)
+        self.batch_num[:, slots] = np.where(kind == EMPTY, 0.0, np.broadcast_to(v.num, shape))
+        self.batch_kind[:, slots] = np.where(kind == EMPTY, NUMBER, kind)
+        if v.text is not None and self.batch_text is None and (kind == STRING).any():
+            self.batch_text = np.full(self.batch_num.shape, None, dtype=object)
+        if self.batch_text is not None:
+            self.batch_text[:, slots] = np.broadcast_to(v.text, shape) if v.text is not None else None
+
+    def numbers(self, ids):
+        """ids 셀의 (시나리오 수, 셀 수) 숫자 배열 (숫자가 아닌 값은 NaN)"""
+        v = self.gather(ids)
+        num = np.where((v.kind == NUMBER) | (v.kind == EMPTY), v.num, np.nan)
+        return np.broadcast_to(num, self.batch_shape + (len(ids),))
+
+
+class ScenarioEvaluator:
+    """
+    입력 셀 목록 → 출력 셀 목록 시나리오 계산기.
+    입력으로 수식 셀을 주면 그 셀은 계산하지 않고 시나리오 값으로 고정합니다 (예: 환율 반영 금액 E21:E26).
+    """
+
+    def __init__(self, model, inputs, outputs=DEFAULT_OUTPUTS):
+        self.model = model
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.input_ids = [model.node_id(cell) for cell in self.inputs]
+        fixed = set(self.input_ids)
+        if len(fixed) != len(self.input_ids):
+            raise ValueError("같은 입력 셀이 두 번 들어 있습니다")
+        self.dirty = sorted(model.dirty_cells(self.input_ids) - fixed)
+        varying = self.input_ids + self.dirty
+        self.slot = np.full(len(model.store.num), -1, dtype=np.intp)
+        self.slot[varying] = np.arange(len(varying))
+        self.width = len(varying)
+        # 수식과 연결되지 않은 출력 셀(예: 실적이 입력된 달의 기말현금)은 시나리오와 무관한 상수
+        keys = [parse_cell_key(cell) for cell in self.outputs]
+        self.output_ids = [model.graph.index.get(key) for key in keys]
+        self.constants = np.array([np.nan if node_id is not None else _number(model.value(key))
+                                   for key, node_id in zip(keys, self.output_ids)])
+        self.linked = [i for i, node_id in enumerate(self.output_ids) if node_id is not None]
+
+    def base_inputs(self):
+        """입력 셀의 현재 값 (숫자가 아니면 NaN)"""
+        store = self.model.store
+        return np.array([store.num[i] if store.kind[i] in (NUMBER, EMPTY) else np.nan for i in self.input_ids])
+
+    def run(self, values, chunk_size=DEFAULT_CHUNK):
+        """
+        values: (시나리오 수, 입력 수) 배열 → (시나리오 수, 출력 수) 출력 값 배열.
+        chunk_size 개씩 나눠 계산해 메모리를 (chunk_size x dirty 셀 수) 로 제한합니다.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim != 2 or values.shape[1] != len(self.input_ids):
+            raise ValueError(f"입력 배열 모양은 (시나리오 수, {len(self.input_ids)}) 이어야 합니다: {values.shape}")
+        result = np.repeat(self.constants[None, :], len(values), axis=0)
+        for start in range(0, len(values), chunk_size):
+            chunk = values[start:start + chunk_size]
+            result[start:start + len(chunk), self.linked] = self._run_chunk(chunk)
+        return result
+
+    def _run_chunk(self, values):
+        store = ScenarioStore(self.model.store, self.slot, self.width, len(values))
+        store.batch_num[:, :len(self.input_ids)] = values
+        base = self.model.store
+        self.model.store = store
+        try:
+            self.model.recalculate_cells(self.dirty)
+        finally:
+            self.model.store = base
+        return store.numbers([self.output_ids[i] for i in self.linked])
+
+
+def scale_scenarios(base, groups, factors):
+    """
+    입력 묶음(groups: 입력 위치 목록들)마다 배율을 곱한 시나리오 입력 배열.
+    factors: (시나리오 수, 묶음 수) 배율 배열
+    """
+    factors = np.asarray(factors, dtype=np.float64)
+    values = np.repeat(base[None, :], len(factors), axis=0)
+    for g, positions in enumerate(groups):
+        values[:, positions] *= factors[:, g:g + 1]
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description="What-if 시나리오 일괄 계산 (기말현금)")
+    parser.add_argument("file_path", nargs="?",
+                        default="/Users/sung/user/workspace/GRK/GRK_workspace/2025_CF_management.xlsx")
+    parser.add_argument("--scale", action="append", default=[], metavar="RANGE",
+                        help="배율을 곱할 입력 범위 (예: \"'03.HR unit cost'!H6:H27\", 여러 번 가능)")
+    parser.add_argument("--factors", type=float, nargs="+", help="시나리오별 배율 (모든 --scale 범위에 같은 배율)")
+    parser.add_argument("--random", type=int, metavar="N", help="범위마다 배율을 무작위로 뽑은 시나리오 N개")
+    parser.add_argument("--spread", type=float, default=0.1, help="--random 배율 범위 (1±spread)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", action="append", default=[], help="출력 셀 (기본: CF 6행 E~P)")
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="한 번에 계산할 시나리오 수")
+    args = parser.parse_args()
+
+    scales = args.scale or ["'03.HR unit cost'!H6:H27"]
+    start = time.perf_counter()
+    model = WorkbookModel.load(args.file_path)
+    model.recalculate()
+    inputs, groups = [], []
+    for text in scales:
+        cells = [cell for cell in expand_cells(text) if model.graph.index.get(parse_cell_key(cell)) is not None]
+        if not cells:
+            parser.error(f"수식과 연결된 셀이 없는 범위입니다: {text}")
+        groups.append(list(range(len(inputs), len(inputs) + len(cells))))
+        inputs.extend(cells)
+    evaluator = ScenarioEvaluator(model, inputs, args.output or DEFAULT_OUTPUTS)
+    loaded = time.perf_counter() - start
+
+    if args.random:
+        rng = np.random.default_rng(args.seed)
+        factors = rng.uniform(1 - args.spread, 1 + args.spread, size=(args.random, len(groups)))
+    else:
+        factors = np.repeat(np.array(args.factors or [1.0, 1.03, 1.05, 1.08])[:, None], len(groups), axis=1)
+    values = scale_scenarios(evaluator.base_inputs(), groups, factors)
+
+    start = time.perf_counter()
+    result = evaluator.run(values, args.chunk)
+    elapsed = time.perf_counter() - start
+
+    print(f"=== What-if 시나리오 ===")
+    print(f"입력 {len(inputs)}셀 ({', '.join(scales)}), 다시 계산할 수식 {len(evaluator.dirty)}개, "
+          f"출력 {len(evaluator.outputs)}셀")
+    print(f"모델 로드: {loaded:.2f}초, 시나리오 {len(values):,}개 계산: {elapsed:.3f}초 "
+          f"({elapsed / len(values) * 1e6:.1f}µs/시나리오)")
+    last = evaluator.outputs[-1]
+    if args.random:
+        percentiles = np.nanpercentile(result[:, -1], [5, 25, 50, 75, 95])
+        print(f"\n{last} 분포: " + ", ".join(f"p{p} {v:,.1f}" for p, v in zip((5, 25, 50, 75, 95), percentiles)))
+    else:
+        print()
+        for factor, row in zip(factors[:, 0], result):
+            print(f"  x{factor:<6g} {last}: {row[-1]:,.1f}  (최저 {np.nanmin(row):,.1f})")
+
+
+if __name__ == "__main__":
+    main()
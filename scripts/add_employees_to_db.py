@@ -1,8 +1,10 @@
 import pandas as pd
-import requests
-import json
-from datetime import datetime, date
-import re
+import argparse
+import zlib
+
+from employee_importer import DEFAULT_BATCH_SIZE, add_import_arguments, import_employees, import_options, print_summary
+from employee_sync import add_sync_arguments, sync_employees
+from hr_roster import date_column, monthly_salary_column, name_mask, text_column
 
 def extract_real_employees(file_path):
     """실제 직원만 추출 (직급 템플릿 제외)"""
@@ -11,82 +13,67 @@ def extract_real_employees(file_path):
         
         print("🚀 실제 직원 데이터만 추출 중...")
         
-        # 헤더 찾기
-        header_row = 2  # 이미 확인한 헤더 위치
-        
-        # 컬럼 매핑
-        headers = {
-            'name': 1,
-            'position': 2, 
-            'joinDate': 4,
-            'monthlySalary': 7
-        }
-        
-        # 실제 직원만 추출 (직급 템플릿 제외)
-        real_employees = []
-        exclude_names = ['합계', '소계', 'Manager', 'Associate', 'SBA', 'BA', 'RA']
-        
-        for idx in range(header_row + 1, len(df)):
-            row = df.iloc[idx]
-            name_value = row.iloc[headers['name']]
-            
-            if (pd.notna(name_value) and 
-                str(name_value).strip() and 
-                str(name_value).strip() not in exclude_names):
-                
-                employee = {}
-                
-                # 이름
-                employee['name'] = str(name_value).strip()
-                
-                # 직급
-                position_value = row.iloc[headers['position']]
-                if pd.notna(position_value):
-                    employee['position'] = str(position_value).strip()
-                else:
-                    employee['position'] = '직원'
-                
-                # 입사일
-                joindate_value = row.iloc[headers['joinDate']]
-                if pd.notna(joindate_value):
-                    if isinstance(joindate_value, (datetime, date)):
-                        employee['joinDate'] = joindate_value.strftime('%Y-%m-%d')
-                    else:
-                        employee['joinDate'] = str(joindate_value)[:10]
-                else:
-                    employee['joinDate'] = '2025-01-01'
-                
-                # 연봉 → 월급 변환
-                salary_value = row.iloc[headers['monthlySalary']]
-                if pd.notna(salary_value):
-                    try:
-                        if isinstance(salary_value, (int, float)):
-                            employee['monthlySalary'] = int(salary_value / 12)
-                        else:
-                            cleaned = re.sub(r'[^\d]', '', str(salary_value))
-                            if cleaned:
-                                annual_salary = int(cleaned)
-                                employee['monthlySalary'] = int(annual_salary / 12)
-                    except:
-                        employee['monthlySalary'] = 3000000  # 기본값
-                else:
-                    employee['monthlySalary'] = 3000000
-                
-                # 기본값 설정
-                employee['department'] = map_department(employee['position'])
-                employee['rank'] = map_rank(employee['position'])
-                employee['tel'] = generate_phone_number(employee['name'])
-                employee['email'] = generate_email(employee['name'])
-                
-                real_employees.append(employee)
-                print(f"✅ 추가 대상: {employee['name']} ({employee['position']})")
-        
-        return real_employees
+        return real_employees_from_frame(df)
         
     except Exception as e:
         print(f"❌ 직원 데이터 추출 오류: {e}")
         return []
 
+def real_employees_from_frame(df, verbose=True):
+    """HR unit cost 시트 DataFrame 에서 실제 직원 목록 만들기 (열 단위 처리)"""
+    # 헤더 찾기
+    header_row = 2  # 이미 확인한 헤더 위치
+    
+    # 컬럼 매핑
+    headers = {
+        'name': 1,
+        'position': 2, 
+        'joinDate': 4,
+        'monthlySalary': 7
+    }
+    
+    # 실제 직원만 추출 (직급 템플릿 제외)
+    exclude_names = ['합계', '소계', 'Manager', 'Associate', 'SBA', 'BA', 'RA']
+    body = df.iloc[header_row + 1:]
+    
+    names = text_column(body.iloc[:, headers['name']])
+    keep = name_mask(names, exclude_names)
+    body, names = body[keep], names[keep]
+    
+    # 직급 (없으면 '직원')
+    positions = text_column(body.iloc[:, headers['position']]).fillna('직원')
+    
+    # 입사일 (없으면 2025-01-01)
+    join_dates = date_column(body.iloc[:, headers['joinDate']], text='truncate').fillna('2025-01-01')
+    
+    # 연봉 → 월급 변환 (값이 없거나 변환 실패면 기본값, 숫자가 없는 문자열이면 생략)
+    salary_values = body.iloc[:, headers['monthlySalary']]
+    salaries, failed = monthly_salary_column(salary_values)
+    salaries[salary_values.isna().to_numpy() | failed] = 3000000
+    
+    # 기본값 설정 (같은 값은 한 번만 계산)
+    departments = positions.map({p: map_department(p) for p in positions.unique()})
+    ranks = positions.map({p: map_rank(p) for p in positions.unique()})
+    tels = names.map({n: generate_phone_number(n) for n in names.unique()})
+    emails = names.map({n: generate_email(n) for n in names.unique()})
+    
+    real_employees = []
+    for name, position, join_date, salary, department, rank, tel, email in zip(
+            names, positions, join_dates, salaries, departments, ranks, tels, emails):
+        employee = {'name': name, 'position': position, 'joinDate': join_date}
+        if not pd.isna(salary):
+            employee['monthlySalary'] = salary
+        employee['department'] = department
+        employee['rank'] = rank
+        employee['tel'] = tel
+        employee['email'] = email
+        real_employees.append(employee)
+    
+    if verbose and real_employees:
+        print('\n'.join(f"✅ 추가 대상: {emp['name']} ({emp['position']})" for emp in real_employees))
+    
+    return real_employees
+
 def map_department(position):
     """직급에 따른 부서 매핑"""
     if position in ['EP']:
@@ -119,8 +106,8 @@ def map_rank(position):
 
 def generate_phone_number(name):
     """이름을 기반으로 가상의 전화번호 생성"""
-    # 간단한 해시를 이용해서 고유한 번호 생성
-    hash_val = hash(name) % 10000
+    # 간단한 해시를 이용해서 고유한 번호 생성 (실행마다 같은 번호가 나오도록 crc32 사용)
+    hash_val = zlib.crc32(name.encode('utf-8')) % 10000
     return f"010-{hash_val:04d}-{(hash_val * 13) % 10000:04d}"
 
 def generate_email(name):
@@ -143,60 +130,22 @@ def generate_email(name):
     english_name = name_mapping.get(name, name.lower().replace(' ', ''))
     return f"{english_name}@grkcon.com"
 
-def send_to_backend(employee_data):
-    """백엔드 API로 직원 데이터 전송"""
-    backend_url = "http://localhost:3001/api/employees"
-    
-    successful_adds = []
-    failed_adds = []
-    
-    print(f"\n🚀 백엔드 서버({backend_url})로 직원 데이터 전송 시작...")
-    
-    for i, employee in enumerate(employee_data):
-        try:
-            print(f"\n👤 {i+1}/{len(employee_data)} - {employee['name']} 추가 중...")
-            print(f"   데이터: {json.dumps(employee, ensure_ascii=False)}")
-            
-            response = requests.post(
-                backend_url, 
-                json=employee,
-                headers={'Content-Type': 'application/json'},
-                timeout=10
-            )
-            
-            if response.status_code == 201:
-                print(f"✅ 성공: {employee['name']}")
-                successful_adds.append(employee['name'])
-            else:
-                print(f"❌ 실패: {employee['name']} - HTTP {response.status_code}")
-                print(f"   응답: {response.text}")
-                failed_adds.append((employee['name'], f"HTTP {response.status_code}: {response.text}"))
-                
-        except requests.exceptions.ConnectionError:
-            print(f"❌ 연결 오류: 백엔드 서버가 실행 중인지 확인하세요 (http://localhost:3001)")
-            failed_adds.append((employee['name'], "백엔드 서버 연결 실패"))
-        except Exception as e:
-            print(f"❌ 네트워크 오류: {employee['name']} - {e}")
-            failed_adds.append((employee['name'], str(e)))
-    
-    # 결과 요약
-    print(f"\n" + "="*80)
-    print(f"📊 결과 요약:")
-    print(f"✅ 성공: {len(successful_adds)}명")
-    print(f"❌ 실패: {len(failed_adds)}명")
-    
-    if successful_adds:
-        print(f"\n✅ 성공한 직원들:")
-        for name in successful_adds:
-            print(f"  - {name}")
-    
-    if failed_adds:
-        print(f"\n❌ 실패한 직원들:")
-        for name, error in failed_adds:
-            print(f"  - {name}: {error}")
+def send_to_backend(employee_data, batch_size=DEFAULT_BATCH_SIZE, **options):
+    """백엔드 API로 직원 데이터 전송 (batch_size 명씩 묶어 /bulk 로, 연결 풀 + 동시 요청, 실패 시 재시도)"""
+    result = import_employees(employee_data, batch_size=batch_size, **options)
+    print_summary(result, list_names=True)
+    return result
 
 def main():
-    file_path = "/Users/sung/user/workspace/GRK/GRK_workspace/2025_CF_management.xlsx"
+    parser = argparse.ArgumentParser(description="실제 직원 데이터 추출 및 DB 추가")
+    parser.add_argument("file_path", nargs="?",
+                        default="/Users/sung/user/workspace/GRK/GRK_workspace/2025_CF_management.xlsx")
+    parser.add_argument("--sync", action="store_true",
+                        help="현재 직원 목록과 비교해 추가/수정(/삭제)만 반영 (다시 실행해도 중복 없음)")
+    add_sync_arguments(parser)
+    add_import_arguments(parser, batch_size=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+    file_path = args.file_path
     
     print("🚀 Excel 파일에서 실제 직원 데이터 추출 및 DB 추가 시작...")
     
@@ -217,11 +166,16 @@ def main():
         print(f"   입사일: {emp['joinDate']} | 월급: {emp['monthlySalary']:,}원")
         print(f"   전화: {emp['tel']} | 이메일: {emp['email']}")
     
-    # 바로 DB에 추가
     print("="*80)
+    if args.sync or args.dry_run or args.prune:
+        # 현재 직원 목록과의 차이만 반영
+        sync_employees(employee_data, dry_run=args.dry_run, prune=args.prune, **import_options(args))
+        return
+
+    # 바로 DB에 추가
     print(f"\n🚀 백엔드 DB에 {len(employee_data)}명의 직원 데이터를 추가합니다...")
     
-    send_to_backend(employee_data)
+    send_to_backend(employee_data, **import_options(args))
     print(f"\n🎉 직원 데이터 추가 작업이 완료되었습니다!")
     print(f"📱 프론트엔드에서 직원관리 페이지를 확인해보세요!")
 
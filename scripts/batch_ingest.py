@@ -0,0 +1,175 @@
+"""
+CF 워크북 일괄 수집
+glob 패턴에 맞는 월별/연도별 CF 워크북들에서 HR 명단('03.HR unit cost'),
+CF 표('01.Cash Flow Management' 의 항목별 월 금액), 월 경비표('02.Monthly Expense'),
+프로젝트 손익 시트('01.SCL LIS시스템 ISP' 등)를 프로세스 풀로 파일마다 나눠 추출하고,
+하나의 중복 없는 데이터셋으로 합칩니다.
+- 직원: 사번(없으면 정규화한 이름 + 입사일) 기준으로 한 명만, 경로 순서상 뒤 파일의 값이 우선
+- CF 표: 연도마다 경로 순서상 마지막 파일의 표만 남김 (월별 스냅숏은 최신 파일이 전체를 대신함)
+- 월 경비표: 경비표가 있는 마지막 파일의 표만 남김
+- 프로젝트: 시트 이름마다 마지막 파일의 시트만 남김
+--export 를 주면 columnar_export 로 표마다 Parquet/Arrow 파일도 씁니다.
+파일마다 워크북 zip 을 한 번 열고 시트 XML 을 스트리밍으로 읽으므로 파일 수만큼 코어를 쓸 수 있습니다.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from columnar_export import FORMATS, export_dataset
+from employee_sync import employee_key
+from hr_stream import HR_SHEET, iter_hr_employees
+from workbook_session import WorkbookSession
+from workbook_tables import CF_SHEET, iter_cf_rows, iter_expense_rows, iter_project_rows
+
+
+def ingest_workbook(path, hr_sheet=HR_SHEET, cf_sheet=CF_SHEET):
+    """워크북 하나에서 직원 명단, CF 표, 월 경비표, 프로젝트 시트 추출 (프로세스 풀 작업 단위, 오류는 결과에 담아 반환)"""
+    start = time.perf_counter()
+    result = {'path': path, 'employees': [], 'cashflow': [], 'expenses': [], 'projects': [], 'error': None}
+    try:
+        with WorkbookSession(path) as session:
+            if hr_sheet in session.sheet_map:
+                result['employees'] = list(iter_hr_employees(session, hr_sheet))
+            result['cashflow'] = list(iter_cf_rows(session, cf_sheet))
+            result['expenses'] = list(iter_expense_rows(session))
+            for sheet in session.sheet_map:
+                result['projects'].extend({'sheet': sheet, **row} for row in iter_project_rows(session, sheet))
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['elapsed'] = time.perf_counter() - start
+    return result
+
+
+def expand_paths(patterns):
+    """glob 패턴들을 중복 없는 워크북 경로 목록으로 (정렬, Excel 잠금 파일 '~$...' 제외)"""
+    paths = set()
+    for pattern in patterns:
+        for path in glob.glob(os.path.expanduser(pattern), recursive=True):
+            if path.lower().endswith(('.xlsx', '.xlsm')) and not os.path.basename(path).startswith('~$'):
+                paths.add(os.path.abspath(path))
+    return sorted(paths)
+
+
+def ingest_paths(paths, workers=None, hr_sheet=HR_SHEET, cf_sheet=CF_SHEET, verbose=True):
+    """파일별 추출 결과를 경로 순서대로 반환 (workers 가 2 이상이면 프로세스 풀, 끝나는 대로 시간 출력)"""
+    workers = min(workers or os.cpu_count() or 1, len(paths)) or 1
+    results = {}
+
+    def report(result):
+        results[result['path']] = result
+        if not verbose:
+            return
+        name = os.path.relpath(result['path'])
+        name = result['path'] if name.startswith('..') else name
+        if result['error']:
+            print(f"❌ [{len(results)}/{len(paths)}] {name}: {result['error']} ({result['elapsed']:.2f}초)")
+        else:
+            print(f"✅ [{len(results)}/{len(paths)}] {name}: 직원 {len(result['employees'])}명, "
+                  f"CF {len(result['cashflow'])}행, 경비 {len(result['expenses'])}행, "
+                  f"프로젝트 {len(result['projects'])}행 ({result['elapsed']:.2f}초)")
+
+    if workers == 1:
+        for path in paths:
+            report(ingest_workbook(path, hr_sheet, cf_sheet))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(ingest_workbook, path, hr_sheet, cf_sheet) for path in paths]
+            for future in as_completed(futures):
+                report(future.result())
+    return [results[path] for path in paths]
+
+
+def merge_results(results):
+    """파일별 결과를 중복 없는 데이터셋으로 합치기 (경로 순서상 뒤 파일이 우선)"""
+    employees = {}
+    tables = {}
+    expenses = []
+    projects = {}
+    for result in results:
+        for employee in result['employees']:
+            key = employee_key(employee)
+            employees.pop(key, None)    # 뒤 파일 값으로 바꾸되 순서도 뒤로
+            employees[key] = employee
+        by_year = {}
+        for row in result['cashflow']:
+            by_year.setdefault(row['year'], []).append({**row, 'source': result['path']})
+        for year, rows in by_year.items():
+            # 연도를 모르는 표는 파일마다 따로 둠
+            tables[year if year is not None else ('?', result['path'])] = rows
+        if result['expenses']:
+            expenses = [{**row, 'source': result['path']} for row in result['expenses']]
+        by_sheet = {}
+        for row in result['projects']:
+            by_sheet.setdefault(row['sheet'], []).append({**row, 'source': result['path']})
+        projects.update(by_sheet)
+    cashflow = [row for rows in tables.values() for row in rows]
+    cashflow.sort(key=lambda row: (row['year'] is None, row['year'] or 0, row['source'], row['row']))
+    return {
+        'files': [{'path': r['path'], 'elapsed': round(r['elapsed'], 3), 'employees': len(r['employees']),
+                   'cashflow': len(r['cashflow']), 'expenses': len(r['expenses']),
+                   'projects': len(r['projects']), 'error': r['error']} for r in results],
+        'employees': list(employees.values()),
+        'cashflow': cashflow,
+        'expenses': expenses,
+        'projects': [row for rows in projects.values() for row in rows],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CF 워크북 일괄 수집 (HR 명단 + CF 표 + 경비표 + 프로젝트)")
+    parser.add_argument("patterns", nargs="*",
+                        default=["/Users/sung/user/workspace/GRK/GRK_workspace/*CF*.xlsx"],
+                        help="워크북 glob 패턴 (여러 개 가능, ** 지원)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="프로세스 수 (기본: 코어 수)")
+    parser.add_argument("--output", help="합친 데이터셋 JSON 경로")
+    parser.add_argument("--export", metavar="DIR", help="표마다 열 기반 파일(Parquet/Arrow)을 쓸 디렉터리")
+    parser.add_argument("--format", choices=FORMATS, default='parquet', help="--export 파일 형식")
+    parser.add_argument("--hr-sheet", default=HR_SHEET)
+    parser.add_argument("--cf-sheet", default=CF_SHEET)
+    args = parser.parse_args()
+
+    paths = expand_paths(args.patterns)
+    if not paths:
+        print("❌ 패턴에 맞는 워크북이 없습니다.")
+        sys.exit(1)
+
+    workers = min(args.workers or 1, len(paths))
+    print(f"🚀 워크북 {len(paths)}개 수집 시작 (프로세스 {workers}개)...")
+    start = time.perf_counter()
+    results = ingest_paths(paths, workers, args.hr_sheet, args.cf_sheet)
+    dataset = merge_results(results)
+    elapsed = time.perf_counter() - start
+
+    failed = sum(1 for r in results if r['error'])
+    extracted = sum(len(r['employees']) for r in results)
+    cf_rows = sum(len(r['cashflow']) for r in results)
+    work = sum(r['elapsed'] for r in results)
+    print(f"\n📊 결과 요약:")
+    print(f"📁 파일: {len(paths) - failed}개 성공, {failed}개 실패")
+    print(f"👤 직원: {len(dataset['employees'])}명 (추출 {extracted}명, 중복 {extracted - len(dataset['employees'])}명 제거)")
+    print(f"💰 CF 표: {len(dataset['cashflow'])}행 (추출 {cf_rows}행, "
+          f"연도 {len({row['year'] for row in dataset['cashflow']})}개)")
+    print(f"🧾 경비표: {len(dataset['expenses'])}행 | 📂 프로젝트: {len(dataset['projects'])}행 "
+          f"(시트 {len({row['sheet'] for row in dataset['projects']})}개)")
+    print(f"⏱️  전체 {elapsed:.2f}초 | 파일별 처리 합계 {work:.2f}초 | 처리량 {len(paths) / elapsed:.1f}개/초")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(dataset, f, ensure_ascii=False, indent=2, default=str)
+        print(f"💾 {args.output} 에 저장했습니다.")
+    if args.export:
+        for table, path in export_dataset(dataset, args.export, args.format).items():
+            print(f"🧱 {table}: {path} ({os.path.getsize(path) / 1024:.1f}KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+컬럼 이름 → 필드 매칭기
+필드별 키워드 목록(예: 'name': ['이름', 'name', '성명'])을 하나의 정규식으로 미리 컴파일해 두고,
+시트마다 컬럼 이름을 한 번씩만 훑어 필드 → 열 위치 목록을 만듭니다.
+행마다 모든 필드 x 컬럼 x 키워드를 부분 문자열로 비교하던 것을 시트당 한 번의 해석으로 바꾸고,
+행은 그 결과(열 위치)로 값만 꺼냅니다. 결과는 "소문자로 바꾼 컬럼 이름에 키워드가 들어 있으면 매칭"과 같습니다.
+"""
+
+import re
+
+
+class ColumnMatcher:
+    """필드별 키워드를 하나의 정규식으로 컴파일한 컬럼 매칭기"""
+
+    def __init__(self, column_mapping):
+        self.fields = list(column_mapping)
+        keywords = sorted({keyword.lower() for aliases in column_mapping.values() for keyword in aliases},
+                          key=len, reverse=True)
+        # 키워드 → 필드 집합. 위치마다 가장 긴 키워드만 잡히므로 그 안에 들어 있는 짧은 키워드의 필드도 합쳐 둠
+        direct = {keyword: set() for keyword in keywords}
+        for field, aliases in column_mapping.items():
+            for keyword in aliases:
+                direct[keyword.lower()].add(field)
+        self._fields_of = {
+            keyword: set().union(*(direct[other] for other in keywords if other in keyword))
+            for keyword in keywords
+        }
+        # 전방 탐색이라 겹치는 위치(예: '월급여' 안의 '급여')도 모두 검사
+        self._pattern = re.compile('(?=(' + '|'.join(map(re.escape, keywords)) + '))') if keywords else None
+
+    def fields_for(self, column):
+        """컬럼 이름에 키워드가 들어 있는 필드 집합"""
+        if self._pattern is None:
+            return set()
+        found = set()
+        for keyword in self._pattern.findall(str(column).lower()):
+            found |= self._fields_of[keyword]
+        return found
+
+    def resolve(self, columns):
+        """필드 → 매칭된 열 위치 목록 (필드는 매핑 순서, 위치는 왼쪽부터, 매칭 없는 필드는 빠짐)"""
+        positions = {field: [] for field in self.fields}
+        for position, column in enumerate(columns):
+            for field in self.fields_for(column):
+                positions[field].append(position)
+        return {field: found for field, found in positions.items() if found}
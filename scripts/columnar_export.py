@@ -0,0 +1,166 @@
+"""
+열 기반(Parquet / Arrow IPC) 내보내기
+batch_ingest.merge_results 데이터셋의 표(CF 표, 월 경비표, HR 명단, 프로젝트 시트)를
+표마다 고정된 타입의 스키마로 파일 하나씩 씁니다.
+- parquet: zstd 압축, 필요한 열만 읽기 (pyarrow.parquet.read_table(columns=...))
+- arrow: 압축 없는 Arrow IPC 파일이라 메모리 맵으로 복사 없이 열을 바로 씁니다
+다시 읽을 때는 read_table(path, columns=[...]) 로 필요한 열만 꺼내면 xlsx/JSON 을 다시 파싱하지 않아도 됩니다.
+pyarrow 패키지가 필요합니다 (pip install pyarrow).
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from datetime import date, datetime
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:  # 열 기반 내보내기는 선택 기능
+    pa = pq = None
+
+FORMATS = ('parquet', 'arrow')
+EXTENSIONS = {'parquet': '.parquet', 'arrow': '.arrow'}
+MONTH_COLUMNS = [f'month_{month:02d}' for month in range(1, 13)]
+_DATE_RE = re.compile(r'(\d{4})\D+(\d{1,2})\D+(\d{1,2})')
+
+# 표 → (열 이름, 타입) 목록. 타입 이름은 pyarrow 생성 함수 이름, 'list<float64>' 만 따로 처리
+TABLE_COLUMNS = {
+    'cashflow': [('source', 'string'), ('year', 'int32'), ('row', 'int32'), ('section', 'string'),
+                 ('item', 'string'), ('total', 'float64')] + [(name, 'float64') for name in MONTH_COLUMNS],
+    'expenses': [('source', 'string'), ('row', 'int32'), ('level', 'int8'), ('category', 'string'),
+                 ('group', 'string'), ('item', 'string'), ('amount', 'float64'), ('share', 'float64'),
+                 ('note', 'string')],
+    'hr_roster': [('name', 'string'), ('position', 'string'), ('department', 'string'), ('rank', 'string'),
+                  ('tel', 'string'), ('email', 'string'), ('joinDate', 'date32'), ('joinDateText', 'string'),
+                  ('monthlySalary', 'int64')],
+    'projects': [('source', 'string'), ('sheet', 'string'), ('project', 'string'), ('code', 'string'),
+                 ('start_date', 'date32'), ('end_date', 'date32'), ('row', 'int32'), ('section', 'string'),
+                 ('category', 'string'), ('item', 'string'), ('factor', 'float64'), ('amount', 'float64'),
+                 ('planned', 'float64'), ('note', 'string'), ('schedule', 'list<float64>')],
+}
+# 데이터셋 키 → 표 이름
+DATASET_TABLES = {'cashflow': 'cashflow', 'expenses': 'expenses', 'employees': 'hr_roster', 'projects': 'projects'}
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise RuntimeError("Parquet/Arrow 내보내기에는 pyarrow 패키지가 필요합니다 (pip install pyarrow)")
+
+
+def to_date(value):
+    """datetime/date 또는 '2021.03.05' 같은 문자열을 date 로, 알 수 없으면 None"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    match = _DATE_RE.search(value) if isinstance(value, str) else None
+    if match:
+        try:
+            return date(*map(int, match.groups()))
+        except ValueError:
+            return None
+    return None
+
+
+def _cashflow_record(row):
+    record = {key: row.get(key) for key in ('source', 'year', 'row', 'section', 'item', 'total')}
+    record.update(zip(MONTH_COLUMNS, row['months']))
+    return record
+
+
+def _employee_record(employee):
+    record = {key: employee.get(key) for key in ('name', 'position', 'department', 'rank', 'tel', 'email',
+                                                'monthlySalary')}
+    record['joinDate'] = to_date(employee.get('joinDate'))
+    record['joinDateText'] = employee.get('joinDate')
+    return record
+
+
+def _project_record(row):
+    return {**row, 'start_date': to_date(row.get('start_date')), 'end_date': to_date(row.get('end_date'))}
+
+
+RECORD_BUILDERS = {'cashflow': _cashflow_record, 'hr_roster': _employee_record, 'projects': _project_record}
+
+
+def table_schema(table):
+    """표 이름의 pyarrow 스키마"""
+    _require_pyarrow()
+    return pa.schema([(name, pa.list_(pa.float64()) if kind == 'list<float64>' else getattr(pa, kind)())
+                      for name, kind in TABLE_COLUMNS[table]])
+
+
+def build_table(table, rows):
+    """레코드 목록을 표 스키마의 pyarrow.Table 로 (스키마에 없는 키는 버림)"""
+    schema = table_schema(table)
+    build = RECORD_BUILDERS.get(table)
+    records = [build(row) for row in rows] if build else rows
+    return pa.Table.from_pylist(records, schema=schema)
+
+
+def write_table(arrow_table, path, fmt='parquet'):
+    """pyarrow.Table 을 parquet(zstd) 또는 압축 없는 Arrow IPC 파일로 저장"""
+    _require_pyarrow()
+    if fmt == 'parquet':
+        pq.write_table(arrow_table, path, compression='zstd')
+    elif fmt == 'arrow':
+        with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, arrow_table.schema) as writer:
+            writer.write_table(arrow_table)
+    else:
+        raise ValueError(f"지원하지 않는 형식: {fmt} (가능: {', '.join(FORMATS)})")
+
+
+def read_table(path, columns=None):
+    """내보낸 파일에서 columns 열만 읽기 (Arrow 파일은 메모리 맵, 복사 없음)"""
+    _require_pyarrow()
+    if path.endswith(EXTENSIONS['parquet']):
+        return pq.read_table(path, columns=columns, memory_map=True)
+    source = pa.memory_map(path, 'r')
+    arrow_table = pa.ipc.open_file(source).read_all()
+    return arrow_table.select(columns) if columns else arrow_table
+
+
+def export_dataset(dataset, out_dir, fmt='parquet'):
+    """데이터셋의 표마다 out_dir/<표><확장자> 파일을 쓰고 {표: 경로} 반환"""
+    _require_pyarrow()
+    os.makedirs(out_dir, exist_ok=True)
+    paths = {}
+    for key, table in DATASET_TABLES.items():
+        path = os.path.join(out_dir, table + EXTENSIONS[fmt])
+        write_table(build_table(table, dataset.get(key, [])), path, fmt)
+        paths[table] = path
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CF 워크북 표를 Parquet/Arrow 파일로 내보내기")
+    parser.add_argument("file_path", nargs="?",
+                        default="/Users/sung/user/workspace/GRK/GRK_workspace/2025_CF_management.xlsx")
+    parser.add_argument("--out", default="workbook_tables", help="출력 디렉터리")
+    parser.add_argument("--format", choices=FORMATS, default='parquet')
+    args = parser.parse_args()
+
+    from batch_ingest import ingest_workbook, merge_results
+
+    print(f"🚀 {args.file_path} 표 추출 시작...")
+    start = time.perf_counter()
+    result = ingest_workbook(args.file_path)
+    if result['error']:
+        print(f"❌ 추출 실패: {result['error']}")
+        sys.exit(1)
+    try:
+        paths = export_dataset(merge_results([result]), args.out, args.format)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    for table, path in paths.items():
+        print(f"🧱 {table}: {path} ({read_table(path).num_rows}행, {os.path.getsize(path) / 1024:.1f}KB)")
+    print(f"🎉 {time.perf_counter() - start:.2f}초")
+
+
+if __name__ == "__main__":
+    main()
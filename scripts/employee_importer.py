@@ -0,0 +1,420 @@
+"""
+직원 데이터 일괄 등록 엔진
+requests.Session 연결 풀을 스레드마다 하나씩 두고, 지정한 동시 요청 수만큼 병렬로
+POST /api/employees 를 보냅니다. 실패한 요청은 지수 백오프로 재시도하되, POST 는 서버가 받지 않은 것이
+확실한 경우(연결 수립 실패, 429/503)만 다시 보내 직원이 중복 등록되지 않게 하고,
+끝나면 처리량과 지연 시간(p50/p95/최대) 요약을 출력합니다.
+batch_size 를 주면 미리 검증한 직원들을 묶어 POST /api/employees/bulk 로 보내고
+행별 결과를 받습니다 (bulk 경로가 없는 백엔드면 한 명씩 보내기로 돌아감).
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+BACKEND_URL = "http://localhost:3001/api/employees"
+
+# 다시 보내면 성공할 수 있는 응답 코드
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+# POST 를 다시 보내도 되는 응답 코드: 서버가 요청을 처리하지 않았다고 알려 주는 경우만
+# (500/502/504 나 읽기 타임아웃은 서버가 이미 등록했을 수 있어 다시 보내면 중복 등록됨)
+POST_RETRY_STATUS = (429, 503)
+
+# Retry-After 헤더를 따르더라도 한 번에 기다리는 최대 시간(초)
+MAX_RETRY_DELAY = 30.0
+
+# 백엔드 BulkCreateEmployeeDto 의 한 요청당 최대 직원 수
+BULK_MAX_ROWS = 1000
+
+# 추출 스크립트의 기본 묶음 크기 (천 명당 요청 5번)
+DEFAULT_BATCH_SIZE = 200
+
+_NAME_PATTERN = re.compile(r'^[가-힣a-zA-Z\s]+$')
+_TEL_PATTERN = re.compile(r'^[0-9-]+$')
+_EMAIL_PATTERN = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+_DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+
+def validate_employee(employee):
+    """백엔드 CreateEmployeeDto 필수 항목 규칙으로 미리 검증, 오류 메시지 목록 반환"""
+    errors = []
+    name = employee.get('name')
+    if not isinstance(name, str) or not 2 <= len(name) <= 50 or not _NAME_PATTERN.match(name):
+        errors.append("name: 이름은 한글/영문/공백 2~50자여야 합니다.")
+    for field, label in (('position', '직급'), ('department', '부서')):
+        value = employee.get(field)
+        if not isinstance(value, str) or not 1 <= len(value) <= 50:
+            errors.append(f"{field}: {label}은(는) 1~50자 문자열이어야 합니다.")
+    tel = employee.get('tel')
+    if not isinstance(tel, str) or not 10 <= len(tel) <= 20 or not _TEL_PATTERN.match(tel):
+        errors.append("tel: 전화번호는 숫자와 하이픈 10~20자여야 합니다.")
+    email = employee.get('email')
+    if not isinstance(email, str) or not _EMAIL_PATTERN.match(email):
+        errors.append("email: 올바른 이메일 형식이 아닙니다.")
+    join_date = employee.get('joinDate')
+    if not isinstance(join_date, str) or not _DATE_PATTERN.match(join_date):
+        errors.append("joinDate: 입사일은 YYYY-MM-DD 형식이어야 합니다.")
+    return errors
+
+
+def _not_sent(error):
+    """요청이 서버에 전달되기 전(연결 수립 단계)에 난 오류인지"""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.Timeout):
+        return False
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+class BulkUnsupported(Exception):
+    """백엔드에 /bulk 경로가 없음 (404)"""
+
+
+class ImportResult:
+    """일괄 등록 결과 (성공/실패 목록, 요청별 지연 시간, 전체 소요 시간)"""
+
+    def __init__(self):
+        self.successful = []      # 이름
+        self.failed = []          # (이름, 오류 내용)
+        self.latencies = []       # 요청 단위(직원 한 명 또는 묶음 하나)별 걸린 시간(초, 재시도 포함)
+        self.attempts = 0         # 실제로 보낸 HTTP 요청 수
+        self.retries = 0
+        self.elapsed = 0.0
+
+    def add(self, name, ok, error=None):
+        if ok:
+            self.successful.append(name)
+        else:
+            self.failed.append((name, error))
+
+    def merge(self, other):
+        """다른 결과의 성공/실패/요청 통계를 합치기 (소요 시간은 제외)"""
+        self.successful += other.successful
+        self.failed += other.failed
+        self.latencies += other.latencies
+        self.attempts += other.attempts
+        self.retries += other.retries
+
+    @property
+    def total(self):
+        return len(self.successful) + len(self.failed)
+
+    @property
+    def throughput(self):
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, p):
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+class EmployeeImporter:
+    """연결 풀과 재시도를 갖춘 직원 등록 클라이언트"""
+
+    def __init__(self, backend_url=BACKEND_URL, concurrency=8, retries=3, backoff=0.5, timeout=10,
+                 batch_size=0, max_delay=MAX_RETRY_DELAY):
+        self.backend_url = backend_url
+        self.bulk_url = backend_url.rstrip('/') + '/bulk'
+        self.concurrency = max(1, concurrency)
+        self.batch_size = min(batch_size, BULK_MAX_ROWS)   # 0 이면 한 명씩
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.max_delay = max_delay
+        self._local = threading.local()
+
+    def _session(self):
+        """작업 스레드별 세션 (keep-alive 연결을 요청 사이에 재사용)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers['Content-Type'] = 'application/json'
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._local.session = session
+        return session
+
+    def _delay(self, attempt, response=None):
+        """attempt 번째 재시도 전 대기 시간 (Retry-After 가 있으면 우선, 최대 max_delay 초)"""
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), self.max_delay)
+            except ValueError:
+                pass
+        return min(self.backoff * (2 ** attempt) * (0.5 + random.random() / 2), self.max_delay)
+
+    def _send(self, url, payload=None, method='post'):
+        """
+        재시도를 포함해 요청 하나 보내기 (기본 JSON POST).
+        POST 는 멱등이 아니므로 요청이 서버에 닿지 않은 연결 실패와 429/503 만 재시도합니다.
+        반환: (성공 응답 또는 None, 오류 내용, 보낸 요청 수)
+        """
+        idempotent = method != 'post'
+        retry_status = RETRY_STATUS if idempotent else POST_RETRY_STATUS
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self._delay(attempt - 1, response))
+            response = None
+            try:
+                response = self._session().request(method, url, json=payload, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = f"연결 오류: {e.__class__.__name__}"
+                if idempotent or _not_sent(e):
+                    continue
+                return None, error, attempt + 1
+            if response.status_code in (200, 201):
+                return response, None, attempt + 1
+            error = f"HTTP {response.status_code}: {response.text[:200]}"
+            if response.status_code not in retry_status:
+                if response.status_code == 404 and url == self.bulk_url:
+                    raise BulkUnsupported(error)
+                return None, error, attempt + 1
+        return None, error, self.retries + 1
+
+    def post(self, employee):
+        """
+        직원 한 명 등록.
+        반환: (성공 여부, 오류 내용, 보낸 요청 수)
+        """
+        response, error, attempts = self._send(self.backend_url, employee)
+        return response is not None, error, attempts
+
+    def patch(self, employee_id, fields):
+        """직원 한 명의 일부 항목 수정, 반환: (성공 여부, 오류 내용, 보낸 요청 수)"""
+        response, error, attempts = self._send(f"{self.backend_url}/{employee_id}", fields, method='patch')
+        return response is not None, error, attempts
+
+    def delete(self, employee_id):
+        """직원 한 명 삭제, 반환: (성공 여부, 오류 내용, 보낸 요청 수)"""
+        response, error, attempts = self._send(f"{self.backend_url}/{employee_id}", method='delete')
+        return response is not None, error, attempts
+
+    def fetch_all(self):
+        """GET /api/employees 로 현재 직원 목록 전체 (실패하면 RuntimeError)"""
+        response, error, _ = self._send(self.backend_url, method='get')
+        if response is None:
+            raise RuntimeError(f"직원 목록 조회 실패: {error}")
+        return response.json()
+
+    def post_batch(self, employees):
+        """
+        직원 여러 명을 /bulk 로 한 번에 등록.
+        반환: ([(성공 여부, 오류 내용)] 요청 순서대로, 보낸 요청 수)
+        """
+        response, error, attempts = self._send(self.bulk_url, {'employees': employees})
+        if response is None:
+            return [(False, error)] * len(employees), attempts
+        rows = response.json()['results']
+        return [(row['status'] == 'created', '; '.join(row.get('errors') or []) or None)
+                for row in rows], attempts
+
+    def run(self, employee_data, verbose=True):
+        """직원 목록 전체 등록 (batch_size 가 있으면 묶음 단위)"""
+        if self.batch_size:
+            return self.run_batches(employee_data, verbose)
+        return self.run_rows(employee_data, verbose)
+
+    def run_rows(self, employee_data, verbose=True):
+        """직원 한 명당 요청 하나씩, 동시에 최대 concurrency 개 등록"""
+        return self.run_calls(employee_data, self.post, verbose=verbose)
+
+    def run_calls(self, items, call, name=None, verbose=True):
+        """
+        항목마다 call(항목) → (성공 여부, 오류 내용, 보낸 요청 수) 를 동시에 최대 concurrency 개 실행.
+        name(항목) 은 결과에 남길 이름 (기본: 항목의 'name').
+        """
+        name = name or (lambda item: item.get('name', 'Unknown'))
+        result = ImportResult()
+        total = len(items)
+        step = max(1, total // 10)
+
+        def job(item):
+            start = time.perf_counter()
+            ok, error, attempts = call(item)
+            return item, ok, error, attempts, time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [executor.submit(job, item) for item in items]
+            for done, future in enumerate(as_completed(futures), 1):
+                item, ok, error, attempts, latency = future.result()
+                result.latencies.append(latency)
+                result.attempts += attempts
+                result.retries += attempts - 1
+                result.add(name(item), ok, error)
+                if verbose and not ok:
+                    print(f"❌ 실패: {name(item)} - {error}")
+                if verbose and (done % step == 0 or done == total):
+                    print(f"   진행: {done}/{total}")
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    def run_batches(self, employee_data, verbose=True):
+        """미리 검증한 직원들을 batch_size 명씩 묶어 /bulk 로 동시 전송"""
+        result = ImportResult()
+        start = time.perf_counter()
+
+        valid = []
+        for employee in employee_data:
+            errors = validate_employee(employee)
+            if errors:
+                result.add(employee.get('name', 'Unknown'), False, "검증 실패: " + '; '.join(errors))
+            else:
+                valid.append(employee)
+        if verbose and result.failed:
+            print(f"⚠️  검증 실패로 제외: {len(result.failed)}명")
+
+        chunks = [valid[i:i + self.batch_size] for i in range(0, len(valid), self.batch_size)]
+        unsupported = []
+
+        def job(chunk):
+            chunk_start = time.perf_counter()
+            try:
+                rows, attempts = self.post_batch(chunk)
+            except BulkUnsupported:
+                return chunk, None, 1, time.perf_counter() - chunk_start
+            return chunk, rows, attempts, time.perf_counter() - chunk_start
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [executor.submit(job, chunk) for chunk in chunks]
+            for done, future in enumerate(as_completed(futures), 1):
+                chunk, rows, attempts, latency = future.result()
+                result.latencies.append(latency)
+                result.attempts += attempts
+                result.retries += attempts - 1
+                if rows is None:
+                    unsupported.extend(chunk)
+                    continue
+                for employee, (ok, error) in zip(chunk, rows):
+                    name = employee.get('name', 'Unknown')
+                    result.add(name, ok, error)
+                    if verbose and not ok:
+                        print(f"❌ 실패: {name} - {error}")
+                if verbose:
+                    print(f"   진행: 묶음 {done}/{len(chunks)}")
+
+        if unsupported:
+            print(f"⚠️  백엔드에 bulk 경로가 없어 {len(unsupported)}명을 한 명씩 전송합니다.")
+            result.merge(self.run_rows(unsupported, verbose))
+        result.elapsed = time.perf_counter() - start
+        return result
+
+
+def print_summary(result, list_names=False):
+    """성공/실패 수와 처리량/지연 시간 요약 출력"""
+    print(f"\n" + "="*80)
+    print(f"📊 결과 요약:")
+    print(f"✅ 성공: {len(result.successful)}명")
+    print(f"❌ 실패: {len(result.failed)}명")
+    print(f"⏱️  소요 시간: {result.elapsed:.2f}초 | 처리량: {result.throughput:.1f}명/초")
+    print(f"📶 HTTP 요청: {result.attempts}회 (재시도 {result.retries}회)")
+    print(f"⌛ 지연 시간: p50 {result.percentile(50) * 1000:.1f}ms | "
+          f"p95 {result.percentile(95) * 1000:.1f}ms | "
+          f"최대 {max(result.latencies, default=0) * 1000:.1f}ms")
+
+    if list_names and result.successful:
+        print(f"\n✅ 성공한 직원들:")
+        for name in result.successful:
+            print(f"  - {name}")
+
+    if result.failed:
+        print(f"\n❌ 실패한 직원들:")
+        for name, error in result.failed:
+            print(f"  - {name}: {error}")
+
+
+def import_employees(employee_data, backend_url=BACKEND_URL, concurrency=8, retries=3, backoff=0.5,
+                     timeout=10, batch_size=0, verbose=True):
+    """직원 목록을 백엔드에 동시 등록하고 결과(ImportResult) 반환"""
+    importer = EmployeeImporter(backend_url, concurrency, retries, backoff, timeout, batch_size)
+    mode = f"{importer.batch_size}명씩 묶음" if importer.batch_size else "한 명씩"
+    print(f"\n🚀 백엔드 서버({backend_url})로 직원 {len(employee_data)}명 전송 시작 "
+          f"({mode}, 동시 요청 {importer.concurrency}개)...")
+    return importer.run(employee_data, verbose=verbose)
+
+
+def add_import_arguments(parser, batch_size=0):
+    """등록 엔진 공통 명령행 옵션 (batch_size 는 --batch-size 기본값)"""
+    parser.add_argument("--url", default=BACKEND_URL, help="직원 등록 API 주소")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 요청 수")
+    parser.add_argument("--retries", type=int, default=3, help="요청별 최대 재시도 횟수")
+    parser.add_argument("--backoff", type=float, default=0.5, help="재시도 대기 기본값(초, 매번 2배)")
+    parser.add_argument("--timeout", type=float, default=10, help="요청 타임아웃(초)")
+    parser.add_argument("--batch-size", type=int, default=batch_size,
+                        help=f"묶음 크기 (POST /bulk, 최대 {BULK_MAX_ROWS}, 0 이면 한 명씩)")
+
+
+def import_options(args):
+    """add_import_arguments 로 받은 옵션을 import_employees 키워드 인자로"""
+    return {
+        'backend_url': args.url,
+        'concurrency': args.concurrency,
+        'retries': args.retries,
+        'backoff': args.backoff,
+        'timeout': args.timeout,
+        'batch_size': args.batch_size,
+    }
+
+
+_SURNAMES = '김이박최정강조윤장임'
+_SYLLABLES = '가나다라마바사아자차카타파하거너더러머버'
+
+
+def synthetic_employees(count, seed=0):
+    """부하 시험용 가짜 직원 데이터 (이름은 한글만, 서로 다름)"""
+    rng = random.Random(seed)
+    departments = ['경영지원팀', '컨설팅팀', '개발팀', '영업팀']
+    positions = ['사원', '대리', '과장', '차장', '부장']
+    employees = []
+    for i in range(count):
+        # i 를 성(10가지) + 20진수 음절 3자리로 (최대 80,000명까지 서로 다른 이름)
+        rest = i // len(_SURNAMES)
+        given = ''.join(_SYLLABLES[rest // len(_SYLLABLES) ** k % len(_SYLLABLES)] for k in (2, 1, 0))
+        employees.append({
+            'name': _SURNAMES[i % len(_SURNAMES)] + given,
+            'position': rng.choice(positions),
+            'department': rng.choice(departments),
+            'tel': f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+            'email': f"test{i:05d}@grkcon.com",
+            'joinDate': f"20{rng.randint(15, 24)}-{rng.randint(1, 12):02d}-01",
+            'monthlySalary': rng.randrange(3_000_000, 9_000_000, 10_000),
+        })
+    return employees
+
+
+def main():
+    parser = argparse.ArgumentParser(description="직원 데이터 일괄 등록")
+    parser.add_argument("json_file", nargs="?", help="직원 목록 JSON 파일 (없으면 --synthetic 사용)")
+    parser.add_argument("--synthetic", type=int, default=0, metavar="N", help="가짜 직원 N명 생성해 등록")
+    add_import_arguments(parser)
+    args = parser.parse_args()
+
+    if args.json_file:
+        with open(args.json_file, encoding='utf-8') as f:
+            employee_data = json.load(f)
+    elif args.synthetic:
+        employee_data = synthetic_employees(args.synthetic)
+    else:
+        parser.error("json_file 또는 --synthetic 이 필요합니다")
+
+    result = import_employees(employee_data, **import_options(args))
+    print_summary(result)
+
+
+if __name__ == "__main__":
+    main()
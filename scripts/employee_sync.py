@@ -0,0 +1,202 @@
+"""
+직원 명단 동기화 (차이만 반영)
+현재 백엔드 직원 목록을 한 번 조회해 안정 키(사번, 없으면 정규화한 이름 + 입사일)로 색인하고,
+Excel 명단과 한 번에 비교해 추가/수정/삭제 계획을 세운 뒤 바뀐 것만 보냅니다.
+같은 명단으로 다시 실행하면 조회 한 번 외에는 아무 요청도 보내지 않습니다.
+--dry-run 이면 계획만 출력하고, 명단에 없는 직원(중복 포함) 삭제는 --prune 일 때만 실행합니다.
+"""
+
+import argparse
+import json
+import time
+import unicodedata
+
+from employee_importer import (
+    DEFAULT_BATCH_SIZE,
+    EmployeeImporter,
+    ImportResult,
+    add_import_arguments,
+    import_options,
+    print_summary,
+)
+
+# 명단(Excel)이 원본인 항목: 값이 다르면 수정. 전화번호/이메일 등은 추가할 때만 보냄
+SYNC_FIELDS = ('position', 'rank', 'department', 'joinDate', 'monthlySalary')
+
+
+def normalize_name(name):
+    """이름 비교용 정규화 (유니코드 NFC, 공백 정리, 대소문자 무시)"""
+    return ' '.join(unicodedata.normalize('NFC', str(name or '')).split()).casefold()
+
+
+def normalize_value(field, value):
+    """백엔드 응답과 명단 값 비교용 정규화 (날짜는 YYYY-MM-DD, 금액은 숫자)"""
+    if value is None or value == '':
+        return None
+    if field in ('joinDate', 'endDate'):
+        return str(value)[:10]
+    if field == 'monthlySalary':
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return value
+    return str(value).strip()
+
+
+def employee_key(employee):
+    """직원 안정 키: 사번이 있으면 사번, 없으면 (정규화한 이름, 입사일)"""
+    if employee.get('empNo'):
+        return ('empNo', str(employee['empNo']))
+    return ('name', normalize_name(employee.get('name')), normalize_value('joinDate', employee.get('joinDate')))
+
+
+class SyncPlan:
+    """명단과 현재 직원 목록의 차이"""
+
+    def __init__(self):
+        self.inserts = []       # 새로 등록할 명단 항목
+        self.updates = []       # (현재 직원, {항목: 새 값})
+        self.deletes = []       # 명단에 없는 현재 직원
+        self.duplicates = []    # 같은 키의 현재 직원이 여럿일 때 남길 하나를 뺀 나머지
+        self.skipped = []       # 명단 안에서 키가 겹쳐 건너뛴 항목
+        self.unchanged = 0
+
+    def has_changes(self, prune=False):
+        """보낼 변경이 있는지 (삭제는 prune 일 때만 보냄)"""
+        return bool(self.inserts or self.updates or (prune and (self.deletes or self.duplicates)))
+
+
+def plan_sync(roster, current, fields=SYNC_FIELDS):
+    """
+    명단(roster)과 현재 직원 목록(current)을 한 번씩만 훑어 동기화 계획 만들기.
+    현재 직원은 사번과 (이름, 입사일) 두 키로 색인하므로 명단에 사번이 없어도 찾을 수 있습니다.
+    """
+    plan = SyncPlan()
+    by_key = {}
+    for employee in sorted(current, key=lambda e: e.get('id') or 0):
+        # 중복: 사번이 같거나, 둘 다 사번 없이 (이름, 입사일)이 같을 때. 가장 먼저 등록된(id 가 작은) 직원만 남김
+        # 사번이 다른 동명이인은 중복이 아니며 (이름, 입사일) 키는 먼저 등록된 직원을 가리킴
+        name_key = employee_key({**employee, 'empNo': None})
+        if employee.get('empNo'):
+            emp_key = ('empNo', str(employee['empNo']))
+            if emp_key in by_key:
+                plan.duplicates.append(employee)
+                continue
+            by_key[emp_key] = employee
+        else:
+            first = by_key.get(name_key)
+            if first is not None and not first.get('empNo'):
+                plan.duplicates.append(employee)
+                continue
+        by_key.setdefault(name_key, employee)
+
+    matched = set()
+    seen = set()
+    for row in roster:
+        key = employee_key(row)
+        if key in seen:
+            plan.skipped.append(row)
+            continue
+        seen.add(key)
+        existing = by_key.get(key)
+        if existing is None or id(existing) in matched:
+            plan.inserts.append(row)
+            continue
+        matched.add(id(existing))
+        changes = {field: row[field] for field in fields
+                   if field in row and normalize_value(field, row[field]) != normalize_value(field, existing.get(field))}
+        if changes:
+            plan.updates.append((existing, changes))
+        else:
+            plan.unchanged += 1
+
+    matched.update(id(e) for e in plan.duplicates)
+    plan.deletes = [e for e in current if id(e) not in matched]
+    return plan
+
+
+def _label(employee):
+    return f"{employee.get('name')} (사번: {employee.get('empNo', 'N/A')}, ID: {employee.get('id')})"
+
+
+def print_plan(plan, prune=False):
+    """동기화 계획 출력"""
+    print(f"\n📋 동기화 계획: 추가 {len(plan.inserts)}명 | 수정 {len(plan.updates)}명 | "
+          f"삭제 {len(plan.deletes)}명 | 중복 {len(plan.duplicates)}명 | 변경 없음 {plan.unchanged}명")
+    for row in plan.skipped:
+        print(f"  ⚠️  명단 안에서 중복, 건너뜀: {row.get('name')} (입사 {row.get('joinDate')})")
+    for row in plan.inserts:
+        print(f"  ➕ {row.get('name')} ({row.get('position')}, 입사 {row.get('joinDate')})")
+    for existing, changes in plan.updates:
+        diff = ', '.join(f"{field}: {existing.get(field)!r} → {value!r}" for field, value in changes.items())
+        print(f"  ✏️  {_label(existing)} - {diff}")
+    suffix = "" if prune else " (--prune 일 때만 삭제)"
+    for employee in plan.deletes:
+        print(f"  🗑️ 명단에 없음: {_label(employee)}{suffix}")
+    for employee in plan.duplicates:
+        print(f"  🗑️ 중복: {_label(employee)}{suffix}")
+
+
+def apply_plan(plan, importer, prune=False, verbose=True):
+    """계획의 변경만 백엔드에 반영하고 결과(ImportResult) 반환"""
+    result = ImportResult()
+    start = time.perf_counter()
+    if plan.inserts:
+        result.merge(importer.run(plan.inserts, verbose=verbose))
+    if plan.updates:
+        result.merge(importer.run_calls(
+            plan.updates, lambda item: importer.patch(item[0]['id'], item[1]),
+            name=lambda item: item[0].get('name'), verbose=verbose))
+    if prune and (plan.deletes or plan.duplicates):
+        result.merge(importer.run_calls(
+            plan.deletes + plan.duplicates, lambda employee: importer.delete(employee['id']),
+            name=lambda employee: employee.get('name'), verbose=verbose))
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def sync_employees(roster, dry_run=False, prune=False, **options):
+    """
+    현재 직원 목록을 조회해 명단과의 차이만 반영 (dry_run 이면 계획만), 계획 반환.
+    options 는 EmployeeImporter 인자 (backend_url, concurrency, batch_size 등)
+    """
+    importer = EmployeeImporter(**options)
+    start = time.perf_counter()
+    current = importer.fetch_all()
+    plan = plan_sync(roster, current)
+    print(f"\n🔄 현재 직원 {len(current)}명 조회 및 비교 완료 ({time.perf_counter() - start:.2f}초)")
+    print_plan(plan, prune)
+
+    if dry_run:
+        print("\n🧪 dry-run: 변경 사항을 보내지 않았습니다.")
+    elif not plan.has_changes(prune):
+        print("\n✅ 보낼 변경 사항이 없습니다.")
+    else:
+        print_summary(apply_plan(plan, importer, prune))
+    return plan
+
+
+def add_sync_arguments(parser):
+    parser.add_argument("--dry-run", action="store_true", help="계획만 출력하고 보내지 않음")
+    parser.add_argument("--prune", action="store_true", help="명단에 없는 직원과 중복 직원 삭제")
+
+
+def sync_options(args):
+    """add_import_arguments/add_sync_arguments 옵션을 sync_employees 키워드 인자로"""
+    return {'dry_run': args.dry_run, 'prune': args.prune, **import_options(args)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="직원 명단 동기화 (차이만 반영)")
+    parser.add_argument("json_file", help="직원 명단 JSON 파일")
+    add_sync_arguments(parser)
+    add_import_arguments(parser, batch_size=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    with open(args.json_file, encoding='utf-8') as f:
+        roster = json.load(f)
+    sync_employees(roster, **sync_options(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+워크북 한 번 파싱 로더
+pd.ExcelFile 로 워크북을 한 번만 열고, 시트마다 DataFrame 을 처음 필요할 때 한 번만 파싱해 기억합니다.
+추출/미리보기 함수들이 같은 로더를 받아 쓰므로 시트 목록 확인, 미리보기, 직원 추출을 모두 해도
+시트마다 파싱은 한 번이고, 미리보기는 이미 읽은 DataFrame 의 앞부분을 잘라 보여 줍니다.
+"""
+
+import time
+
+import pandas as pd
+
+
+class ExcelFrames:
+    """워크북을 한 번 열어 두고 시트별 DataFrame 을 나눠 주는 로더"""
+
+    def __init__(self, file_path):
+        start = time.perf_counter()
+        self.file_path = file_path
+        self.excel_file = pd.ExcelFile(file_path)
+        self.sheet_names = self.excel_file.sheet_names
+        self._frames = {}
+        self.load_time = time.perf_counter() - start   # 워크북 열기 + 시트 파싱에 쓴 시간 합계(초)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.excel_file.close()
+
+    def frame(self, sheet_name):
+        """시트 DataFrame (처음 요청할 때만 파싱)"""
+        if sheet_name not in self._frames:
+            start = time.perf_counter()
+            self._frames[sheet_name] = self.excel_file.parse(sheet_name)
+            self.load_time += time.perf_counter() - start
+        return self._frames[sheet_name]
+
+    def frames(self):
+        """(시트 이름, DataFrame) 을 시트 순서대로"""
+        for sheet_name in self.sheet_names:
+            yield sheet_name, self.frame(sheet_name)
+
+    def preview(self, sheet_name, rows=5):
+        """이미 읽은 DataFrame 의 앞 rows 행"""
+        return self.frame(sheet_name).head(rows)
+
+    @property
+    def parsed_count(self):
+        return len(self._frames)
+
+
+def open_frames(source):
+    """파일 경로면 새 로더를, 이미 로더면 그대로 반환"""
+    if isinstance(source, ExcelFrames):
+        return source
+    return ExcelFrames(source)
+
+
+def print_load_time(frames):
+    """워크북 열기 + 파싱 시간 출력"""
+    print(f"⏱️  워크북 읽기: 시트 {frames.parsed_count}/{len(frames.sheet_names)}개 파싱, {frames.load_time:.2f}초")
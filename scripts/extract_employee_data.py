@@ -1,25 +1,52 @@
 import pandas as pd
-import requests
 import json
 from datetime import datetime, date
 import re
+import argparse
+
+from employee_importer import DEFAULT_BATCH_SIZE, add_import_arguments, import_employees, import_options, print_summary
+from column_matcher import ColumnMatcher
+from excel_frames import open_frames, print_load_time
+
+# 컬럼 매핑 (Excel 컬럼명 → DB 필드명)
+COLUMN_MAPPING = {
+    # 이름
+    'name': ['이름', 'name', '성명', '직원명', '성함'],
+    # 직급/직책
+    'position': ['직급', 'position', '직책', '포지션', '직위'],
+    'rank': ['직책', 'rank', '직급', '직위'],
+    # 부서
+    'department': ['부서', 'department', '팀', 'team', '소속'],
+    # 연락처
+    'tel': ['전화번호', 'tel', 'phone', '연락처', '휴대폰', '핸드폰'],
+    'email': ['이메일', 'email', 'e-mail', '메일', '전자우편'],
+    # 날짜
+    'joinDate': ['입사일', '입사날짜', 'join_date', 'start_date', '시작일'],
+    # 급여
+    'monthlySalary': ['월급', '급여', 'salary', '월급여', '기본급'],
+    # 기타
+    'ssn': ['주민번호', '주민등록번호', 'ssn', '생년월일'],
+    'bankAccount': ['계좌번호', '계좌', 'account', '통장번호']
+}
+COLUMN_MATCHER = ColumnMatcher(COLUMN_MAPPING)
+NAME_MATCHER = ColumnMatcher({'name': ['이름', 'name', '성명', '직원명']})
 
 def read_excel_file(file_path):
-    """Excel 파일을 읽고 시트 정보를 확인"""
+    """Excel 파일을 한 번 읽어 시트 정보를 확인하고 로더(ExcelFrames) 반환 (file_path 는 경로 또는 로더)"""
     try:
         # Excel 파일의 모든 시트 이름 확인
-        excel_file = pd.ExcelFile(file_path)
+        excel_file = open_frames(file_path)
         print("📊 Excel 파일의 시트 목록:")
         for i, sheet_name in enumerate(excel_file.sheet_names):
             print(f"{i+1}. {sheet_name}")
         
-        # 각 시트의 데이터 미리보기
+        # 각 시트의 데이터 미리보기 (읽어 둔 DataFrame 의 앞 5행)
         for sheet_name in excel_file.sheet_names:
             print(f"\n📄 시트: {sheet_name}")
-            df = pd.read_excel(file_path, sheet_name=sheet_name, nrows=5)
+            df = excel_file.preview(sheet_name)
             print(f"컬럼: {list(df.columns)}")
             print("데이터 미리보기:")
-            print(df.head())
+            print(df)
             print("-" * 80)
         
         return excel_file
@@ -28,72 +55,53 @@ def read_excel_file(file_path):
         return None
 
 def extract_employee_data(file_path):
-    """Excel 파일에서 직원 정보 추출"""
+    """Excel 파일에서 직원 정보 추출 (file_path 는 경로 또는 read_excel_file 이 돌려준 로더)"""
     try:
         # 가능한 직원 정보가 있을 만한 시트들을 확인
         potential_sheets = ['직원', '인사', '사원', '직원명단', 'employee', 'staff']
         
-        excel_file = pd.ExcelFile(file_path)
+        excel_file = open_frames(file_path)
         employee_data = []
         
-        for sheet_name in excel_file.sheet_names:
+        for sheet_name, df in excel_file.frames():
             print(f"\n🔍 {sheet_name} 시트 분석 중...")
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
-            
-            # 직원 정보로 보이는 컬럼들을 찾기
-            columns = [col.lower() for col in df.columns]
-            print(f"컬럼들: {df.columns.tolist()}")
-            
-            # 이름 컬럼 찾기
-            name_columns = [col for col in df.columns if any(keyword in col.lower() for keyword in ['이름', 'name', '성명', '직원명'])]
-            if name_columns:
-                print(f"✅ 이름 컬럼 발견: {name_columns}")
-                
-                # 해당 시트의 데이터를 직원 정보로 처리
-                for idx, row in df.iterrows():
-                    if pd.notna(row[name_columns[0]]) and str(row[name_columns[0]]).strip():
-                        employee_info = extract_employee_info_from_row(row, df.columns)
-                        if employee_info:
-                            employee_data.append(employee_info)
+            employee_data.extend(extract_employee_data_from_frame(df))
         
         return employee_data
     except Exception as e:
         print(f"❌ 직원 데이터 추출 오류: {e}")
         return []
 
+def extract_employee_data_from_frame(df):
+    """시트 DataFrame 에서 직원 정보 추출"""
+    employee_data = []
+    print(f"컬럼들: {df.columns.tolist()}")
+    
+    # 이름 컬럼 찾기
+    name_columns = NAME_MATCHER.resolve(df.columns).get('name')
+    if name_columns:
+        print(f"✅ 이름 컬럼 발견: {[df.columns[i] for i in name_columns]}")
+        
+        # 필드별 컬럼은 시트당 한 번만 찾고, 각 행은 그 열 위치로 값만 꺼냄
+        columns = {field: found[0] for field, found in COLUMN_MATCHER.resolve(df.columns).items()}
+        name_column = name_columns[0]
+        for row in df.itertuples(index=False, name=None):
+            if pd.notna(row[name_column]) and str(row[name_column]).strip():
+                employee_info = extract_employee_info_from_row(row, columns)
+                if employee_info:
+                    employee_data.append(employee_info)
+    
+    return employee_data
+
 def extract_employee_info_from_row(row, columns):
-    """행에서 직원 정보 추출"""
+    """행에서 직원 정보 추출 (columns: 필드 → 열 위치, COLUMN_MATCHER.resolve 로 시트마다 한 번 계산)"""
     employee = {}
     
-    # 컬럼 매핑 (Excel 컬럼명 → DB 필드명)
-    column_mapping = {
-        # 이름
-        'name': ['이름', 'name', '성명', '직원명', '성함'],
-        # 직급/직책
-        'position': ['직급', 'position', '직책', '포지션', '직위'],
-        'rank': ['직책', 'rank', '직급', '직위'],
-        # 부서
-        'department': ['부서', 'department', '팀', 'team', '소속'],
-        # 연락처
-        'tel': ['전화번호', 'tel', 'phone', '연락처', '휴대폰', '핸드폰'],
-        'email': ['이메일', 'email', 'e-mail', '메일', '전자우편'],
-        # 날짜
-        'joinDate': ['입사일', '입사날짜', 'join_date', 'start_date', '시작일'],
-        # 급여
-        'monthlySalary': ['월급', '급여', 'salary', '월급여', '기본급'],
-        # 기타
-        'ssn': ['주민번호', '주민등록번호', 'ssn', '생년월일'],
-        'bankAccount': ['계좌번호', '계좌', 'account', '통장번호']
-    }
-    
-    # 각 필드별로 해당하는 컬럼 찾아서 값 추출
-    for field, possible_columns in column_mapping.items():
-        for col in columns:
-            if any(keyword in col.lower() for keyword in possible_columns):
-                value = row[col]
-                if pd.notna(value) and str(value).strip():
-                    employee[field] = clean_value(str(value).strip(), field)
-                break
+    # 각 필드별로 해당하는 컬럼의 값 추출
+    for field, column in columns.items():
+        value = row[column]
+        if pd.notna(value) and str(value).strip():
+            employee[field] = clean_value(str(value).strip(), field)
     
     # 필수 필드 확인
     if 'name' in employee and employee['name']:
@@ -154,47 +162,19 @@ def clean_value(value, field_type):
     
     return value
 
-def send_to_backend(employee_data):
-    """백엔드 API로 직원 데이터 전송"""
-    backend_url = "http://localhost:3001/api/employees"
-    
-    successful_adds = []
-    failed_adds = []
-    
-    for i, employee in enumerate(employee_data):
-        try:
-            print(f"\n👤 {i+1}/{len(employee_data)} - {employee.get('name', 'Unknown')} 추가 중...")
-            
-            response = requests.post(
-                backend_url, 
-                json=employee,
-                headers={'Content-Type': 'application/json'}
-            )
-            
-            if response.status_code == 201:
-                print(f"✅ 성공: {employee['name']}")
-                successful_adds.append(employee['name'])
-            else:
-                print(f"❌ 실패: {employee['name']} - {response.status_code}")
-                print(f"   오류 내용: {response.text}")
-                failed_adds.append((employee['name'], response.text))
-                
-        except Exception as e:
-            print(f"❌ 네트워크 오류: {employee['name']} - {e}")
-            failed_adds.append((employee['name'], str(e)))
-    
-    # 결과 요약
-    print(f"\n📊 결과 요약:")
-    print(f"✅ 성공: {len(successful_adds)}명")
-    print(f"❌ 실패: {len(failed_adds)}명")
-    
-    if failed_adds:
-        print(f"\n실패한 직원들:")
-        for name, error in failed_adds:
-            print(f"  - {name}: {error}")
+def send_to_backend(employee_data, batch_size=DEFAULT_BATCH_SIZE, **options):
+    """백엔드 API로 직원 데이터 전송 (batch_size 명씩 묶어 /bulk 로, 연결 풀 + 동시 요청, 요청 타임아웃 10초)"""
+    result = import_employees(employee_data, batch_size=batch_size, **options)
+    print_summary(result)
+    return result
 
 def main():
-    file_path = "/Users/sung/user/workspace/GRK/GRK_workspace/2025_CF_management.xlsx"
+    parser = argparse.ArgumentParser(description="Excel 직원 데이터 추출 및 DB 추가")
+    parser.add_argument("file_path", nargs="?",
+                        default="/Users/sung/user/workspace/GRK/GRK_workspace/2025_CF_management.xlsx")
+    add_import_arguments(parser, batch_size=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+    file_path = args.file_path
     
     print("🚀 Excel 파일에서 직원 데이터 추출 시작...")
     
@@ -203,8 +183,9 @@ def main():
     if not excel_file:
         return
     
-    # 2. 직원 데이터 추출
-    employee_data = extract_employee_data(file_path)
+    # 2. 직원 데이터 추출 (1단계에서 읽은 시트 재사용)
+    employee_data = extract_employee_data(excel_file)
+    print_load_time(excel_file)
     
     if not employee_data:
         print("❌ 직원 데이터를 찾을 수 없습니다.")
@@ -224,7 +205,7 @@ def main():
     confirm = input(f"\n백엔드에 {len(employee_data)}명의 직원 데이터를 추가하시겠습니까? (y/n): ")
     
     if confirm.lower() == 'y':
-        send_to_backend(employee_data)
+        send_to_backend(employee_data, **import_options(args))
     else:
         print("취소되었습니다.")
 
@@ -1,109 +1,94 @@
 import pandas as pd
+import numpy as np
 import json
-from datetime import datetime, date
-import re
+
+from excel_frames import open_frames
+from hr_roster import date_column, find_header_row, monthly_salary_column, name_mask, text_column
 
 def extract_hr_unit_cost_data(file_path):
-    """HR unit cost 시트에서 직원 정보 추출"""
+    """HR unit cost 시트에서 직원 정보 추출 (file_path 는 경로 또는 ExcelFrames 로더)"""
     try:
-        # HR unit cost 시트 읽기
-        df = pd.read_excel(file_path, sheet_name='03.HR unit cost')
+        # HR unit cost 시트 읽기 (로더가 이미 읽었으면 재사용)
+        df = open_frames(file_path).frame('03.HR unit cost')
         
         print("📊 HR unit cost 시트 원본 데이터:")
         print(df.to_string())
         print("=" * 100)
         
-        # 직원 데이터가 있는 행 찾기 (이름 컬럼이 있는 곳)
-        employee_data = []
-        
-        # 헤더 찾기 (이름, 직급 등이 있는 행)
-        header_row = None
-        for idx, row in df.iterrows():
-            if '이름' in str(row.iloc[0]) or any('이름' in str(cell) for cell in row if pd.notna(cell)):
-                header_row = idx
-                print(f"✅ 헤더 행 발견: {idx}번째 행")
-                break
+        return hr_employees_from_frame(df)
         
-        if header_row is None:
-            print("❌ 이름 헤더를 찾을 수 없습니다.")
-            return []
-        
-        # 헤더 행의 컬럼 정보 파악
-        headers = {}
-        header_row_data = df.iloc[header_row]
+    except Exception as e:
+        print(f"❌ HR 데이터 추출 오류: {e}")
+        return []
+
+def hr_employees_from_frame(df, verbose=True):
+    """HR unit cost 시트 DataFrame 에서 직원 목록 만들기 (열 단위 처리)"""
+    # 헤더 찾기 (이름, 직급 등이 있는 행)
+    header_row = find_header_row(df, '이름')
+    if header_row is None:
+        print("❌ 이름 헤더를 찾을 수 없습니다.")
+        return []
+    if verbose:
+        print(f"✅ 헤더 행 발견: {header_row}번째 행")
+    
+    # 헤더 행의 컬럼 정보 파악
+    headers = {}
+    header_row_data = df.iloc[header_row]
+    if verbose:
         print(f"📋 헤더 행 데이터: {header_row_data.tolist()}")
-        
-        for col_idx, cell_value in enumerate(header_row_data):
-            if pd.notna(cell_value):
-                cell_str = str(cell_value).strip()
+    
+    for col_idx, cell_value in enumerate(header_row_data):
+        if pd.notna(cell_value):
+            cell_str = str(cell_value).strip()
+            if verbose:
                 print(f"컬럼 {col_idx}: '{cell_str}'")
-                
-                if '이름' in cell_str:
-                    headers['name'] = col_idx
-                elif '직급' in cell_str:
-                    headers['position'] = col_idx
-                elif '입사일' in cell_str:
-                    headers['joinDate'] = col_idx
-                elif '연봉' in cell_str:
-                    headers['monthlySalary'] = col_idx
-        
-        print(f"📍 컬럼 매핑: {headers}")
-        
-        # 직원 데이터 추출 (헤더 다음 행부터)
-        for idx in range(header_row + 1, len(df)):
-            row = df.iloc[idx]
             
-            # 이름이 있는 행만 처리
-            if 'name' in headers:
-                name_value = row.iloc[headers['name']]
-                if pd.notna(name_value) and str(name_value).strip() and str(name_value).strip() not in ['합계', '소계', '', 'NaN']:
-                    employee = {}
-                    
-                    # 이름
-                    employee['name'] = str(name_value).strip()
-                    
-                    # 직급
-                    if 'position' in headers:
-                        position_value = row.iloc[headers['position']]
-                        if pd.notna(position_value):
-                            employee['position'] = str(position_value).strip()
-                    
-                    # 입사일
-                    if 'joinDate' in headers:
-                        joindate_value = row.iloc[headers['joinDate']]
-                        if pd.notna(joindate_value):
-                            if isinstance(joindate_value, (datetime, date)):
-                                employee['joinDate'] = joindate_value.strftime('%Y-%m-%d')
-                            else:
-                                employee['joinDate'] = str(joindate_value).strip()
-                    
-                    # 연봉
-                    if 'monthlySalary' in headers:
-                        salary_value = row.iloc[headers['monthlySalary']]
-                        if pd.notna(salary_value):
-                            try:
-                                # 숫자만 추출해서 월급으로 변환 (연봉 / 12)
-                                if isinstance(salary_value, (int, float)):
-                                    employee['monthlySalary'] = int(salary_value / 12)
-                                else:
-                                    cleaned = re.sub(r'[^\d]', '', str(salary_value))
-                                    if cleaned:
-                                        annual_salary = int(cleaned)
-                                        employee['monthlySalary'] = int(annual_salary / 12)
-                            except:
-                                pass
-                    
-                    # 기본값 설정
-                    set_default_values(employee)
-                    
-                    employee_data.append(employee)
-                    print(f"✅ 직원 추출: {employee['name']}")
-        
-        return employee_data
-        
-    except Exception as e:
-        print(f"❌ HR 데이터 추출 오류: {e}")
+            if '이름' in cell_str:
+                headers['name'] = col_idx
+            elif '직급' in cell_str:
+                headers['position'] = col_idx
+            elif '입사일' in cell_str:
+                headers['joinDate'] = col_idx
+            elif '연봉' in cell_str:
+                headers['monthlySalary'] = col_idx
+    
+    if verbose:
+        print(f"📍 컬럼 매핑: {headers}")
+    if 'name' not in headers:
         return []
+    
+    # 직원 데이터 추출 (헤더 다음 행부터, 이름이 있는 행만)
+    body = df.iloc[header_row + 1:]
+    names = text_column(body.iloc[:, headers['name']])
+    keep = name_mask(names, ['합계', '소계', '', 'NaN'])
+    body, names = body[keep], names[keep]
+    
+    # 값이 없는 항목은 None (기본값 설정에서 채움)
+    missing = pd.Series(np.nan, index=body.index, dtype=object)
+    positions = text_column(body.iloc[:, headers['position']]) if 'position' in headers else missing
+    join_dates = (date_column(body.iloc[:, headers['joinDate']], text='strip')
+                  if 'joinDate' in headers else missing)
+    # 숫자만 추출해서 월급으로 변환 (연봉 / 12), 변환 실패는 생략
+    salaries = monthly_salary_column(body.iloc[:, headers['monthlySalary']])[0] if 'monthlySalary' in headers else missing
+    
+    employee_data = []
+    for name, position, join_date, salary in zip(names, positions, join_dates, salaries):
+        employee = {'name': name}
+        if not pd.isna(position):
+            employee['position'] = position
+        if not pd.isna(join_date):
+            employee['joinDate'] = join_date
+        if not pd.isna(salary):
+            employee['monthlySalary'] = salary
+        
+        # 기본값 설정
+        set_default_values(employee)
+        employee_data.append(employee)
+    
+    if verbose and employee_data:
+        print('\n'.join(f"✅ 직원 추출: {emp['name']}" for emp in employee_data))
+    
+    return employee_data
 
 def set_default_values(employee):
     """기본값 설정"""
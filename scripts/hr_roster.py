@@ -0,0 +1,96 @@
+"""
+HR 명단 열 단위(벡터화) 변환 도구
+'03.HR unit cost' 시트를 행마다 df.iloc 로 읽지 않고, 필요한 열을 한 번에
+pandas/NumPy 문자열·숫자 연산으로 정리합니다 (이름 필터, 입사일 정규화, 연봉 → 월급).
+값 하나하나의 처리 결과는 기존 행 단위 코드와 같습니다.
+"""
+
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+
+def find_header_row(df, keyword='이름', block=64):
+    """keyword 가 들어 있는 셀이 있는 첫 행 번호 (없으면 None). 헤더는 보통 위쪽이라 앞 블록부터 검사"""
+    start = 0
+    while start < len(df):
+        part = df.iloc[start:start + block]
+        contains = part.apply(lambda column: column.astype(str).str.contains(keyword, regex=False) & column.notna())
+        hits = np.flatnonzero(contains.to_numpy().any(axis=1))
+        if len(hits):
+            return start + int(hits[0])
+        start += block
+        block *= 4
+    return None
+
+
+def _instance_mask(values, types):
+    """object 열에서 값이 types 의 인스턴스인 위치"""
+    return np.fromiter((isinstance(value, types) for value in values.to_numpy()), dtype=bool, count=len(values))
+
+
+def text_column(values):
+    """값이 있으면 str(값).strip(), 없으면 NaN"""
+    present = values.notna()
+    result = pd.Series(np.nan, index=values.index, dtype=object)
+    result[present] = values[present].astype(str).str.strip().astype(object)
+    return result
+
+
+def name_mask(names, exclude_names=()):
+    """text_column 으로 정리한 이름 중 비어 있지 않고 제외 목록에 없는 위치"""
+    return (names.notna() & (names != '') & ~names.isin(list(exclude_names))).to_numpy()
+
+
+def date_column(values, text='truncate'):
+    """
+    입사일 값을 'YYYY-MM-DD' 문자열로 (없으면 NaN).
+    날짜/시간 값은 strftime, 그 밖의 값은 str() 후 앞 10자(text='truncate') 또는 공백 제거(text='strip')
+    """
+    present = values.notna().to_numpy()
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        is_date = present
+    elif values.dtype == object:
+        is_date = present & _instance_mask(values, (datetime, date))
+    else:
+        is_date = np.zeros(len(values), dtype=bool)
+    is_text = present & ~is_date
+
+    result = pd.Series(np.nan, index=values.index, dtype=object)
+    if is_date.any():
+        result[is_date] = pd.to_datetime(values[is_date]).dt.strftime('%Y-%m-%d').astype(object)
+    if is_text.any():
+        strings = values[is_text].astype(str).str
+        result[is_text] = (strings[:10] if text == 'truncate' else strings.strip()).astype(object)
+    return result
+
+
+def monthly_salary_column(values):
+    """
+    연봉 값을 월급(int(연봉 / 12))으로.
+    반환: (월급 Series(없으면 NaN), 계산 실패 위치) - 숫자 값은 그대로 나누고, 그 밖의 값은
+    숫자만 남겨 나눕니다. 숫자가 하나도 없으면 NaN, 무한대처럼 정수로 못 바꾸면 실패 위치에 표시.
+    """
+    present = values.notna().to_numpy()
+    if pd.api.types.is_float_dtype(values.dtype):
+        is_number = present
+    elif values.dtype == object:
+        is_number = present & _instance_mask(values, (int, float))
+    else:
+        is_number = np.zeros(len(values), dtype=bool)    # numpy 정수/날짜 등은 기존 코드처럼 문자열 경로
+    is_text = present & ~is_number
+
+    annual = np.full(len(values), np.nan)
+    if is_number.any():
+        annual[is_number] = values[is_number].astype(float).to_numpy()
+    if is_text.any():
+        digits = values[is_text].astype(str).str.replace(r'[^\d]', '', regex=True)
+        annual[is_text] = digits.where(digits != '').astype(float).to_numpy()
+
+    monthly = np.trunc(annual / 12)
+    failed = (is_number | is_text) & ~np.isnan(annual) & ~np.isfinite(monthly)
+    result = pd.Series(np.nan, index=values.index, dtype=object)
+    ok = np.isfinite(monthly)
+    result[ok] = pd.Series(monthly[ok].astype(np.int64), index=values.index[ok]).astype(object)
+    return result, failed
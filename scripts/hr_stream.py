@@ -0,0 +1,131 @@
+"""
+HR 시트 스트리밍 추출
+'03.HR unit cost' 시트 XML 을 excel_stream(저장소 루트)으로 행 단위로 읽으며,
+'이름' 헤더 행을 찾는 즉시 필요한 네 열(이름, 직급, 입사일, 연봉)만 값으로 변환하고
+직원 레코드를 하나씩 내보냅니다. 시트 전체를 DataFrame 으로 만들지 않으므로
+HR 내보내기 파일이 커져도 메모리 사용량이 일정하고 첫 직원이 바로 나옵니다.
+레코드 내용은 extract_hr_data.extract_hr_unit_cost_data 와 같습니다.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from datetime import date, datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from excel_stream import iter_sheet_rows
+from extract_hr_data import set_default_values
+from workbook_session import WorkbookSession
+
+HR_SHEET = '03.HR unit cost'
+# 헤더 셀에 들어 있는 글자 → 필드 (앞에 있는 것부터 검사)
+HEADER_FIELDS = (('이름', 'name'), ('직급', 'position'), ('입사일', 'joinDate'), ('연봉', 'monthlySalary'))
+EXCLUDE_NAMES = ('합계', '소계', '', 'NaN')
+
+
+def map_header(cells):
+    """헤더 행 {열: 값} 을 필드 → 열 번호로 (같은 필드는 오른쪽 열이 우선)"""
+    headers = {}
+    for col, value in sorted(cells.items()):
+        text = str(value).strip()
+        for keyword, field in HEADER_FIELDS:
+            if keyword in text:
+                headers[field] = col
+                break
+    return headers
+
+
+def monthly_salary(value):
+    """연봉 값을 월급(int(연봉 / 12))으로, 숫자가 없거나 변환할 수 없으면 None"""
+    try:
+        if isinstance(value, (int, float)):
+            return int(value / 12)
+        cleaned = re.sub(r'[^\d]', '', str(value))
+        return int(int(cleaned) / 12) if cleaned else None
+    except (OverflowError, ValueError):
+        return None
+
+
+def employee_from_row(cells, headers):
+    """데이터 행 {열: 값} 을 직원 레코드로 (이름이 없거나 제외 대상이면 None)"""
+    name = cells.get(headers['name'])
+    if name is None or str(name).strip() in EXCLUDE_NAMES:
+        return None
+    employee = {'name': str(name).strip()}
+    position = cells.get(headers.get('position'))
+    if position is not None:
+        employee['position'] = str(position).strip()
+    join_date = cells.get(headers.get('joinDate'))
+    if join_date is not None:
+        if isinstance(join_date, (datetime, date)):
+            employee['joinDate'] = join_date.strftime('%Y-%m-%d')
+        else:
+            employee['joinDate'] = str(join_date).strip()
+    salary = cells.get(headers.get('monthlySalary'))
+    if salary is not None:
+        salary = monthly_salary(salary)
+        if salary is not None:
+            employee['monthlySalary'] = salary
+    set_default_values(employee)
+    return employee
+
+
+def iter_hr_employees(source, sheet_name=HR_SHEET, keyword='이름'):
+    """
+    HR 시트에서 직원 레코드를 하나씩 내보내기 (source 는 파일 경로 또는 WorkbookSession).
+    keyword 가 든 셀이 있는 첫 행을 헤더로 보고, 그다음 행부터는 헤더의 네 열만 읽습니다.
+    """
+    session = source if isinstance(source, WorkbookSession) else WorkbookSession(source)
+    try:
+        if sheet_name not in session.sheet_map:
+            raise KeyError(f"시트를 찾을 수 없습니다: {sheet_name}")
+
+        columns = set()     # 헤더를 찾기 전에는 비워 두어 모든 열, 찾은 뒤에는 필요한 열만 변환
+        headers = None
+        for _, cells in iter_sheet_rows(session.zf, session.sheet_map[sheet_name], session.shared_strings,
+                                        columns, session.date_styles):
+            if headers is None:
+                if any(keyword in str(value) for value in cells.values()):
+                    headers = map_header(cells)
+                    if 'name' not in headers:
+                        return
+                    columns.update(headers.values())
+                continue
+            employee = employee_from_row(cells, headers)
+            if employee is not None:
+                yield employee
+    finally:
+        if session is not source:
+            session.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HR 시트에서 직원 데이터 스트리밍 추출")
+    parser.add_argument("file_path", nargs="?",
+                        default="/Users/sung/user/workspace/GRK/GRK_workspace/2025_CF_management.xlsx")
+    parser.add_argument("--sheet", default=HR_SHEET, help="HR 시트 이름")
+    parser.add_argument("--json", action="store_true", help="직원마다 JSON 한 줄로 출력 (NDJSON)")
+    args = parser.parse_args()
+
+    print(f"🚀 {args.sheet} 시트에서 직원 데이터 스트리밍 추출 시작...", file=sys.stderr)
+    start = time.perf_counter()
+    count = 0
+    for employee in iter_hr_employees(args.file_path, args.sheet):
+        if count == 0:
+            print(f"⚡ 첫 직원: {time.perf_counter() - start:.3f}초", file=sys.stderr)
+        count += 1
+        if args.json:
+            print(json.dumps(employee, ensure_ascii=False))
+        else:
+            print(f"✅ 직원 추출: {employee['name']} ({employee['position']}, 입사 {employee['joinDate']})")
+    print(f"🎉 총 {count}명, {time.perf_counter() - start:.2f}초", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
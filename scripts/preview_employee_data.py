@@ -3,11 +3,31 @@ import json
 from datetime import datetime, date
 import re
 
+from column_matcher import ColumnMatcher
+from excel_frames import open_frames, print_load_time
+
+# 컬럼 매핑 정의
+COLUMN_MAPPING = {
+    'name': ['이름', 'name', '성명', '직원명', '성함'],
+    'position': ['직급', 'position', '직책', '포지션', '직위'],
+    'rank': ['직책', 'rank', '급수', '직무급'],
+    'department': ['부서', 'department', '팀', 'team', '소속', '사업부'],
+    'tel': ['전화번호', 'tel', 'phone', '연락처', '휴대폰', '핸드폰', '전화'],
+    'email': ['이메일', 'email', 'e-mail', '메일', '전자우편'],
+    'joinDate': ['입사일', '입사날짜', 'join_date', 'start_date', '시작일', '입사연월일'],
+    'monthlySalary': ['월급', '급여', 'salary', '월급여', '기본급', '월봉'],
+    'ssn': ['주민번호', '주민등록번호', 'ssn', '생년월일'],
+    'bankAccount': ['계좌번호', '계좌', 'account', '통장번호'],
+    'age': ['나이', 'age', '연령']
+}
+COLUMN_MATCHER = ColumnMatcher(COLUMN_MAPPING)
+NAME_MATCHER = ColumnMatcher({'name': COLUMN_MAPPING['name']})
+
 def read_and_preview_excel(file_path):
-    """Excel 파일을 읽고 직원 데이터만 미리보기"""
+    """Excel 파일을 한 번 읽고 직원 데이터만 미리보기 (file_path 는 경로 또는 ExcelFrames 로더)"""
     try:
         # Excel 파일의 모든 시트 이름 확인
-        excel_file = pd.ExcelFile(file_path)
+        excel_file = open_frames(file_path)
         print("📊 Excel 파일의 시트 목록:")
         for i, sheet_name in enumerate(excel_file.sheet_names):
             print(f"{i+1}. {sheet_name}")
@@ -15,15 +35,14 @@ def read_and_preview_excel(file_path):
         # 각 시트의 데이터 미리보기
         all_employee_data = []
         
-        for sheet_name in excel_file.sheet_names:
+        for sheet_name, df in excel_file.frames():
             print(f"\n📄 시트: {sheet_name}")
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
             print(f"컬럼: {list(df.columns)}")
             print(f"데이터 행 수: {len(df)}")
             
             # 처음 5행 데이터 보기
             print("데이터 미리보기:")
-            print(df.head().to_string())
+            print(excel_file.preview(sheet_name).to_string())
             
             # 직원 정보로 보이는 데이터 추출 시도
             employee_data = extract_employee_data_from_sheet(df, sheet_name)
@@ -33,6 +52,7 @@ def read_and_preview_excel(file_path):
             
             print("-" * 100)
         
+        print_load_time(excel_file)
         return all_employee_data
         
     except Exception as e:
@@ -44,50 +64,35 @@ def extract_employee_data_from_sheet(df, sheet_name):
     employee_data = []
     
     # 이름 컬럼 찾기
-    name_columns = [col for col in df.columns if any(keyword in str(col).lower() for keyword in ['이름', 'name', '성명', '직원명', '성함'])]
+    name_columns = NAME_MATCHER.resolve(df.columns).get('name')
     
     if not name_columns:
         print(f"❌ {sheet_name}에서 이름 컬럼을 찾을 수 없습니다.")
         return []
     
-    print(f"✅ 이름 컬럼 발견: {name_columns[0]}")
-    
-    # 컬럼 매핑 정의
-    column_mapping = {
-        'name': ['이름', 'name', '성명', '직원명', '성함'],
-        'position': ['직급', 'position', '직책', '포지션', '직위'],
-        'rank': ['직책', 'rank', '급수', '직무급'],
-        'department': ['부서', 'department', '팀', 'team', '소속', '사업부'],
-        'tel': ['전화번호', 'tel', 'phone', '연락처', '휴대폰', '핸드폰', '전화'],
-        'email': ['이메일', 'email', 'e-mail', '메일', '전자우편'],
-        'joinDate': ['입사일', '입사날짜', 'join_date', 'start_date', '시작일', '입사연월일'],
-        'monthlySalary': ['월급', '급여', 'salary', '월급여', '기본급', '월봉'],
-        'ssn': ['주민번호', '주민등록번호', 'ssn', '생년월일'],
-        'bankAccount': ['계좌번호', '계좌', 'account', '통장번호'],
-        'age': ['나이', 'age', '연령']
-    }
+    name_column = name_columns[0]
+    print(f"✅ 이름 컬럼 발견: {df.columns[name_column]}")
+    
+    # 필드별 후보 컬럼(열 위치)은 시트당 한 번만 찾음
+    columns = COLUMN_MATCHER.resolve(df.columns)
     
     # 각 행을 직원으로 처리
-    for idx, row in df.iterrows():
-        name_value = row[name_columns[0]]
+    for row in df.itertuples(index=False, name=None):
+        name_value = row[name_column]
         
         # 이름이 있는 경우에만 처리
         if pd.notna(name_value) and str(name_value).strip() and str(name_value).strip() != '':
             employee = {}
             
-            # 각 필드별로 해당하는 컬럼 찾아서 값 추출
-            for field, possible_columns in column_mapping.items():
+            # 각 필드별로 후보 컬럼 중 값이 있는 첫 컬럼에서 추출
+            for field, positions in columns.items():
                 found_value = None
-                found_column = None
                 
-                for col in df.columns:
-                    col_lower = str(col).lower()
-                    if any(keyword in col_lower for keyword in possible_columns):
-                        value = row[col]
-                        if pd.notna(value) and str(value).strip():
-                            found_value = clean_and_format_value(str(value).strip(), field)
-                            found_column = col
-                            break
+                for position in positions:
+                    value = row[position]
+                    if pd.notna(value) and str(value).strip():
+                        found_value = clean_and_format_value(str(value).strip(), field)
+                        break
                 
                 if found_value is not None:
                     employee[field] = found_value
@@ -0,0 +1,207 @@
+"""
+/api/employees 로컬 스텁 서버
+백엔드(NestJS) 없이 등록 스크립트를 시험하기 위한 메모리 서버입니다.
+POST /api/employees (201), POST /api/employees/bulk (행별 결과), GET /api/employees,
+PATCH/DELETE /api/employees/<id> 를 지원하고
+응답 지연과 일시 오류(503)를 흉내 낼 수 있습니다. HTTP/1.1 keep-alive 를 지원합니다.
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+API_PATH = '/api/employees'
+BULK_PATH = API_PATH + '/bulk'
+BULK_MAX_ROWS = 1000
+
+
+class EmployeeStore:
+    """스레드 안전한 메모리 직원 저장소"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.employees = {}
+        self.next_id = 1
+        self.requests = 0
+        self.injected_failures = 0
+
+    def add(self, employee):
+        with self.lock:
+            employee = {'id': self.next_id, **employee}
+            self.employees[self.next_id] = employee
+            self.next_id += 1
+            return employee
+
+    def all(self):
+        with self.lock:
+            return list(self.employees.values())
+
+    def update(self, employee_id, fields):
+        with self.lock:
+            employee = self.employees.get(employee_id)
+            if employee is not None:
+                employee.update(fields)
+            return employee
+
+    def delete(self, employee_id):
+        with self.lock:
+            return self.employees.pop(employee_id, None) is not None
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True  # keep-alive 에서 헤더/본문 분할 전송이 지연 ACK 에 막히지 않도록
+
+    def log_message(self, format, *args):
+        pass    # 요청마다 로그를 찍지 않음
+
+    def _send(self, status, body):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length) or b'null')
+
+    def _simulate(self):
+        """설정된 지연을 주고, fail_rate 확률로 True(503 응답) 반환"""
+        server = self.server
+        with server.store.lock:
+            server.store.requests += 1
+        if server.latency:
+            time.sleep(server.latency)
+        if server.fail_rate and random.random() < server.fail_rate:
+            with server.store.lock:
+                server.store.injected_failures += 1
+            self._send(503, {'statusCode': 503, 'message': 'Service Unavailable (stub)'})
+            return True
+        return False
+
+    def do_GET(self):
+        if self.path.split('?')[0] != API_PATH:
+            return self._send(404, {'statusCode': 404, 'message': 'Not Found'})
+        if not self._simulate():
+            self._send(200, self.server.store.all())
+
+    def do_POST(self):
+        if self.path == BULK_PATH and self.server.bulk:
+            return self._bulk_create()
+        if self.path != API_PATH:
+            return self._send(404, {'statusCode': 404, 'message': 'Not Found'})
+        try:
+            employee = self._read_json()
+        except ValueError:
+            return self._send(400, {'statusCode': 400, 'message': 'Invalid JSON'})
+        if self._simulate():
+            return
+        if not isinstance(employee, dict) or not employee.get('name'):
+            return self._send(400, {'statusCode': 400, 'message': ['name should not be empty']})
+        self._send(201, self.server.store.add(employee))
+
+    def _bulk_create(self):
+        """백엔드 POST /employees/bulk 와 같은 형식: 묶음 전체는 한 번에, 결과는 행마다"""
+        try:
+            body = self._read_json()
+        except ValueError:
+            return self._send(400, {'statusCode': 400, 'message': 'Invalid JSON'})
+        employees = body.get('employees') if isinstance(body, dict) else None
+        if not isinstance(employees, list) or not 1 <= len(employees) <= BULK_MAX_ROWS:
+            return self._send(400, {'statusCode': 400,
+                                    'message': [f'employees must contain 1~{BULK_MAX_ROWS} items']})
+        if self._simulate():
+            return
+        results = []
+        for index, employee in enumerate(employees):
+            if isinstance(employee, dict) and employee.get('name'):
+                saved = self.server.store.add(employee)
+                results.append({'index': index, 'status': 'created', 'id': saved['id']})
+            else:
+                results.append({'index': index, 'status': 'failed', 'errors': ['name: 이름은 필수 입력 항목입니다.']})
+        created = sum(row['status'] == 'created' for row in results)
+        self._send(201, {'total': len(results), 'created': created, 'failed': len(results) - created,
+                         'results': results})
+
+    def _employee_id(self):
+        """'/api/employees/<id>' 경로의 id (형식이 다르면 None)"""
+        prefix, _, employee_id = self.path.rpartition('/')
+        return int(employee_id) if prefix == API_PATH and employee_id.isdigit() else None
+
+    def do_PATCH(self):
+        employee_id = self._employee_id()
+        if employee_id is None:
+            return self._send(404, {'statusCode': 404, 'message': 'Not Found'})
+        try:
+            fields = self._read_json()
+        except ValueError:
+            return self._send(400, {'statusCode': 400, 'message': 'Invalid JSON'})
+        if self._simulate():
+            return
+        employee = self.server.store.update(employee_id, fields if isinstance(fields, dict) else {})
+        if employee is None:
+            return self._send(404, {'statusCode': 404, 'message': f'Employee with ID {employee_id} not found'})
+        self._send(200, employee)
+
+    def do_DELETE(self):
+        employee_id = self._employee_id()
+        if employee_id is None:
+            return self._send(404, {'statusCode': 404, 'message': 'Not Found'})
+        if self._simulate():
+            return
+        if not self.server.store.delete(employee_id):
+            return self._send(404, {'statusCode': 404, 'message': f'Employee with ID {employee_id} not found'})
+        self._send(200, {'message': 'Employee deleted successfully', 'id': employee_id})
+
+
+def make_server(host='127.0.0.1', port=3001, latency=0.0, fail_rate=0.0, bulk=True):
+    """
+    스텁 서버 생성 (port=0 이면 빈 포트 자동 선택, server.server_address 로 확인).
+    bulk=False 면 /bulk 경로가 없는 예전 백엔드처럼 404 응답.
+    """
+    server = ThreadingHTTPServer((host, port), StubHandler)
+    server.daemon_threads = True
+    server.store = EmployeeStore()
+    server.latency = latency
+    server.fail_rate = fail_rate
+    server.bulk = bulk
+    return server
+
+
+def start_background_server(**kwargs):
+    """백그라운드 스레드에서 스텁 서버 실행, (서버, API 주소) 반환"""
+    server = make_server(**kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}{API_PATH}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/api/employees 로컬 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3001)
+    parser.add_argument("--latency", type=float, default=0.0, help="요청마다 줄 지연(밀리초)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="503 으로 응답할 확률 (0~1)")
+    parser.add_argument("--no-bulk", action="store_true", help="/bulk 경로 없이 실행 (예전 백엔드 흉내)")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.latency / 1000, args.fail_rate, not args.no_bulk)
+    print(f"🧪 스텁 서버 실행 중: http://{args.host}:{args.port}{API_PATH} "
+          f"(지연 {args.latency:g}ms, 오류율 {args.fail_rate:g})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n📊 요청 {server.store.requests}회, 저장된 직원 {len(server.store.employees)}명, "
+              f"주입한 오류 {server.store.injected_failures}회")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+CF 워크북 표 추출기
+WorkbookSession 과 excel_stream.iter_sheet_rows 로 시트 XML 을 행 단위로 읽어
+CF 관리표, 월 경비표, 프로젝트 손익 시트를 행 레코드(dict)로 하나씩 내보냅니다.
+각 표의 헤더(라벨) 위치는 시트마다 찾으므로 행/열이 조금 밀려도 동작합니다.
+"""
+
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from excel_stream import iter_sheet_rows
+
+CF_SHEET = '01.Cash Flow Management'
+EXPENSE_SHEET = '02.Monthly Expense'
+PROJECT_HEADER_ROWS = 10    # 프로젝트 시트의 'Category ... Item' 헤더를 찾는 범위
+_YEAR_RE = re.compile(r'(20\d{2})')
+_ELAPSED_MONTH_RE = re.compile(r'^\d+M$')
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _text(value):
+    """문자열이면 공백을 정리한 값, 비었거나 문자열이 아니면 None"""
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return None
+
+
+def _number(value):
+    return value if _is_number(value) else None
+
+
+def _rows(session, sheet_name, columns=None):
+    return iter_sheet_rows(session.zf, session.sheet_map[sheet_name], session.shared_strings,
+                           columns, session.date_styles)
+
+
+def iter_cf_rows(session, sheet_name=CF_SHEET):
+    """
+    CF 시트에서 항목 행을 {'year', 'row', 'section', 'item', 'total', 'months'} 로 하나씩 내보내기.
+    '구분' 셀이 있는 행을 헤더로 보고(같은 행의 '소계' 가 합계 열), 그 아래 1~12 가 나란히 있는 행을
+    월 헤더로 씁니다. 구분 열 값은 대분류(section)로 아래 행에 이어지고, 바로 오른쪽 열이 세부 항목(item)입니다.
+    months 는 1~12월 금액 목록 (숫자가 아니면 None), 연도는 헤더 위 제목의 '(2025)' 같은 네 자리 연도입니다.
+    """
+    if sheet_name not in session.sheet_map:
+        return
+    columns = set()     # 월 헤더를 찾은 뒤에는 라벨/합계/월 열만 변환
+    year = label_col = total_col = None
+    months = None
+    section = None
+    for row, cells in _rows(session, sheet_name, columns):
+        if months is None:
+            for col, value in cells.items():
+                if isinstance(value, str):
+                    text = value.strip()
+                    if year is None and _YEAR_RE.search(text):
+                        year = int(_YEAR_RE.search(text).group(1))
+                    if label_col is None and text == '구분':
+                        label_col = col
+                    elif label_col is not None and total_col is None and text == '소계':
+                        total_col = col
+            month_cols = {value: col for col, value in cells.items() if _is_number(value) and value in range(1, 13)}
+            if label_col is not None and len(month_cols) == 12:
+                months = [month_cols[month] for month in range(1, 13)]
+                columns.update(months + [label_col, label_col + 1] + ([total_col] if total_col else []))
+            continue
+
+        head = _text(cells.get(label_col))
+        item = _text(cells.get(label_col + 1))
+        if head:
+            section = head
+        if not head and not item:
+            continue
+        yield {
+            'year': year,
+            'row': row,
+            'section': section,
+            'item': item,
+            'total': _number(cells.get(total_col)),
+            'months': [_number(cells.get(col)) for col in months],
+        }
+
+
+def iter_expense_rows(session, sheet_name=EXPENSE_SHEET):
+    """
+    월 경비 시트에서 경비 행을 {'row', 'level', 'category', 'group', 'item', 'amount', 'share', 'note'} 로 내보내기.
+    'Annual Expense' 셀의 열부터 세 열이 분류(대분류/중분류/항목) 라벨이고, 같은 행의 첫 숫자 열이 금액,
+    '비 고' 헤더 열이 비고, 그 바로 왼쪽 열이 비중입니다. 대분류/중분류는 아래 행으로 이어집니다.
+    """
+    if sheet_name not in session.sheet_map:
+        return
+    label_col = amount_col = note_col = header_row = None
+    category = group = None
+    for row, cells in _rows(session, sheet_name):
+        if label_col is None or note_col is None:
+            for col, value in cells.items():
+                text = _text(value)
+                if text and text.replace(' ', '') == '비고':
+                    note_col = col
+                elif text == 'Annual Expense':
+                    label_col, header_row = col, row
+                    amount_col = next((c for c in sorted(cells) if c > col and _is_number(cells[c])), col + 3)
+            if label_col is None or note_col is None:
+                continue
+
+        labels = [_text(cells.get(label_col + level)) for level in range(3)]
+        if not any(labels):
+            continue
+        level = next(level for level, label in enumerate(labels) if label)
+        if level == 0:
+            category, group = labels[0], labels[1]
+        elif level == 1:
+            group = labels[1]
+        yield {
+            'row': row,
+            'level': level,
+            'category': category,
+            'group': group,
+            'item': labels[2],
+            'amount': _number(cells.get(amount_col)),
+            'share': _number(cells.get(note_col - 1)),
+            'note': _text(cells.get(note_col)) if row != header_row else None,
+        }
+
+
+def iter_project_rows(session, sheet_name):
+    """
+    프로젝트 손익 시트에서 손익 항목 행을 내보내기 ('Category ... Item' 헤더가 위쪽에 없으면 아무것도 내보내지 않음).
+    레코드: {'project', 'code', 'start_date', 'end_date', 'row', 'section', 'category', 'item',
+    'factor', 'amount', 'planned', 'note', 'schedule'}.
+    Item 열 오른쪽 두 열이 비율(인건비 행은 투입 MM)/금액, 그다음 두 번째 열이 투입 합계(숫자) 또는 비고(문자열)이고,
+    '투입 경과' 행의 1M, 2M ... 열 값이 월별 투입 계획(schedule)입니다.
+    """
+    if sheet_name not in session.sheet_map:
+        return
+    project = code = start_date = end_date = None
+    section_col = item_col = None
+    section = category = None
+    schedule_cols = []
+    for row, cells in _rows(session, sheet_name):
+        if project is None:
+            project = next((_text(v) for _, v in sorted(cells.items()) if _text(v)), None)
+        if item_col is None:
+            texts = {col: _text(value) for col, value in cells.items()}
+            if 'Item' in texts.values() and 'Category' in texts.values():
+                item_col = next(col for col, text in texts.items() if text == 'Item')
+                section_col = next(col for col, text in texts.items() if text == 'Category')
+            elif row >= PROJECT_HEADER_ROWS:
+                return
+            continue
+
+        label = _text(cells.get(item_col)) or ''
+        if label.startswith('기간') and '월' not in label:
+            code = _text(cells.get(item_col + 1)) or code
+            continue
+        if label.startswith('시작일'):
+            start_date, end_date = cells.get(item_col + 1), cells.get(item_col + 2)
+            continue
+        if label.startswith('기간(월)'):
+            continue
+        elapsed = [col for col, value in sorted(cells.items()) if _ELAPSED_MONTH_RE.match(_text(value) or '')]
+        if elapsed:
+            schedule_cols = elapsed
+
+        head = _text(cells.get(section_col))
+        sub = _text(cells.get(section_col + 1))
+        item = _text(cells.get(item_col))
+        if head:
+            section, category = head, sub
+        elif sub:
+            category = sub
+        if not (head or sub or item):
+            continue
+        plan = cells.get(item_col + 4)
+        schedule = [_number(cells.get(col)) for col in schedule_cols] if not elapsed else []
+        yield {
+            'project': project,
+            'code': code,
+            'start_date': start_date,
+            'end_date': end_date,
+            'row': row,
+            'section': section,
+            'category': category,
+            'item': item,
+            'factor': _number(cells.get(item_col + 1)),
+            'amount': _number(cells.get(item_col + 2)),
+            'planned': _number(plan),
+            'note': _text(plan),
+            'schedule': schedule if any(v is not None for v in schedule) else None,
+        }
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+역방향(reverse-mode) 민감도 분석
+목표 셀(예: '01.Cash Flow Management!P6' 연말 기말현금)에서 시작해 수식 그룹을 위상 역순으로 한 번 훑으며
+각 셀의 수반값(adjoint, ∂목표/∂셀)을 선행 셀로 흘려 보내, 모든 입력 셀(수식이 아닌 셀)에 대한
+편미분을 한 번에 구합니다. 입력마다 값을 바꿔 재계산하는 방식(입력 수 x 모델 계산)이 필요 없습니다.
+- 사칙연산/거듭제곱/SUM/AVERAGE/ABS: 해석적 미분
+- IF/IFERROR: 현재 값에서 선택된 분기로만 전달, MIN/MAX: 선택된 셀로만 전달
+- VLOOKUP: 찾아온 셀로 전달 (찾는 키는 미분 0)
+- ROUND/ROUNDUP/ROUNDDOWN: 반올림을 건너뛰고 인자로 그대로 전달 (계단 함수라 0 이 되는 것을 피함)
+- 비교/문자열 연결/COUNT/AND/OR/DATEDIF 등: 국소적으로 상수라 0
+순환 참조 셀은 한 번만 역전파하므로 근삿값입니다.
+"""
+
+import argparse
+import time
+from collections import defaultdict
+
+import numpy as np
+
+from formula_eval import (
+    NUMBER,
+    WorkbookModel,
+    as_number,
+    compile_arguments,
+    count_values,
+    truthy,
+    vlookup_cells,
+)
+from formula_graph import format_cell_key, parse_cell_key
+
+DEFAULT_TARGET = '01.Cash Flow Management!P6'
+LABEL_COLUMNS = range(1, 5)     # 행 이름을 찾을 A~D 열
+
+
+def _numbers(model, node, group):
+    """노드 값을 구성원 수 모양의 숫자 배열로"""
+    num, _ = as_number(model.evaluate(node, group))
+    return np.broadcast_to(num, (len(group.members),))
+
+
+def _area_ids(model, node, group):
+    ids, _ = model.bind(group, node)
+    return ids[:, None] if node[0] == 'ref' else ids
+
+
+class ReverseSweep:
+    """한 번의 역전파: adjoint 배열(노드 번호별 ∂목표/∂셀)에 국소 미분을 누적"""
+
+    def __init__(self, model):
+        self.model = model
+        self.adjoint = np.zeros(len(model.store.num), dtype=np.float64)
+        self.skipped = defaultdict(int)
+
+    def run(self, target_id):
+        model = self.model
+        self.adjoint[target_id] = 1.0
+        for group in reversed(model.groups):
+            positions = np.nonzero(self.adjoint[group.targets])[0]
+            if not len(positions):
+                continue
+            if len(positions) < len(group.members):
+                group = group.subset(positions.tolist())
+            self.backward(group.ast, group, self.adjoint[group.targets])
+        return self.adjoint
+
+    def add(self, ids, seed):
+        seed = np.nan_to_num(np.broadcast_to(seed, np.shape(ids)), nan=0.0, posinf=0.0, neginf=0.0)
+        np.add.at(self.adjoint, ids, seed)
+
+    def backward(self, node, group, seed):
+        """seed(구성원별 ∂목표/∂node) 를 node 의 선행 셀로 전달"""
+        if not np.any(seed):
+            return
+        kind = node[0]
+        model = self.model
+        if kind == 'ref':
+            ids, _ = model.bind(group, node)
+            self.add(ids, seed)
+        elif kind == 'range':
+            ids, _ = model.bind(group, node)
+            self.add(ids[:, 0], seed)
+        elif kind == 'neg':
+            self.backward(node[1], group, -seed)
+        elif kind == 'pct':
+            self.backward(node[1], group, seed / 100.0)
+        elif kind == 'op':
+            self._backward_op(node, group, seed)
+        elif kind == 'call':
+            handler = getattr(self, f"_call_{node[1].lower()}", None)
+            if handler is None:
+                self.skipped[node[1]] += 1
+            else:
+                handler(node[2], group, seed)
+
+    def _backward_op(self, node, group, seed):
+        op, left, right = node[1], node[2], node[3]
+        if op in ('+', '-'):
+            self.backward(left, group, seed)
+            self.backward(right, group, seed if op == '+' else -seed)
+            return
+        if op not in ('*', '/', '^'):
+            return
+        a = _numbers(self.model, left, group)
+        b = _numbers(self.model, right, group)
+        with np.errstate(all='ignore'):
+            if op == '*':
+                da, db = seed * b, seed * a
+            elif op == '/':
+                da, db = seed / b, -seed * a / (b * b)
+            else:
+                power = np.power(a, b)
+                da = seed * b * np.power(a, b - 1)
+                db = np.where(a > 0, seed * power * np.log(np.where(a > 0, a, 1.0)), 0.0)
+        self.backward(left, group, np.nan_to_num(da, nan=0.0, posinf=0.0, neginf=0.0))
+        self.backward(right, group, np.nan_to_num(db, nan=0.0, posinf=0.0, neginf=0.0))
+
+    # -- 함수별 역전파 (이름: _call_<함수 이름 소문자>) -------------------------
+
+    def _spread(self, args, group, seed):
+        """SUM 처럼 인자의 숫자 셀마다 seed 를 그대로 전달"""
+        model = self.model
+        for arg in args:
+            area = model.evaluate_area(arg, group)
+            if area is None:
+                self.backward(arg, group, seed)
+            else:
+                self.add(_area_ids(model, arg, group), seed[:, None] * (area.kind == NUMBER))
+
+    def _call_sum(self, args, group, seed):
+        self._spread(args, group, seed)
+
+    def _call_average(self, args, group, seed):
+        count, _, _ = count_values(self.model, group, compile_arguments(args))
+        with np.errstate(all='ignore'):
+            self._spread(args, group, np.where(count > 0, seed / count, 0.0))
+
+    def _extreme(self, args, group, seed, name):
+        """MIN/MAX: 결과와 같은 값을 가진 첫 셀(또는 인자)로만 전달"""
+        model = self.model
+        result = _numbers(model, ('call', name, args), group)
+        remaining = np.ones(len(group.members), dtype=bool)
+        for arg in args:
+            area = model.evaluate_area(arg, group)
+            if area is None:
+                hit = remaining & (_numbers(model, arg, group) == result)
+                self.backward(arg, group, seed * hit)
+            else:
+                equal = (area.kind == NUMBER) & (area.num == result[:, None])
+                first = np.argmax(equal, axis=-1)
+                hit = remaining & equal.any(axis=-1)
+                ids = _area_ids(model, arg, group)
+                self.add(ids[np.arange(len(first)), first], seed * hit)
+            remaining &= ~hit
+
+    def _call_min(self, args, group, seed):
+        self._extreme(args, group, seed, 'MIN')
+
+    def _call_max(self, args, group, seed):
+        self._extreme(args, group, seed, 'MAX')
+
+    def _call_if(self, args, group, seed):
+        truth, err = truthy(self.model.evaluate(args[0], group))
+        truth = np.broadcast_to(truth & (err == 0), seed.shape)
+        if len(args) > 1:
+            self.backward(args[1], group, seed * truth)
+        if len(args) > 2:
+            self.backward(args[2], group, seed * ~truth)
+
+    def _call_iferror(self, args, group, seed):
+        failed = np.broadcast_to(self.model.evaluate(args[0], group).is_error(), seed.shape)
+        self.backward(args[0], group, seed * ~failed)
+        self.backward(args[1], group, seed * failed)
+
+    def _call_abs(self, args, group, seed):
+        self.backward(args[0], group, seed * np.sign(_numbers(self.model, args[0], group)))
+
+    def _call_round(self, args, group, seed):
+        self.backward(args[0], group, seed)
+
+    _call_roundup = _call_rounddown = _call_round
+
+    def _call_vlookup(self, args, group, seed):
+        ids, err = vlookup_cells(self.model, group, compile_arguments(args))
+        found = err == 0
+        self.add(ids[found], seed[found])
+
+
+def reverse_gradient(model, target=DEFAULT_TARGET):
+    """
+    목표 셀에 대한 모든 입력 셀의 편미분 {셀 키: ∂목표/∂셀} 과 미분을 건너뛴 함수 횟수.
+    모델은 recalculate() 로 현재 값이 계산된 상태여야 합니다.
+    """
+    sweep = ReverseSweep(model)
+    adjoint = sweep.run(model.node_id(target))
+    keys = model.graph.keys
+    gradient = {keys[node_id]: float(adjoint[node_id])
+                for node_id in np.nonzero(adjoint[:len(keys)])[0].tolist() if node_id not in model.asts}
+    return gradient, dict(sweep.skipped)
+
+
+def row_labels(model):
+    """(시트, 행) → 행 이름 (A~D 열의 첫 문자열)"""
+    labels = {}
+    for (sheet, row, col), (value, _) in sorted(model.cells.items()):
+        if col in LABEL_COLUMNS and isinstance(value, str) and (sheet, row) not in labels:
+            labels[(sheet, row)] = value.strip()
+    return labels
+
+
+def sensitivity_table(model, gradient, by='impact'):
+    """
+    편미분을 순위표로: 셀, 행 이름, 현재 값, 편미분, 1% 변화 영향(편미분 x 값 x 0.01).
+    by='impact' 면 1% 변화 영향, 'gradient' 면 편미분 절댓값 순.
+    """
+    labels = row_labels(model)
+    rows = []
+    for key, derivative in gradient.items():
+        value = model.store.get(model.graph.index[key])
+        number = float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else 0.0
+        rows.append({
+            'cell': format_cell_key(key),
+            'label': labels.get(key[:2], ''),
+            'value': value,
+            'gradient': derivative,
+            'impact': derivative * number * 0.01,
+        })
+    rows.sort(key=lambda row: abs(row[by]), reverse=True)
+    return rows
+
+
+def finite_difference(model, target, cell, relative_step=1e-6, min_step=1e-3):
+    """입력 하나를 앞뒤로 조금 바꿔 재계산한 중앙 차분 미분 (검증용, 원래 값으로 되돌림)"""
+    original = model.value(cell)
+    step = max(abs(original) * relative_step, min_step)
+    model.update({cell: original + step})
+    upper = model.value(target)
+    model.update({cell: original - step})
+    lower = model.value(target)
+    model.update({cell: original})
+    return (upper - lower) / (2 * step)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="역방향 민감도 분석 (목표 셀에 대한 모든 입력의 편미분)")
+    parser.add_argument("file_path", nargs="?",
+                        default="/Users/sung/user/workspace/GRK/GRK_workspace/2025_CF_management.xlsx")
+    parser.add_argument("--target", default=DEFAULT_TARGET, help="목표 셀 (기본: 연말 기말현금)")
+    parser.add_argument("--top", type=int, default=30, help="출력할 입력 수")
+    parser.add_argument("--by", choices=('impact', 'gradient'), default='impact',
+                        help="정렬 기준 (impact: 1%% 변화 영향, gradient: 편미분)")
+    parser.add_argument("--check", type=int, default=0, metavar="K", help="상위 K개 입력을 차분 미분으로 검증")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    model = WorkbookModel.load(args.file_path)
+    model.recalculate()
+    loaded = time.perf_counter() - start
+
+    start = time.perf_counter()
+    gradient, skipped = reverse_gradient(model, args.target)
+    elapsed = time.perf_counter() - start
+    table = sensitivity_table(model, gradient, args.by)
+
+    print(f"=== 역방향 민감도: {args.target} = {model.value(args.target):,.2f} ===")
+    print(f"모델 로드: {loaded:.2f}초, 역전파 한 번: {elapsed * 1000:.1f}ms, 미분이 0 이 아닌 입력 {len(table)}개")
+    if skipped:
+        print(f"⚠️ 미분하지 않은 함수 (0 으로 처리): {skipped}")
+
+    print(f"\n{'순위':>4}  {'셀':<34} {'행 이름':<28} {'현재 값':>16} {'편미분':>12} {'1% 변화 영향':>14}")
+    for rank, row in enumerate(table[:args.top], 1):
+        value = row['value']
+        shown = f"{value:,.2f}" if isinstance(value, float) else str(value)
+        print(f"{rank:>4}  {row['cell']:<34} {row['label'][:28]:<28} {shown:>16} "
+              f"{row['gradient']:>12.4g} {row['impact']:>14,.2f}")
+
+    totals = defaultdict(float)
+    for row in table:
+        totals[parse_cell_key(row['cell'])[0]] += abs(row['impact'])
+    print(f"\n시트별 1% 변화 영향 절댓값 합:")
+    for sheet, total in sorted(totals.items(), key=lambda item: -item[1]):
+        print(f"  {sheet:<30} {total:>16,.2f}")
+
+    if args.check:
+        print(f"\n차분 미분 검증 (상위 {args.check}개):")
+        for row in table[:args.check]:
+            if not isinstance(row['value'], float):
+                continue
+            numeric = finite_difference(model, args.target, row['cell'])
+            print(f"  {row['cell']:<34} 역전파 {row['gradient']:>12.6g}  차분 {numeric:>12.6g}")
+
+
+if __name__ == "__main__":
+    main()
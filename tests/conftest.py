@@ -0,0 +1,44 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 저장소 루트의 모듈(excel_stream, formula_eval ...)과 scripts/ 의 모듈(employee_sync ...)을 바로 import
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'scripts'))
+
+from excel_stream import split_address
+from formula_eval import WorkbookModel
+from formula_graph import FormulaGraph
+
+# 수식 엔진 테스트 공용 도우미 (test_formula_eval, test_sensitivity 에서 import)
+SHEET = 'S'
+
+
+def make_model(cells):
+    """{'A1': 값 또는 '=수식'} 으로 시트 하나짜리 모델을 만들고 전체 재계산"""
+    values, formulas = {}, []
+    max_row = max_col = 1
+    for address, value in cells.items():
+        row, col = split_address(address)
+        max_row, max_col = max(max_row, row), max(max_col, col)
+        if isinstance(value, str) and value.startswith('='):
+            formulas.append((SHEET, row, col, value))
+        elif value is not None:
+            values[(SHEET, row, col)] = (value, 's' if isinstance(value, str) else 'n')
+    graph = FormulaGraph.from_formulas(formulas, {SHEET: (max_row, max_col)})
+    model = WorkbookModel(graph, values)
+    model.recalculate()
+    return model
+
+
+def value(model, address):
+    return model.value(f"{SHEET}!{address}")
+
+
+# 인력 단가표: A 이름, B 등급 점수(오름차순), C 연봉
+TABLE = {
+    'A1': 'Kim', 'B1': 10, 'C1': 100,
+    'A2': 'Lee', 'B2': 20, 'C2': 200,
+    'A3': 'Park', 'B3': 30, 'C3': 300,
+}
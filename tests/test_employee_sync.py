@@ -0,0 +1,84 @@
+from employee_importer import EmployeeImporter
+from employee_sync import apply_plan, plan_sync
+
+
+def employee(id, name, joinDate='2024-01-01', empNo=None, **fields):
+    return {'id': id, 'empNo': empNo, 'name': name, 'joinDate': joinDate, **fields}
+
+
+def row(name, joinDate='2024-01-01', empNo=None, **fields):
+    return {'empNo': empNo, 'name': name, 'joinDate': joinDate, **fields}
+
+
+class RecordingImporter(EmployeeImporter):
+    """요청을 보내지 않고 호출만 기록"""
+
+    def __init__(self):
+        super().__init__(concurrency=1)
+        self.calls = []
+
+    def post(self, employee):
+        self.calls.append(('post', employee['name']))
+        return True, None, 1
+
+    def patch(self, employee_id, fields):
+        self.calls.append(('patch', employee_id, fields))
+        return True, None, 1
+
+    def delete(self, employee_id):
+        self.calls.append(('delete', employee_id))
+        return True, None, 1
+
+
+def test_insert_update_and_unchanged():
+    current = [employee(1, '김철수', empNo='E1', position='사원'),
+               employee(2, '이영희', '2023-03-02', department='개발팀')]
+    roster = [row('김철수', empNo='E1', position='대리'),
+              row(' 이영희 ', '2023-03-02T00:00:00', department='개발팀'),
+              row('박민수', empNo='E3')]
+    plan = plan_sync(roster, current)
+    assert plan.inserts == [roster[2]]
+    assert plan.updates == [(current[0], {'position': '대리'})]
+    assert plan.unchanged == 1
+    assert plan.deletes == plan.duplicates == plan.skipped == []
+
+
+def test_roster_rows_with_same_key_are_skipped():
+    roster = [row('김철수', empNo='E1'), row('김철수', empNo='E1', position='대리'),
+              row('이영희'), row('이영희')]
+    plan = plan_sync(roster, [])
+    assert plan.inserts == [roster[0], roster[2]]
+    assert plan.skipped == [roster[1], roster[3]]
+
+
+def test_same_name_and_join_date_with_different_emp_no_is_not_duplicate():
+    current = [employee(1, '김철수', empNo='E1'), employee(2, '김철수', empNo='E2')]
+    plan = plan_sync([row('김철수', empNo='E1'), row('김철수', empNo='E2')], current)
+    assert plan.inserts == [] and plan.duplicates == [] and plan.deletes == []
+    assert plan.unchanged == 2
+
+
+def test_duplicates_need_equal_or_missing_emp_no():
+    current = [employee(1, '김철수'), employee(2, '김철수'), employee(3, '김철수', empNo='E3'),
+               employee(4, '이영희', empNo='E4'), employee(5, '이영희 ', empNo='E4')]
+    plan = plan_sync([row('김철수'), row('이영희', empNo='E4')], current)
+    assert [e['id'] for e in plan.duplicates] == [2, 5]
+    assert plan.unchanged == 2
+    assert [e['id'] for e in plan.deletes] == [3]
+
+
+def test_deletes_are_sent_only_with_prune():
+    current = [employee(1, '김철수', empNo='E1'), employee(2, '퇴사자', empNo='E2'),
+               employee(3, '이영희'), employee(4, '이영희')]
+    plan = plan_sync([row('김철수', empNo='E1'), row('이영희')], current)
+    assert [e['id'] for e in plan.deletes] == [2]
+    assert [e['id'] for e in plan.duplicates] == [4]
+    assert not plan.has_changes()
+    assert plan.has_changes(prune=True)
+
+    importer = RecordingImporter()
+    apply_plan(plan, importer, prune=False, verbose=False)
+    assert importer.calls == []
+    result = apply_plan(plan, importer, prune=True, verbose=False)
+    assert sorted(importer.calls) == [('delete', 2), ('delete', 4)]
+    assert result.total == 2
@@ -0,0 +1,27 @@
+from excel_stream import translate_formula
+
+
+def test_translate_relative_and_absolute():
+    assert translate_formula('=A1+$B$2+C$3+$D4', 1, 1) == '=B2+$B$2+D$3+$D5'
+
+
+def test_translate_skips_string_literals_and_functions():
+    assert translate_formula('=IF(A1="A1",LOG10(B2),0)', 1, 0) == '=IF(A2="A1",LOG10(B3),0)'
+
+
+def test_translate_quoted_sheet_reference():
+    assert translate_formula("='03.HR unit cost'!A1+B1", 1, 0) == "='03.HR unit cost'!A2+B2"
+
+
+def test_translate_unquoted_sheet_reference():
+    assert translate_formula('Sheet1!A1+B1', 1, 0) == 'Sheet1!A2+B2'
+    assert translate_formula('=SUM(Data!$A1:B1)', 2, 1) == '=SUM(Data!$A3:C3)'
+
+
+def test_translate_sheet_name_that_looks_like_a_cell():
+    assert translate_formula('=Q1!A1', 1, 0) == '=Q1!A2'
+
+
+def test_translate_quoted_sheet_name_with_escaped_quote():
+    assert translate_formula("='Q1''s plan'!B2+C3", 1, 0) == "='Q1''s plan'!B3+C4"
+    assert translate_formula("=IF(A1=\"it\"\"s A1\",'a''b c'!A1,0)", 1, 0) == "=IF(A2=\"it\"\"s A1\",'a''b c'!A2,0)"
@@ -0,0 +1,161 @@
+import pytest
+
+import formula_eval
+from formula_eval import WorkbookModel, compile_formula, parse_formula
+from scenario_eval import ScenarioEvaluator
+
+from conftest import SHEET, TABLE, make_model, value
+
+
+def test_vlookup_exact_match_is_case_insensitive():
+    model = make_model({**TABLE, 'E1': 'lee', 'F1': '=VLOOKUP(E1,$A$1:$C$3,3,FALSE)'})
+    assert value(model, 'F1') == 200.0
+
+
+def test_vlookup_exact_match_missing_key_is_na():
+    model = make_model({**TABLE, 'E1': 'Choi', 'F1': '=VLOOKUP(E1,$A$1:$C$3,3,FALSE)'})
+    assert value(model, 'F1') == '#N/A'
+
+
+def test_vlookup_approximate_match_takes_last_row_not_above_key():
+    model = make_model({**TABLE,
+                        'E1': 25, 'F1': '=VLOOKUP(E1,$B$1:$C$3,2)',
+                        'E2': 30, 'F2': '=VLOOKUP(E2,$B$1:$C$3,2,TRUE)',
+                        'E3': 5, 'F3': '=VLOOKUP(E3,$B$1:$C$3,2,TRUE)',
+                        'E4': 99, 'F4': '=VLOOKUP(E4,$B$1:$C$3,2,TRUE)'})
+    assert value(model, 'F1') == 200.0
+    assert value(model, 'F2') == 300.0
+    assert value(model, 'F3') == '#N/A'
+    assert value(model, 'F4') == 300.0
+
+
+def test_vlookup_match_mode_is_per_cell_and_flag_errors_propagate():
+    model = make_model({'A1': 1, 'B1': 'a', 'A2': 3, 'B2': 'b', 'A3': 5, 'B3': 'c',
+                        'D1': 4, 'E1': True, 'F1': '=VLOOKUP(D1,$A$1:$B$3,2,E1)',
+                        'D2': 4, 'E2': False, 'F2': '=VLOOKUP(D2,$A$1:$B$3,2,E2)',
+                        'D3': 4, 'E3': '=1/0', 'F3': '=VLOOKUP(D3,$A$1:$B$3,2,E3)'})
+    assert value(model, 'F1') == 'b'
+    assert value(model, 'F2') == '#N/A'
+    assert value(model, 'F3') == '#DIV/0!'
+
+
+def test_vlookup_column_out_of_range_is_ref_error():
+    model = make_model({**TABLE, 'E1': 'Kim', 'F1': '=VLOOKUP(E1,$A$1:$C$3,4,FALSE)'})
+    assert value(model, 'F1') == '#REF!'
+
+
+def test_iferror_catches_vlookup_error():
+    model = make_model({**TABLE, 'E1': 'Choi', 'F1': '=IFERROR(VLOOKUP(E1,$A$1:$C$3,3,FALSE),0)',
+                        'E2': 'Park', 'F2': '=IFERROR(VLOOKUP(E2,$A$1:$C$3,3,FALSE),0)'})
+    assert value(model, 'F1') == 0.0
+    assert value(model, 'F2') == 300.0
+
+
+def test_errors_propagate_through_arithmetic_and_lookup_keys():
+    model = make_model({**TABLE, 'E1': 0, 'F1': '=1/E1', 'G1': '=F1+1', 'H1': '=SUM(F1,1)',
+                        'I1': '=VLOOKUP(F1,$B$1:$C$3,2,FALSE)', 'J1': '=IFERROR(G1,"bad")'})
+    assert value(model, 'F1') == '#DIV/0!'
+    assert value(model, 'G1') == '#DIV/0!'
+    assert value(model, 'H1') == '#DIV/0!'
+    assert value(model, 'I1') == '#DIV/0!'
+    assert value(model, 'J1') == 'bad'
+
+
+def test_blank_cell_equals_empty_string_zero_and_false():
+    model = make_model({'A1': None, 'B1': '=A1=""', 'C1': '=""=A1', 'D1': '=A1=0', 'E1': '=A1=FALSE',
+                        'F1': '=A1="x"', 'G1': '=A1<>""'})
+    assert value(model, 'B1') is True
+    assert value(model, 'C1') is True
+    assert value(model, 'D1') is True
+    assert value(model, 'E1') is True
+    assert value(model, 'F1') is False
+    assert value(model, 'G1') is False
+
+
+def test_empty_string_is_not_zero():
+    model = make_model({'A1': '=""', 'B1': '=A1=0', 'C1': '=A1=""'})
+    assert value(model, 'B1') is False
+    assert value(model, 'C1') is True
+
+
+def test_literal_na_string_is_text_not_error():
+    model = make_model({'A1': '#N/A', 'B1': '=IFERROR(A1,"err")', 'C1': '=A1&"!"', 'D1': '=A1="#n/a"'})
+    assert value(model, 'A1') == '#N/A'
+    assert value(model, 'B1') == '#N/A'
+    assert value(model, 'C1') == '#N/A!'
+    assert value(model, 'D1') is True
+
+
+def test_unparsable_formulas_evaluate_to_name_error():
+    model = make_model({'A1': 2, 'B1': '=SUM({1,2,3})', 'B2': '=Table1[Col]+A1', 'B3': '=Sheet1!#REF!+1',
+                        'B4': '=A1*2'})
+    assert value(model, 'B1') == '#NAME?'
+    assert value(model, 'B2') == '#NAME?'
+    assert value(model, 'B3') == '#REF!'
+    assert value(model, 'B4') == 4.0
+    assert set(model.parse_errors) == {model.node_id(f'{SHEET}!B1'), model.node_id(f'{SHEET}!B2')}
+
+
+def test_update_recalculates_dependents():
+    model = make_model({**TABLE, 'E1': 'Kim', 'F1': '=VLOOKUP(E1,$A$1:$C$3,3,FALSE)*2'})
+    assert model.update({f'{SHEET}!C1': 150}) == 1
+    assert value(model, 'F1') == 300.0
+
+
+def test_update_rejects_formula_cells():
+    model = make_model({'A1': 1, 'B1': '=A1+1'})
+    with pytest.raises(ValueError):
+        model.update({f'{SHEET}!B1': 5})
+    assert value(model, 'B1') == 2.0
+
+
+def test_lookup_index_is_rebuilt_when_first_column_changes():
+    model = make_model({**TABLE, 'A3': '=E2', 'E2': 'Park',
+                        'E1': 'Choi', 'F1': '=VLOOKUP(E1,$A$1:$C$3,3,FALSE)'})
+    assert value(model, 'F1') == '#N/A'
+    model.update({f'{SHEET}!A2': 'Choi'})
+    assert value(model, 'F1') == 200.0
+    # 첫 열의 수식 셀이 다시 계산되어 바뀌어도 색인을 버림
+    model.update({f'{SHEET}!A2': 'Lee', f'{SHEET}!E2': 'Choi'})
+    assert value(model, 'F1') == 300.0
+
+
+def test_scenario_run_keeps_lookup_indexes(monkeypatch):
+    model = make_model({**TABLE, 'E1': 'Lee', 'G1': 2, 'F1': '=VLOOKUP(E1,$A$1:$C$3,3,FALSE)*G1'})
+    indexes = dict(model.lookup_indexes)
+    assert indexes
+
+    def fail(ids):
+        raise AssertionError("시나리오 계산 중에 VLOOKUP 색인을 확인함")
+    monkeypatch.setattr(model, '_invalidate_lookups', fail)
+    evaluator = ScenarioEvaluator(model, [f'{SHEET}!G1'], [f'{SHEET}!F1'])
+    assert evaluator.run([[1.0], [3.0]]).tolist() == [[200.0], [600.0]]
+    assert model.lookup_indexes == indexes
+    assert all(model.lookup_indexes[key] is index for key, index in indexes.items())
+    assert value(model, 'F1') == 400.0
+
+
+def test_same_r1c1_shape_shares_ast_and_compiled_closure():
+    ast = parse_formula('=G7+G35-G8', 6, 7)
+    assert parse_formula('=H7+H35-H8', 6, 8) is ast
+    assert compile_formula(parse_formula('=H7+H35-H8', 6, 8)) is compile_formula(ast)
+    assert parse_formula('=$G$7', 6, 7) == parse_formula('=$G$7', 6, 8)
+    assert parse_formula('=G7', 6, 7) != parse_formula('=G7', 6, 8)
+
+
+def test_recalculation_runs_compiled_closures_without_parsing_or_ast_walks(monkeypatch):
+    model = make_model({**TABLE, 'E1': 'Lee',
+                        'F1': '=IFERROR(ROUND(VLOOKUP(E1,$A$1:$C$3,3,FALSE)*1.1,0),0)+SUM(C1:C3,1)'})
+    assert value(model, 'F1') == 220.0 + 601.0
+
+    def fail(*args, **kwargs):
+        raise AssertionError("계산 중에 파싱/AST 해석을 다시 함")
+    monkeypatch.setattr(formula_eval._Parser, 'parse', fail)
+    monkeypatch.setattr(formula_eval, 'compile_formula', fail)
+    monkeypatch.setattr(formula_eval, 'compile_area', fail)
+    monkeypatch.setattr(WorkbookModel, 'evaluate', fail)
+    monkeypatch.setattr(WorkbookModel, 'evaluate_area', fail)
+    model.update({f'{SHEET}!C2': 300})
+    assert value(model, 'F1') == 330.0 + 701.0
+    model.recalculate()
+    assert value(model, 'F1') == 330.0 + 701.0
@@ -0,0 +1,26 @@
+from analyze_excel_summary import classify_formula
+from formula_graph import FormulaGraph, tokenize
+
+
+def test_tokenize_array_constant_and_deleted_sheet_reference():
+    tokens = tokenize('=SUM({1,"a}";2})+Sheet1!#REF!+\'Q1\'\'s!\'!#REF!')
+    assert [(t.kind, t.text) for t in tokens] == [
+        ('func', 'SUM'), ('lparen', '('), ('array', '{1,"a}";2}'), ('rparen', ')'),
+        ('op', '+'), ('error', '#REF!'), ('op', '+'), ('error', '#REF!')]
+
+
+def test_unparsable_formula_becomes_node_without_edges():
+    graph = FormulaGraph.from_formulas([('S', 1, 1, '=Table1[Col]+B1'), ('S', 1, 2, '=C1'),
+                                        ('S', 1, 4, '=A1#')], {'S': (1, 4)})
+    bad = graph.index[('S', 1, 1)]
+    assert set(graph.unparsed) == {bad, graph.index[('S', 1, 4)]}
+    assert bad in graph.formulas
+    assert graph.precedent_ids(bad) == []
+    assert graph.precedents('S!B1') == ['S!C1']
+
+
+def test_classify_falls_back_to_substrings_for_unparsable_formula():
+    assert classify_formula('=VLOOKUP(A1,Table1[#All],2,FALSE)') == 'vlookup'
+    assert classify_formula('=Table1[Col]*2') == 'calculation'
+    assert classify_formula('=SUM(A1:A3)') == 'sum'
+    assert classify_formula('="a+b"') is None
@@ -0,0 +1,41 @@
+import pytest
+
+from sensitivity import finite_difference, reverse_gradient
+
+from conftest import SHEET, TABLE, make_model
+
+
+def gradient_of(model, address):
+    gradient, skipped = reverse_gradient(model, f"{SHEET}!{address}")
+    assert not skipped
+    return {key[1:]: value for key, value in gradient.items()}
+
+
+def test_arithmetic_and_sum_gradients():
+    model = make_model({'A1': 2, 'B1': 3, 'A2': 4, 'A3': 5, 'C1': '=A1*B1+SUM(A1:A3)'})
+    assert gradient_of(model, 'C1') == {(1, 1): 4.0, (1, 2): 2.0, (2, 1): 1.0, (3, 1): 1.0}
+
+
+def test_if_flows_only_into_selected_branch():
+    model = make_model({'A1': 1, 'B1': 3, 'C1': 7, 'D1': '=IF(A1>0,B1*2,C1)'})
+    assert gradient_of(model, 'D1') == {(1, 2): 2.0}
+    model.update({f'{SHEET}!A1': -1})
+    assert gradient_of(model, 'D1') == {(1, 3): 1.0}
+
+
+def test_vlookup_flows_into_found_cell_only():
+    model = make_model({**TABLE, 'E1': 'Lee', 'F1': '=VLOOKUP(E1,$A$1:$C$3,3,FALSE)*2',
+                        'E2': 'Choi', 'F2': '=IFERROR(VLOOKUP(E2,$A$1:$C$3,3,FALSE),E3)', 'E3': 5})
+    assert gradient_of(model, 'F1') == {(2, 3): 2.0}
+    assert gradient_of(model, 'F2') == {(3, 5): 1.0}
+
+
+def test_reverse_gradient_matches_finite_difference():
+    model = make_model({'A1': 1.5, 'A2': 2.5, 'A3': 4.0, 'B1': 0.2,
+                        'C1': '=A1^2/A2', 'C2': '=MAX(A1:A3)*(1+B1)', 'C3': '=AVERAGE(C1:C2)-ABS(A2-A3)',
+                        'D1': '=C3+C1*B1'})
+    gradient = gradient_of(model, 'D1')
+    for address in ('A1', 'A2', 'A3', 'B1'):
+        row, col = int(address[1]), ord(address[0]) - ord('A') + 1
+        numeric = finite_difference(model, f"{SHEET}!D1", f"{SHEET}!{address}")
+        assert gradient.get((row, col), 0.0) == pytest.approx(numeric, rel=1e-4, abs=1e-6)
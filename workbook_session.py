@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+워크북 분석 세션
+xlsx(zip) 을 한 번만 열고, 각 파트(workbook.xml, sharedStrings.xml, docProps/core.xml,
+시트 요약 등)는 처음 필요할 때 한 번만 파싱해 기억해 둡니다.
+여러 분석 함수가 같은 세션을 받아 쓰므로 리포트를 몇 개 돌려도 파트마다 파싱은 한 번입니다.
+"""
+
+import xml.etree.ElementTree as ET
+from collections import Counter, OrderedDict
+from datetime import datetime
+from functools import cached_property
+
+from analysis_cache import analyze_sheet_member
+from excel_stream import (
+    NS_MAIN,
+    date_style_ids,
+    open_workbook_zip,
+    parse_active_sheet,
+    parse_sheet_map,
+    parse_style_table,
+    read_shared_strings,
+    resolve_labels,
+)
+
+NS_CORE = 'http://schemas.openxmlformats.org/package/2006/metadata/core-properties'
+NS_DC = 'http://purl.org/dc/elements/1.1/'
+NS_DCTERMS = 'http://purl.org/dc/terms/'
+
+# docProps/core.xml 의 속성 이름 → 요소 태그
+_CORE_PROPERTIES = {
+    'title': f'{{{NS_DC}}}title',
+    'creator': f'{{{NS_DC}}}creator',
+    'last_modified_by': f'{{{NS_CORE}}}lastModifiedBy',
+    'created': f'{{{NS_DCTERMS}}}created',
+    'modified': f'{{{NS_DCTERMS}}}modified',
+    'subject': f'{{{NS_DC}}}subject',
+    'description': f'{{{NS_DC}}}description',
+    'keywords': f'{{{NS_CORE}}}keywords',
+    'category': f'{{{NS_CORE}}}category',
+}
+
+
+def _parse_w3cdtf(text):
+    """'2020-08-21T06:29:47Z' 형태의 날짜를 datetime 으로 (해석 못 하면 문자열 그대로)"""
+    try:
+        return datetime.fromisoformat(text.rstrip('Z')).replace(tzinfo=None)
+    except ValueError:
+        return text
+
+
+def _xml_bool(value):
+    if value is None:
+        return None
+    return value in ('1', 'true')
+
+
+class WorkbookSession:
+    """zip 을 한 번 열어 두고 파트별 파싱 결과를 기억하는 분석 세션"""
+
+    def __init__(self, file_path, cache=None):
+        self.file_path = file_path
+        self.cache = cache
+        self.zf = open_workbook_zip(file_path)
+        self._xml = {}
+        self.parse_counts = Counter()   # 파트 → 실제 파싱 횟수 (캐시 적중은 제외)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.zf.close()
+
+    @cached_property
+    def namelist(self):
+        return self.zf.namelist()
+
+    def xml(self, part):
+        """zip 안의 작은 XML 파트를 파싱한 루트 요소 (없으면 None)"""
+        if part not in self._xml:
+            if part in self.namelist:
+                self._xml[part] = ET.fromstring(self.zf.read(part))
+                self.parse_counts[part] += 1
+            else:
+                self._xml[part] = None
+        return self._xml[part]
+
+    @cached_property
+    def sheet_map(self):
+        """워크시트 이름 → zip 내부 XML 경로"""
+        return parse_sheet_map(self.xml('xl/workbook.xml'), self.xml('xl/_rels/workbook.xml.rels'))
+
+    @property
+    def sheet_names(self):
+        return list(self.sheet_map)
+
+    @cached_property
+    def active_sheet(self):
+        return parse_active_sheet(self.xml('xl/workbook.xml'))
+
+    @cached_property
+    def shared_strings(self):
+        self.parse_counts['xl/sharedStrings.xml'] += 1
+        return read_shared_strings(self.zf)
+
+    @cached_property
+    def styles(self):
+        """셀 스타일 표 (styles.xml cellXfs 순서, 셀 레코드의 style_id 가 표 번호)"""
+        root = self.xml('xl/styles.xml')
+        return parse_style_table(root) if root is not None else []
+
+    @cached_property
+    def date_styles(self):
+        """날짜/시간 서식인 스타일 번호 집합 (excel_stream.iter_sheet_rows 의 date_styles)"""
+        return date_style_ids(self.styles)
+
+    @cached_property
+    def summaries(self):
+        """시트별 요약 (analysis_cache 가 있으면 바뀌지 않은 시트는 캐시에서 읽음)"""
+        summaries = OrderedDict()
+        for sheet_name, part in self.sheet_map.items():
+            misses = self.cache.misses if self.cache is not None else 0
+            summary = dict(analyze_sheet_member(self.zf, part, self.cache))
+            if self.cache is None or self.cache.misses > misses:
+                self.parse_counts[part] += 1
+            summary['labels'] = resolve_labels(summary, self.shared_strings)
+            summaries[sheet_name] = summary
+        return summaries
+
+    def summary(self, sheet_name):
+        return self.summaries[sheet_name]
+
+    def formulas(self, sheet_name):
+        """시트의 {셀 주소: 수식}"""
+        return dict(self.summaries[sheet_name]['formulas'])
+
+    @cached_property
+    def defined_names(self):
+        """이름 정의 목록 [{name, value, local_sheet_id}]"""
+        root = self.xml('xl/workbook.xml')
+        names = []
+        for elem in root.iter(f'{{{NS_MAIN}}}definedName'):
+            local_sheet_id = elem.get('localSheetId')
+            names.append({
+                'name': elem.get('name'),
+                'value': elem.text,
+                'local_sheet_id': int(local_sheet_id) if local_sheet_id is not None else None,
+            })
+        return names
+
+    @cached_property
+    def properties(self):
+        """docProps/core.xml 문서 속성 (없는 항목은 None)"""
+        root = self.xml('docProps/core.xml')
+        properties = dict.fromkeys(_CORE_PROPERTIES)
+        if root is None:
+            return properties
+        for key, tag in _CORE_PROPERTIES.items():
+            elem = root.find(tag)
+            if elem is not None and elem.text:
+                properties[key] = _parse_w3cdtf(elem.text) if key in ('created', 'modified') else elem.text
+        return properties
+
+    @cached_property
+    def protection(self):
+        """워크북 보호 설정 (workbookProtection 이 없으면 None)"""
+        elem = self.xml('xl/workbook.xml').find(f'{{{NS_MAIN}}}workbookProtection')
+        if elem is None:
+            return None
+        return {
+            'workbook_password': elem.get('workbookPassword') or elem.get('workbookHashValue'),
+            'lock_structure': _xml_bool(elem.get('lockStructure')),
+            'lock_windows': _xml_bool(elem.get('lockWindows')),
+        }